@@ -56,3 +56,24 @@ def create_test_parquet_file_2(DF, TEST_PARQUET_FILE_PATH_2):
     DF.to_parquet(TEST_PARQUET_FILE_PATH_2, index=False)
     yield
     os.remove(TEST_PARQUET_FILE_PATH_2)
+
+
+@pytest.fixture
+def fake_bcp(tmp_path_factory):
+    """A stand-in for the bcp executable. Instead of inserting the file into
+    a table, it copies it (without the header) into the `loaded` directory
+    and reports the number of copied rows, like bcp does.
+    """
+    directory = tmp_path_factory.mktemp("fake_bcp")
+    loaded_dir = directory / "loaded"
+    loaded_dir.mkdir()
+    bcp_path = directory / "bcp"
+    bcp_path.write_text(
+        f"""#!/bin/bash
+# args: <table> in <file> ...
+tail -n +2 "$3" > "{loaded_dir}/$(basename "$3")"
+echo "$(wc -l < "{loaded_dir}/$(basename "$3")") rows copied."
+"""
+    )
+    bcp_path.chmod(0o755)
+    return dict(path=str(bcp_path), loaded_dir=str(loaded_dir))
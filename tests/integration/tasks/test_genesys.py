@@ -56,7 +56,7 @@ def var_dictionary() -> None:
 
 
 class MockGenesysTask:
-    report_data = ([[None, "COMPLETED"], [None, "COMPLETED"]],)
+    report_data = [[None, "COMPLETED"], [None, "COMPLETED"]]
 
     def genesys_api_connection(post_data_list, end_point, method="POST"):
         if method == "GET":
@@ -248,7 +248,7 @@ class MockGenesysTask:
                 ],
                 "totalHits": 100,
             }
-        return report
+        return [report]
 
     def get_reporting_exports_data():
         pass
@@ -262,6 +262,12 @@ class MockGenesysTask:
             "V_D_PROD_FB_QUEUE_CHAT.csv",
         ]
 
+    def process_reporting_exports(expected_count, path, timeout):
+        return [
+            "V_D_PROD_FB_QUEUE_CALLBACK.csv",
+            "V_D_PROD_FB_QUEUE_CHAT.csv",
+        ]
+
     def delete_all_reporting_exports():
         pass
 
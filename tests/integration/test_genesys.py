@@ -178,8 +178,8 @@ def test_generate_api_connection(mock_api_response, var_dictionary):
 
 
 def test_api_connection_return_type():
-    conn_dict = Genesys().genesys_api_connection(post_data_list=["test_value_to_post"])
-    assert isinstance(conn_dict, dict)
+    responses = Genesys().genesys_api_connection(post_data_list=["test_value_to_post"])
+    assert isinstance(responses, list) and isinstance(responses[0], dict)
 
 
 def test_load_reporting_exports_return_type(caplog):
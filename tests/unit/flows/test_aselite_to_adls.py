@@ -0,0 +1,35 @@
+import pytest
+
+from viadot.flows.aselite_to_adls import ASELiteToADLS
+
+
+def test_aselite_to_adls_incremental_requires_no_overwrite():
+    with pytest.raises(ValueError, match="overwrite"):
+        ASELiteToADLS(
+            "aselite incremental",
+            query="SELECT * FROM sales",
+            to_path="raw/sales.csv",
+            incremental_column="version",
+        )
+
+
+def test_aselite_to_adls_incremental_watermark_key():
+    keys = [
+        ASELiteToADLS(
+            "aselite incremental",
+            query=query,
+            to_path=f"raw/sales_{date}.csv",
+            overwrite=False,
+            incremental_column="version",
+        ).watermark_key
+        for query, date in [
+            ("SELECT * FROM sales", "2023-01-01"),
+            ("SELECT * FROM sales;", "2023-01-02"),
+            ("SELECT * FROM returns", "2023-01-02"),
+        ]
+    ]
+
+    # the key doesn't depend on the file of the run, only on the query
+    assert keys[0] == keys[1]
+    assert keys[0] != keys[2]
+    assert keys[0].startswith("aselite_incremental.")
@@ -47,3 +47,32 @@ def test_duckdb_transform(duckdb, TEST_PARQUET_FILE_PATH):
 
     df = duckdb.to_df(f"SELECT * FROM {SILVER_SCHEMA}.{TABLE}")
     assert df.shape[0] == 3
+
+
+def test_duckdb_transform_scripts(duckdb, TEST_PARQUET_FILE_PATH, tmp_path):
+    duckdb.create_table_from_parquet(
+        schema=BRONZE_SCHEMA,
+        table="scripts_source",
+        path=TEST_PARQUET_FILE_PATH,
+        if_exists="replace",
+    )
+    (tmp_path / "silver.sql").write_text(
+        f"CREATE TABLE {SILVER_SCHEMA}.scripts_table AS SELECT * FROM {BRONZE_SCHEMA}.scripts_source"
+    )
+    (tmp_path / "gold.sql").write_text(
+        f"CREATE TABLE {SILVER_SCHEMA}.scripts_gold AS SELECT * FROM {SILVER_SCHEMA}.scripts_table"
+    )
+
+    flow = DuckDBTransform(
+        name="DuckDBTransform scripts flow",
+        scripts_path=str(tmp_path),
+        credentials=CREDENTIALS,
+    )
+    result = flow.run()
+
+    assert result.is_successful()
+
+    df = duckdb.to_df(f"SELECT * FROM {SILVER_SCHEMA}.scripts_gold")
+    assert df.shape[0] == 3
+    log = duckdb.to_df("SELECT * FROM run_log")
+    assert list(log["script"]) == ["silver", "gold"]
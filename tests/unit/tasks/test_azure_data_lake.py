@@ -0,0 +1,171 @@
+import os
+
+import pandas as pd
+import pytest
+from fsspec.implementations.local import LocalFileSystem
+
+import viadot.tasks.azure_data_lake as azure_data_lake_tasks
+from viadot.exceptions import ValidationError
+from viadot.sources import AzureDataLake
+from viadot.tasks import AzureDataLakeCopy, AzureDataLakeToAzureSQLStream
+
+SQL_CREDENTIALS = dict(server="fake", db_name="fake", user="fake", password="fake")
+
+
+class FakeConnection:
+    def __init__(self, queries):
+        self.queries = queries
+
+    def cursor(self):
+        return self
+
+    def execute(self, query):
+        self.queries.append(query)
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    queries = []
+
+    class FakeAzureSQL:
+        def __init__(self, *args, **kwargs):
+            self.con = FakeConnection(queries)
+
+    monkeypatch.setattr(azure_data_lake_tasks, "AzureSQL", FakeAzureSQL)
+    monkeypatch.setattr(
+        azure_data_lake_tasks,
+        "AzureDataLake",
+        lambda *args, **kwargs: AzureDataLake(fs=LocalFileSystem()),
+    )
+    monkeypatch.setattr(
+        azure_data_lake_tasks,
+        "_get_credentials",
+        lambda *args, **kwargs: {"ACCOUNT_NAME": "test"},
+    )
+    return queries
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "source.csv"
+    pd.DataFrame({" b ": range(1000), "a": ["x\ty"] * 1000}).to_csv(
+        path, sep="\t", index=False
+    )
+    return str(path)
+
+
+def test_adls_to_azure_sql_stream(fake_bcp, queries, source_file, tmp_path):
+    task = AzureDataLakeToAzureSQLStream(
+        batch_size=100,
+        rows_per_file=300,
+        max_concurrent_loads=2,
+        bcp_path=fake_bcp["path"],
+    )
+    result = task.run(
+        path=source_file,
+        local_path=str(tmp_path / "stream.csv"),
+        schema="sandbox",
+        table="test_stream",
+        columns=["a", "b"],
+        remove_tab=True,
+        error_log_file_path=str(tmp_path / "log_file.log"),
+        sqldb_credentials=SQL_CREDENTIALS,
+    )
+
+    assert result["files"] == 4
+    assert result["rows"] == 1000
+    assert queries == []
+    with open(os.path.join(fake_bcp["loaded_dir"], "stream_0.csv")) as f:
+        assert f.readline() == "xy\t0\n"
+
+
+def test_adls_to_azure_sql_stream_validation(fake_bcp, queries, source_file, tmp_path):
+    task = AzureDataLakeToAzureSQLStream(
+        batch_size=100,
+        bcp_path=fake_bcp["path"],
+        error_log_file_path=str(tmp_path / "log_file.log"),
+    )
+    kwargs = dict(
+        path=source_file,
+        local_path=str(tmp_path / "stream.csv"),
+        schema="sandbox",
+        table="test_stream",
+        sqldb_credentials=SQL_CREDENTIALS,
+    )
+
+    result = task.run(
+        validate_df_dict={"dataset_row_count": {"min": 999, "max": 1001}}, **kwargs
+    )
+    assert result["rows"] == 1000
+    staging_table = queries[0].split()[-3]
+    assert queries == [
+        f"SELECT TOP 0 * INTO {staging_table} FROM sandbox.test_stream",
+        f"INSERT INTO sandbox.test_stream WITH (TABLOCK) SELECT * FROM {staging_table}",
+        f"DROP TABLE IF EXISTS {staging_table}",
+    ]
+
+    queries.clear()
+    with pytest.raises(ValidationError):
+        task.run(validate_df_dict={"column_unique_values": ["a"]}, **kwargs)
+    assert not any(query.startswith("INSERT") for query in queries)
+    assert queries[-1].startswith("DROP TABLE")
+
+
+def test_adls_to_azure_sql_stream_validation_remove_tab(
+    fake_bcp, queries, source_file, tmp_path
+):
+    task = AzureDataLakeToAzureSQLStream(
+        batch_size=100,
+        bcp_path=fake_bcp["path"],
+        error_log_file_path=str(tmp_path / "log_file.log"),
+    )
+
+    result = task.run(
+        path=source_file,
+        local_path=str(tmp_path / "stream.csv"),
+        table="test_stream",
+        remove_tab=True,
+        validate_df_dict={"column_sum": {"b": {"min": 499_500, "max": 499_500}}},
+        sqldb_credentials=SQL_CREDENTIALS,
+    )
+
+    assert result["rows"] == 1000
+
+
+def test_adls_to_azure_sql_stream_column_mismatch(
+    fake_bcp, queries, source_file, tmp_path
+):
+    task = AzureDataLakeToAzureSQLStream(bcp_path=fake_bcp["path"])
+    with pytest.raises(ValidationError):
+        task.run(
+            path=source_file,
+            local_path=str(tmp_path / "stream.csv"),
+            table="test_stream",
+            columns=["a", "c"],
+            error_log_file_path=str(tmp_path / "log_file.log"),
+            sqldb_credentials=SQL_CREDENTIALS,
+        )
+
+
+def test_adls_copy_file_format(queries, tmp_path):
+    from_path = str(tmp_path / "sales.txt")
+    pd.DataFrame({"a": [1, 2]}).to_csv(from_path, sep="\t", index=False)
+    to_path = str(tmp_path / "copy.txt")
+    task = AzureDataLakeCopy(gen=1, to_gen=2)
+
+    summary = task.run(
+        from_path=from_path,
+        to_path=to_path,
+        metadata_columns={"_source": "gen1"},
+        file_format="csv",
+    )
+
+    assert [result["status"] for result in summary["files"]] == ["success"]
+    df = pd.read_csv(to_path, sep="\t")
+    pd.testing.assert_frame_equal(df, pd.DataFrame({"a": [1, 2], "_source": "gen1"}))
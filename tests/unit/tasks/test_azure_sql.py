@@ -0,0 +1,63 @@
+import os
+
+import pandas as pd
+import pytest
+
+from viadot.exceptions import ValidationError
+from viadot.tasks import azure_sql
+from viadot.tasks.azure_sql import AzureSQLUpsert
+
+DTYPES = {"id": "INT", "name": "VARCHAR(50)", "amount": "FLOAT(24)"}
+
+
+class FakeAzureSQL:
+    """Records the queries instead of running them."""
+
+    def __init__(self, credentials):
+        self.credentials = dict(
+            server="fake", db_name="fake", user="fake", password="fake"
+        )
+        self.con = None
+        self.queries = []
+
+    def create_table(self, schema, table, dtypes, if_exists):
+        self.queries.append(f"CREATE TABLE {schema}.{table}")
+
+    def run(self, query):
+        self.queries.append(query)
+        return True
+
+
+@pytest.fixture
+def upsert(monkeypatch, fake_bcp):
+    monkeypatch.setattr(azure_sql, "AzureSQL", FakeAzureSQL)
+    monkeypatch.setattr(azure_sql, "get_credentials", lambda *args, **kwargs: {})
+    monkeypatch.setattr(
+        azure_sql, "get_sql_server_table_dtypes", lambda **kwargs: DTYPES
+    )
+    monkeypatch.setattr(azure_sql, "build_merge_query", lambda **kwargs: "MERGE")
+    return AzureSQLUpsert(
+        schema="sandbox",
+        table="test",
+        on="id",
+        load_method="bcp",
+        bcp_path=fake_bcp["path"],
+    )
+
+
+def test_azure_sql_upsert_bcp_column_order(upsert, fake_bcp):
+    df = pd.DataFrame({"amount": [1.5, 2.5], "id": [1, 2], "name": ["a", "b"]})
+
+    assert upsert.run(df=df)
+
+    # the columns are loaded in the order of the table
+    (loaded_file,) = os.listdir(fake_bcp["loaded_dir"])
+    with open(os.path.join(fake_bcp["loaded_dir"], loaded_file)) as f:
+        assert f.read().splitlines() == ["1\ta\t1.5", "2\tb\t2.5"]
+
+
+def test_azure_sql_upsert_bcp_different_columns(upsert):
+    df = pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+
+    with pytest.raises(ValidationError):
+        upsert.run(df=df)
@@ -0,0 +1,112 @@
+import os
+
+import pytest
+from prefect.engine import signals
+
+import viadot.tasks.bcp as bcp_tasks
+from viadot.tasks import BCPTask
+from viadot.tasks.bcp import split_file
+
+CREDENTIALS = dict(server="fake", db_name="fake", user="fake", password="fake")
+
+
+class FakeConnection:
+    def __init__(self, queries):
+        self.queries = queries
+
+    def cursor(self):
+        return self
+
+    def execute(self, query):
+        self.queries.append(query)
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    queries = []
+
+    class FakeSQLServer:
+        def __init__(self, *args, **kwargs):
+            self.con = FakeConnection(queries)
+
+    monkeypatch.setattr(bcp_tasks, "SQLServer", FakeSQLServer)
+    return queries
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("id\tname\n" + "".join(f"{i}\tname_{i}\n" for i in range(1000)))
+    return str(path)
+
+
+def test_split_file(csv_file):
+    parts = list(split_file(csv_file, n_parts=3))
+
+    assert len(parts) == 3
+    lines = []
+    for part in parts:
+        with open(part) as f:
+            assert f.readline() == "id\tname\n"
+            lines.extend(f.readlines())
+    with open(csv_file) as f:
+        assert lines == f.readlines()[1:]
+
+
+def test_split_file_small_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("id\n1\n")
+    assert len(list(split_file(str(path), n_parts=4))) == 1
+
+
+def test_bcp_parallel(fake_bcp, queries, csv_file, tmp_path):
+    task = BCPTask(bcp_path=fake_bcp["path"], credentials=CREDENTIALS)
+
+    result = task.run(
+        path=csv_file,
+        schema="sandbox",
+        table="test_bcp",
+        parallel=4,
+        error_log_file_path=str(tmp_path / "log_file.log"),
+    )
+
+    assert result["files"] == 4
+    assert result["rows"] == 1000
+    assert result["rows_per_second"] > 0
+    assert sorted(os.listdir(fake_bcp["loaded_dir"])) == [
+        f"data_part{i}.csv" for i in range(4)
+    ]
+    # the source file is kept, the parts are removed
+    assert os.listdir(tmp_path) == ["data.csv"]
+    staging_table = queries[0].split()[-3]
+    assert staging_table.startswith("sandbox.test_bcp_staging_")
+    assert queries == [
+        f"SELECT TOP 0 * INTO {staging_table} FROM sandbox.test_bcp",
+        f"INSERT INTO sandbox.test_bcp WITH (TABLOCK) SELECT * FROM {staging_table}",
+        f"DROP TABLE IF EXISTS {staging_table}",
+    ]
+
+
+def test_bcp_parallel_failure(queries, csv_file, tmp_path):
+    failing_bcp = tmp_path / "bcp"
+    failing_bcp.write_text("#!/bin/bash\necho 'Error' >&2\nexit 1\n")
+    failing_bcp.chmod(0o755)
+    task = BCPTask(bcp_path=str(failing_bcp), credentials=CREDENTIALS)
+
+    with pytest.raises(signals.FAIL):
+        task.run(
+            path=csv_file,
+            table="test_bcp",
+            parallel=2,
+            error_log_file_path=str(tmp_path / "log_file.log"),
+        )
+
+    # the destination table is left untouched, so the load can be retried
+    assert not any(query.startswith("INSERT") for query in queries)
+    assert queries[-1].startswith("DROP TABLE")
@@ -3,7 +3,7 @@ import os
 import pytest
 
 from viadot.sources.duckdb import DuckDB
-from viadot.tasks import DuckDBCreateTableFromParquet
+from viadot.tasks import DuckDBCreateTableFromParquet, DuckDBToSQLServerStream
 
 TABLE = "test_table"
 SCHEMA = "test_schema"
@@ -35,3 +35,30 @@ def test_create_table(duckdb, TEST_PARQUET_FILE_PATH):
 
     assert duckdb._check_if_table_exists(TABLE, schema=SCHEMA)
     os.remove(DATABASE_PATH)
+
+
+def test_duckdb_to_sql_server_stream(fake_bcp, tmp_path):
+    duckdb_creds = {"database": str(tmp_path / "stream.duckdb")}
+    sql_server_creds = dict(server="fake", db_name="fake", user="fake", password="fake")
+    task = DuckDBToSQLServerStream(
+        batch_size=100,
+        rows_per_file=300,
+        max_concurrent_loads=2,
+        bcp_path=fake_bcp["path"],
+        duckdb_credentials=duckdb_creds,
+        sql_server_credentials=sql_server_creds,
+    )
+    result = task.run(
+        query="SELECT range AS id FROM range(1000)",
+        path=str(tmp_path / "stream.csv"),
+        schema="sandbox",
+        table="test_stream",
+        error_log_file_path=str(tmp_path / "log_file.log"),
+    )
+
+    assert result["files"] == 4
+    assert result["rows"] == 1000
+    loaded = sorted(os.listdir(fake_bcp["loaded_dir"]))
+    assert loaded == [f"stream_{i}.csv" for i in range(4)]
+    # the intermediate files are removed once loaded
+    assert not any(f.startswith("stream_") for f in os.listdir(tmp_path))
@@ -0,0 +1,312 @@
+import copy
+import random
+import time
+
+import pandas as pd
+import pytest
+from prefect.utilities import logging
+
+from viadot.tasks import GenesysToCSV
+
+logger = logging.get_logger()
+
+
+def merge_conversations_dfs_baseline(data_to_merge: list) -> pd.DataFrame:
+    """The implementation of `GenesysToCSV.merge_conversations_dfs()` based on
+    `pd.json_normalize()`, which the current one replaced and must match. Copied
+    unchanged, apart from this docstring."""
+    # LEVEL 0
+    df0 = pd.json_normalize(data_to_merge)
+    df0.drop(["participants"], axis=1, inplace=True)
+
+    # LEVEL 1
+    df1 = pd.json_normalize(
+        data_to_merge,
+        record_path=["participants"],
+        meta=["conversationId"],
+    )
+    df1.drop(["sessions"], axis=1, inplace=True)
+
+    # LEVEL 2
+    df2 = pd.json_normalize(
+        data_to_merge,
+        record_path=["participants", "sessions"],
+        meta=[
+            ["participants", "externalContactId"],
+            ["participants", "participantId"],
+        ],
+        errors="ignore",
+        sep="_",
+    )
+    df2.rename(
+        columns={
+            "participants_externalContactId": "externalContactId",
+            "participants_participantId": "participantId",
+        },
+        inplace=True,
+    )
+    for key in ["metrics", "segments", "mediaEndpointStats"]:
+        try:
+            df2.drop([key], axis=1, inplace=True)
+        except KeyError as e:
+            logger.info(f"Key {e} not appearing in the response.")
+
+    # LEVEL 3
+    # not all levels 3 have the same data, and that creates problems of standardization
+    # so I add empty data where it is not available to avoid future errors
+    conversations_df = {}
+    for i, conversation in enumerate(data_to_merge):
+        for j, entry_0 in enumerate(conversation["participants"]):
+            for key in list(entry_0.keys()):
+                if key == "sessions":
+                    for k, entry_1 in enumerate(entry_0[key]):
+                        if "metrics" not in list(entry_1.keys()):
+                            conversation["participants"][j][key][k]["metrics"] = []
+                        if "segments" not in list(entry_1.keys()):
+                            conversation["participants"][j][key][k]["segments"] = []
+                        if "mediaEndpointStats" not in list(entry_1.keys()):
+                            conversation["participants"][j][key][k][
+                                "mediaEndpointStats"
+                            ] = []
+        # LEVEL 3 metrics
+        df3_1 = pd.json_normalize(
+            conversation,
+            record_path=["participants", "sessions", "metrics"],
+            meta=[
+                ["participants", "sessions", "sessionId"],
+            ],
+            errors="ignore",
+            record_prefix="metrics_",
+            sep="_",
+        )
+        df3_1.rename(
+            columns={"participants_sessions_sessionId": "sessionId"}, inplace=True
+        )
+        # LEVEL 3 segments
+        df3_2 = pd.json_normalize(
+            conversation,
+            record_path=["participants", "sessions", "segments"],
+            meta=[
+                ["participants", "sessions", "sessionId"],
+            ],
+            errors="ignore",
+            record_prefix="segments_",
+            sep="_",
+        )
+        df3_2.rename(
+            columns={"participants_sessions_sessionId": "sessionId"}, inplace=True
+        )
+        # LEVEL 3 mediaEndpointStats
+        df3_3 = pd.json_normalize(
+            conversation,
+            record_path=["participants", "sessions", "mediaEndpointStats"],
+            meta=[
+                ["participants", "sessions", "sessionId"],
+            ],
+            errors="ignore",
+            record_prefix="mediaEndpointStats_",
+            sep="_",
+        )
+        df3_3.rename(
+            columns={"participants_sessions_sessionId": "sessionId"}, inplace=True
+        )
+
+        # merging all LEVELs 3 from the same conversation
+        dff3_tmp = pd.concat([df3_1, df3_2])
+        dff3 = pd.concat([dff3_tmp, df3_3])
+
+        conversations_df.update({i: dff3})
+
+    # NERGING ALL LEVELS
+    # LEVELS 3
+    for l, key in enumerate(list(conversations_df.keys())):
+        if l == 0:
+            dff3_f = conversations_df[key]
+        else:
+            dff3_f = pd.concat([dff3_f, conversations_df[key]])
+
+    # LEVEL 3 with LEVEL 2
+    dff2 = pd.merge(dff3_f, df2, how="outer", on=["sessionId"])
+
+    # LEVEL 2 with LEVEL 1
+    dff1 = pd.merge(df1, dff2, how="outer", on=["externalContactId", "participantId"])
+
+    # LEVEL 1 with LEVEL 0
+    dff = pd.merge(df0, dff1, how="outer", on=["conversationId"])
+
+    return dff
+
+
+def make_conversations(n: int, seed: int = 0) -> list:
+    """Generate synthetic conversations, with optional and nested fields."""
+    rng = random.Random(seed)
+    conversations = []
+    for i in range(n):
+        participants = []
+        for j in range(rng.randint(1, 4)):
+            sessions = []
+            for k in range(rng.randint(0, 3)):
+                session = {
+                    "sessionId": f"s-{i}-{j}-{k}",
+                    "mediaType": rng.choice(["voice", "chat"]),
+                    "direction": "inbound",
+                }
+                if rng.random() < 0.5:
+                    session["flow"] = {
+                        "flowId": f"f-{k}",
+                        "flowType": "INBOUNDCALL",
+                        "outcome": {"name": "transfer"},
+                    }
+                if rng.random() < 0.8:
+                    session["metrics"] = [
+                        {
+                            "emitDate": "2023-01-01T00:00:00.00Z",
+                            "name": rng.choice(["nConnected", "tTalk", "tHeld"]),
+                            "value": rng.randint(1, 1000),
+                            **({"unit": None} if rng.random() < 0.1 else {}),
+                        }
+                        for _ in range(rng.randint(0, 4))
+                    ]
+                if rng.random() < 0.8:
+                    session["segments"] = [
+                        {
+                            "conference": rng.random() < 0.5,
+                            "segmentStart": "2023-01-01T00:00:00.00Z",
+                            "segmentEnd": "2023-01-01T00:01:00.00Z",
+                            "segmentType": rng.choice(["system", "interact"]),
+                            **(
+                                {"queueId": f"q-{rng.randint(0, 3)}"}
+                                if rng.random() < 0.5
+                                else {}
+                            ),
+                        }
+                        for _ in range(rng.randint(1, 3))
+                    ]
+                if rng.random() < 0.5:
+                    session["mediaEndpointStats"] = [
+                        {
+                            "codecs": ["audio/opus"],
+                            "minMos": rng.random() * 5,
+                            "receivedPackets": rng.randint(0, 500),
+                        }
+                    ]
+                sessions.append(session)
+            participant = {
+                "participantId": f"p-{i}-{j}",
+                "purpose": rng.choice(["customer", "ivr", "agent"]),
+                "sessions": sessions,
+            }
+            if rng.random() < 0.7:
+                participant["externalContactId"] = f"c-{i}"
+                participant["attributes"] = {"lob": "lob", "reached": "reach"}
+            participants.append(participant)
+        conversations.append(
+            {
+                "conversationId": f"conv-{i}",
+                "conversationStart": "2023-01-01T00:00:00.00Z",
+                "divisionIds": ["d1", "d2"],
+                "mediaStatsMinConversationMos": rng.random() * 5,
+                "originatingDirection": rng.choice(["inbound", "outbound"]),
+                "participants": participants,
+            }
+        )
+    return conversations
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_merge_conversations_dfs(seed):
+    conversations = make_conversations(30, seed=seed)
+    expected = merge_conversations_dfs_baseline(copy.deepcopy(conversations))
+
+    df = GenesysToCSV().merge_conversations_dfs(conversations)
+
+    pd.testing.assert_frame_equal(df, expected)
+    # the input is not modified
+    assert conversations == make_conversations(30, seed=seed)
+
+
+def _conversation(conversation_id: str, sessions_by_participant: list) -> dict:
+    return {
+        "conversationId": conversation_id,
+        "participants": [
+            {
+                "participantId": f"{conversation_id}-p{i}",
+                "externalContactId": conversation_id,
+                "sessions": sessions,
+            }
+            for i, sessions in enumerate(sessions_by_participant)
+        ],
+    }
+
+
+EDGE_CASES = {
+    # a conversation without any session has no `sessionId` column at level 3
+    "no_sessions_first": [
+        _conversation("c0", [[]]),
+        _conversation(
+            "c1",
+            [
+                [
+                    {
+                        "sessionId": "s1",
+                        "metrics": [{"name": "tTalk", "value": 1}],
+                        "segments": [{"segmentType": "system"}],
+                    }
+                ]
+            ],
+        ),
+    ],
+    "participant_without_sessions": [
+        _conversation(
+            "c0",
+            [[], [{"sessionId": "s0", "metrics": [{"name": "tTalk", "value": 1}]}]],
+        ),
+        _conversation("c1", [[{"sessionId": "s1", "segments": []}]]),
+    ],
+    # the integer and None values are typed as when concatenating the conversations
+    "none_metric_in_second_conversation": [
+        _conversation(
+            "c0", [[{"sessionId": "s0", "metrics": [{"name": "n", "value": 1}]}]]
+        ),
+        _conversation(
+            "c1",
+            [
+                [
+                    {
+                        "sessionId": "s1",
+                        "metrics": [{"name": "n", "value": 2, "extra": None}],
+                    }
+                ]
+            ],
+        ),
+    ],
+}
+
+
+@pytest.mark.parametrize("case", EDGE_CASES)
+def test_merge_conversations_dfs_edge_cases(case):
+    conversations = EDGE_CASES[case]
+    expected = merge_conversations_dfs_baseline(copy.deepcopy(conversations))
+
+    df = GenesysToCSV().merge_conversations_dfs(copy.deepcopy(conversations))
+
+    pd.testing.assert_frame_equal(df, expected)
+    assert df.to_csv(index=False) == expected.to_csv(index=False)
+
+
+@pytest.mark.benchmark
+def test_merge_conversations_dfs_benchmark(record_property):
+    conversations = make_conversations(1000)
+
+    start = time.perf_counter()
+    expected = merge_conversations_dfs_baseline(copy.deepcopy(conversations))
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    df = GenesysToCSV().merge_conversations_dfs(conversations)
+    new_time = time.perf_counter() - start
+
+    record_property("baseline_seconds", reference_time)
+    record_property("seconds", new_time)
+    pd.testing.assert_frame_equal(df, expected)
+    assert new_time < reference_time
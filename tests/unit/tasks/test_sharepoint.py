@@ -0,0 +1,150 @@
+import datetime
+import json
+import time
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from viadot.exceptions import ValidationError
+from viadot.tasks import sharepoint
+from viadot.tasks.sharepoint import SharepointToDF
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "january"
+    sheet.append(["id", "name", "amount", "date"])
+    for i in range(25):
+        sheet.append([i, f"name\t{i}", 1.5 * i, datetime.datetime(2023, 1, 1 + i)])
+    sheet.append([])
+    sheet.append([25, "after a blank row"])
+
+    sheet = workbook.create_sheet("february")
+    sheet.append(["id", "name", "amount", "date"])
+    for i in range(3):
+        sheet.append([100 + i, "x", 2.0, None])
+
+    path = str(tmp_path / "workbook.xlsx")
+    workbook.save(path)
+    return path
+
+
+@pytest.fixture
+def no_download(monkeypatch):
+    class FakeSharepoint:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def download_file(self, *args, **kwargs):
+            pass
+
+    class FakeSecret:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def run(self):
+            return json.dumps({"site": "tenant.sharepoint.com"})
+
+    monkeypatch.setattr(sharepoint, "Sharepoint", FakeSharepoint)
+    monkeypatch.setattr(sharepoint, "AzureKeyVaultSecret", FakeSecret)
+
+
+def test_split_sheet(workbook_path):
+    task = SharepointToDF(path_to_file=workbook_path)
+
+    chunks = task.split_sheet("january", nrows=10, chunks=[])
+
+    assert [chunk.shape[0] for chunk in chunks] == [10, 10, 7]
+    assert list(chunks[0].columns) == [0, 1, 2, 3, "sheet_name"]
+    df = pd.concat(chunks)
+    # blank rows are kept, as with `pd.read_excel()`
+    assert df[0].isna().sum() == 1
+    assert list(df[0].dropna()) == list(range(26))
+    assert (df["sheet_name"] == "january").all()
+
+    chunks_read_at_once = task.split_sheet("january", nrows=1000, chunks=[])
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks).reset_index(drop=True), chunks_read_at_once[0]
+    )
+
+
+def test_sharepoint_to_df(workbook_path, no_download):
+    task = SharepointToDF(path_to_file=workbook_path, url_to_file="url", nrows=10)
+
+    df = task.run(credentials_secret="secret", validate_excel_file=True)
+
+    assert df.shape[0] == 30
+    assert list(df.columns[:5]) == ["id", "name", "amount", "date", "sheet_name"]
+    assert list(df["sheet_name"].value_counts().sort_index()) == [3, 27]
+    assert df["name"].iloc[1] == "name1"
+    assert df["date"].iloc[0] == pd.Timestamp("2023-01-01")
+
+
+def test_sharepoint_to_df_sheet_number(workbook_path, no_download):
+    task = SharepointToDF(path_to_file=workbook_path, url_to_file="url")
+
+    df = task.run(credentials_secret="secret", sheet_number=1)
+
+    assert list(df["id"]) == [100, 101, 102]
+
+
+def test_sharepoint_to_df_validate_excel_file(workbook_path, no_download):
+    workbook = openpyxl.load_workbook(workbook_path)
+    workbook["february"]["B1"] = "other"
+    workbook.save(workbook_path)
+    task = SharepointToDF(path_to_file=workbook_path, url_to_file="url")
+
+    with pytest.raises(ValidationError):
+        task.run(credentials_secret="secret", validate_excel_file=True)
+
+
+def test_sharepoint_to_df_parallel(workbook_path, no_download):
+    task = SharepointToDF(path_to_file=workbook_path, url_to_file="url", nrows=10)
+
+    df = task.run(credentials_secret="secret", max_workers=1)
+    df_parallel = task.run(credentials_secret="secret", max_workers=2)
+
+    pd.testing.assert_frame_equal(df, df_parallel)
+
+
+def test_sharepoint_to_df_parallel_validate_excel_file(workbook_path, no_download):
+    workbook = openpyxl.load_workbook(workbook_path)
+    workbook["february"]["B1"] = "other"
+    workbook.save(workbook_path)
+    task = SharepointToDF(path_to_file=workbook_path, url_to_file="url")
+
+    with pytest.raises(ValidationError):
+        task.run(credentials_secret="secret", validate_excel_file=True, max_workers=2)
+
+
+@pytest.mark.benchmark
+def test_sharepoint_to_df_parallel_benchmark(tmp_path, no_download, record_property):
+    n_sheets, n_rows = 4, 2000
+    workbook = openpyxl.Workbook(write_only=True)
+    for i_sheet in range(n_sheets):
+        sheet = workbook.create_sheet(f"sheet_{i_sheet}")
+        sheet.append(["id", "name", "amount", "date"])
+        for i in range(n_rows):
+            sheet.append([i, f"name_{i}", i * 0.5, datetime.datetime(2023, 1, 1)])
+    path = str(tmp_path / "benchmark.xlsx")
+    workbook.save(path)
+    task = SharepointToDF(path_to_file=path, url_to_file="url", nrows=500)
+
+    timings = {}
+    results = {}
+    for max_workers in (1, 4):
+        start = time.perf_counter()
+        df = task.run(credentials_secret="secret", max_workers=max_workers)
+        timings[max_workers] = time.perf_counter() - start
+        results[max_workers] = df
+    record_property("serial_seconds", timings[1])
+    record_property("parallel_seconds", timings[4])
+
+    assert results[1].shape[0] == n_sheets * n_rows
+    assert list(results[4]["sheet_name"].unique()) == [
+        f"sheet_{i}" for i in range(n_sheets)
+    ]
+    pd.testing.assert_frame_equal(results[1], results[4])
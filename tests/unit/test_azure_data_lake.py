@@ -0,0 +1,370 @@
+import io
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pytest
+from fsspec.implementations.local import LocalFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
+
+from viadot.sources import AzureDataLake
+from viadot.sources.azure_data_lake import (
+    add_metadata_columns,
+    filters_to_expression,
+    glob_to_regex,
+    unify_tables,
+)
+
+
+@pytest.fixture
+def lake():
+    return AzureDataLake(fs=LocalFileSystem())
+
+
+@pytest.fixture
+def partitioned_dir(tmp_path):
+    df = pd.DataFrame(
+        {
+            "country": ["italy", "germany", "spain", "italy"],
+            "sales": [100, 50, 80, 20],
+            "year": [2022, 2022, 2023, 2023],
+        }
+    )
+    ds.write_dataset(
+        pa.Table.from_pandas(df, preserve_index=False),
+        str(tmp_path / "sales"),
+        format="parquet",
+        partitioning=ds.partitioning(pa.schema([("year", pa.int32())]), flavor="hive"),
+    )
+    return str(tmp_path / "sales")
+
+
+def test_filters_to_expression():
+    expression = filters_to_expression(
+        [
+            [("country", "=", "italy"), ("sales", ">", 50)],
+            [("country", "in", ["spain"])],
+        ]
+    )
+    table = pa.table({"country": ["italy", "italy", "spain"], "sales": [100, 20, 1]})
+    filtered = ds.dataset(table).to_table(filter=expression)
+    assert filtered.to_pydict() == {"country": ["italy", "spain"], "sales": [100, 1]}
+
+
+def test_filters_to_expression_unsupported_operator():
+    with pytest.raises(ValueError):
+        filters_to_expression([("country", "like", "ita%")])
+
+
+def test_to_df_parquet_columns_and_filters(lake, tmp_path, DF):
+    path = str(tmp_path / "sales.parquet")
+    DF.to_parquet(path, index=False)
+
+    df = lake.to_df(path, columns=["country"], filters=[("sales", ">=", 80)])
+
+    assert list(df.columns) == ["country"]
+    assert sorted(df["country"]) == ["italy", "spain"]
+
+
+def test_to_df_hive_partitioned_directory(lake, partitioned_dir):
+    df = lake.to_df(partitioned_dir)
+    assert df.shape == (4, 3)
+
+    df = lake.to_df(
+        partitioned_dir, columns=["country", "sales"], filters=[("year", "=", 2023)]
+    )
+    assert list(df.columns) == ["country", "sales"]
+    assert sorted(df["sales"]) == [20, 80]
+
+
+def test_to_df_parquet_directory_ignores_hidden_files(lake, partitioned_dir):
+    with open(os.path.join(partitioned_dir, "_SUCCESS"), "w"):
+        pass
+
+    df = lake.to_df(partitioned_dir, filters=[("year", "=", 2022)])
+
+    assert sorted(df["country"]) == ["germany", "italy"]
+
+
+def test_read_many_parquet_partitions(lake, partitioned_dir):
+    df = lake.read_many(
+        partitioned_dir + "/*/*.parquet",
+        columns=["country", "year"],
+        filters=[("sales", ">", 30)],
+    )
+
+    # the partition keys are read from the paths
+    assert df.sort_values("country").to_dict("list") == {
+        "country": ["germany", "italy", "spain"],
+        "year": [2022, 2022, 2023],
+    }
+
+
+def test_to_df_csv_columns_and_filters(lake, tmp_path, DF):
+    path = str(tmp_path / "sales.csv")
+    DF.to_csv(path, index=False, sep="\t")
+
+    df = lake.to_df(path, columns=["country", "sales"], filters=[("sales", "<", 80)])
+
+    assert list(df["country"]) == ["germany"]
+
+
+def test_upload_many(lake, tmp_path):
+    from_paths = []
+    for i in range(5):
+        path = tmp_path / f"file_{i}.csv"
+        path.write_text(f"a,b\n{i},{i}\n" * 1000)
+        from_paths.append(str(path))
+    to_paths = [str(tmp_path / "lake" / "dir" / f"file_{i}.csv") for i in range(5)]
+
+    results = lake.upload_many(
+        from_paths=from_paths, to_paths=to_paths, max_workers=2, chunk_size=1024
+    )
+
+    assert [result["to_path"] for result in results] == to_paths
+    assert all(result["status"] == "success" for result in results)
+    for from_path, result in zip(from_paths, results):
+        with open(from_path) as src, open(result["to_path"]) as dst:
+            assert src.read() == dst.read()
+        assert result["bytes"] == len(open(from_path, "rb").read())
+
+
+def test_upload_many_gen1(lake):
+    lake.gen = 1
+
+    with pytest.raises(NotImplementedError):
+        lake.upload_many(from_paths=["a.csv"], to_paths=["sandbox/a.csv"])
+
+
+def test_upload_many_reports_failures(lake, tmp_path):
+    existing = tmp_path / "existing.csv"
+    existing.write_text("old")
+    new = tmp_path / "new.csv"
+    new.write_text("new")
+
+    results = lake.upload_many(
+        from_paths=[str(new), str(new), str(tmp_path / "missing.csv")],
+        to_paths=[
+            str(existing),
+            str(tmp_path / "copy.csv"),
+            str(tmp_path / "missing_copy.csv"),
+        ],
+        overwrite=False,
+    )
+
+    assert [result["status"] for result in results] == ["failed", "success", "failed"]
+    assert results[0]["error"].startswith("FileExistsError")
+    assert existing.read_text() == "old"
+
+
+@pytest.fixture
+def tree(tmp_path):
+    files = [
+        "2022/01/sales_a.csv",
+        "2023/01/sales_a.csv",
+        "2023/01/sales_b.parquet",
+        "2023/02/returns.csv",
+        "2023/02/nested/sales_c.csv",
+        "readme.md",
+    ]
+    for file in files:
+        path = tmp_path / "raw" / file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    return str(tmp_path / "raw")
+
+
+def _relative(paths, root):
+    return sorted(path[len(root) + 1 :] for path in paths)
+
+
+def test_glob_to_regex():
+    regex = glob_to_regex("2023/*/sales_*.csv")
+    assert regex.match("2023/01/sales_a.csv")
+    assert not regex.match("2023/01/nested/sales_a.csv")
+    assert not regex.match("2023/01/sales_a.csv.bak")
+
+    regex = glob_to_regex("**/*.parquet")
+    assert regex.match("a.parquet")
+    assert regex.match("a/b/c.parquet")
+
+    assert glob_to_regex("sales_[ab].csv").match("sales_b.csv")
+    assert not glob_to_regex("sales_[!ab].csv").match("sales_b.csv")
+
+
+def test_iter_files(lake, tree):
+    assert len(list(lake.iter_files(tree))) == 6
+    assert _relative(lake.iter_files(tree, recursive=False), tree) == ["readme.md"]
+    assert _relative(lake.iter_files(tree, pattern="2023/*/sales_*.csv"), tree) == [
+        "2023/01/sales_a.csv"
+    ]
+    assert _relative(lake.iter_files(tree, pattern="2023/**/sales_*"), tree) == [
+        "2023/01/sales_a.csv",
+        "2023/01/sales_b.parquet",
+        "2023/02/nested/sales_c.csv",
+    ]
+    assert _relative(lake.iter_files(tree, pattern="**/*.parquet"), tree) == [
+        "2023/01/sales_b.parquet"
+    ]
+    assert list(lake.iter_files(tree, pattern="2024/**")) == []
+
+
+def test_iter_files_only_lists_matching_directories(tree):
+    fs = LocalFileSystem()
+    listed = []
+    ls = fs.ls
+
+    def _ls(path, *args, **kwargs):
+        listed.append(path)
+        return ls(path, *args, **kwargs)
+
+    fs.ls = _ls
+    lake = AzureDataLake(fs=fs)
+    list(lake.iter_files(tree, pattern="2023/01/*.csv"))
+
+    assert _relative(listed, tree) == ["2023/01"]
+
+
+def test_iter_files_cache(tree, tmp_path):
+    lake = AzureDataLake(fs=LocalFileSystem())
+    first = sorted(lake.iter_files(tree, pattern="2023/**", cache_ttl=60))
+    (tmp_path / "raw" / "2023" / "new.csv").write_text("")
+
+    assert sorted(lake.iter_files(tree, pattern="2023/**", cache_ttl=60)) == first
+    assert len(list(lake.iter_files(tree, pattern="2023/**"))) == len(first) + 1
+
+
+def test_add_metadata_columns_csv(DF):
+    src = io.BytesIO(DF.to_csv(sep="\t", index=False).encode("utf-8"))
+    dst = io.BytesIO()
+
+    add_metadata_columns(src, dst, columns={"_source": "gen1"}, chunksize=2)
+
+    df = pd.read_csv(io.BytesIO(dst.getvalue()), sep="\t")
+    pd.testing.assert_frame_equal(df, DF.assign(_source="gen1"))
+
+
+def test_add_metadata_columns_csv_keeps_values():
+    text = "id\tcode\tamount\n1\t007\t5\n2\t008\t\n3\t009\t7\n4\tNA\t8\n"
+    src = io.BytesIO(text.encode("utf-8"))
+    dst = io.BytesIO()
+
+    add_metadata_columns(src, dst, columns={"_source": "gen1"}, chunksize=2)
+
+    assert dst.getvalue().decode("utf-8").splitlines() == [
+        "id\tcode\tamount\t_source",
+        "1\t007\t5\tgen1",
+        "2\t008\t\tgen1",
+        "3\t009\t7\tgen1",
+        "4\tNA\t8\tgen1",
+    ]
+
+
+def test_iter_batches_csv_keeps_values(lake, tmp_path):
+    path = tmp_path / "sales.csv"
+    path.write_text("code\tamount\n007\t5\n008\t\n009\t7\n")
+
+    batches = list(lake.iter_batches(str(path), batch_size=2, sep="\t"))
+
+    assert [batch.to_dict("list") for batch in batches] == [
+        {"code": ["007", "008"], "amount": ["5", ""]},
+        {"code": ["009"], "amount": ["7"]},
+    ]
+
+
+def test_add_metadata_columns_parquet(DF):
+    src = io.BytesIO()
+    DF.to_parquet(src, index=False)
+    src.seek(0)
+    dst = io.BytesIO()
+
+    add_metadata_columns(
+        src, dst, columns={"_source": "gen1"}, file_format="parquet", chunksize=2
+    )
+
+    df = pd.read_parquet(io.BytesIO(dst.getvalue()))
+    pd.testing.assert_frame_equal(df, DF.assign(_source="gen1"))
+
+
+def test_copy_many_within_lake(lake, tree, tmp_path):
+    from_paths = sorted(lake.iter_files(tree, pattern="2023/**"))
+    to_paths = [path.replace("raw", "curated") for path in from_paths]
+
+    results = lake.copy_many(from_paths, to_paths, max_workers=2)
+
+    assert all(result["status"] == "success" for result in results)
+    assert all(os.path.exists(path) for path in to_paths)
+
+
+def test_copy_many_streams_to_other_lake_with_metadata(lake, tmp_path, DF):
+    from_path = str(tmp_path / "sales.csv")
+    DF.to_csv(from_path, sep="\t", index=False)
+    to_lake = AzureDataLake(fs=MemoryFileSystem())
+
+    results = lake.copy_many(
+        [from_path, str(tmp_path / "missing.csv")],
+        ["/gen2/sales.csv", "/gen2/missing.csv"],
+        to_lake=to_lake,
+        metadata_columns={"_source": "gen1"},
+    )
+
+    assert [result["status"] for result in results] == ["success", "failed"]
+    with to_lake.fs.open("/gen2/sales.csv", "rb") as f:
+        df = pd.read_csv(f, sep="\t")
+    pd.testing.assert_frame_equal(df, DF.assign(_source="gen1"))
+
+
+@pytest.fixture
+def daily_files(tmp_path):
+    directory = tmp_path / "daily"
+    directory.mkdir()
+    pd.DataFrame({"id": [1, 2], "amount": [10, 20]}).to_csv(
+        directory / "2023-01-01.csv", sep="\t", index=False
+    )
+    pd.DataFrame({"id": [3], "amount": [1.5], "currency": ["EUR"]}).to_csv(
+        directory / "2023-01-02.csv", sep="\t", index=False
+    )
+    pd.DataFrame({"id": [4, 5], "amount": [7, 8]}).to_parquet(
+        directory / "2023-02-01.parquet", index=False
+    )
+    return str(directory)
+
+
+def test_unify_tables():
+    table = unify_tables(
+        [
+            pa.table({"a": pa.array([1], pa.int32()), "b": ["x"]}),
+            pa.table({"a": [1.5], "c": [True]}),
+            pa.table({"b": [1]}),
+        ]
+    )
+    assert table.schema == pa.schema(
+        [("a", pa.float64()), ("b", pa.string()), ("c", pa.bool_())]
+    )
+    assert table.to_pydict() == {
+        "a": [1.0, 1.5, None],
+        "b": ["x", None, "1"],
+        "c": [None, True, None],
+    }
+
+
+def test_to_df_directory(lake, daily_files):
+    df = lake.to_df(daily_files, add_source_file=True)
+
+    assert list(df.columns) == ["id", "amount", "currency", "_source_file"]
+    assert list(df["id"]) == [1, 2, 3, 4, 5]
+    assert list(df["amount"]) == [10, 20, 1.5, 7, 8]
+    assert df["_source_file"].str.endswith("2023-01-01.csv").sum() == 2
+
+
+def test_to_df_glob(lake, daily_files):
+    df = lake.to_df(daily_files + "/2023-01-*.csv", columns=["id"])
+    assert list(df.columns) == ["id"]
+    assert list(df["id"]) == [1, 2, 3]
+
+    df = lake.to_df(daily_files + "/*", filters=[("amount", ">", 5)], limit=3)
+    assert list(df["id"]) == [1, 2, 4]
+
+    with pytest.raises(FileNotFoundError):
+        lake.to_df(daily_files + "/*.json")
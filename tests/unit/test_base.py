@@ -1,12 +1,14 @@
 import logging
 import os
+import sqlite3
+from datetime import date
 
 import pandas as pd
 import pyarrow as pa
 import pytest
 
 from viadot.signals import SKIP
-from viadot.sources.base import SQL, Source
+from viadot.sources.base import DDL_PATTERN, SQL, Source
 
 from .test_credentials import get_credentials
 
@@ -81,3 +83,73 @@ def test_handle_if_empty(caplog):
         src._handle_if_empty(if_empty="fail")
     with pytest.raises(SKIP):
         src._handle_if_empty(if_empty="skip")
+
+
+class SQLite3Source(SQL):
+    """A SQL source using Python's sqlite3 module, which doesn't need an ODBC driver."""
+
+    def _connect(self):
+        return sqlite3.connect(self.credentials["db_name"], check_same_thread=False)
+
+
+@pytest.fixture
+def sqlite3_source(tmp_path):
+    source = SQLite3Source(credentials=dict(db_name=str(tmp_path / "test.db")))
+    rows = [(i, ["italy", "spain"][i % 2], i * 1.5) for i in range(1, 101)]
+    rows += [(None, "germany", 0.5), (1000, "italy", 1.0)]
+    cursor = source.con.cursor()
+    cursor.execute("CREATE TABLE sales (id INT, country VARCHAR(10), amount FLOAT)")
+    cursor.executemany("INSERT INTO sales VALUES (?, ?, ?)", rows)
+    source.con.commit()
+    return source
+
+
+@pytest.mark.parametrize("partition_method", ["range", "ntile"])
+def test_to_df_partitioned(sqlite3_source, partition_method):
+    query = "SELECT * FROM sales"
+    expected = sqlite3_source.to_df(query)
+
+    df = sqlite3_source.to_df_partitioned(
+        query, partition_column="id", partitions=4, partition_method=partition_method
+    )
+
+    assert len(df) == 102
+    pd.testing.assert_frame_equal(
+        df.sort_values("amount", ignore_index=True),
+        expected.sort_values("amount", ignore_index=True),
+    )
+
+
+def test_to_df_partitioned_non_numeric_column(sqlite3_source):
+    df = sqlite3_source.to_df_partitioned(
+        "SELECT * FROM sales WHERE id < 50;", partition_column="country"
+    )
+    assert len(df) == 49
+
+
+def test_split_range():
+    assert SQL._split_range(0, 100, 4) == [0, 25, 50, 75]
+    assert SQL._split_range(1, 3, 4) == [1, 2]
+    assert SQL._split_range(date(2023, 1, 1), date(2023, 1, 9), 4) == [
+        date(2023, 1, 1),
+        date(2023, 1, 3),
+        date(2023, 1, 5),
+        date(2023, 1, 7),
+    ]
+
+
+@pytest.mark.parametrize(
+    "query, is_ddl",
+    [
+        ("SELECT * FROM sales", False),
+        ("INSERT INTO sales VALUES (1)", False),
+        ("MERGE INTO sales USING stg ON 1 = 0", False),
+        ("CREATE TABLE sales (id INT)", True),
+        ("-- rebuild\nDROP TABLE sales", True),
+        ("IF OBJECT_ID('sales') IS NOT NULL DROP TABLE sales", True),
+        ("SELECT * INTO sales_copy FROM sales", True),
+        ("EXEC sp_rename 'sales', 'sales_old'", True),
+    ],
+)
+def test_ddl_pattern(query, is_ddl):
+    assert bool(DDL_PATTERN.search(query)) is is_ddl
@@ -0,0 +1,292 @@
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+import requests
+from fsspec.implementations.local import LocalFileSystem
+
+from viadot.cache import DownloadCache, ExtractCache, TableMetadataCache, TokenCache
+from viadot.exceptions import APIError
+from viadot.sources.base import Source
+
+
+class FakeSource(Source):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def to_df(self, query: str = None, if_empty: str = None):
+        self.calls += 1
+        return pd.DataFrame({"query": [query], "call": [self.calls]})
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ExtractCache(path=str(tmp_path), ttl=60)
+
+
+def test_get_or_extract_uses_cache(cache):
+    source = FakeSource(credentials={"user": "a"})
+
+    df1 = source.to_df_cached(cache=cache, query="SELECT * FROM t")
+    df2 = source.to_df_cached(cache=cache, query="\n  SELECT * FROM t;\n")
+
+    assert source.calls == 1
+    pd.testing.assert_frame_equal(df1, df2)
+
+
+def test_cache_key_depends_on_params_and_credentials(cache):
+    source = FakeSource(credentials={"user": "a"})
+    other_source = FakeSource(credentials={"user": "b"})
+
+    source.to_df_cached(cache=cache, query="SELECT * FROM t")
+    source.to_df_cached(cache=cache, query="SELECT * FROM t2")
+    other_source.to_df_cached(cache=cache, query="SELECT * FROM t")
+
+    assert source.calls == 2
+    assert other_source.calls == 1
+
+
+def test_cache_key_keeps_whitespace_inside_query_and_params(cache):
+    source = FakeSource(credentials={"user": "a"})
+
+    source.to_df_cached(cache=cache, query="SELECT * FROM t WHERE name = 'a b'")
+    source.to_df_cached(cache=cache, query="SELECT * FROM t WHERE name = 'a  b'")
+    source.to_df_cached(cache=cache, query="SELECT * FROM t", key_params={"sep": " "})
+    source.to_df_cached(cache=cache, query="SELECT * FROM t", key_params={"sep": "  "})
+
+    assert source.calls == 4
+
+
+def test_cache_ttl(tmp_path):
+    cache = ExtractCache(path=str(tmp_path), ttl=0)
+    source = FakeSource()
+
+    source.to_df_cached(cache=cache, query="SELECT 1")
+    time.sleep(0.01)
+    source.to_df_cached(cache=cache, query="SELECT 1")
+
+    assert source.calls == 2
+
+
+def test_cache_lru_eviction(tmp_path):
+    cache = ExtractCache(path=str(tmp_path), ttl=60)
+    df = pd.DataFrame({"a": range(1000)})
+
+    cache.put("first", df)
+    cache.put("second", df)
+    entry_size = os.path.getsize(tmp_path / "first.parquet")
+    # make "first" the most recently used entry
+    os.utime(tmp_path / "second.parquet", (time.time() - 10, time.time()))
+    assert cache.get("first") is not None
+
+    cache.max_size = 2 * entry_size
+    cache.put("third", df)
+
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
+    assert cache.get("third") is not None
+
+
+def test_cache_clear(cache):
+    cache.put("key", pd.DataFrame({"a": [1]}))
+    cache.clear()
+    assert cache.get("key") is None
+
+
+class CountingFileSystem(LocalFileSystem):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.downloads = 0
+
+    def get_file(self, *args, **kwargs):
+        self.downloads += 1
+        return super().get_file(*args, **kwargs)
+
+
+def test_download_cache_skips_unchanged_files(tmp_path):
+    cache = DownloadCache(path=str(tmp_path / "cache"))
+    fs = CountingFileSystem()
+    remote = tmp_path / "schema.json"
+    remote.write_text('{"a": "int"}')
+    local = tmp_path / "local.json"
+
+    assert cache.download(fs, str(remote), str(local)) is False
+    local.unlink()
+    assert cache.download(fs, str(remote), str(local)) is True
+    assert local.read_text() == '{"a": "int"}'
+    assert fs.downloads == 1
+
+    remote.write_text('{"a": "int", "b": "str"}')
+    os.utime(remote, (time.time() + 10, time.time() + 10))
+    assert cache.download(fs, str(remote), str(local)) is False
+    assert local.read_text() == '{"a": "int", "b": "str"}'
+    assert fs.downloads == 2
+
+
+def test_download_cache_into_directory(tmp_path):
+    cache = DownloadCache(path=str(tmp_path / "cache"))
+    fs = LocalFileSystem()
+    remote = tmp_path / "schema.json"
+    remote.write_text('{"a": "int"}')
+    local_dir = tmp_path / "local"
+    local_dir.mkdir()
+
+    assert cache.download(fs, str(remote), str(local_dir)) is False
+    assert cache.download(fs, str(remote), str(local_dir)) is True
+    assert os.listdir(local_dir) == ["schema.json"]
+    assert (local_dir / "schema.json").read_text() == '{"a": "int"}'
+
+
+def test_download_cache_lru_eviction(tmp_path):
+    fs = LocalFileSystem()
+    remotes = []
+    for i in range(3):
+        remote = tmp_path / f"file_{i}.csv"
+        remote.write_text("x" * 100)
+        remotes.append(str(remote))
+
+    cache = DownloadCache(path=str(tmp_path / "cache"), max_size=250)
+    for remote in remotes:
+        cache.download(fs, remote, str(tmp_path / "local.csv"))
+        time.sleep(0.01)
+
+    assert len(os.listdir(tmp_path / "cache")) == 2
+    assert cache.download(fs, remotes[0], str(tmp_path / "local.csv")) is False
+    assert cache.download(fs, remotes[2], str(tmp_path / "local.csv")) is True
+
+
+class FakeConnection:
+    def __init__(self, db_name):
+        self.db_name = db_name
+
+    def getinfo(self, info_type):
+        return self.db_name
+
+
+def test_table_metadata_cache():
+    cache = TableMetadataCache(ttl=60)
+    con = FakeConnection("db")
+    other_con = FakeConnection("other_db")
+    columns = [dict(name="id", type="int", max_length=4, is_key=True)]
+    calls = []
+
+    def _fetch():
+        calls.append(1)
+        return columns
+
+    key = cache.make_key(con, table="Sales", schema="sandbox")
+    assert cache.get_or_fetch(key, _fetch) == columns
+    assert (
+        cache.get_or_fetch(cache.make_key(con, "sales", "SANDBOX"), _fetch) == columns
+    )
+    assert len(calls) == 1
+
+    # tables which don't exist are not cached
+    missing_key = cache.make_key(con, table="missing", schema="sandbox")
+    assert cache.get_or_fetch(missing_key, lambda: []) == []
+    assert cache.get(missing_key) is None
+
+    other_key = cache.make_key(other_con, table="sales", schema="sandbox")
+    cache.put(other_key, columns)
+    cache.invalidate(con)
+    assert cache.get(key) is None
+    assert cache.get(other_key) == columns
+
+    cache.invalidate(other_con, table="sales", schema="sandbox")
+    assert cache.get(other_key) is None
+
+
+def test_table_metadata_cache_ttl():
+    cache = TableMetadataCache(ttl=0)
+    key = cache.make_key(FakeConnection("db"), table="sales")
+    cache.put(key, [dict(name="id", type="int", max_length=4, is_key=False)])
+    time.sleep(0.01)
+    assert cache.get(key) is None
+
+
+def test_token_cache_reuses_token_until_expiry():
+    cache = TokenCache(margin=60)
+    key = cache.make_key("https://login.example.com/oauth/token", {"CLIENT_ID": "id"})
+    other_key = cache.make_key(
+        "https://login.example.com/oauth/token", {"CLIENT_ID": "x"}
+    )
+    tokens = iter(["token1", "token2", "token3"])
+
+    assert cache.get_or_fetch(key, lambda: (next(tokens), 3600)) == "token1"
+    assert cache.get_or_fetch(key, lambda: (next(tokens), 3600)) == "token1"
+    assert cache.get_or_fetch(other_key, lambda: (next(tokens), 3600)) == "token2"
+
+    # tokens expiring within the margin are renewed
+    cache.put(key, "expiring", expires_in=30)
+    assert cache.get_or_fetch(key, lambda: (next(tokens), 3600)) == "token3"
+
+
+def test_token_cache_fetches_once_concurrently():
+    cache = TokenCache()
+    key = cache.make_key("https://login.example.com/oauth/token")
+    calls = []
+
+    def _fetch():
+        calls.append(1)
+        time.sleep(0.1)
+        return "token", None
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_fetch(key, _fetch)))
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["token"] * 10
+    assert len(calls) == 1
+
+
+def _api_error(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    try:
+        raise requests.HTTPError(response=response)
+    except requests.HTTPError as e:
+        try:
+            raise APIError("The API call failed.") from e
+        except APIError as api_error:
+            return api_error
+
+
+def test_token_cache_call_renews_rejected_token():
+    cache = TokenCache()
+    key = cache.make_key("https://login.example.com/oauth/token")
+    tokens = iter(["revoked", "token"])
+    sent = []
+
+    def _request(token):
+        sent.append(token)
+        if token == "revoked":
+            raise _api_error(401)
+        return "data"
+
+    assert cache.call(key, lambda: (next(tokens), 3600), _request) == "data"
+    assert sent == ["revoked", "token"]
+    assert cache.get(key) == "token"
+
+
+def test_token_cache_call_raises_other_errors():
+    cache = TokenCache()
+    key = cache.make_key("https://login.example.com/oauth/token")
+    sent = []
+
+    def _request(token):
+        sent.append(token)
+        raise _api_error(500)
+
+    with pytest.raises(APIError):
+        cache.call(key, lambda: ("token", 3600), _request)
+    assert sent == ["token"]
+    assert cache.get(key) == "token"
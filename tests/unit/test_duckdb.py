@@ -126,3 +126,147 @@ def test_run_query_with_comments(duckdb, TEST_PARQUET_FILE_PATH):
     assert isinstance(output3, pd.DataFrame)
 
     duckdb.drop_table(TABLE, schema=SCHEMA)
+
+
+def test_get_scripts_dependencies():
+    scripts = {
+        "bronze": "CREATE TABLE bronze.sales AS SELECT * FROM 'sales.parquet'",
+        "silver": "CREATE OR REPLACE TABLE silver.sales AS SELECT * FROM bronze.sales",
+        "silver_append": "INSERT INTO silver.sales SELECT * FROM bronze.sales",
+        "gold": "-- depends_on: silver_append\nCREATE VIEW gold AS SELECT * FROM silver.sales s JOIN lookup l ON s.id = l.id",
+        "lookup": "CREATE TABLE lookup AS SELECT 1 AS id",
+    }
+    graph = DuckDB.get_scripts_dependencies(scripts)
+    assert graph == {
+        "bronze": [],
+        "silver": ["bronze"],
+        "silver_append": ["bronze", "silver"],
+        "gold": ["lookup", "silver", "silver_append"],
+        "lookup": [],
+    }
+
+
+def test_get_scripts_dependencies_same_table():
+    scripts = {
+        "load_2023": "INSERT INTO sales SELECT * FROM 'sales_2023.parquet'",
+        "load_2024": "INSERT INTO sales SELECT * FROM 'sales_2024.parquet'",
+        "create": "CREATE TABLE sales (id INTEGER)",
+        "cleanup": "DELETE FROM sales WHERE id IS NULL",
+    }
+    graph = DuckDB.get_scripts_dependencies(scripts)
+    assert graph == {
+        "load_2023": ["create"],
+        "load_2024": ["create", "load_2023"],
+        "create": [],
+        "cleanup": ["create", "load_2023", "load_2024"],
+    }
+
+
+def test_get_scripts_dependencies_comments():
+    scripts = {
+        "source": "CREATE TABLE source AS SELECT 1 AS id",
+        "target": """
+        CREATE TABLE target AS
+        SELECT id, '--' AS separator  -- FROM ignored
+        /* JOIN ignored_too */
+        FROM source""",
+    }
+    graph = DuckDB.get_scripts_dependencies(scripts)
+    assert graph == {"source": [], "target": ["source"]}
+
+
+def test_get_scripts_dependencies_cycle():
+    scripts = {
+        "a": "CREATE TABLE a AS SELECT * FROM b",
+        "b": "CREATE TABLE b AS SELECT * FROM a",
+    }
+    with pytest.raises(ValueError, match="Circular dependency"):
+        DuckDB.get_scripts_dependencies(scripts)
+
+
+def test_run_scripts(duckdb, TEST_PARQUET_FILE_PATH, tmp_path):
+    (tmp_path / "bronze.sql").write_text(
+        f"CREATE TABLE {SCHEMA}.bronze AS SELECT * FROM '{TEST_PARQUET_FILE_PATH}'"
+    )
+    (tmp_path / "silver_1.sql").write_text(
+        f"CREATE TABLE {SCHEMA}.silver_1 AS SELECT * FROM {SCHEMA}.bronze"
+    )
+    (tmp_path / "silver_2.sql").write_text(
+        f"CREATE TABLE {SCHEMA}.silver_2 AS SELECT * FROM {SCHEMA}.bronze WHERE sales > 60"
+    )
+    (tmp_path / "gold.sql").write_text(
+        f"""CREATE TABLE {SCHEMA}.gold AS
+        SELECT * FROM {SCHEMA}.silver_1
+        UNION ALL
+        SELECT * FROM {SCHEMA}.silver_2"""
+    )
+    duckdb.run(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}")
+
+    records = duckdb.run_scripts(path=str(tmp_path), log_schema=SCHEMA)
+
+    scripts_order = [record["script"] for record in records]
+    assert scripts_order[0] == "bronze"
+    assert scripts_order[-1] == "gold"
+    assert all(record["status"] == "success" for record in records)
+
+    df = duckdb.to_df(f"SELECT * FROM {SCHEMA}.gold")
+    assert df.shape[0] == 5
+
+    log = duckdb.to_df(f"SELECT * FROM {SCHEMA}.run_log")
+    assert sorted(log["script"]) == ["bronze", "gold", "silver_1", "silver_2"]
+    assert (log["duration_seconds"] >= 0).all()
+
+    for table in ["bronze", "silver_1", "silver_2", "gold", "run_log"]:
+        duckdb.drop_table(table, schema=SCHEMA)
+
+
+def test_run_scripts_failed(duckdb, tmp_path):
+    (tmp_path / "first.sql").write_text(f"CREATE TABLE {SCHEMA}.first AS SELECT 1 AS a")
+    (tmp_path / "broken.sql").write_text(f"SELECT * FROM {SCHEMA}.first WHERE")
+    (tmp_path / "last.sql").write_text(
+        f"-- depends_on: broken\nCREATE TABLE {SCHEMA}.last AS SELECT 1 AS a"
+    )
+    (tmp_path / "after_last.sql").write_text(
+        f"CREATE TABLE {SCHEMA}.after_last AS SELECT * FROM {SCHEMA}.last"
+    )
+    (tmp_path / "second.sql").write_text(
+        f"CREATE TABLE {SCHEMA}.second AS SELECT * FROM {SCHEMA}.first"
+    )
+    duckdb.run(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}")
+
+    with pytest.raises(Exception):
+        duckdb.run_scripts(path=str(tmp_path), log_schema=SCHEMA)
+
+    log = duckdb.to_df(f"SELECT * FROM {SCHEMA}.run_log ORDER BY script")
+    assert dict(zip(log["script"], log["status"])) == {
+        "after_last": "skipped",
+        "broken": "failed",
+        "first": "success",
+        "last": "skipped",
+        "second": "success",
+    }
+    assert not duckdb._check_if_table_exists("last", schema=SCHEMA)
+
+    for table in ["first", "second", "run_log"]:
+        duckdb.drop_table(table, schema=SCHEMA)
+
+
+def test_to_csv_files(duckdb, tmp_path):
+    query = "SELECT range AS id, 'row_' || range::VARCHAR AS name FROM range(25)"
+    files = list(
+        duckdb.to_csv_files(
+            query=query,
+            path=str(tmp_path / "data.csv"),
+            batch_size=4,
+            rows_per_file=10,
+        )
+    )
+
+    assert [os.path.basename(f) for f in files] == [
+        "data_0.csv",
+        "data_1.csv",
+        "data_2.csv",
+    ]
+    dfs = [pd.read_csv(f, sep="\t") for f in files]
+    assert [df.shape[0] for df in dfs] == [10, 10, 5]
+    assert list(pd.concat(dfs)["id"]) == list(range(25))
@@ -0,0 +1,254 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from viadot.cache import token_cache
+from viadot.sources import genesys
+from viadot.sources.genesys import Genesys, RateLimiter
+
+
+class FakeResponse:
+    status_code = 200
+
+    def json(self):
+        return {"token_type": "bearer", "access_token": "token", "expires_in": 86400}
+
+
+@pytest.fixture
+def token_requests(monkeypatch):
+    requests = []
+
+    def _handle_api_response(url, *args, **kwargs):
+        requests.append(url)
+        return FakeResponse()
+
+    monkeypatch.setattr(genesys, "handle_api_response", _handle_api_response)
+    token_cache.clear()
+    yield requests
+    token_cache.clear()
+
+
+def test_authorization_token_is_cached(token_requests):
+    credentials = {"CLIENT_ID": "id", "CLIENT_SECRET": "secret"}
+    g = Genesys(credentials_genesys=credentials, environment="mypurecloud.de")
+
+    headers = [g.authorization_token for _ in range(5)]
+    other_headers = Genesys(
+        credentials_genesys=credentials, environment="mypurecloud.de"
+    ).authorization_token
+
+    assert headers[0] == {
+        "Authorization": "bearer token",
+        "Content-Type": "application/json",
+    }
+    assert other_headers == headers[0]
+    assert token_requests == ["https://login.mypurecloud.de/oauth/token"]
+
+
+class ApiServer(ThreadingHTTPServer):
+    """Echoes the posted bodies back, after a delay, and rejects the first request with 429."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), ApiRequestHandler)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.rejected = False
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/api/v2/analytics"
+
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            reject = not self.server.rejected
+            self.server.rejected = True
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(
+                self.server.max_in_flight, self.server.in_flight
+            )
+        # The first requests are the slowest, so that the responses come out of order.
+        time.sleep(0.05 * (5 - body["n"] % 5))
+        with self.server.lock:
+            self.server.in_flight -= 1
+        content = json.dumps({"n": body["n"]}).encode()
+        self.send_response(429 if reject else 200)
+        self.send_header("Retry-After", "0")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+@pytest.fixture
+def api_server(token_requests):
+    server = ApiServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_send_requests(api_server):
+    g = Genesys(
+        credentials_genesys={"CLIENT_ID": "id", "CLIENT_SECRET": "secret"},
+        environment="mypurecloud.de",
+    )
+    requests = [("POST", api_server.url, None, json.dumps({"n": n})) for n in range(20)]
+
+    responses = asyncio.run(g._send_requests(requests, max_concurrency=4))
+
+    assert responses == [{"n": n} for n in range(20)]
+    assert 1 < api_server.max_in_flight <= 4
+
+
+class AuthRequestHandler(BaseHTTPRequestHandler):
+    """Rejects the requests sent with a revoked token."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        revoked = self.headers["Authorization"] == "bearer revoked"
+        content = json.dumps({"authorization": self.headers["Authorization"]}).encode()
+        self.send_response(401 if revoked else 200)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+def test_send_requests_renews_rejected_token(token_requests):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), AuthRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    g = Genesys(
+        credentials_genesys={"CLIENT_ID": "id", "CLIENT_SECRET": "secret"},
+        environment="mypurecloud.de",
+    )
+    token_key, _ = g._token_cache_entry()
+    token_cache.put(token_key, "bearer revoked", expires_in=3600)
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/v2/analytics"
+
+    try:
+        responses = asyncio.run(g._send_requests([("POST", url, None, "{}")] * 3))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert responses == [{"authorization": "bearer token"}] * 3
+    assert token_requests == ["https://login.mypurecloud.de/oauth/token"]
+
+
+def test_rate_limiter_follows_headers():
+    limiter = RateLimiter(capacity=10)
+
+    limiter.update(
+        {
+            "inin-ratelimit-allowed": "300",
+            "inin-ratelimit-count": "240",
+            "inin-ratelimit-reset": "30",
+        }
+    )
+    assert limiter.rate == 2
+
+    limiter.update(
+        {
+            "inin-ratelimit-allowed": "300",
+            "inin-ratelimit-count": "300",
+            "inin-ratelimit-reset": "0.2",
+        }
+    )
+    start = time.monotonic()
+    asyncio.run(limiter.acquire())
+    assert time.monotonic() - start >= 0.2
+
+
+def _entity(report_id, status, view_type="agent_status_detail_view"):
+    return {
+        "id": report_id,
+        "downloadUrl": f"https://download/{report_id}"
+        if status == "COMPLETED"
+        else None,
+        "filter": {"queueIds": ["queue"], "mediaTypes": ["voice"]},
+        "viewType": view_type,
+        "interval": "2023-01-01T00:00:00/2023-01-02T00:00:00",
+        "status": status,
+    }
+
+
+@pytest.fixture
+def genesys_exports(token_requests, monkeypatch):
+    """A Genesys instance whose exports go through the given list of states."""
+    g = Genesys(
+        credentials_genesys={"CLIENT_ID": "id", "CLIENT_SECRET": "secret"},
+        environment="mypurecloud.de",
+        view_type="agent_status_detail_view",
+        start_date="2023-01-01",
+    )
+    g.polls = []
+    g.events = []
+
+    def _load_reporting_exports():
+        entities = g.polls.pop(0) if len(g.polls) > 1 else g.polls[0]
+        g.events.append("poll")
+        return {"entities": entities}
+
+    monkeypatch.setattr(g, "load_reporting_exports", _load_reporting_exports)
+    monkeypatch.setattr(
+        g,
+        "download_report",
+        lambda report_url, **kwargs: g.events.append(f"download {report_url}"),
+    )
+    monkeypatch.setattr(
+        g,
+        "delete_reporting_exports",
+        lambda report_id: g.events.append(f"delete {report_id}") or 200,
+    )
+    return g
+
+
+def test_process_reporting_exports(genesys_exports):
+    g = genesys_exports
+    g.polls = [
+        [_entity("a", "RUNNING")],
+        [_entity("a", "COMPLETED"), _entity("b", "RUNNING")],
+        [_entity("a", "COMPLETED"), _entity("b", "RUNNING"), _entity("c", "FAILED")],
+        [_entity("a", "COMPLETED"), _entity("b", "COMPLETED"), _entity("c", "FAILED")],
+    ]
+
+    file_names = g.process_reporting_exports(
+        expected_count=3, initial_delay=0.05, max_delay=0.1
+    )
+
+    assert file_names == [
+        "AGENT_STATUS_DETAIL_VIEW_0_20230101.csv",
+        "AGENT_STATUS_DETAIL_VIEW_1_20230101.csv",
+    ]
+    # each report is downloaded and deleted while the others are still running
+    polls = [i for i, event in enumerate(g.events) if event == "poll"]
+    assert g.events.index("delete a") < polls[-1]
+    assert "download https://download/c" not in g.events
+    assert "delete c" in g.events
+    assert g.events.count("poll") == 4
+    assert [report[-1] for report in g.report_data] == ["COMPLETED"] * 2 + ["FAILED"]
+
+
+def test_process_reporting_exports_timeout(genesys_exports):
+    g = genesys_exports
+    g.polls = [[_entity("a", "COMPLETED"), _entity("b", "RUNNING")]]
+
+    file_names = g.process_reporting_exports(timeout=0.1, initial_delay=0.01)
+
+    assert file_names == ["AGENT_STATUS_DETAIL_VIEW_0_20230101.csv"]
+    assert "delete b" in g.events
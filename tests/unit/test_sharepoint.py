@@ -0,0 +1,395 @@
+import hashlib
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+import requests
+from office365.runtime.auth.authentication_context import AuthenticationContext
+from office365.sharepoint.client_context import ClientContext
+
+from viadot.exceptions import ValidationError
+from viadot.sources import Sharepoint, SharepointList
+from viadot.sources import sharepoint
+from viadot.tasks.sharepoint import SharepointListToDF
+from viadot.watermarks import LocalWatermarkStore
+
+SELECTED_FIELDS = {
+    "FieldInternalNames": ["Title", "Author/Title", "Colors"],
+    "FieldToExpand": ["Author"],
+    "FieldExpandProperty": "Title",
+    "MultiChoiceField": ["Colors"],
+}
+
+
+class ListServer(ThreadingHTTPServer):
+    """Serves the items of a list through the REST API, in the verbose JSON format."""
+
+    def __init__(self, items):
+        super().__init__(("127.0.0.1", 0), ListRequestHandler)
+        self.items = items
+        self.urls = []
+        self.lock = threading.Lock()
+
+    @property
+    def site_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/sites/site/"
+
+
+class ListRequestHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        # The form digest, requested by some versions of the client before any request.
+        content = json.dumps(
+            {
+                "d": {
+                    "GetContextWebInformation": {
+                        "FormDigestValue": "digest",
+                        "FormDigestTimeoutSeconds": 1800,
+                        "WebFullUrl": self.server.site_url,
+                        "SiteFullUrl": self.server.site_url,
+                    }
+                }
+            }
+        ).encode()
+        self._send_json(content)
+
+    def _send_json(self, content):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json;odata=verbose")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        url = self.path
+        with self.server.lock:
+            self.server.urls.append(url)
+        top = int(re.search(r"\$top=(\d+)", url).group(1))
+        if "orderby=ID desc" in url.replace("%20", " "):
+            items = sorted(self.server.items, key=lambda item: -item["ID"])
+        else:
+            start = re.search(r"p_ID%3D(\d+)", url)
+            start = int(start.group(1)) if start else 0
+            items = [item for item in self.server.items if item["ID"] > start]
+        modified_since = re.search(r"Modified%20ge%20datetime%27(.+?)%27", url)
+        if modified_since:
+            items = [
+                item for item in items if item["Modified"] >= modified_since.group(1)
+            ]
+        select = re.search(r"\$select=([^&]*)", url).group(1).split(",")
+        fields = [field.split("/")[0] for field in select]
+        results = [
+            {
+                "__metadata": {"type": "SP.Data.ListItem"},
+                **{field: item[field] for field in fields if field in item},
+            }
+            for item in items[:top]
+        ]
+        data = {"results": results}
+        if modified_since and len(items) > top:
+            next_start = f"p_ID%3D{results[-1]['ID']}"
+            next_url = re.sub(r"\$skiptoken=[^&]*&?", "", url) + (
+                f"&$skiptoken=Paged%3DTRUE%26{next_start}"
+            )
+            data[
+                "__next"
+            ] = f"http://127.0.0.1:{self.server.server_address[1]}{next_url}"
+        self._send_json(json.dumps({"d": data}).encode())
+
+
+@pytest.fixture
+def list_server(monkeypatch):
+    """Serves list items to a real `ClientContext`, with the authentication skipped."""
+    server = ListServer([])
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        AuthenticationContext, "authenticate_request", lambda self, request: None
+    )
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _item(item_id):
+    return {
+        "ID": item_id,
+        "Modified": f"2023-05-{item_id % 28 + 1:02d}T10:00:00Z",
+        "Title": f"item {item_id}",
+        "Author": {"__metadata": {"type": "SP.Data.UserInfo"}, "Title": "John"},
+        "Colors": {"__metadata": {"type": "Collection"}, "results": ["red", "blue"]},
+    }
+
+
+@pytest.fixture
+def sharepoint_list(list_server):
+    sharepoint_list = SharepointList(credentials={"TENANT": "tenant"})
+    sharepoint_list.ctx = ClientContext(list_server.site_url)
+    return sharepoint_list
+
+
+def test_get_all_items_df(sharepoint_list, list_server):
+    # IDs with gaps, as after deleting items
+    ids = [i for i in range(1, 95) if i % 7]
+    list_server.items = [_item(i) for i in ids]
+
+    df = sharepoint_list.get_all_items_df(
+        list_title="O'Test list",
+        site_url=list_server.site_url,
+        selected_fields=SELECTED_FIELDS,
+        row_count=10,
+        max_workers=3,
+    )
+
+    assert list(df.columns) == ["Title", "Author", "Colors"]
+    assert list(df["Title"]) == [f"item {i}" for i in ids]
+    assert (df["Author"] == "John").all()
+    assert (df["Colors"] == "red;blue").all()
+    # 1 request for the last ID and 1 per page
+    assert len(list_server.urls) == 1 + 10
+    assert "GetByTitle('O%27%27Test%20list')" in list_server.urls[0]
+
+
+def test_get_all_items_df_empty_list(sharepoint_list, list_server):
+    list_server.items = []
+
+    df = sharepoint_list.get_all_items_df(
+        list_title="list",
+        site_url=list_server.site_url,
+        selected_fields=SELECTED_FIELDS,
+    )
+
+    assert df.empty
+
+
+def test_get_all_items_df_missing_values(sharepoint_list, list_server):
+    items = [_item(1), {"ID": 2, "Title": None, "Author": None}, _item(3)]
+    list_server.items = items
+
+    df = sharepoint_list.get_all_items_df(
+        list_title="list",
+        site_url=list_server.site_url,
+        selected_fields=SELECTED_FIELDS,
+        row_count=2,
+    )
+
+    assert df["Author"].tolist() == ["John", None, "John"]
+    assert df["Colors"].tolist() == ["red;blue", None, "red;blue"]
+
+
+def test_get_all_items_df_invalid_field_property(sharepoint_list, list_server):
+    list_server.items = [_item(1)]
+    selected_fields = dict(SELECTED_FIELDS, FieldExpandProperty="EMail")
+
+    with pytest.raises(ValueError, match="field property"):
+        sharepoint_list.get_all_items_df(
+            list_title="list",
+            site_url=list_server.site_url,
+            selected_fields=selected_fields,
+        )
+
+
+def test_get_all_items_df_modified_since(sharepoint_list, list_server):
+    list_server.items = [_item(i) for i in range(1, 60)]
+    selected_fields = dict(
+        SELECTED_FIELDS,
+        FieldInternalNames=["ID", "Modified"] + SELECTED_FIELDS["FieldInternalNames"],
+    )
+
+    df = sharepoint_list.get_all_items_df(
+        list_title="list",
+        site_url=list_server.site_url,
+        selected_fields=selected_fields,
+        row_count=5,
+        modified_since="2023-05-25T10:00:00Z",
+    )
+
+    assert list(df.columns) == ["ID", "Modified", "Title", "Author", "Colors"]
+    assert list(df["ID"]) == [24, 25, 26, 27, 52, 53, 54, 55]
+    # the items are only requested with the server-side filter, following the pages
+    assert len(list_server.urls) == 2
+    assert all("$filter=Modified" in url for url in list_server.urls)
+
+
+def test_sharepoint_list_to_df_incremental(list_server, monkeypatch, tmp_path):
+    list_server.items = [_item(i) for i in range(1, 60)]
+
+    def select_fields(self, list_title, site_url, required_fields, field_property):
+        self.ctx = ClientContext(site_url)
+        return dict(
+            SELECTED_FIELDS,
+            FieldInternalNames=["Title", "Author/Title", "Colors", "ID", "Modified"],
+        )
+
+    # The fields are described by their own endpoints, not served here.
+    monkeypatch.setattr(SharepointList, "select_fields", select_fields)
+    monkeypatch.setattr(SharepointListToDF, "change_column_name", lambda self, df: df)
+    store = LocalWatermarkStore(str(tmp_path / "watermarks.json"))
+    store.set("list", "2023-05-25T10:00:00Z")
+    task = SharepointListToDF(
+        path="list.parquet",
+        list_title="list",
+        site_url=list_server.site_url,
+        required_fields=["Title", "Author", "Colors"],
+        filters={"Title": {"dtype": "str", "value1": "item 52", "operator1": "!="}},
+        row_count=5,
+        incremental=True,
+        watermark_key="list",
+        watermark_store=store,
+    )
+    task.credentials = {"TENANT": "tenant"}
+
+    df = task.run()
+
+    assert list(df["ID"]) == [24, 25, 26, 27, 53, 54, 55]
+    assert (df["Author"] == "John").all()
+    assert all("$filter=Modified" in url for url in list_server.urls)
+
+
+class FileServer(ThreadingHTTPServer):
+    """Serves a single file, with range requests, and can drop connections midway."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FileRequestHandler)
+        self.content = b""
+        self.etag = '"1"'
+        self.fail_after = None
+        self.requests = []
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/file.xlsx"
+
+
+class FileRequestHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.server.requests.append(("HEAD", None))
+        self.send_response(200)
+        self.send_header("ETag", self.server.etag)
+        self.send_header("Content-Length", str(len(self.server.content)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+    def do_GET(self):
+        content = self.server.content
+        range_header = self.headers.get("Range")
+        self.server.requests.append(("GET", range_header))
+        start, end = 0, len(content) - 1
+        status = 200
+        if range_header and self.headers.get("If-Range") in (None, self.server.etag):
+            match = re.match(r"bytes=(\d+)-(\d*)", range_header)
+            start = int(match.group(1))
+            end = min(int(match.group(2) or end), end)
+            if start >= len(content):
+                self.send_response(416)
+                self.end_headers()
+                return
+            status = 206
+        body = content[start : end + 1]
+        self.send_response(status)
+        self.send_header("ETag", self.server.etag)
+        self.send_header("Content-Length", str(len(body)))
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(content)}")
+        self.end_headers()
+        if self.server.fail_after is not None:
+            # Send part of the body and drop the connection.
+            self.wfile.write(body[: self.server.fail_after])
+            self.server.fail_after = None
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def file_server(monkeypatch):
+    server = FileServer()
+    server.content = bytes(range(256)) * 40
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(Sharepoint, "get_connection", lambda self: requests.Session())
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def sharepoint_file(file_server):
+    return Sharepoint(
+        credentials={"site": "tenant.sharepoint.com"},
+        download_from_path=file_server.url,
+    )
+
+
+def test_download_file_in_chunks(sharepoint_file, file_server, tmp_path):
+    path = str(tmp_path / "file.xlsx")
+
+    assert sharepoint_file.download_file(download_to_path=path, chunk_size=4096)
+
+    with open(path, "rb") as f:
+        assert f.read() == file_server.content
+    ranges = [range_ for method, range_ in file_server.requests if method == "GET"]
+    assert ranges == ["bytes=0-4095", "bytes=4096-8191", "bytes=8192-12287"]
+
+
+def test_download_file_skips_unchanged_file(sharepoint_file, file_server, tmp_path):
+    path = str(tmp_path / "file.xlsx")
+    sharepoint_file.download_file(download_to_path=path)
+    file_server.requests.clear()
+
+    assert not sharepoint_file.download_file(download_to_path=path)
+    assert file_server.requests == [("HEAD", None)]
+
+    file_server.etag = '"2"'
+    file_server.content = b"new content"
+    assert sharepoint_file.download_file(download_to_path=path)
+    with open(path, "rb") as f:
+        assert f.read() == b"new content"
+
+
+def test_download_file_resumes_after_failure(sharepoint_file, file_server, tmp_path):
+    path = str(tmp_path / "file.xlsx")
+    file_server.fail_after = 1000
+
+    sharepoint_file.download_file(download_to_path=path, chunk_size=4096)
+
+    with open(path, "rb") as f:
+        assert f.read() == file_server.content
+    ranges = [range_ for method, range_ in file_server.requests if method == "GET"]
+    assert ranges[:2] == ["bytes=0-4095", "bytes=1000-5095"]
+
+
+def test_download_file_resumes_partial_file(sharepoint_file, file_server, tmp_path):
+    path = str(tmp_path / "file.xlsx")
+    with open(path + ".part", "wb") as f:
+        f.write(file_server.content[:5000])
+    sharepoint._write_download_cache(
+        path + ".download.json",
+        {"etag": '"1"', "last_modified": None, "size": 10240, "complete": False},
+    )
+
+    sharepoint_file.download_file(download_to_path=path, chunk_size=1 << 20)
+
+    with open(path, "rb") as f:
+        assert f.read() == file_server.content
+    assert ("GET", "bytes=5000-1053575") in file_server.requests
+
+
+def test_download_file_checksum(sharepoint_file, file_server, tmp_path):
+    path = str(tmp_path / "file.xlsx")
+    checksum = hashlib.sha256(file_server.content).hexdigest()
+
+    sharepoint_file.download_file(download_to_path=path, checksum=checksum)
+
+    with pytest.raises(ValidationError):
+        sharepoint_file.download_file(
+            download_to_path=str(tmp_path / "other.xlsx"), checksum="0" * 64
+        )
@@ -0,0 +1,119 @@
+import struct
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from viadot.sources.sql_server import (
+    SQLServer,
+    _DatetimeOffsetBytes,
+    decode_datetimeoffset,
+)
+
+
+def _pack(year, month, day, hour, minute, second, ns, offset_h, offset_m):
+    return struct.pack(
+        "<6hI2h", year, month, day, hour, minute, second, ns, offset_h, offset_m
+    )
+
+
+def test_decode_datetimeoffset():
+    values = [
+        _pack(2023, 3, 31, 23, 30, 15, 123456700, 2, 0),
+        None,
+        _pack(1999, 12, 31, 20, 0, 0, 0, -5, -30),
+        _pack(2024, 2, 29, 0, 0, 0, 0, 0, 0),
+    ]
+
+    timestamps, offsets = decode_datetimeoffset(values)
+
+    assert timestamps.dtype == np.dtype("datetime64[ns]")
+    assert list(offsets) == [120, 0, -330, 0]
+    assert pd.isna(timestamps[1])
+    for value, timestamp in zip(values, timestamps):
+        if value is None:
+            continue
+        expected = SQLServer._handle_datetimeoffset(value).astimezone(timezone.utc)
+        # the per-value converter truncates to microseconds
+        assert pd.Timestamp(timestamp).tz_localize("UTC").floor("us") == expected
+
+
+def test_decode_datetimeoffset_out_of_range():
+    with pytest.raises(ValueError):
+        decode_datetimeoffset([_pack(9999, 12, 31, 0, 0, 0, 0, 0, 0)])
+
+
+def test_check_if_table_exists_finds_views(monkeypatch):
+    sql_server = SQLServer.__new__(SQLServer)
+    queries = []
+
+    def run(query):
+        queries.append(query)
+        return [(1,)]
+
+    # the view has no table metadata
+    monkeypatch.setattr(sql_server, "get_table_metadata", lambda **kwargs: [])
+    monkeypatch.setattr(sql_server, "run", run)
+
+    assert sql_server._check_if_table_exists(table="sales_view", schema="dbo")
+    assert "INFORMATION_SCHEMA.VIEWS" in queries[0]
+
+
+class FakeConnection:
+    """Returns the rows of a query, converting the DATETIMEOFFSET values like pyodbc."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.converter = None
+        self.description = [("id",), ("created_at",)]
+
+    def add_output_converter(self, sql_type, converter):
+        self.converter = converter
+
+    def cursor(self):
+        return self
+
+    def execute(self, query, *params):
+        self.remaining = [
+            (id, None if value is None else self.converter(value))
+            for id, value in self.rows
+        ]
+
+    def fetchmany(self, size):
+        rows, self.remaining = self.remaining[:size], self.remaining[size:]
+        return rows
+
+    def close(self):
+        pass
+
+
+@pytest.mark.parametrize(
+    "values, dtype",
+    [
+        # a chunk with only NULLs
+        ([None, _pack(2023, 3, 31, 23, 30, 15, 0, 2, 0)], "datetime64[ns, UTC]"),
+        # a date out of the datetime64[ns] range in a later chunk
+        (
+            [
+                _pack(2023, 3, 31, 23, 30, 15, 0, 2, 0),
+                _pack(9999, 12, 31, 0, 0, 0, 0, 0, 0),
+            ],
+            "object",
+        ),
+    ],
+)
+def test_to_df_utc_datetimeoffset_chunks(values, dtype):
+    sql_server = SQLServer.__new__(SQLServer)
+    con = FakeConnection(list(enumerate(values)))
+
+    df = sql_server.to_df(
+        "SELECT * FROM sales", con=con, utc_datetimeoffset=True, chunksize=1
+    )
+
+    assert list(df["id"]) == [0, 1]
+    assert df["created_at"].dtype == dtype
+    if dtype == "object":
+        # all the values are decoded the same way, whichever chunk they are in
+        assert {type(value) for value in df["created_at"]} == {datetime}
+    assert con.converter == SQLServer._handle_datetimeoffset
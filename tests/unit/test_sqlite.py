@@ -45,3 +45,15 @@ def test_check_if_table_exists(sqlite):
     assert exists == True
     not_exists = sqlite._check_if_table_exists("test_table")
     assert not_exists == False
+
+
+def test_get_table_metadata(sqlite):
+    columns = sqlite.get_table_metadata(TABLE)
+    assert [column["name"] for column in columns] == ["country", "sales"]
+    assert columns[0]["type"] == "varchar"
+    assert columns[0]["max_length"] == 100
+
+    # DDL issued through viadot invalidates the cached metadata
+    sqlite.run(f"ALTER TABLE {TABLE} ADD COLUMN year INT")
+    columns = sqlite.get_table_metadata(TABLE)
+    assert [column["name"] for column in columns] == ["country", "sales", "year"]
@@ -30,6 +30,7 @@ class MockAzureUploadClass:
         to_path: str = "",
         sp_credentials_secret: str = "",
         overwrite: bool = False,
+        max_workers: int = 8,
     ) -> None:
         pass
 
@@ -3,18 +3,23 @@ import os
 
 import pandas as pd
 import pytest
-from viadot.exceptions import APIError
+from viadot.exceptions import APIError, ValidationError
 
 from viadot.signals import SKIP
 from viadot.utils import (
+    DFStreamValidator,
     add_viadot_metadata_columns,
+    build_merge_query,
     check_if_empty_file,
     gen_bulk_insert_query_from_df,
     get_nested_value,
+    get_sql_server_table_dtypes,
+    merge_df_with_snapshot,
     slugify,
     handle_api_response,
     union_dict,
     gen_bulk_insert_query_from_df,
+    write_csv_files,
 )
 
 EMPTY_CSV_PATH = "empty.csv"
@@ -321,3 +326,103 @@ def test_get_nested_value_non_dict_passed():
     """Sample test checking the correctness of the function when non dict value (int) is provided."""
 
     assert get_nested_value(nested_dict=5) == None
+
+
+def test_write_csv_files(tmp_path):
+    dfs = (pd.DataFrame({"a": range(i * 4, i * 4 + 4)}) for i in range(3))
+
+    paths = list(write_csv_files(dfs, str(tmp_path / "data.csv"), rows_per_file=5))
+
+    assert paths == [str(tmp_path / f"data_{i}.csv") for i in range(3)]
+    df = pd.concat(pd.read_csv(path, sep="\t") for path in paths)
+    assert list(df["a"]) == list(range(12))
+    assert len(pd.read_csv(paths[-1])) == 2
+
+
+def test_df_stream_validator():
+    validator = DFStreamValidator(
+        {
+            "column_unique_values": ["id"],
+            "column_sum": {"amount": {"min": 0, "max": 10}},
+            "dataset_row_count": {"min": 0, "max": 5},
+        }
+    )
+    validator.update(pd.DataFrame({"id": [1, 2], "amount": [1, 2]}))
+    validator.update(pd.DataFrame({"id": [3], "amount": [3]}))
+    validator.validate()
+
+    validator.update(pd.DataFrame({"id": [1], "amount": [5]}))
+    with pytest.raises(ValidationError, match="2 test/tests"):
+        validator.validate()
+
+
+class FakeSQLServerConnection:
+    """Returns the columns of a table, like a SQL Server catalog query would."""
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.queries = 0
+
+    def getinfo(self, info_type):
+        return f"fake_{info_type}"
+
+    def cursor(self):
+        return self
+
+    def execute(self, query):
+        self.queries += 1
+        return self
+
+    def fetchall(self):
+        return self.columns
+
+    def close(self):
+        pass
+
+
+def test_build_merge_query_composite_key():
+    con = FakeSQLServerConnection(
+        [
+            ("id", "int", 4, 1),
+            ("country", "varchar", 2, 1),
+            ("amount", "float", 8, 0),
+        ]
+    )
+
+    query = build_merge_query(
+        stg_schema="sandbox",
+        stg_table="stg_sales",
+        schema="sandbox",
+        table="sales_merge",
+        primary_key=["id", "country"],
+        con=con,
+    )
+
+    assert "ON stg.id = existing.id AND stg.country = existing.country" in query
+    assert "UPDATE SET existing.amount = stg.amount\n" in query
+    assert "INSERT(id, country, amount)" in query
+
+
+def test_sql_server_table_columns_are_cached():
+    con = FakeSQLServerConnection([("id", "int", 4, 1), ("name", "varchar", 50, 0)])
+
+    dtypes = get_sql_server_table_dtypes(table="cached", schema="sandbox", con=con)
+    build_merge_query("sandbox", "#stg", "sandbox", "cached", "id", con=con)
+
+    assert dtypes == {"id": "int", "name": "varchar(50)"}
+    assert con.queries == 1
+
+
+def test_merge_df_with_snapshot():
+    snapshot = pd.DataFrame(
+        {"ID": [1, 2, 3], "Title": ["a", "b", "c"], "_viadot_source": ["old"] * 3}
+    )
+    delta = pd.DataFrame({"ID": [2, 4, 4], "Title": ["B", "d", "D"]})
+
+    merged = merge_df_with_snapshot(snapshot, delta, key_columns=["ID"])
+
+    assert merged["ID"].tolist() == [1, 3, 2, 4]
+    assert merged["Title"].tolist() == ["a", "c", "B", "D"]
+
+    with pytest.raises(ValueError):
+        merge_df_with_snapshot(snapshot, delta, key_columns=["Modified"])
@@ -0,0 +1,133 @@
+import sqlite3
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from viadot.task_utils import set_watermark
+from viadot.watermarks import (
+    DuckDBWatermarkStore,
+    LocalWatermarkStore,
+    WatermarkStore,
+    apply_watermark,
+    build_incremental_query,
+    decode_watermark,
+    encode_watermark,
+    get_watermark_store,
+    make_watermark_key,
+    watermark_to_sql,
+)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        b"\x00\x00\x00\x00\x00\x00\x07\xd1",
+        pd.Timestamp("2023-01-01 10:00:00.1234567"),
+        pd.Timestamp("2023-01-01 10:00:00", tz="UTC"),
+        date(2023, 1, 1),
+        42,
+        Decimal("1.5"),
+        "abc",
+    ],
+)
+def test_encode_decode_watermark(value):
+    assert decode_watermark(encode_watermark(value)) == value
+
+
+def test_watermark_to_sql():
+    assert watermark_to_sql(b"\x00\x00\x07\xd1") == "0x000007D1"
+    assert (
+        watermark_to_sql(pd.Timestamp("2023-01-01 10:00:00.1234567"))
+        == "CAST('2023-01-01 10:00:00.1234567' AS DATETIME2)"
+    )
+    assert (
+        watermark_to_sql(datetime(2023, 1, 1, 10, tzinfo=timezone.utc))
+        == "CAST('2023-01-01 10:00:00.0000000 +00:00' AS DATETIMEOFFSET)"
+    )
+    assert watermark_to_sql(date(2023, 1, 1)) == "CAST('2023-01-01' AS DATE)"
+    assert watermark_to_sql(7) == "7"
+    assert watermark_to_sql("O'Brien") == "'O''Brien'"
+
+
+def test_build_incremental_query():
+    query = "SELECT id, rv FROM sales;"
+    assert build_incremental_query(query, "rv") == query
+    assert build_incremental_query(query, "rv", b"\x07\xd1") == (
+        "SELECT * FROM (SELECT id, rv FROM sales) AS incremental_query "
+        "WHERE [rv] > 0x07D1"
+    )
+
+
+def test_make_watermark_key():
+    assert make_watermark_key("ASElite to ADLS", "Sales") == "aselite_to_adls.sales"
+
+
+def test_get_watermark_store(tmp_path):
+    store = LocalWatermarkStore(path=str(tmp_path / "watermarks.json"))
+    assert get_watermark_store(store) is store
+    assert isinstance(get_watermark_store("local"), LocalWatermarkStore)
+    with pytest.raises(ValueError):
+        get_watermark_store("redis")
+
+
+def test_watermark_store_is_abstract():
+    with pytest.raises(TypeError):
+        WatermarkStore()
+
+
+def test_local_watermark_store(tmp_path):
+    path = str(tmp_path / "state" / "watermarks.json")
+    store = LocalWatermarkStore(path=path)
+    assert store.get("flow.sales") is None
+
+    store.set("flow.sales", b"\x07\xd1")
+    store.set("flow.returns", 5)
+
+    store = LocalWatermarkStore(path=path)
+    assert store.get("flow.sales") == b"\x07\xd1"
+    assert store.get("flow.returns") == 5
+
+
+def test_duckdb_watermark_store(tmp_path):
+    store = DuckDBWatermarkStore(credentials={"database": str(tmp_path / "db.duckdb")})
+    assert store.get("flow.sales") is None
+
+    store.set("flow.sales", pd.Timestamp("2023-01-01 10:00:00"))
+    store.set("flow.sales", pd.Timestamp("2023-01-02 10:00:00"))
+
+    assert store.get("flow.sales") == pd.Timestamp("2023-01-02 10:00:00")
+
+
+def test_incremental_extraction(tmp_path):
+    store = LocalWatermarkStore(path=str(tmp_path / "watermarks.json"))
+    con = sqlite3.connect(":memory:")
+    con.execute("CREATE TABLE sales (id INT, version INT)")
+    con.executemany("INSERT INTO sales VALUES (?, ?)", [(1, 10), (2, 20)])
+
+    def _extract():
+        query = apply_watermark(
+            "SELECT * FROM sales", column="version", key="flow.sales", store=store
+        )
+        return pd.read_sql_query(query, con)
+
+    df = _extract()
+    assert list(df["id"]) == [1, 2]
+
+    # the watermark only moves forward once it's committed
+    assert list(_extract()["id"]) == [1, 2]
+    set_watermark.run(df, column="version", key="flow.sales", store=store)
+    assert _extract().empty
+
+    con.executemany("INSERT INTO sales VALUES (?, ?)", [(3, 30)])
+    df = _extract()
+    assert list(df["id"]) == [3]
+
+    set_watermark.run(df.iloc[:0], column="version", key="flow.sales", store=store)
+    assert store.get("flow.sales") == 20
+
+
+def test_apply_watermark_requires_key():
+    with pytest.raises(ValueError):
+        apply_watermark("SELECT * FROM sales", column="version", key=None)
@@ -0,0 +1,649 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import pandas as pd
+from prefect.utilities import logging
+
+from .config import USER_HOME
+from .exceptions import APIError
+
+logger = logging.get_logger(__name__)
+
+
+class _LocalCache:
+    """A directory of cache entries with an optional TTL and LRU eviction above a size cap."""
+
+    EXTENSION = ""
+
+    def __init__(self, path: str, ttl: int = None, max_size: int = 1024**3):
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        os.makedirs(self.path, exist_ok=True)
+
+    @staticmethod
+    def credentials_identity(credentials: Dict[str, Any] = None) -> str:
+        """Return a hash identifying a set of credentials, so that data obtained with
+        different credentials is cached separately without storing the credentials.
+
+        Args:
+            credentials (Dict[str, Any], optional): The credentials. Defaults to None.
+
+        Returns:
+            str: The SHA-256 hash of the credentials.
+        """
+        serialized = json.dumps(credentials or {}, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def _get_entry_path(self, key: str) -> str:
+        return os.path.join(self.path, key + self.EXTENSION)
+
+    def _list_entries(self) -> List[Tuple[str, os.stat_result]]:
+        entries = []
+        for file_name in os.listdir(self.path):
+            if not file_name.endswith(self.EXTENSION) or file_name.endswith(".tmp"):
+                continue
+            path = os.path.join(self.path, file_name)
+            try:
+                entries.append((path, os.stat(path)))
+            except FileNotFoundError:
+                # Removed by a concurrent run.
+                continue
+        return entries
+
+    def _is_expired(self, stat: os.stat_result) -> bool:
+        return self.ttl is not None and time.time() - stat.st_mtime > self.ttl
+
+    @staticmethod
+    def _touch(path: str, stat: os.stat_result) -> None:
+        # Record the access for LRU eviction, keeping the creation time in `mtime`.
+        os.utime(path, (time.time(), stat.st_mtime))
+
+    def evict(self) -> None:
+        """Remove expired entries and, if the cache is still larger than `max_size`,
+        the least recently used ones."""
+        entries = []
+        for path, stat in self._list_entries():
+            if self._is_expired(stat):
+                self._remove(path)
+            else:
+                entries.append((path, stat))
+
+        total_size = sum(stat.st_size for _, stat in entries)
+        for path, stat in sorted(entries, key=lambda entry: entry[1].st_atime):
+            if total_size <= self.max_size:
+                break
+            self._remove(path)
+            total_size -= stat.st_size
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for path, _ in self._list_entries():
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class ExtractCache(_LocalCache):
+    DEFAULT_PATH = os.path.join(USER_HOME, ".cache", "viadot", "extracts")
+    EXTENSION = ".parquet"
+
+    def __init__(
+        self,
+        path: str = None,
+        ttl: int = 12 * 60 * 60,
+        max_size: int = 1024**3,
+    ):
+        """A local cache for DataFrames extracted from sources.
+
+        Each extract is stored as a Parquet file named after a key built from the
+        source class, the extracting method, its (normalized) parameters and the
+        identity of the credentials used. Entries older than `ttl` seconds are
+        considered stale, and the least recently used entries are evicted once
+        the total size of the cache exceeds `max_size` bytes.
+
+        Args:
+            path (str, optional): The directory in which to store the cache.
+            Defaults to `~/.cache/viadot/extracts`.
+            ttl (int, optional): For how many seconds an entry is valid. Defaults to 12 hours.
+            max_size (int, optional): The maximum total size of the cache in bytes.
+            Defaults to 1 GiB.
+        """
+        super().__init__(
+            path=path or ExtractCache.DEFAULT_PATH, ttl=ttl, max_size=max_size
+        )
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Normalize a query so that surrounding whitespace and a trailing semicolon
+        do not produce different cache keys. The whitespace inside the query is kept,
+        as it can be significant, eg. in string literals.
+
+        Args:
+            query (str): The query to normalize.
+
+        Returns:
+            str: The query without surrounding whitespace and trailing semicolon.
+        """
+        return query.strip().rstrip(";").rstrip()
+
+    def make_key(
+        self,
+        source: Any,
+        method: str,
+        params: Dict[str, Any] = None,
+    ) -> str:
+        """Build the cache key of an extract.
+
+        Args:
+            source (Any): The source instance the data is extracted with.
+            method (str): The name of the extracting method.
+            params (Dict[str, Any], optional): The parameters identifying the extract,
+            eg. the query. The `query` parameters, including nested ones, are normalized
+            with `normalize_query()`. Defaults to None.
+
+        Returns:
+            str: The cache key.
+        """
+        key_data = dict(
+            source=type(source).__module__ + "." + type(source).__qualname__,
+            method=method,
+            params=self._normalize_params(params or {}),
+            credentials=self.credentials_identity(getattr(source, "credentials", None)),
+        )
+        serialized = json.dumps(key_data, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def _normalize_params(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                str(name): self.normalize_query(item)
+                if name == "query" and isinstance(item, str)
+                else self._normalize_params(item)
+                for name, item in value.items()
+            }
+        if isinstance(value, set):
+            return sorted((self._normalize_params(item) for item in value), key=str)
+        if isinstance(value, (list, tuple)):
+            return [self._normalize_params(item) for item in value]
+        if hasattr(value, "tolist"):
+            # numpy arrays and pandas Series
+            return self._normalize_params(value.tolist())
+        return value
+
+    def get(self, key: str) -> Union[pd.DataFrame, None]:
+        """Retrieve an extract from the cache.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Union[pd.DataFrame, None]: The cached DataFrame, or None if there is no
+            valid entry for the key.
+        """
+        path = self._get_entry_path(key)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        if self._is_expired(stat):
+            self._remove(path)
+            return None
+
+        try:
+            df = pd.read_parquet(path)
+        except Exception as e:
+            logger.warning(f"Cache entry {path} could not be read: {e}")
+            self._remove(path)
+            return None
+
+        self._touch(path, stat)
+        return df
+
+    def put(self, key: str, df: pd.DataFrame) -> bool:
+        """Store an extract in the cache and evict stale and least recently used entries.
+
+        Args:
+            key (str): The cache key.
+            df (pd.DataFrame): The DataFrame to cache.
+
+        Returns:
+            bool: Whether the DataFrame was cached. DataFrames which cannot be stored
+            as Parquet are not cached.
+        """
+        path = self._get_entry_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"The extract could not be cached: {e}")
+            self._remove(tmp_path)
+            return False
+        self.evict()
+        return True
+
+    def get_or_extract(
+        self,
+        source: Any,
+        method: Union[str, Callable] = "to_df",
+        *args,
+        key_params: Dict[str, Any] = None,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """Return an extract from the cache, or extract it with the source and cache it.
+
+        Args:
+            source (Any): The source instance to extract the data with.
+            method (Union[str, Callable], optional): The extracting method or its name.
+            Defaults to "to_df".
+            *args: Positional arguments passed to the extracting method.
+            key_params (Dict[str, Any], optional): Additional parameters identifying the
+            extract, for sources which hold the query in their state (eg. `SAPRFC.sql`).
+            Defaults to None.
+            **kwargs: Keyword arguments passed to the extracting method.
+
+        Returns:
+            pd.DataFrame: The extracted DataFrame.
+        """
+        func = getattr(source, method) if isinstance(method, str) else method
+        params = dict(args=list(args), kwargs=kwargs, key_params=key_params or {})
+        key = self.make_key(source, method=func.__name__, params=params)
+
+        df = self.get(key)
+        if df is not None:
+            logger.info(
+                f"Using cached extract for {type(source).__name__}.{func.__name__}()."
+            )
+            return df
+
+        df = func(*args, **kwargs)
+        if isinstance(df, pd.DataFrame):
+            self.put(key, df)
+        return df
+
+
+class DownloadCache(_LocalCache):
+    DEFAULT_PATH = os.path.join(USER_HOME, ".cache", "viadot", "downloads")
+
+    def __init__(self, path: str = None, max_size: int = 1024**3):
+        """A local cache for files downloaded from remote filesystems.
+
+        Each file is stored under a key built from its remote location and version,
+        ie. its ETag or, if the filesystem does not provide one, its last modification
+        time and size. A cached file is therefore only reused while the remote file is
+        unchanged, and checking it only takes a metadata request. The least recently
+        used entries are evicted once the total size of the cache exceeds `max_size` bytes.
+
+        Args:
+            path (str, optional): The directory in which to store the cache.
+            Defaults to `~/.cache/viadot/downloads`.
+            max_size (int, optional): The maximum total size of the cache in bytes.
+            Defaults to 1 GiB.
+        """
+        super().__init__(path=path or DownloadCache.DEFAULT_PATH, max_size=max_size)
+
+    @staticmethod
+    def get_version(info: Dict[str, Any]) -> str:
+        """Return the version of a remote file from its metadata.
+
+        Args:
+            info (Dict[str, Any]): The file's metadata, as returned by `fs.info()`.
+
+        Returns:
+            str: The ETag of the file, or its last modification time and size.
+        """
+        for field in ("etag", "ETag", "last_modified", "modificationTime", "mtime"):
+            if info.get(field):
+                return f"{field}={info[field]};size={info.get('size')}"
+        raise ValueError(f"Could not determine the version of {info.get('name')}.")
+
+    def make_key(self, fs: Any, path: str, version: str) -> str:
+        """Build the cache key of a remote file.
+
+        Args:
+            fs (Any): The filesystem the file is downloaded from.
+            path (str): The path to the file.
+            version (str): The version of the file, see `get_version()`.
+
+        Returns:
+            str: The cache key.
+        """
+        key_data = dict(
+            fs=type(fs).__module__ + "." + type(fs).__qualname__,
+            storage_options=self.credentials_identity(
+                getattr(fs, "storage_options", None)
+            ),
+            path=path,
+            version=version,
+        )
+        serialized = json.dumps(key_data, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def download(self, fs: Any, from_path: str, to_path: str) -> bool:
+        """Download a file, reusing the cached copy if the remote file is unchanged.
+
+        Args:
+            fs (Any): The fsspec filesystem to download the file from.
+            from_path (str): The path to the remote file.
+            to_path (str): The local destination path. If it is a directory, the file
+            is downloaded into it under its remote name.
+
+        Returns:
+            bool: Whether the cached copy was used.
+        """
+        if os.path.isdir(to_path) or to_path.endswith(("/", os.sep)):
+            os.makedirs(to_path, exist_ok=True)
+            to_path = os.path.join(to_path, os.path.basename(from_path.rstrip("/")))
+
+        fs.invalidate_cache(from_path)
+        version = self.get_version(fs.info(from_path))
+        path = self._get_entry_path(self.make_key(fs, from_path, version))
+
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            stat = None
+
+        if stat is not None:
+            shutil.copyfile(path, to_path)
+            self._touch(path, stat)
+            logger.info(f"Using cached copy of {from_path}.")
+            return True
+
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            fs.get_file(from_path, tmp_path)
+            shutil.copyfile(tmp_path, to_path)
+            os.replace(tmp_path, path)
+        finally:
+            self._remove(tmp_path)
+        self.evict()
+        return False
+
+
+class TableMetadataCache:
+    def __init__(self, ttl: int = 10 * 60):
+        """An in-memory cache of database table metadata, shared by the SQL helpers
+        of a process.
+
+        The metadata of a table is a list of its columns, each described by a dictionary
+        with the `name`, `type`, `max_length` and `is_key` (whether the column is part
+        of the primary key) fields. Entries are keyed by server, database, schema and table,
+        expire after `ttl` seconds, and are invalidated whenever DDL is run through
+        viadot on the same database.
+
+        Args:
+            ttl (int, optional): For how many seconds an entry is valid. Defaults to 10 minutes.
+        """
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        con: "pyodbc.Connection", table: str, schema: str = None
+    ) -> Tuple[str, str, str, str]:
+        """Build the cache key of a table.
+
+        Args:
+            con (pyodbc.Connection): A connection to the database where the table is located.
+            table (str): The name of the table.
+            schema (str, optional): The schema of the table. Defaults to None.
+
+        Returns:
+            Tuple[str, str, str, str]: The server, database, schema and table names, lowercased
+            as SQL Server identifiers are case-insensitive by default.
+        """
+        import pyodbc
+
+        return (
+            str(con.getinfo(pyodbc.SQL_SERVER_NAME)).lower(),
+            str(con.getinfo(pyodbc.SQL_DATABASE_NAME)).lower(),
+            str(schema).lower(),
+            table.lower(),
+        )
+
+    def get(self, key: Tuple[str, str, str, str]) -> Union[List[Dict[str, Any]], None]:
+        """Retrieve the metadata of a table.
+
+        Args:
+            key (Tuple[str, str, str, str]): The cache key, see `make_key()`.
+
+        Returns:
+            Union[List[Dict[str, Any]], None]: The columns of the table, or None if there
+            is no valid entry for the key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            created_at, columns = entry
+            if self.ttl is not None and time.monotonic() - created_at > self.ttl:
+                del self._entries[key]
+                return None
+            return columns
+
+    def put(
+        self, key: Tuple[str, str, str, str], columns: List[Dict[str, Any]]
+    ) -> None:
+        """Store the metadata of a table.
+
+        Args:
+            key (Tuple[str, str, str, str]): The cache key, see `make_key()`.
+            columns (List[Dict[str, Any]]): The columns of the table.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), columns)
+
+    def get_or_fetch(
+        self,
+        key: Tuple[str, str, str, str],
+        fetch: Callable[[], List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """Return the metadata of a table from the cache, or fetch and cache it.
+
+        Tables which don't exist, ie. for which `fetch` returns no columns, are not cached,
+        so that they are found as soon as they're created.
+
+        Args:
+            key (Tuple[str, str, str, str]): The cache key, see `make_key()`.
+            fetch (Callable[[], List[Dict[str, Any]]]): A function querying the columns of the table.
+
+        Returns:
+            List[Dict[str, Any]]: The columns of the table.
+        """
+        columns = self.get(key)
+        if columns is None:
+            columns = fetch()
+            if columns:
+                self.put(key, columns)
+        return columns
+
+    def invalidate(
+        self, con: "pyodbc.Connection", table: str = None, schema: str = None
+    ) -> None:
+        """Remove the metadata of a table or, if no table is specified, of all the
+        tables of a database.
+
+        Args:
+            con (pyodbc.Connection): A connection to the database.
+            table (str, optional): The name of the table. Defaults to None.
+            schema (str, optional): The schema of the table. Defaults to None.
+        """
+        key = self.make_key(con, table=table or "", schema=schema)
+        prefix = key if table else key[:2]
+        with self._lock:
+            for entry_key in list(self._entries):
+                if entry_key[: len(prefix)] == prefix:
+                    del self._entries[entry_key]
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+table_metadata_cache = TableMetadataCache()
+
+
+class TokenCache:
+    def __init__(self, margin: int = 60, default_ttl: int = 5 * 60):
+        """An in-memory cache of API access tokens, shared by the sources of a process.
+
+        A token is reused until `margin` seconds before it expires, so that the requests
+        of a run, possibly made from several threads, don't each generate a new token.
+        Concurrent requests for the same missing or expired token wait for a single
+        fetch instead of each fetching one.
+
+        Args:
+            margin (int, optional): How many seconds before its expiry a token is renewed.
+            Defaults to 60.
+            default_ttl (int, optional): For how many seconds a token is valid when its
+            lifetime is unknown. Defaults to 5 minutes.
+        """
+        self.margin = margin
+        self.default_ttl = default_ttl
+        self._entries = {}
+        self._fetch_locks = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, credentials: Dict[str, Any] = None) -> Tuple[str, str]:
+        """Build the cache key of a token.
+
+        Args:
+            url (str): The URL the token is generated with.
+            credentials (Dict[str, Any], optional): The credentials the token is generated
+            with. Only their hash is stored. Defaults to None.
+
+        Returns:
+            Tuple[str, str]: The URL and the identity of the credentials.
+        """
+        return (url, _LocalCache.credentials_identity(credentials))
+
+    def get(self, key: Tuple[str, str]) -> Any:
+        """Retrieve a token.
+
+        Args:
+            key (Tuple[str, str]): The cache key, see `make_key()`.
+
+        Returns:
+            Any: The token, or None if there is no token valid for at least `margin` seconds.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, token = entry
+            if time.monotonic() >= expires_at - self.margin:
+                del self._entries[key]
+                return None
+            return token
+
+    def put(self, key: Tuple[str, str], token: Any, expires_in: float = None) -> None:
+        """Store a token.
+
+        Args:
+            key (Tuple[str, str]): The cache key, see `make_key()`.
+            token (Any): The token.
+            expires_in (float, optional): For how many seconds the token is valid.
+            Defaults to None (`default_ttl`).
+        """
+        if expires_in is None:
+            expires_in = self.default_ttl
+        with self._lock:
+            self._entries[key] = (time.monotonic() + float(expires_in), token)
+
+    def get_or_fetch(
+        self,
+        key: Tuple[str, str],
+        fetch: Callable[[], Tuple[Any, Union[float, None]]],
+    ) -> Any:
+        """Return a token from the cache, or fetch and cache it.
+
+        Args:
+            key (Tuple[str, str]): The cache key, see `make_key()`.
+            fetch (Callable[[], Tuple[Any, Union[float, None]]]): A function generating a
+            token, returning the token and its lifetime in seconds (or None if unknown).
+
+        Returns:
+            Any: The token.
+        """
+        token = self.get(key)
+        if token is not None:
+            return token
+
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+        with fetch_lock:
+            # The token may have been fetched by another thread in the meantime.
+            token = self.get(key)
+            if token is None:
+                token, expires_in = fetch()
+                self.put(key, token, expires_in=expires_in)
+        return token
+
+    def call(
+        self,
+        key: Tuple[str, str],
+        fetch: Callable[[], Tuple[Any, Union[float, None]]],
+        request: Callable[[Any], Any],
+    ) -> Any:
+        """Send a request with a cached token. If the server rejects the token (HTTP 401),
+        eg. because it was revoked before its expiry, a new token is fetched and the
+        request is sent once more.
+
+        Args:
+            key (Tuple[str, str]): The cache key, see `make_key()`.
+            fetch (Callable[[], Tuple[Any, Union[float, None]]]): A function generating a
+            token, see `get_or_fetch()`.
+            request (Callable[[Any], Any]): A function sending the request with the token
+            it's given, raising an `APIError` caused by the `requests.HTTPError` of the
+            response on failure, as `viadot.utils.handle_api_response()` does.
+
+        Returns:
+            Any: The result of `request`.
+        """
+        token = self.get_or_fetch(key, fetch)
+        try:
+            return request(token)
+        except APIError as e:
+            response = getattr(e.__cause__, "response", None)
+            if getattr(response, "status_code", None) != 401:
+                raise
+        logger.warning("The access token was rejected. Retrying with a new token.")
+        self.invalidate(key, token=token)
+        return request(self.get_or_fetch(key, fetch))
+
+    def invalidate(self, key: Tuple[str, str], token: Any = None) -> None:
+        """Remove a token, eg. after it's been rejected.
+
+        Args:
+            key (Tuple[str, str]): The cache key, see `make_key()`.
+            token (Any, optional): The rejected token. If provided, the token is only
+            removed if it wasn't already replaced, eg. by another thread. Defaults to None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (token is None or entry[1] == token):
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all tokens from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = TokenCache()
@@ -21,6 +21,10 @@ class ADLSContainerToContainer(Flow):
         name (str): The name of the flow.
         from_path (str): The path to the Data Lake file.
         to_path (str): The path of the final file location a/a/filename.extension.
+        recursive (bool, optional): Set this to true if copying entire directories. The files are copied
+            concurrently. Defaults to False.
+        overwrite (bool, optional): Whether to overwrite the destination file(s). Defaults to True.
+        max_workers (int, optional): The maximum number of files copied concurrently. Defaults to 8.
         adls_sp_credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary with
             ACCOUNT_NAME and Service Principal credentials (TENANT_ID, CLIENT_ID, CLIENT_SECRET) for the Azure Data Lake.
             Defaults to None.
@@ -34,6 +38,9 @@ class ADLSContainerToContainer(Flow):
         name: str,
         from_path: str,
         to_path: str,
+        recursive: bool = False,
+        overwrite: bool = True,
+        max_workers: int = 8,
         adls_sp_credentials_secret: str = None,
         vault_name: str = None,
         timeout: int = 3600,
@@ -43,6 +50,9 @@ class ADLSContainerToContainer(Flow):
         from_path = from_path.strip("/")
         self.from_path = from_path
         self.to_path = to_path
+        self.recursive = recursive
+        self.overwrite = overwrite
+        self.max_workers = max_workers
         self.adls_sp_credentials_secret = adls_sp_credentials_secret
         self.vault_name = vault_name
         self.timeout = timeout
@@ -58,6 +68,9 @@ class ADLSContainerToContainer(Flow):
         copy_task.bind(
             from_path=self.from_path,
             to_path=self.to_path,
+            recursive=self.recursive,
+            overwrite=self.overwrite,
+            max_workers=self.max_workers,
             sp_credentials_secret=self.adls_sp_credentials_secret,
             vault_name=self.vault_name,
             flow=self,
@@ -1,35 +1,36 @@
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
-import pandas as pd
 from prefect import Flow, task
 from prefect.utilities import logging
 
-from ..tasks import AzureDataLakeDownload, AzureDataLakeUpload
+from ..tasks import AzureDataLakeCopy
 
 logger = logging.get_logger(__name__)
 
 
 @task
-def add_ingestion_metadata(
-    path: str,
-    sep: str = "\t",
-):
-    """Add ingestion metadata column(s), eg. data download date"""
-    df = pd.read_csv(path, sep=sep)
-    df["_viadot_downloaded_at_utc"] = datetime.now(timezone.utc)
-    df.to_csv(path, sep=sep, index=False)
+def get_ingestion_metadata_columns() -> Dict[str, Any]:
+    """Get the ingestion metadata column(s) to add to the copied file(s)."""
+    return {"_viadot_downloaded_at_utc": datetime.now(timezone.utc)}
 
 
 class ADLSGen1ToGen2(Flow):
     """Move file(s) from Azure Data Lake gen1 to gen2.
 
+    The file(s) are streamed from gen1 to gen2, adding the ingestion metadata column(s)
+    on the way, without being staged on local disk.
+
     Args:
         name (str): The name of the flow.
         gen1_path (str): The path to the gen1 Data Lake file/folder.
         gen2_path (str): The path of the final gen2 file/folder.
-        local_file_path (str): Where the gen1 file should be downloaded.
+        local_file_path (str): Deprecated, the file(s) are no longer downloaded locally.
         overwrite (str): Whether to overwrite the destination file(s).
+        recursive (bool, optional): Set this to true if moving entire directories. Defaults to False.
+        max_workers (int, optional): The maximum number of files moved concurrently. Defaults to 8.
+        sep (str, optional): The separator of the file(s), which are read as CSV whatever their
+            extension. Defaults to "\t".
         gen1_sp_credentials_secret (str): The Key Vault secret holding Service Pricipal credentials for gen1 lake
         gen2_sp_credentials_secret (str): The Key Vault secret holding Service Pricipal credentials for gen2 lake
         vault_name (str): The name of the vault from which to retrieve the secrets.
@@ -44,6 +45,8 @@ class ADLSGen1ToGen2(Flow):
         gen2_path: str,
         local_file_path: str = None,
         overwrite: bool = True,
+        recursive: bool = False,
+        max_workers: int = 8,
         sep: str = "\t",
         gen1_sp_credentials_secret: str = None,
         gen2_sp_credentials_secret: str = None,
@@ -56,6 +59,8 @@ class ADLSGen1ToGen2(Flow):
         self.local_file_path = local_file_path or self.slugify(name) + ".csv"
         self.gen2_path = gen2_path
         self.overwrite = overwrite
+        self.recursive = recursive
+        self.max_workers = max_workers
         self.sep = sep
         self.gen1_sp_credentials_secret = gen1_sp_credentials_secret
         self.gen2_sp_credentials_secret = gen2_sp_credentials_secret
@@ -69,25 +74,21 @@ class ADLSGen1ToGen2(Flow):
         return name.replace(" ", "_").lower()
 
     def gen_flow(self) -> Flow:
-        gen1_download_task = AzureDataLakeDownload(gen=1, timeout=self.timeout)
-        gen1_download_task.bind(
+        metadata_columns = get_ingestion_metadata_columns.bind(flow=self)
+        copy_task = AzureDataLakeCopy(gen=1, to_gen=2, timeout=self.timeout)
+        copy_task.bind(
             from_path=self.gen1_path,
-            to_path=self.local_file_path,
-            gen=1,
-            sp_credentials_secret=self.gen1_sp_credentials_secret,
-            vault_name=self.vault_name,
-            flow=self,
-        )
-        add_ingestion_metadata.bind(path=self.local_file_path, sep=self.sep, flow=self)
-        gen2_upload_task = AzureDataLakeUpload(gen=2, timeout=self.timeout)
-        gen2_upload_task.bind(
-            from_path=self.local_file_path,
             to_path=self.gen2_path,
+            recursive=self.recursive,
             overwrite=self.overwrite,
-            sp_credentials_secret=self.gen2_sp_credentials_secret,
+            max_workers=self.max_workers,
+            metadata_columns=metadata_columns,
+            file_format="csv",
+            sep=self.sep,
+            gen=1,
+            to_gen=2,
+            sp_credentials_secret=self.gen1_sp_credentials_secret,
+            to_sp_credentials_secret=self.gen2_sp_credentials_secret,
             vault_name=self.vault_name,
             flow=self,
         )
-
-        add_ingestion_metadata.set_upstream(gen1_download_task, flow=self)
-        gen2_upload_task.set_upstream(add_ingestion_metadata, flow=self)
@@ -10,6 +10,7 @@ from prefect.utilities import logging
 
 from viadot.tasks import (
     AzureDataLakeCopy,
+    AzureDataLakeToAzureSQLStream,
     AzureDataLakeToDF,
     AzureSQLCreateTable,
     AzureSQLDBQuery,
@@ -79,6 +80,11 @@ def df_to_csv_task(df, remove_tab, path: str, sep: str = "\t"):
             df.to_csv(path, sep=sep, index=False)
 
 
+@task(timeout=3600)
+def get_columns_task(df: pd.DataFrame) -> List[str]:
+    return [column.strip() for column in df.columns]
+
+
 @task(timeout=3600)
 def check_dtypes_sort(
     df: pd.DataFrame = None,
@@ -149,10 +155,16 @@ class ADLSToAzureSQL(Flow):
         sqldb_credentials_secret: str = None,
         on_bcp_error: Literal["skip", "fail"] = "skip",
         max_download_retries: int = 5,
+        use_download_cache: bool = False,
         tags: List[str] = ["promotion"],
         vault_name: str = None,
         timeout: int = 3600,
         validate_df_dict: Dict[str, Any] = None,
+        stream: bool = False,
+        sample_size: int = 10_000,
+        batch_size: int = 100_000,
+        rows_per_file: int = 1_000_000,
+        max_concurrent_loads: int = 4,
         *args: List[any],
         **kwargs: Dict[str, Any],
     ):
@@ -185,12 +197,24 @@ class ADLSToAzureSQL(Flow):
             Azure SQL Database credentials. Defaults to None.
             on_bcp_error (Literal["skip", "fail"], optional): What to do if error occurs. Defaults to "skip".
             max_download_retries (int, optional): How many times to retry the download. Defaults to 5.
+            use_download_cache (bool, optional): Whether to keep a local copy of the schema file and reuse it
+            while the file is unchanged in ADLS. Defaults to False.
             tags (List[str], optional): Flow tags to use, eg. to control flow concurrency. Defaults to ["promotion"].
             vault_name (str, optional): The name of the vault from which to obtain the secrets. Defaults to None.
             timeout(int, optional): The amount of time (in seconds) to wait while running this task before
                 a timeout occurs. Defaults to 3600.
             validate_df_dict (Dict[str,Any], optional): A dictionary with optional list of tests to verify the output dataframe.
                 If defined, triggers the `validate_df` task from task_utils. Defaults to None.
+            stream (bool, optional): Whether to stream the file into the table instead of loading it into memory.
+                The file is read in batches, written into rotating CSV files and loaded with concurrent bcp
+                processes. The dtypes and column order are checked on the first `sample_size` rows, and the
+                `validate_df_dict` tests on the whole file, by loading it through a staging table. Defaults to False.
+            sample_size (int, optional): The number of rows used for the checks in stream mode. Defaults to 10 000.
+            batch_size (int, optional): The number of rows read at a time in stream mode. Defaults to 100 000.
+            rows_per_file (int, optional): The maximum number of rows in a single CSV file in stream mode.
+                Defaults to 1 000 000.
+            max_concurrent_loads (int, optional): The maximum number of concurrent bcp processes in stream mode.
+                Defaults to 4.
         """
 
         adls_path = adls_path.strip("/")
@@ -236,11 +260,19 @@ class ADLSToAzureSQL(Flow):
 
         # Global
         self.max_download_retries = max_download_retries
+        self.use_download_cache = use_download_cache
         self.tags = tags
         self.vault_name = vault_name
         self.timeout = timeout
         self.validate_df_dict = validate_df_dict
 
+        # Stream mode
+        self.stream = stream
+        self.sample_size = sample_size
+        self.batch_size = batch_size
+        self.rows_per_file = rows_per_file
+        self.max_concurrent_loads = max_concurrent_loads
+
         super().__init__(*args, name=name, **kwargs)
 
         # self.dtypes.update(METADATA_COLUMNS)
@@ -261,6 +293,7 @@ class ADLSToAzureSQL(Flow):
             path=self.adls_path,
             sp_credentials_secret=self.adls_sp_credentials_secret,
             sep=self.read_sep,
+            limit=self.sample_size if self.stream else None,
             flow=self,
         )
 
@@ -272,6 +305,7 @@ class ADLSToAzureSQL(Flow):
                 download_json_file_task.bind(
                     from_path=self.json_shema_path,
                     to_path=self.local_json_path,
+                    use_cache=self.use_download_cache,
                     sp_credentials_secret=self.adls_sp_credentials_secret,
                     flow=self,
                 )
@@ -294,6 +328,11 @@ class ADLSToAzureSQL(Flow):
                 credentials_secret=self.sqldb_credentials_secret,
                 flow=self,
             )
+
+            if self.stream:
+                self._gen_stream_tasks(df=df, df_reorder=df_reorder, dtypes=dtypes)
+                return
+
             if self.check_col_order == False:
                 df_to_csv = df_to_csv_task.bind(
                     df=df,
@@ -342,3 +381,43 @@ class ADLSToAzureSQL(Flow):
             df_to_csv.set_upstream(df_reorder, flow=self)
             create_table_task.set_upstream(df_to_csv, flow=self)
             bulk_insert_task.set_upstream(create_table_task, flow=self)
+
+    def _gen_stream_tasks(self, df, df_reorder, dtypes) -> None:
+        columns = get_columns_task.bind(
+            df_reorder if self.check_col_order else df, flow=self
+        )
+
+        create_table_task = AzureSQLCreateTable(timeout=self.timeout)
+        create_table_task.bind(
+            schema=self.schema,
+            table=self.table,
+            dtypes=dtypes,
+            if_exists=self._map_if_exists(self.if_exists),
+            credentials_secret=self.sqldb_credentials_secret,
+            vault_name=self.vault_name,
+            flow=self,
+        )
+        stream_task = AzureDataLakeToAzureSQLStream(timeout=self.timeout)
+        stream_task.bind(
+            path=self.adls_path,
+            local_path=self.local_file_path,
+            table=self.table,
+            schema=self.schema,
+            columns=columns,
+            read_sep=self.read_sep,
+            write_sep=self.write_sep,
+            remove_tab=self.remove_tab,
+            batch_size=self.batch_size,
+            rows_per_file=self.rows_per_file,
+            max_concurrent_loads=self.max_concurrent_loads,
+            on_error=self.on_bcp_error,
+            error_log_file_path=self.name.replace(" ", "_") + ".log",
+            validate_df_dict=self.validate_df_dict,
+            sp_credentials_secret=self.adls_sp_credentials_secret,
+            sqldb_credentials_secret=self.sqldb_credentials_secret,
+            vault_name=self.vault_name,
+            flow=self,
+        )
+
+        create_table_task.set_upstream(columns, flow=self)
+        stream_task.set_upstream(create_table_task, flow=self)
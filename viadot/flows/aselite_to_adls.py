@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Literal
+import hashlib
+from typing import Any, Dict, List, Literal, Union
 
 from prefect import Flow
 
@@ -6,10 +7,12 @@ from viadot.task_utils import (
     df_clean_column,
     df_converts_bytes_to_int,
     df_to_csv,
+    set_watermark,
     validate_df,
 )
 from viadot.tasks import AzureDataLakeUpload
 from viadot.tasks.aselite import ASELiteToDF
+from viadot.watermarks import WatermarkStore, make_watermark_key
 
 
 class ASELiteToADLS(Flow):
@@ -29,6 +32,9 @@ class ASELiteToADLS(Flow):
         sp_credentials_secret: str = None,
         remove_special_characters: bool = None,
         columns_to_clean: List[str] = None,
+        incremental_column: str = None,
+        watermark_key: str = None,
+        watermark_store: Union[str, WatermarkStore] = "local",
         timeout: int = 3600,
         *args: List[any],
         **kwargs: Dict[str, Any]
@@ -54,9 +60,23 @@ class ASELiteToADLS(Flow):
             remove_special_characters (str, optional): Call a function that remove special characters like escape symbols. Defaults to None.
             columns_to_clean (List(str), optional): Select columns to clean, used with remove_special_characters.
             If None whole data frame will be processed. Defaults to None.
+            incremental_column (str, optional): The column tracking changes, a `rowversion` column, whose values are
+                unique and increasing (timestamp columns such as `modified_at` are not supported). If provided, only
+                the rows changed since the last run are downloaded, and the watermark is moved forward once the file
+                is uploaded to ADLS. As the file only holds the changed rows, use with `overwrite=False` and a
+                `to_path` unique per run, eg. including the date. Defaults to None.
+            watermark_key (str, optional): The key of the watermark. Defaults to None (built from the flow name
+                and a hash of `query`, so that it is the same on every run).
+            watermark_store (Union[str, WatermarkStore], optional): The store holding the watermark: "local",
+                "duckdb", "prefect" (the Prefect KV Store) or a `WatermarkStore`. Defaults to "local".
             timeout(int, optional): The amount of time (in seconds) to wait while running this task before
                 a timeout occurs. Defaults to 3600.
         """
+        if incremental_column and overwrite:
+            raise ValueError(
+                "'overwrite' must be False in incremental mode, as the file only holds the rows changed since the last run."
+            )
+
         self.query = query
         self.sqldb_credentials_secret = sqldb_credentials_secret
         self.vault_name = vault_name
@@ -71,6 +91,12 @@ class ASELiteToADLS(Flow):
         self.sp_credentials_secret = sp_credentials_secret
         self.remove_special_characters = remove_special_characters
         self.columns_to_clean = columns_to_clean
+        self.incremental_column = incremental_column
+        if watermark_key is None and query is not None:
+            query_hash = hashlib.sha256(query.strip().rstrip(";").encode("utf-8"))
+            watermark_key = make_watermark_key(name, query_hash.hexdigest()[:16])
+        self.watermark_key = watermark_key
+        self.watermark_store = watermark_store
         self.timeout = timeout
 
         super().__init__(*args, name=name, **kwargs)
@@ -83,8 +109,12 @@ class ASELiteToADLS(Flow):
             query=self.query,
             credentials_secret=self.sqldb_credentials_secret,
             vault_name=self.vault_name,
+            incremental_column=self.incremental_column,
+            watermark_key=self.watermark_key,
+            watermark_store=self.watermark_store,
             flow=self,
         )
+        extracted_df = df
 
         if self.convert_bytes == True:
             df = df_converts_bytes_to_int.bind(df, flow=self)
@@ -120,3 +150,13 @@ class ASELiteToADLS(Flow):
 
         create_csv.set_upstream(df, flow=self)
         adls_upload.set_upstream(create_csv, flow=self)
+
+        if self.incremental_column:
+            watermark = set_watermark.bind(
+                extracted_df,
+                column=self.incremental_column,
+                key=self.watermark_key,
+                store=self.watermark_store,
+                flow=self,
+            )
+            watermark.set_upstream(adls_upload, flow=self)
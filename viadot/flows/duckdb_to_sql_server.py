@@ -7,7 +7,13 @@ from prefect.utilities import logging
 
 from viadot.task_utils import df_to_csv as df_to_csv_task
 from viadot.task_utils import get_sql_dtypes_from_df as get_sql_dtypes_from_df_task
-from viadot.tasks import BCPTask, DuckDBQuery, DuckDBToDF, SQLServerCreateTable
+from viadot.tasks import (
+    BCPTask,
+    DuckDBQuery,
+    DuckDBToDF,
+    DuckDBToSQLServerStream,
+    SQLServerCreateTable,
+)
 
 logger = logging.get_logger(__name__)
 
@@ -44,6 +50,10 @@ class DuckDBToSQLServer(Flow):
         sql_server_credentials: dict = None,
         on_bcp_error: Literal["skip", "fail"] = "skip",
         bcp_error_log_path="./log_file.log",
+        stream: bool = False,
+        batch_size: int = 100_000,
+        rows_per_file: int = 1_000_000,
+        max_concurrent_loads: int = 4,
         tags: List[str] = ["load"],
         timeout: int = 3600,
         *args: List[any],
@@ -71,6 +81,15 @@ class DuckDBToSQLServer(Flow):
             sql_server_credentials (dict, optional): The credentials to use for connecting with SQL Server.
             on_bcp_error (Literal["skip", "fail"], optional): What to do if error occurs. Defaults to "skip".
             bcp_error_log_path (string, optional): Full path of an error file. Defaults to "./log_file.log".
+            stream (bool, optional): Whether to stream the data instead of loading it into a DataFrame. The data is
+            fetched in record batches and written into rotating CSV files, each of which is loaded with bcp as soon
+            as it is complete. Defaults to False.
+            batch_size (int, optional): The number of rows fetched from DuckDB at a time in streaming mode.
+            Defaults to 100 000.
+            rows_per_file (int, optional): The maximum number of rows in a single CSV file in streaming mode.
+            Defaults to 1 000 000.
+            max_concurrent_loads (int, optional): The maximum number of concurrent bcp processes in streaming mode.
+            Defaults to 4.
             tags (List[str], optional): Flow tags to use, eg. to control flow concurrency. Defaults to ["load"].
             timeout(int, optional): The amount of time (in seconds) to wait while running this task before
                 a timeout occurs. Defaults to 3600.
@@ -98,6 +117,12 @@ class DuckDBToSQLServer(Flow):
         self.on_bcp_error = on_bcp_error
         self.bcp_error_log_path = bcp_error_log_path
 
+        # DuckDBToSQLServerStream
+        self.stream = stream
+        self.batch_size = batch_size
+        self.rows_per_file = rows_per_file
+        self.max_concurrent_loads = max_concurrent_loads
+
         # Global
         self.tags = tags
         self.timeout = timeout
@@ -118,6 +143,9 @@ class DuckDBToSQLServer(Flow):
         return name.replace(" ", "_").lower()
 
     def gen_flow(self) -> Flow:
+        if self.stream:
+            return self.gen_stream_flow()
+
         if self.duckdb_query is None:
             duckdb_to_df_task = DuckDBToDF(timeout=self.timeout)
             df = duckdb_to_df_task.bind(
@@ -172,3 +200,53 @@ class DuckDBToSQLServer(Flow):
         create_table_task.set_upstream(df_to_csv, flow=self)
         bulk_insert_task.set_upstream(create_table_task, flow=self)
         cleanup_csv_task.set_upstream(bulk_insert_task, flow=self)
+
+    def gen_stream_flow(self) -> Flow:
+        if self.duckdb_query is None:
+            query = f"SELECT * FROM {self.duckdb_schema}.{self.duckdb_table}"
+        else:
+            query = self.duckdb_query
+
+        if self.dtypes:
+            # Use user-provided dtypes.
+            dtypes = self.dtypes
+        else:
+            # Infer the dtypes from a sample, the same way as `get_sql_dtypes_from_df`
+            # does for the full DataFrame.
+            sample_df = self.duckdb_run_query_task.bind(
+                query=f"SELECT * FROM ({query}) AS sample LIMIT 10000",
+                credentials=self.duckdb_credentials,
+                fetch_type="dataframe",
+                flow=self,
+            )
+            dtypes = get_sql_dtypes_from_df_task.bind(df=sample_df, flow=self)
+
+        create_table_task = SQLServerCreateTable(timeout=self.timeout)
+        create_table_task.bind(
+            schema=self.sql_server_schema,
+            table=self.sql_server_table,
+            dtypes=dtypes,
+            if_exists=self.if_exists,
+            credentials=self.sql_server_credentials,
+            flow=self,
+        )
+
+        stream_task = DuckDBToSQLServerStream(timeout=self.timeout)
+        stream_task.bind(
+            query=query,
+            path=self.local_file_path,
+            schema=self.sql_server_schema,
+            table=self.sql_server_table,
+            sep=self.write_sep,
+            batch_size=self.batch_size,
+            rows_per_file=self.rows_per_file,
+            max_concurrent_loads=self.max_concurrent_loads,
+            on_error=self.on_bcp_error,
+            error_log_file_path=self.bcp_error_log_path,
+            if_empty=self.if_empty,
+            duckdb_credentials=self.duckdb_credentials,
+            sql_server_credentials=self.sql_server_credentials,
+            flow=self,
+        )
+
+        stream_task.set_upstream(create_table_task, flow=self)
@@ -2,40 +2,81 @@ from typing import Any, Dict, List
 
 from prefect import Flow
 
-from viadot.tasks.duckdb import DuckDBQuery
+from viadot.tasks.duckdb import DuckDBQuery, DuckDBRunScripts
 
 
 class DuckDBTransform(Flow):
     def __init__(
         self,
         name: str,
-        query: str,
+        query: str = None,
         credentials: dict = None,
         tags: List[str] = ["transform"],
         timeout: int = 3600,
+        scripts_path: str = None,
+        dependencies: Dict[str, List[str]] = None,
+        max_workers: int = 4,
+        log_table: str = "run_log",
+        log_schema: str = None,
         *args: List[any],
         **kwargs: Dict[str, Any]
     ):
         """
         Flow for running SQL queries on top of DuckDB.
 
+        Either a single `query` or a directory of SQL scripts (`scripts_path`) can be run.
+        In the latter case, the scripts are run in dependency order, with independent scripts
+        running concurrently. Dependencies are inferred from the tables each script reads and
+        writes, and can also be declared with `dependencies` or `-- depends_on: script_a, script_b`
+        comments inside the scripts.
+
         Args:
             name (str): The name of the flow.
-            query (str, required): The query to execute on the database.
+            query (str, optional): The query to execute on the database. Defaults to None.
             credentials (dict, optional): Credentials for the connection. Defaults to None.
             tags (list, optional): Tag for marking flow. Defaults to "transform".
             timeout(int, optional): The amount of time (in seconds) to wait while running this task before
                 a timeout occurs. Defaults to 3600.
+            scripts_path (str, optional): The directory containing the `.sql` scripts to run. Defaults to None.
+            dependencies (Dict[str, List[str]], optional): Explicitly declared dependencies, mapping script
+                names (file names without the extension) to the scripts they depend on. Defaults to None.
+            max_workers (int, optional): The maximum number of scripts run concurrently. Defaults to 4.
+            log_table (str, optional): The table in which to record the runtime of each script.
+                Defaults to "run_log".
+            log_schema (str, optional): The schema of the log table. Defaults to None.
         """
+        if (query is None) == (scripts_path is None):
+            raise ValueError(
+                "Exactly one of 'query' and 'scripts_path' must be provided."
+            )
+
         self.query = query
         self.credentials = credentials
         self.tags = tags
         self.timeout = timeout
+        self.scripts_path = scripts_path
+        self.dependencies = dependencies
+        self.max_workers = max_workers
+        self.log_table = log_table
+        self.log_schema = log_schema
 
         super().__init__(*args, name=name, **kwargs)
         self.gen_flow()
 
     def gen_flow(self) -> Flow:
+        if self.scripts_path is not None:
+            run_scripts_task = DuckDBRunScripts(timeout=self.timeout)
+            run_scripts_task.bind(
+                path=self.scripts_path,
+                dependencies=self.dependencies,
+                max_workers=self.max_workers,
+                log_table=self.log_table,
+                log_schema=self.log_schema,
+                credentials=self.credentials,
+                flow=self,
+            )
+            return
+
         query_task = DuckDBQuery(timeout=self.timeout)
         query_task.bind(
             query=self.query,
@@ -78,7 +78,7 @@ class GenesysToADLS(Flow):
         self,
         name: str,
         view_type: str = None,
-        view_type_time_sleep: int = 80,
+        view_type_time_sleep: int = 600,
         post_data_list: List[str] = None,
         end_point: str = "analytics/reporting/exports",
         list_of_userids: list = None,
@@ -108,7 +108,8 @@ class GenesysToADLS(Flow):
         Args:
             name (str): The name of the Flow.
             view_type (str, optional): The type of view export job to be created. Defaults to None.
-            view_type_time_sleep (int, optional): Waiting time to retrieve data from Genesys API. Defaults to 80.
+            view_type_time_sleep (int, optional): Maximum time, in seconds, to wait for the reports to be generated
+                in Genesys API. Defaults to 600.
             post_data_list (List[str], optional): List of string templates to generate json body. Defaults to None.
                 Example for only one POST:
                 >>> post_data_list = '''[{
@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Union
 
 import pendulum
 from prefect import Flow, task, case
@@ -17,11 +17,14 @@ from viadot.task_utils import (
     df_to_csv,
     df_to_parquet,
     dtypes_to_json_task,
+    merge_with_adls_snapshot,
+    set_watermark,
     validate_df,
 )
 from viadot.tasks import AzureDataLakeUpload
 from viadot.tasks.sharepoint import SharepointListToDF, SharepointToDF
 from viadot.task_utils import check_if_df_empty
+from viadot.watermarks import WatermarkStore, make_watermark_key
 
 logger = logging.get_logger()
 
@@ -35,6 +38,7 @@ class SharepointToADLS(Flow):
         path_to_file: str = None,
         sheet_number: int = None,
         validate_excel_file: bool = False,
+        max_workers: int = 1,
         output_file_extension: str = ".csv",
         local_dir_path: str = None,
         adls_dir_path: str = None,
@@ -60,6 +64,7 @@ class SharepointToADLS(Flow):
             path_to_file (str, optional): Path to local Excel file. Defaults to None.
             sheet_number (int, optional): Sheet number to be extracted from file. Counting from 0, if None all sheets are axtracted. Defaults to None.
             validate_excel_file (bool, optional): Check if columns in separate sheets are the same. Defaults to False.
+            max_workers (int, optional): The number of processes parsing the sheets concurrently. Defaults to 1.
             output_file_extension (str, optional): Output file extension - to allow selection of .csv for data which is not easy to handle with parquet. Defaults to ".csv".
             local_dir_path (str, optional): File directory. Defaults to None.
             adls_dir_path (str, optional): Azure Data Lake destination folder/catalog path. Defaults to None.
@@ -83,6 +88,7 @@ class SharepointToADLS(Flow):
         self.local_dir_path = local_dir_path
         self.sheet_number = sheet_number
         self.validate_excel_file = validate_excel_file
+        self.max_workers = max_workers
         self.timeout = timeout
         self.validate_df_dict = validate_df_dict
 
@@ -126,6 +132,7 @@ class SharepointToADLS(Flow):
             nrows=self.nrows,
             sheet_number=self.sheet_number,
             validate_excel_file=self.validate_excel_file,
+            max_workers=self.max_workers,
             flow=self,
         )
 
@@ -203,6 +210,7 @@ class SharepointListToADLS(Flow):
         required_fields: List[str] = None,
         field_property: str = "Title",
         row_count: int = 5000,
+        max_workers: int = 4,
         adls_sp_credentials_secret: str = None,
         sp_cert_credentials_secret: str = None,
         vault_name: str = None,
@@ -212,6 +220,9 @@ class SharepointListToADLS(Flow):
         validate_df_dict: dict = None,
         set_prefect_kv: bool = False,
         if_no_data_returned: Literal["skip", "warn", "fail"] = "skip",
+        incremental: bool = False,
+        watermark_key: str = None,
+        watermark_store: Union[str, WatermarkStore] = "local",
         *args: List[any],
         **kwargs: Dict[str, Any],
     ):
@@ -261,6 +272,8 @@ class SharepointListToADLS(Flow):
                                     lead to errors - extension of sp connector would be required.
                                     Default to ["Title"]. Defaults to "Title".
             row_count (int, optional): Number of downloaded rows in single request.Defaults to 5000.
+            max_workers (int, optional): The maximum number of requests sent concurrently when downloading
+                all the list items. Defaults to 4.
             adls_sp_credentials_secret (str, optional): Credentials to connect to Azure ADLS
                                     If not passed it will take cred's from your .config/credentials.json Defaults to None.
             sp_cert_credentials_secret (str, optional): Credentials to verify Sharepoint connection.
@@ -271,11 +284,22 @@ class SharepointListToADLS(Flow):
             sep (str, optional): The separator to use in the CSV. Defaults to "\t".
             validate_df_dict (dict, optional): Whether to do an extra df validation before ADLS upload or not to do. Defaults to None.
             set_prefect_kv (bool, optional): Whether to do key-value parameters in KV Store or not. Defaults to False.
+            incremental (bool, optional): Whether to only extract the items modified since the last run, based on
+                the `Modified` column, and merge them by `ID` into the previous snapshot stored at
+                `adls_dir_path`/`file_name`. The watermark is moved forward once the new snapshot is uploaded.
+                Items deleted from the list are not removed from the snapshot. Defaults to False.
+            watermark_key (str, optional): The key of the watermark. Defaults to None (built from the flow name
+                and `list_title`).
+            watermark_store (Union[str, WatermarkStore], optional): The store holding the watermark: "local",
+                "duckdb", "prefect" (the Prefect KV Store) or a `WatermarkStore`. Defaults to "local".
 
         Returns:
             .parquet file inside ADLS.
         """
 
+        if incremental and file_name is None:
+            raise ValueError("'file_name' is required in incremental mode.")
+
         # SharepointListToDF
         self.file_name = file_name
         self.list_title = list_title
@@ -286,8 +310,12 @@ class SharepointListToADLS(Flow):
         self.sp_cert_credentials_secret = sp_cert_credentials_secret
         self.vault_name = vault_name
         self.row_count = row_count
+        self.max_workers = max_workers
         self.validate_df_dict = validate_df_dict
         self.if_no_data_returned = if_no_data_returned
+        self.incremental = incremental
+        self.watermark_key = watermark_key or make_watermark_key(name, list_title)
+        self.watermark_store = watermark_store
 
         # AzureDataLakeUpload
         self.adls_dir_path = adls_dir_path
@@ -333,6 +361,10 @@ class SharepointListToADLS(Flow):
             field_property=self.field_property,
             filters=self.filters,
             row_count=self.row_count,
+            max_workers=self.max_workers,
+            incremental=self.incremental,
+            watermark_key=self.watermark_key,
+            watermark_store=self.watermark_store,
             credentials_secret=self.sp_cert_credentials_secret,
         )
 
@@ -346,6 +378,16 @@ class SharepointListToADLS(Flow):
                 validation_task.set_upstream(df, flow=self)
 
             df_with_metadata = add_ingestion_metadata_task.bind(df, flow=self)
+            if self.incremental:
+                df_with_metadata = merge_with_adls_snapshot.bind(
+                    df_with_metadata,
+                    path=self.adls_file_path,
+                    key_columns=["ID"],
+                    sep=self.sep,
+                    sp_credentials_secret=self.adls_sp_credentials_secret,
+                    vault_name=self.vault_name,
+                    flow=self,
+                )
             dtypes_dict = df_get_data_types_task.bind(df_with_metadata, flow=self)
             df_mapped = df_map_mixed_dtypes_for_parquet.bind(
                 df_with_metadata, dtypes_dict, flow=self
@@ -370,9 +412,10 @@ class SharepointListToADLS(Flow):
                 )
 
             file_to_adls_task = AzureDataLakeUpload()
-            file_to_adls_task.bind(
+            adls_upload = file_to_adls_task.bind(
                 from_path=self.local_file_path,
-                to_path=self.adls_dir_path,
+                # The snapshot is merged with the next delta, so it's stored under a fixed path.
+                to_path=self.adls_file_path if self.incremental else self.adls_dir_path,
                 overwrite=self.overwrite,
                 sp_credentials_secret=self.adls_sp_credentials_secret,
                 flow=self,
@@ -401,6 +444,15 @@ class SharepointListToADLS(Flow):
             json_to_adls_task.set_upstream(dtypes_to_json_task, flow=self)
             if self.set_prefect_kv == True:
                 set_key_value(key=self.adls_dir_path, value=self.adls_file_path)
+            if self.incremental:
+                watermark = set_watermark.bind(
+                    df,
+                    column="Modified",
+                    key=self.watermark_key,
+                    store=self.watermark_store,
+                    flow=self,
+                )
+                watermark.set_upstream(adls_upload, flow=self)
 
     @staticmethod
     def slugify(name):
@@ -1,9 +1,15 @@
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Union
 
 from prefect import Flow
 
-from viadot.task_utils import add_ingestion_metadata_task, cast_df_to_str, df_to_parquet
+from viadot.task_utils import (
+    add_ingestion_metadata_task,
+    cast_df_to_str,
+    df_to_parquet,
+    set_watermark,
+)
 from viadot.tasks import DuckDBCreateTableFromParquet, SQLServerToDF
+from viadot.watermarks import WatermarkStore, make_watermark_key
 
 
 class SQLServerToDuckDB(Flow):
@@ -18,6 +24,9 @@ class SQLServerToDuckDB(Flow):
         if_exists: Literal["fail", "replace", "append", "skip", "delete"] = "fail",
         if_empty: Literal["warn", "skip", "fail"] = "skip",
         duckdb_credentials: dict = None,
+        incremental_column: str = None,
+        watermark_key: str = None,
+        watermark_store: Union[str, WatermarkStore] = "local",
         timeout: int = 3600,
         *args: List[any],
         **kwargs: Dict[str, Any],
@@ -36,12 +45,25 @@ class SQLServerToDuckDB(Flow):
             if_exists (Literal, optional):  What to do if the table already exists. Defaults to "fail".
             if_empty (Literal, optional): What to do if Parquet file is empty. Defaults to "skip".
             duckdb_credentials (dict, optional): Credentials for the DuckDB connection. Defaults to None.
+            incremental_column (str, optional): The column tracking changes, a `rowversion` column, whose values are
+                unique and increasing (timestamp columns such as `modified_at` are not supported). If provided, only
+                the rows changed since the last run are downloaded, and the watermark is moved forward once the
+                DuckDB table is created. Use with `if_exists="append"`. Defaults to None.
+            watermark_key (str, optional): The key of the watermark. Defaults to None (built from the flow name
+                and the DuckDB table).
+            watermark_store (Union[str, WatermarkStore], optional): The store holding the watermark: "local",
+                "duckdb", "prefect" (the Prefect KV Store) or a `WatermarkStore`. Defaults to "local".
             timeout(int, optional): The amount of time (in seconds) to wait while running this task before
                 a timeout occurs. Defaults to 3600.
         """
         # SQLServerToDF
         self.sql_query = sql_query
         self.sqlserver_config_key = sqlserver_config_key
+        self.incremental_column = incremental_column
+        self.watermark_key = watermark_key or make_watermark_key(
+            name, f"{duckdb_schema or 'main'}.{duckdb_table}"
+        )
+        self.watermark_store = watermark_store
         self.timeout = timeout
 
         # DuckDBCreateTableFromParquet
@@ -63,7 +85,12 @@ class SQLServerToDuckDB(Flow):
     def gen_flow(self) -> Flow:
         df_task = SQLServerToDF(timeout=self.timeout)
         df = df_task.bind(
-            config_key=self.sqlserver_config_key, query=self.sql_query, flow=self
+            config_key=self.sqlserver_config_key,
+            query=self.sql_query,
+            incremental_column=self.incremental_column,
+            watermark_key=self.watermark_key,
+            watermark_store=self.watermark_store,
+            flow=self,
         )
         df_mapped = cast_df_to_str.bind(df, flow=self)
         df_with_metadata = add_ingestion_metadata_task.bind(df_mapped, flow=self)
@@ -82,3 +109,13 @@ class SQLServerToDuckDB(Flow):
             flow=self,
         )
         create_duckdb_table.set_upstream(parquet, flow=self)
+
+        if self.incremental_column:
+            watermark = set_watermark.bind(
+                df,
+                column=self.incremental_column,
+                key=self.watermark_key,
+                store=self.watermark_store,
+                flow=self,
+            )
+            watermark.set_upstream(create_duckdb_table, flow=self)
@@ -1,12 +1,268 @@
+import io
 import os
-from typing import Any, Dict, List
+import re
+import shutil
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Pattern,
+    Tuple,
+    Union,
+)
 
+import fsspec
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from adlfs import AzureBlobFileSystem, AzureDatalakeFileSystem
 
+from ..cache import DownloadCache
 from ..config import local_config
 from .base import Source
 
+Filter = Tuple[str, str, Any]
+
+GLOB_CHARS = re.compile(r"[*?\[]")
+
+# Short-lived listings shared between `AzureDataLake` instances, see `AzureDataLake.iter_files()`.
+_listing_cache: Dict[Tuple, Tuple[float, List[str]]] = {}
+_listing_cache_lock = threading.Lock()
+
+
+def glob_to_regex(pattern: str) -> Pattern:
+    """
+    Compile a glob pattern into a regular expression matching paths.
+
+    `*` and `?` do not match `/`, `**` matches any number of directories,
+    and `[...]` matches a character class.
+
+    Args:
+        pattern (str): The glob pattern, eg. `2023/*/sales_*.csv` or `**/*.parquet`.
+
+    Returns:
+        Pattern: The compiled regular expression.
+    """
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            regex += ".*"
+            i += 2
+            continue
+        if char == "*":
+            regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif char == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                regex += re.escape(char)
+            else:
+                group = pattern[i + 1 : end]
+                if group.startswith("!"):
+                    group = "^" + group[1:]
+                regex += f"[{group}]"
+                i = end
+        else:
+            regex += re.escape(char)
+        i += 1
+    return re.compile(regex + r"\Z")
+
+
+def filters_to_expression(
+    filters: Union[List[Filter], List[List[Filter]]]
+) -> ds.Expression:
+    """
+    Convert filters in the disjunctive normal form used by `pandas.read_parquet()`
+    into a pyarrow dataset expression.
+
+    Args:
+        filters (Union[List[Filter], List[List[Filter]]]): Either a list of
+        `(column, operator, value)` tuples combined with AND, or a list of such lists
+        combined with OR. Supported operators are `=`, `==`, `!=`, `<`, `>`, `<=`, `>=`,
+        `in` and `not in`.
+
+    Example:
+    ```python
+    filters_to_expression([("country", "=", "italy"), ("sales", ">", 50)])
+    ```
+
+    Raises:
+        ValueError: If an operator is not supported.
+
+    Returns:
+        ds.Expression: The filter expression.
+    """
+    if filters and isinstance(filters[0], tuple):
+        filters = [filters]
+
+    def _to_expression(column: str, op: str, value: Any) -> ds.Expression:
+        field = ds.field(column)
+        if op in ("=", "=="):
+            return field == value
+        elif op == "!=":
+            return field != value
+        elif op == "<":
+            return field < value
+        elif op == ">":
+            return field > value
+        elif op == "<=":
+            return field <= value
+        elif op == ">=":
+            return field >= value
+        elif op == "in":
+            return field.isin(list(value))
+        elif op == "not in":
+            return ~field.isin(list(value))
+        raise ValueError(f"Filter operator '{op}' is not supported.")
+
+    disjunction = None
+    for conjunction_filters in filters:
+        conjunction = None
+        for column, op, value in conjunction_filters:
+            expression = _to_expression(column, op, value)
+            conjunction = (
+                expression if conjunction is None else conjunction & expression
+            )
+        disjunction = conjunction if disjunction is None else disjunction | conjunction
+    return disjunction
+
+
+def add_metadata_columns(
+    src: IO[bytes],
+    dst: IO[bytes],
+    columns: Dict[str, Any],
+    file_format: Literal["csv", "parquet"] = "csv",
+    sep: str = "\t",
+    chunksize: int = 100_000,
+) -> None:
+    """
+    Stream a CSV or Parquet file from `src` to `dst`, adding constant columns to each row.
+
+    The file is processed in chunks of `chunksize` rows, so that memory usage does not
+    depend on the size of the file.
+
+    Args:
+        src (IO[bytes]): The source file object.
+        dst (IO[bytes]): The destination file object.
+        columns (Dict[str, Any]): The names and values of the columns to add.
+        file_format (Literal["csv", "parquet"], optional): The format of the file. Defaults to "csv".
+        sep (str, optional): The separator of CSV files. Defaults to "\t".
+        chunksize (int, optional): The number of rows processed at a time. Defaults to 100 000.
+
+    Raises:
+        ValueError: If the file format is not supported.
+    """
+    if file_format == "csv":
+        text_dst = io.TextIOWrapper(dst, encoding="utf-8", newline="")
+        try:
+            # Read the values as text, so that they are copied unchanged rather than
+            # converted with the types inferred for each chunk.
+            chunks = pd.read_csv(
+                src, sep=sep, chunksize=chunksize, dtype=str, keep_default_na=False
+            )
+            for i, chunk in enumerate(chunks):
+                chunk = chunk.assign(**columns)
+                chunk.to_csv(text_dst, sep=sep, index=False, header=i == 0)
+            text_dst.flush()
+        finally:
+            # Do not close `dst` together with the wrapper.
+            text_dst.detach()
+    elif file_format == "parquet":
+        parquet_file = pq.ParquetFile(src)
+
+        def _with_columns(table: pa.Table) -> pa.Table:
+            for name, value in columns.items():
+                array = pa.array([value] * table.num_rows, type=pa.scalar(value).type)
+                table = table.append_column(name, array)
+            return table
+
+        writer = None
+        try:
+            for batch in parquet_file.iter_batches(batch_size=chunksize):
+                table = _with_columns(pa.Table.from_batches([batch]))
+                if writer is None:
+                    writer = pq.ParquetWriter(dst, table.schema)
+                writer.write_table(table)
+            if writer is None:
+                # An empty file still gets the new columns in its schema.
+                table = _with_columns(parquet_file.schema_arrow.empty_table())
+                pq.write_table(table, dst)
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        raise ValueError("Only CSV and parquet formats are supported.")
+
+
+def _flatten_filters(filters: Union[List[Filter], List[List[Filter]]]) -> List[Filter]:
+    if filters and isinstance(filters[0], tuple):
+        return filters
+    return [f for conjunction_filters in filters for f in conjunction_filters]
+
+
+def _common_type(types: List[pa.DataType]) -> pa.DataType:
+    types = [t for t in types if not pa.types.is_null(t)]
+    if not types:
+        return pa.null()
+    if all(t == types[0] for t in types):
+        return types[0]
+    if all(pa.types.is_integer(t) for t in types):
+        return pa.int64()
+    if all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in types):
+        return pa.float64()
+    return pa.string()
+
+
+def unify_tables(tables: List[pa.Table]) -> pa.Table:
+    """
+    Concatenate tables whose schemas differ.
+
+    The unified schema contains the columns of all tables, in the order in which they
+    first appear. Columns missing from a table are filled with nulls, and columns with
+    different types are cast to a common type: `int64` for integers of different widths,
+    `float64` for a mix of integers and floats, and `string` otherwise.
+
+    Args:
+        tables (List[pa.Table]): The tables to concatenate.
+
+    Returns:
+        pa.Table: The concatenated table.
+    """
+    field_types = {}
+    for table in tables:
+        for field in table.schema:
+            field_types.setdefault(field.name, []).append(field.type)
+    schema = pa.schema(
+        [(name, _common_type(types)) for name, types in field_types.items()]
+    )
+
+    unified_tables = []
+    for table in tables:
+        arrays = [
+            table.column(field.name).cast(field.type)
+            if field.name in table.column_names
+            else pa.nulls(table.num_rows, type=field.type)
+            for field in schema
+        ]
+        unified_tables.append(pa.Table.from_arrays(arrays, schema=schema))
+    return pa.concat_tables(unified_tables)
+
 
 class AzureDataLake(Source):
     """
@@ -25,6 +281,10 @@ class AzureDataLake(Source):
             - AZURE_TENANT_ID
             - AZURE_CLIENT_ID
             - AZURE_CLIENT_SECRET
+    fs : fsspec.AbstractFileSystem, optional
+        A filesystem to use instead of connecting to the lake, eg. a local
+        filesystem standing in for the lake in tests. If provided, the
+        credentials are not required.
     """
 
     def __init__(
@@ -32,9 +292,19 @@ class AzureDataLake(Source):
         path: str = None,
         gen: int = 2,
         credentials: Dict[str, Any] = None,
+        fs: fsspec.AbstractFileSystem = None,
         *args,
         **kwargs,
     ):
+        if fs is not None:
+            super().__init__(*args, credentials=credentials, **kwargs)
+            self.path = path
+            self.gen = gen
+            self.storage_options = {}
+            self.fs = fs
+            self.base_url = ""
+            return
+
         credentials = credentials or local_config.get("AZURE_ADLS")
 
         super().__init__(*args, credentials=credentials, **kwargs)
@@ -94,7 +364,7 @@ class AzureDataLake(Source):
         """
 
         if self.gen == 1:
-            raise NotImplemented(
+            raise NotImplementedError(
                 "Azure Data Lake Gen1 does not support simple file upload."
             )
 
@@ -106,6 +376,173 @@ class AzureDataLake(Source):
             overwrite=overwrite,
         )
 
+    def upload_many(
+        self,
+        from_paths: List[str],
+        to_paths: List[str],
+        overwrite: bool = False,
+        max_workers: int = 8,
+        chunk_size: int = 4 * 1024 * 1024,
+    ) -> List[Dict[str, Any]]:
+        """
+        Upload multiple files to the lake concurrently, reusing the lake's filesystem client.
+
+        Each file is streamed to the lake in blocks of `chunk_size` bytes, so memory usage
+        is bounded by `max_workers * chunk_size`. A failed upload does not stop the others;
+        its error is reported in the results instead.
+
+        Args:
+            from_paths (List[str]): Paths to the local files to be uploaded.
+            to_paths (List[str]): Paths to the destination files, in the same order as `from_paths`.
+            overwrite (bool, optional): Whether to overwrite the files if they exist. Defaults to False.
+            max_workers (int, optional): The maximum number of files uploaded concurrently. Defaults to 8.
+            chunk_size (int, optional): The size of the uploaded blocks in bytes. Defaults to 4 MiB.
+
+        Example:
+        ```python
+        from viadot.sources import AzureDataLake
+        lake = AzureDataLake()
+        lake.upload_many(
+            from_paths=["a.csv", "b.csv"],
+            to_paths=["sandbox/a.csv", "sandbox/b.csv"],
+        )
+        ```
+
+        Raises:
+            ValueError: If `from_paths` and `to_paths` have different lengths.
+            NotImplementedError: If the lake is an Azure Data Lake Gen1.
+
+        Returns:
+            List[Dict[str, Any]]: One result per file, in the order of `from_paths`, with
+            the keys `from_path`, `to_path`, `status` ("success" or "failed"), `bytes`,
+            `seconds` and `error`.
+        """
+        if self.gen == 1:
+            raise NotImplementedError(
+                "Azure Data Lake Gen1 does not support simple file upload."
+            )
+
+        def _upload(from_path: str, to_path: str) -> int:
+            if not overwrite and self.fs.exists(to_path):
+                raise FileExistsError(f"File {to_path} already exists.")
+            with open(from_path, "rb") as src:
+                with self.fs.open(to_path, "wb", block_size=chunk_size) as dst:
+                    shutil.copyfileobj(src, dst, length=chunk_size)
+            return os.path.getsize(from_path)
+
+        return self._transfer_many(
+            _upload, from_paths, to_paths, to_fs=self.fs, max_workers=max_workers
+        )
+
+    def copy_many(
+        self,
+        from_paths: List[str],
+        to_paths: List[str],
+        to_lake: "AzureDataLake" = None,
+        overwrite: bool = True,
+        max_workers: int = 8,
+        chunk_size: int = 4 * 1024 * 1024,
+        metadata_columns: Dict[str, Any] = None,
+        file_format: Literal["csv", "parquet"] = None,
+        sep: str = "\t",
+    ) -> List[Dict[str, Any]]:
+        """
+        Copy multiple files concurrently, within the lake or to another lake.
+
+        Files copied within the same filesystem use a server-side copy where the backend
+        supports it, so the data does not pass through the machine running the copy.
+        Otherwise, eg. when copying from a gen1 to a gen2 lake, each file is streamed
+        from one filesystem to the other in blocks of `chunk_size` bytes, without being
+        staged on local disk.
+
+        Args:
+            from_paths (List[str]): Paths to the files to copy.
+            to_paths (List[str]): Paths to the destination files, in the same order as `from_paths`.
+            to_lake (AzureDataLake, optional): The destination lake. Defaults to None (this lake).
+            overwrite (bool, optional): Whether to overwrite the files if they exist. Defaults to True.
+            max_workers (int, optional): The maximum number of files copied concurrently. Defaults to 8.
+            chunk_size (int, optional): The size of the streamed blocks in bytes. Defaults to 4 MiB.
+            metadata_columns (Dict[str, Any], optional): Columns to add to each file while it is
+            streamed, eg. `{"_viadot_downloaded_at_utc": datetime.now(timezone.utc)}`. See
+            `add_metadata_columns()`. Defaults to None.
+            file_format (Literal["csv", "parquet"], optional): The format of the files, required to add
+            metadata columns. Defaults to None (inferred from the file extension).
+            sep (str, optional): The separator of CSV files. Defaults to "\t".
+
+        Returns:
+            List[Dict[str, Any]]: One result per file, in the order of `from_paths`, with
+            the keys `from_path`, `to_path`, `status` ("success" or "failed"), `bytes`,
+            `seconds` and `error`.
+        """
+        to_fs = to_lake.fs if to_lake is not None else self.fs
+
+        def _copy(from_path: str, to_path: str) -> int:
+            if not overwrite and to_fs.exists(to_path):
+                raise FileExistsError(f"File {to_path} already exists.")
+            if to_fs is self.fs and not metadata_columns:
+                try:
+                    self.fs.cp_file(from_path, to_path)
+                    return self.fs.size(to_path)
+                except NotImplementedError:
+                    pass
+            with self.fs.open(from_path, "rb", block_size=chunk_size) as src:
+                with to_fs.open(to_path, "wb", block_size=chunk_size) as dst:
+                    if metadata_columns:
+                        add_metadata_columns(
+                            src,
+                            dst,
+                            columns=metadata_columns,
+                            file_format=file_format or from_path.split(".")[-1],
+                            sep=sep,
+                        )
+                    else:
+                        shutil.copyfileobj(src, dst, length=chunk_size)
+                    return dst.tell()
+
+        return self._transfer_many(
+            _copy, from_paths, to_paths, to_fs=to_fs, max_workers=max_workers
+        )
+
+    @staticmethod
+    def _transfer_many(
+        transfer: Callable[[str, str], int],
+        from_paths: List[str],
+        to_paths: List[str],
+        to_fs: fsspec.AbstractFileSystem,
+        max_workers: int,
+    ) -> List[Dict[str, Any]]:
+        if len(from_paths) != len(to_paths):
+            raise ValueError("'from_paths' and 'to_paths' must have the same length.")
+
+        for parent in {to_fs._parent(to_path) for to_path in to_paths}:
+            if parent:
+                to_fs.makedirs(parent, exist_ok=True)
+
+        def _transfer(from_path: str, to_path: str) -> Dict[str, Any]:
+            result = dict(
+                from_path=from_path,
+                to_path=to_path,
+                status="success",
+                bytes=0,
+                seconds=0.0,
+                error=None,
+            )
+            start = time.perf_counter()
+            try:
+                result["bytes"] = transfer(from_path, to_path)
+            except Exception as e:
+                result["status"] = "failed"
+                result["error"] = f"{type(e).__name__}: {e}"
+            result["seconds"] = time.perf_counter() - start
+            return result
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_transfer, from_path, to_path)
+                for from_path, to_path in zip(from_paths, to_paths)
+            ]
+            return [future.result() for future in futures]
+
     def exists(self, path: str = None) -> bool:
         """
         Check if a location exists in Azure Data Lake.
@@ -133,13 +570,29 @@ class AzureDataLake(Source):
         from_path: str = None,
         recursive: bool = False,
         overwrite: bool = True,
+        cache: DownloadCache = None,
     ) -> None:
+        """
+        Download file(s) from the lake.
+
+        Args:
+            to_path (str): The local destination path.
+            from_path (str, optional): The path to the file(s) in the lake. Defaults to None.
+            recursive (bool, optional): Set this to true if downloading entire directories.
+            Defaults to False.
+            overwrite (bool, optional): Whether to overwrite the local file(s). Defaults to True.
+            cache (DownloadCache, optional): A cache from which to reuse a file if it has not
+            changed in the lake since it was cached. Only used for single files. Defaults to None.
+        """
         if overwrite is False:
-            raise NotImplemented(
+            raise NotImplementedError(
                 "Currently, only the default behavior (overwrite) is available."
             )
 
         from_path = from_path or self.path
+        if cache is not None and not recursive:
+            cache.download(self.fs, from_path=from_path, to_path=to_path)
+            return
         self.fs.download(rpath=from_path, lpath=to_path, recursive=recursive)
 
     def to_df(
@@ -149,29 +602,425 @@ class AzureDataLake(Source):
         quoting: int = 0,
         lineterminator: str = None,
         error_bad_lines: bool = None,
-    ):
+        columns: List[str] = None,
+        filters: Union[List[Filter], List[List[Filter]]] = None,
+        add_source_file: bool = False,
+        limit: int = None,
+        max_workers: int = 8,
+    ) -> pd.DataFrame:
+        """
+        Load a CSV or Parquet file, a directory or a glob of files into a DataFrame.
+
+        Parquet files and directories are read as a `pyarrow.dataset` over the lake's
+        filesystem when `columns` or `filters` are provided, or when `path` is a directory.
+        In this case, only the required columns and the row groups which can match the
+        filters are fetched, and hive-partitioned directories (eg. `table/year=2023/...`)
+        are read as one dataset with the partition keys available as columns.
+
+        Glob paths (eg. `raw/sales/2023-*.csv`), directories of CSV files and directories
+        read with `add_source_file` are read with `read_many()`.
+
+        Args:
+            path (str, optional): The path to the file or directory, or a glob. Defaults to None.
+            sep (str, optional): The separator to use when reading a CSV file. Defaults to "\t".
+            quoting (int, optional): The quoting mode to use when reading a CSV file. Defaults to 0.
+            lineterminator (str, optional): The newline separator to use when reading a CSV file.
+            Defaults to None.
+            error_bad_lines (bool, optional): Whether to raise an exception on bad lines. Defaults to None.
+            columns (List[str], optional): The columns to read. Defaults to None (all columns).
+            filters (Union[List[Filter], List[List[Filter]]], optional): Row filters in the format
+            used by `pandas.read_parquet()`, eg. `[("country", "=", "italy"), ("sales", ">", 50)]`.
+            See `filters_to_expression()`. Defaults to None.
+            add_source_file (bool, optional): Whether to add a `_source_file` column with the path
+            of the file each row was read from. Defaults to False.
+            limit (int, optional): The maximum number of rows to read. Defaults to None (all rows).
+            max_workers (int, optional): The maximum number of files read concurrently. Defaults to 8.
+
+        Raises:
+            ValueError: If the file format is not supported.
+
+        Returns:
+            pd.DataFrame: The loaded data.
+        """
         if quoting is None:
             quoting = 0
 
         path = path or self.path
         url = os.path.join(self.base_url, path)
+        csv_kwargs = dict(
+            sep=sep,
+            quoting=quoting,
+            lineterminator=lineterminator,
+            error_bad_lines=error_bad_lines,
+        )
+
+        read_many_kwargs = dict(
+            columns=columns,
+            filters=filters,
+            add_source_file=add_source_file,
+            limit=limit,
+            max_workers=max_workers,
+            **csv_kwargs,
+        )
+        if GLOB_CHARS.search(path):
+            return self.read_many(path, **read_many_kwargs)
 
         if url.endswith(".csv"):
             df = pd.read_csv(
                 url,
                 storage_options=self.storage_options,
-                sep=sep,
-                quoting=quoting,
-                lineterminator=lineterminator,
-                error_bad_lines=error_bad_lines,
+                usecols=columns,
+                nrows=None if filters else limit,
+                **csv_kwargs,
             )
-        elif url.endswith(".parquet"):
+            if filters:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                df = (
+                    ds.dataset(table)
+                    .to_table(filter=filters_to_expression(filters))
+                    .to_pandas()
+                )
+        elif url.endswith(".parquet") and not (columns or filters):
             df = pd.read_parquet(url, storage_options=self.storage_options)
+        elif url.endswith(".parquet"):
+            df = self.read_parquet_dataset(path, columns=columns, filters=filters)
+        elif self.fs.isdir(path):
+            # The directory is listed once, both to choose how to read it and to read it.
+            root = path.rstrip("/")
+            files = sorted(self.iter_files(root, max_workers=max_workers))
+            if add_source_file or any(file.endswith(".csv") for file in files):
+                return self.read_many(path, **read_many_kwargs)
+            # Like `pyarrow.dataset`, ignore the files and directories starting with "_"
+            # or ".", eg. `_SUCCESS`.
+            files = [
+                file
+                for file in files
+                if not any(
+                    part.startswith(("_", "."))
+                    for part in file[len(root) + 1 :].split("/")
+                )
+            ]
+            df = self.read_parquet_dataset(files, columns=columns, filters=filters)
         else:
             raise ValueError("Only CSV and parquet formats are supported.")
 
+        if limit is not None:
+            df = df.head(limit)
+        if add_source_file:
+            df["_source_file"] = path
         return df
 
+    def iter_batches(
+        self,
+        path: str = None,
+        batch_size: int = 100_000,
+        columns: List[str] = None,
+        **csv_kwargs,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV or Parquet file in batches, without loading the whole file into memory.
+
+        Args:
+            path (str, optional): The path to the file. Defaults to None.
+            batch_size (int, optional): The maximum number of rows in a batch. Defaults to 100 000.
+            columns (List[str], optional): The columns to read. Defaults to None (all columns).
+            **csv_kwargs: Keyword arguments passed to `pd.read_csv()` for CSV files, eg. `sep`.
+            By default, the values of CSV files are read as text (`dtype=str`,
+            `keep_default_na=False`), as the types inferred for each batch could differ.
+
+        Raises:
+            ValueError: If the file format is not supported.
+
+        Yields:
+            pd.DataFrame: The batches of the file.
+        """
+        path = path or self.path
+        with self.fs.open(path, "rb") as f:
+            if path.endswith(".csv"):
+                csv_kwargs = {"dtype": str, "keep_default_na": False, **csv_kwargs}
+                yield from pd.read_csv(
+                    f, chunksize=batch_size, usecols=columns, **csv_kwargs
+                )
+            elif path.endswith(".parquet"):
+                parquet_file = pq.ParquetFile(f)
+                for batch in parquet_file.iter_batches(
+                    batch_size=batch_size, columns=columns
+                ):
+                    yield batch.to_pandas()
+            else:
+                raise ValueError("Only CSV and parquet formats are supported.")
+
+    def read_parquet_dataset(
+        self,
+        path: Union[str, List[str]] = None,
+        columns: List[str] = None,
+        filters: Union[List[Filter], List[List[Filter]]] = None,
+    ) -> pd.DataFrame:
+        """
+        Read a Parquet file or directory as a `pyarrow.dataset`, pushing the column
+        projection and the filters down to the Parquet reader.
+
+        Args:
+            path (Union[str, List[str]], optional): The path to the file or directory, or
+            a list of files. Defaults to None.
+            columns (List[str], optional): The columns to read. Defaults to None (all columns).
+            filters (Union[List[Filter], List[List[Filter]]], optional): Row filters, see
+            `filters_to_expression()`. Defaults to None.
+
+        Returns:
+            pd.DataFrame: The loaded data.
+        """
+        path = path or self.path
+        dataset = ds.dataset(
+            path, filesystem=self.fs, format="parquet", partitioning="hive"
+        )
+        expression = filters_to_expression(filters) if filters else None
+        table = dataset.to_table(columns=columns, filter=expression)
+        return table.to_pandas()
+
+    def read_many(
+        self,
+        path: str = None,
+        columns: List[str] = None,
+        filters: Union[List[Filter], List[List[Filter]]] = None,
+        add_source_file: bool = False,
+        limit: int = None,
+        max_workers: int = 8,
+        **csv_kwargs,
+    ) -> pd.DataFrame:
+        """
+        Read all the CSV and Parquet files in a directory or matching a glob into one DataFrame.
+
+        The files are read concurrently into Arrow tables, which are then concatenated with
+        `unify_tables()`, so files with missing or differently typed columns can be read
+        together. Files are concatenated in the order of their paths. For Parquet files, only
+        the required columns and the row groups which can match the filters are fetched, and
+        the hive partition keys in the paths (eg. `raw/sales/year=2023/...`) are available as
+        columns.
+
+        Args:
+            path (str, optional): The path to a directory, eg. `raw/sales`, or a glob, eg.
+            `raw/sales/2023-*.csv` or `raw/sales/**/*.parquet`. Defaults to None.
+            columns (List[str], optional): The columns to read. Defaults to None (all columns).
+            filters (Union[List[Filter], List[List[Filter]]], optional): Row filters, see
+            `filters_to_expression()`. Defaults to None.
+            add_source_file (bool, optional): Whether to add a `_source_file` column with the path
+            of the file each row was read from. Defaults to False.
+            limit (int, optional): The maximum number of rows to read. Once it is reached, no
+            further files are read. Defaults to None (all rows).
+            max_workers (int, optional): The maximum number of files read concurrently. Defaults to 8.
+            **csv_kwargs: Keyword arguments passed to `pd.read_csv()` for CSV files, eg. `sep`.
+            By default, the values of CSV files are read as text (`dtype=str`,
+            `keep_default_na=False`), as the types inferred for each batch could differ.
+
+        Raises:
+            FileNotFoundError: If there are no CSV or Parquet files in the path.
+
+        Returns:
+            pd.DataFrame: The loaded data.
+        """
+        path = (path or self.path).rstrip("/")
+        segments = path.split("/")
+        glob_start = next(
+            (i for i, segment in enumerate(segments) if GLOB_CHARS.search(segment)),
+            len(segments),
+        )
+        root = "/".join(segments[:glob_start])
+        pattern = "/".join(segments[glob_start:]) or None
+
+        files = sorted(
+            file
+            for file in self.iter_files(root, pattern=pattern, max_workers=max_workers)
+            if file.endswith((".csv", ".parquet"))
+        )
+        if not files:
+            raise FileNotFoundError(f"No CSV or parquet files found in {path}.")
+
+        expression = filters_to_expression(filters) if filters else None
+        filter_columns = {column for column, _, _ in _flatten_filters(filters or [])}
+
+        def _read(file: str) -> pa.Table:
+            if file.endswith(".csv"):
+                wanted = set(columns) | filter_columns if columns else None
+                with self.fs.open(file, "rb") as f:
+                    df = pd.read_csv(
+                        f,
+                        usecols=(lambda column: column in wanted) if wanted else None,
+                        nrows=None if filters else limit,
+                        **csv_kwargs,
+                    )
+                dataset = ds.dataset(pa.Table.from_pandas(df, preserve_index=False))
+            else:
+                # Only the required columns and row groups are read, and the hive
+                # partition keys (eg. `year=2023`) below `root` are added as columns.
+                dataset = ds.dataset(
+                    [file],
+                    filesystem=self.fs,
+                    format="parquet",
+                    partitioning="hive",
+                    partition_base_dir=root,
+                )
+            names = dataset.schema.names
+            selected = (
+                [column for column in columns if column in names] if columns else None
+            )
+            if expression is not None and not filter_columns <= set(names):
+                # Comparisons with missing (null) columns never match.
+                table = dataset.schema.empty_table()
+                return table.select(selected) if selected is not None else table
+            if limit is not None:
+                return dataset.head(limit, columns=selected, filter=expression)
+            return dataset.to_table(columns=selected, filter=expression)
+
+        tables = []
+        rows = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_read, file) for file in files]
+            for future in futures:
+                if limit is not None and rows >= limit:
+                    future.cancel()
+                    continue
+                table = future.result()
+                tables.append(table)
+                rows += table.num_rows
+
+        table = unify_tables(tables)
+        if add_source_file:
+            source_files = [
+                file for file, part in zip(files, tables) for _ in range(part.num_rows)
+            ]
+            table = table.append_column(
+                "_source_file", pa.array(source_files, type=pa.string())
+            )
+        if limit is not None:
+            table = table.slice(0, limit)
+        return table.to_pandas()
+
+    def iter_files(
+        self,
+        path: str = None,
+        pattern: str = None,
+        recursive: bool = True,
+        max_workers: int = 8,
+        cache_ttl: int = None,
+    ) -> Iterator[str]:
+        """
+        Lazily list the files under a path, optionally matching a glob pattern.
+
+        Unlike `find()`, the tree is not materialized: directories are listed concurrently,
+        and files are yielded as soon as their directory is listed. Each directory is listed
+        at once with `ls()`, so the memory used is bounded by the largest directory rather
+        than by the whole tree. The literal prefix of `pattern` is pushed down, so that only
+        the part of the tree that can contain matches is listed, and directories which
+        cannot match the pattern are not descended into.
+
+        Args:
+            path (str, optional): The directory to list. Defaults to None.
+            pattern (str, optional): A glob pattern the paths relative to `path` must match,
+            eg. `2023/*/sales_*.csv` or `**/*.parquet`, see `glob_to_regex()`.
+            Defaults to None (all files).
+            recursive (bool, optional): Whether to list subdirectories. Defaults to True.
+            max_workers (int, optional): The maximum number of directories listed concurrently.
+            Defaults to 8.
+            cache_ttl (int, optional): For how many seconds to reuse a complete listing of the same
+            path and pattern. Defaults to None (no caching).
+
+        Example:
+        ```python
+        from viadot.sources import AzureDataLake
+        lake = AzureDataLake()
+        for file in lake.iter_files("raw/supermetrics", pattern="2023/**/*.parquet"):
+            print(file)
+        ```
+
+        Yields:
+            str: The paths to the files, in the same format as returned by `find()`. The order
+            of the paths is not guaranteed.
+        """
+        path = (path or self.path).rstrip("/")
+        cache_key = (
+            type(self.fs).__name__,
+            self.storage_options.get("account_name"),
+            path,
+            pattern,
+            recursive,
+        )
+        if cache_ttl:
+            with _listing_cache_lock:
+                cached = _listing_cache.get(cache_key)
+            if cached is not None and time.time() - cached[0] <= cache_ttl:
+                yield from cached[1]
+                return
+
+        listed = []
+        for file in self._iter_files(path, pattern, recursive, max_workers):
+            if cache_ttl:
+                listed.append(file)
+            yield file
+
+        if cache_ttl:
+            with _listing_cache_lock:
+                _listing_cache[cache_key] = (time.time(), listed)
+
+    def _iter_files(
+        self, path: str, pattern: str, recursive: bool, max_workers: int
+    ) -> Iterator[str]:
+        segments = pattern.strip("/").split("/") if pattern else []
+        path_regex = glob_to_regex(pattern.strip("/")) if pattern else None
+        segment_regexes = [
+            None if segment == "**" else glob_to_regex(segment) for segment in segments
+        ]
+
+        # Push the literal prefix of the pattern down to the listing.
+        literal_dirs = []
+        for segment in segments[:-1]:
+            if GLOB_CHARS.search(segment):
+                break
+            literal_dirs.append(segment)
+        start = "/".join([path] + literal_dirs) if path else "/".join(literal_dirs)
+
+        def _relative(name: str) -> str:
+            return name[len(path) + 1 :] if path else name
+
+        def _could_match(directory: str) -> bool:
+            if not recursive:
+                return False
+            if not segments:
+                return True
+            for i, part in enumerate(_relative(directory).split("/")):
+                if segment_regexes[i] is None:
+                    # `**` matches any directory below
+                    return True
+                if i >= len(segments) - 1 or not segment_regexes[i].match(part):
+                    return False
+            return True
+
+        def _list(directory: str) -> Tuple[str, List[Dict[str, Any]]]:
+            try:
+                return directory, self.fs.ls(directory, detail=True)
+            except FileNotFoundError:
+                return directory, []
+
+        pending = set()
+        directories = deque([start])
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while directories or pending:
+                while directories and len(pending) < max_workers:
+                    pending.add(executor.submit(_list, directories.popleft()))
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directory, entries = future.result()
+                    for entry in entries:
+                        name = entry["name"].rstrip("/")
+                        if name == directory:
+                            # Some backends list the directory itself.
+                            continue
+                        if entry["type"] == "directory":
+                            if _could_match(name):
+                                directories.append(name)
+                        elif path_regex is None or path_regex.match(_relative(name)):
+                            yield name
+
     def ls(self, path: str = None) -> List[str]:
         """
         Returns list of files in a path.
@@ -1,12 +1,17 @@
 import os
+import re
+import threading
 from abc import abstractmethod
-from typing import Any, Dict, List, Literal, NoReturn, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any, Dict, List, Literal, NoReturn, Sequence, Tuple, Union
 
 import pandas as pd
 import pyarrow as pa
 import pyodbc
 from prefect.utilities import logging
 
+from ..cache import ExtractCache, table_metadata_cache
 from ..config import local_config
 from ..signals import SKIP
 
@@ -14,6 +19,13 @@ logger = logging.get_logger(__name__)
 
 Record = Tuple[Any]
 
+# Statements that can change the structure of a table, wherever they appear in a query
+# (eg. `IF OBJECT_ID(...) IS NOT NULL DROP TABLE ...`, `SELECT ... INTO`, `EXEC sp_rename`).
+DDL_PATTERN = re.compile(
+    r"\b(CREATE|DROP|ALTER|TRUNCATE|SP_RENAME)\b|(?<!INSERT\s)(?<!MERGE\s)\bINTO\b",
+    re.IGNORECASE,
+)
+
 
 class Source:
     def __init__(self, *args, credentials: Dict[str, Any] = None, **kwargs):
@@ -33,6 +45,31 @@ class Source:
     def query():
         pass
 
+    def to_df_cached(
+        self,
+        cache: ExtractCache = None,
+        key_params: Dict[str, Any] = None,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Opt-in cached version of `to_df()`. The result is served from a local
+        extract cache if the same source class has extracted the same data with the same
+        credentials within the cache's TTL, and extracted with `to_df()` otherwise.
+
+        Args:
+            cache (ExtractCache, optional): The cache to use. Defaults to a cache
+            with the default location, TTL and size.
+            key_params (Dict[str, Any], optional): Additional parameters identifying
+            the extract, eg. the query for sources which store it in their state.
+            Defaults to None.
+            **kwargs: Keyword arguments passed to `to_df()`.
+
+        Returns:
+            pd.DataFrame: The extracted data.
+        """
+        cache = cache or ExtractCache()
+        return cache.get_or_extract(self, "to_df", key_params=key_params, **kwargs)
+
     def to_arrow(self, if_empty: str = "warn") -> pa.Table:
         """
         Creates a pyarrow table from source.
@@ -254,10 +291,15 @@ class SQL(Source):
             pyodbc.Connection: database connection.
         """
         if not self._con:
-            self._con = pyodbc.connect(self.conn_str, timeout=5)
-            self._con.timeout = self.query_timeout
+            self._con = self._connect()
         return self._con
 
+    def _connect(self) -> pyodbc.Connection:
+        """Open a new connection to the database."""
+        con = pyodbc.connect(self.conn_str, timeout=5)
+        con.timeout = self.query_timeout
+        return con
+
     def run(self, query: str) -> Union[List[Record], bool]:
         cursor = self.con.cursor()
         cursor.execute(query)
@@ -271,37 +313,240 @@ class SQL(Source):
         self.con.commit()
         cursor.close()
 
+        if DDL_PATTERN.search(query):
+            table_metadata_cache.invalidate(self.con)
+
         return result
 
     def to_df(
-        self, query: str, con: pyodbc.Connection = None, if_empty: str = None
+        self,
+        query: str,
+        con: pyodbc.Connection = None,
+        if_empty: str = None,
+        params: Sequence[Any] = None,
     ) -> pd.DataFrame:
         """Creates DataFrame form SQL query.
         Args:
             query (str): SQL query. If don't start with "SELECT" returns empty DataFrame.
             con (pyodbc.Connection, optional): The connection to use to pull the data.
             if_empty (str, optional): What to do if the query returns no data. Defaults to None.
+            params (Sequence[Any], optional): Values of the `?` parameters of the query. Defaults to None.
         """
         conn = con or self.con
 
         query_sanitized = query.strip().upper()
         if query_sanitized.startswith("SELECT") or query_sanitized.startswith("WITH"):
-            df = pd.read_sql_query(query, conn)
+            df = pd.read_sql_query(query, conn, params=params)
             if df.empty:
                 self._handle_if_empty(if_empty=if_empty)
         else:
             df = pd.DataFrame()
         return df
 
+    @staticmethod
+    def _split_range(lower: Any, upper: Any, partitions: int) -> List[Any]:
+        """Split the range between two numbers or dates into `partitions` equal parts.
+
+        Returns:
+            List[Any]: The lower bounds of the parts, without duplicates.
+        """
+        if isinstance(lower, datetime) or not isinstance(lower, date):
+            step = (upper - lower) / partitions
+            bounds = [lower + step * i for i in range(partitions)]
+            if isinstance(lower, int):
+                bounds = [int(bound) for bound in bounds]
+        else:
+            # dates can only be split by whole days
+            bounds = [
+                lower + (upper - lower) * i // partitions for i in range(partitions)
+            ]
+        return sorted(set(bounds))
+
+    def _get_partition_bounds(
+        self,
+        query: str,
+        partition_column: str,
+        partitions: int,
+        partition_method: Literal["range", "ntile"] = "range",
+    ) -> Tuple[List[Any], Any]:
+        """Get the lower bounds of the partitions of a query and the maximum value."""
+        lower, upper = self.run(
+            f"SELECT MIN({partition_column}), MAX({partition_column}) FROM ({query}) AS q"
+        )[0]
+        if lower is None:
+            return [], None
+
+        if partition_method == "range":
+            try:
+                return self._split_range(lower, upper, partitions), upper
+            except TypeError:
+                logger.info(
+                    f"Column {partition_column} is neither numeric nor a date. Partitioning with NTILE..."
+                )
+        elif partition_method != "ntile":
+            raise ValueError(
+                "Please provide correct 'partition_method' parameter value - 'range' or 'ntile'."
+            )
+
+        ntile_query = f"""
+        SELECT MIN({partition_column})
+        FROM (
+            SELECT {partition_column}, NTILE({partitions}) OVER (ORDER BY {partition_column}) AS tile
+            FROM ({query}) AS q
+            WHERE {partition_column} IS NOT NULL
+        ) AS tiles
+        GROUP BY tile
+        ORDER BY tile
+        """
+        bounds = [row[0] for row in self.run(ntile_query)]
+        return sorted(set(bounds)), upper
+
+    def to_df_partitioned(
+        self,
+        query: str,
+        partition_column: str,
+        partitions: int = 4,
+        partition_method: Literal["range", "ntile"] = "range",
+        max_workers: int = None,
+        if_empty: str = None,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """Creates DataFrame form SQL query, reading key ranges of the result concurrently.
+
+        The range of `partition_column` is split into `partitions` parts, either into equal
+        ranges between its minimum and maximum (`partition_method="range"`, for numeric and
+        date columns) or into parts with the same number of rows with `NTILE`
+        (`partition_method="ntile"`, for skewed or other orderable columns). Each part, plus
+        the rows where the column is NULL, is read with a range-bounded sub-query, on its own
+        connection, and the parts are concatenated in order.
+
+        Note that the sub-queries wrap `query` (`SELECT * FROM (query) AS q WHERE ...`), so it
+        can't end with an `ORDER BY` clause. The parts are read in separate transactions, so
+        the result is only consistent if the data doesn't change while it's being read.
+
+        Args:
+            query (str): SQL query.
+            partition_column (str): The column by which to partition the result.
+            partitions (int, optional): The number of parts. Defaults to 4.
+            partition_method (Literal["range", "ntile"], optional): How to split the range of
+            `partition_column`. Defaults to "range".
+            max_workers (int, optional): The maximum number of parts read concurrently.
+            Defaults to `partitions`.
+            if_empty (str, optional): What to do if the query returns no data. Defaults to None.
+            **kwargs: Additional keyword arguments passed to `to_df()`.
+
+        Returns:
+            pd.DataFrame: The result of the query.
+        """
+        query = query.strip().rstrip(";")
+        bounds, upper = self._get_partition_bounds(
+            query,
+            partition_column=partition_column,
+            partitions=partitions,
+            partition_method=partition_method,
+        )
+
+        sub_query = f"SELECT * FROM ({query}) AS q WHERE "
+        sub_queries = [(sub_query + f"{partition_column} IS NULL", [])]
+        for i, lower in enumerate(bounds):
+            if i < len(bounds) - 1:
+                condition = f"{partition_column} >= ? AND {partition_column} < ?"
+                sub_queries.append((sub_query + condition, [lower, bounds[i + 1]]))
+            else:
+                condition = f"{partition_column} >= ? AND {partition_column} <= ?"
+                sub_queries.append((sub_query + condition, [lower, upper]))
+
+        local = threading.local()
+        connections = []
+        connections_lock = threading.Lock()
+
+        def _read_part(part_query: str, params: List[Any]) -> pd.DataFrame:
+            if not hasattr(local, "con"):
+                local.con = self._connect()
+                with connections_lock:
+                    connections.append(local.con)
+            return self.to_df(part_query, con=local.con, params=params, **kwargs)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers or partitions) as executor:
+                futures = [
+                    executor.submit(_read_part, part_query, params)
+                    for part_query, params in sub_queries
+                ]
+                dfs = [future.result() for future in futures]
+        finally:
+            for con in connections:
+                con.close()
+
+        # Parts with only NULLs in a column have it as `object`, so the dtypes are
+        # inferred again once the parts are concatenated.
+        non_empty_dfs = [part for part in dfs if not part.empty]
+        df = pd.concat(non_empty_dfs or dfs[:1], ignore_index=True).infer_objects()
+        if df.empty:
+            self._handle_if_empty(if_empty=if_empty)
+        return df
+
+    def _fetch_table_metadata(
+        self, table: str, schema: str = None
+    ) -> List[Dict[str, Any]]:
+        query = f"""
+        SELECT
+            col.COLUMN_NAME,
+            col.DATA_TYPE,
+            col.CHARACTER_MAXIMUM_LENGTH,
+            CASE WHEN pk.COLUMN_NAME IS NULL THEN 0 ELSE 1 END
+        FROM INFORMATION_SCHEMA.COLUMNS AS col
+            LEFT JOIN (
+                SELECT kcu.TABLE_SCHEMA, kcu.TABLE_NAME, kcu.COLUMN_NAME
+                FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS AS tc
+                    INNER JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE AS kcu
+                        ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+                        AND tc.TABLE_SCHEMA = kcu.TABLE_SCHEMA
+                WHERE tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
+            ) AS pk
+                ON col.TABLE_SCHEMA = pk.TABLE_SCHEMA
+                AND col.TABLE_NAME = pk.TABLE_NAME
+                AND col.COLUMN_NAME = pk.COLUMN_NAME
+        WHERE col.TABLE_SCHEMA = '{schema}' AND col.TABLE_NAME = '{table}'
+        ORDER BY col.ORDINAL_POSITION
+        """
+        return [
+            dict(name=row[0], type=row[1], max_length=row[2], is_key=bool(row[3]))
+            for row in self.run(query)
+        ]
+
+    def get_table_metadata(
+        self, table: str, schema: str = None, use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Get the columns of a table, with their types, lengths and whether they're
+        part of the primary key.
+
+        The result is stored in the shared `table_metadata_cache`, which is invalidated
+        whenever DDL is run with `run()`.
+
+        Args:
+            table (str): Table name.
+            schema (str, optional): Schema name. Defaults to None.
+            use_cache (bool, optional): Whether to use the cached metadata. Defaults to True.
+
+        Returns:
+            List[Dict[str, Any]]: The columns, in column order, each with the `name`, `type`,
+            `max_length` and `is_key` fields. Empty if the table doesn't exist.
+        """
+        if not use_cache:
+            return self._fetch_table_metadata(table=table, schema=schema)
+        key = table_metadata_cache.make_key(self.con, table=table, schema=schema)
+        return table_metadata_cache.get_or_fetch(
+            key, lambda: self._fetch_table_metadata(table=table, schema=schema)
+        )
+
     def _check_if_table_exists(self, table: str, schema: str = None) -> bool:
         """Checks if table exists.
         Args:
             table (str): Table name.
             schema (str, optional): Schema name. Defaults to None.
         """
-        exists_query = f"SELECT * FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_SCHEMA = '{schema}' AND TABLE_NAME='{table}'"
-        exists = bool(self.run(exists_query))
-        return exists
+        return bool(self.get_table_metadata(table=table, schema=schema))
 
     def create_table(
         self,
@@ -377,6 +622,50 @@ class SQL(Source):
 
         return sql
 
+    def insert_df(
+        self,
+        df: pd.DataFrame,
+        table: str,
+        schema: str = None,
+        batch_size: int = 10_000,
+        fast_executemany: bool = False,
+    ) -> int:
+        """Insert a pandas DataFrame into an existing database table with parameterized
+        batches of rows.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to insert.
+            table (str): The table name.
+            schema (str, optional): The schema name. Defaults to None.
+            batch_size (int, optional): The number of rows sent in a single batch.
+            Defaults to 10 000.
+            fast_executemany (bool, optional): Whether to send each batch as a single
+            array of parameters. Only supported by some drivers, eg. the Microsoft
+            ODBC drivers for SQL Server. Defaults to False.
+
+        Returns:
+            int: The number of inserted rows.
+        """
+        fqn = f"{schema}.{table}" if schema is not None else table
+        columns = ", ".join(f'"{column}"' for column in df.columns)
+        placeholders = ", ".join("?" for _ in df.columns)
+        insert_sql = f"INSERT INTO {fqn} ({columns}) VALUES ({placeholders})"
+
+        # Convert numpy scalars into Python objects and missing values into NULLs.
+        df = df.astype(object).where(df.notna(), None)
+
+        cursor = self.con.cursor()
+        cursor.fast_executemany = fast_executemany
+        for start in range(0, len(df), batch_size):
+            batch = df.iloc[start : start + batch_size]
+            cursor.executemany(
+                insert_sql, list(batch.itertuples(index=False, name=None))
+            )
+        self.con.commit()
+        cursor.close()
+
+        return len(df)
+
     def _sql_column(self, column_name: str) -> str:
         """Returns the name of a column"""
         if isinstance(column_name, str):
@@ -1,9 +1,10 @@
 import json
-from typing import Any, Dict, Literal
+from typing import Any, Callable, Dict, Literal, Tuple
 
 import pandas as pd
 from prefect.utilities import logging
 
+from ..cache import token_cache
 from ..config import local_config
 from ..exceptions import APIError, CredentialError
 from ..utils import handle_api_response
@@ -67,21 +68,42 @@ class BusinessCore(Source):
     def generate_token(self) -> str:
         """
         Function for generating Business Core API token based on username and password.
+        The token is cached, and only generated again shortly before it expires.
 
         Returns:
         string: Business Core API token.
 
         """
+        token = token_cache.get_or_fetch(*self._token_cache_entry())
+        self.token = token
+        return token
+
+    def _token_cache_entry(
+        self,
+    ) -> Tuple[Tuple[str, str], Callable[[], Tuple[str, int]]]:
+        """The key of the API access token in the token cache, and the function generating it."""
         url = "https://api.businesscore.ae/api/user/Login"
+        key = token_cache.make_key(url, self.credentials)
+        return key, lambda: self._generate_token(url)
+
+    def _generate_token(self, url: str) -> Tuple[str, int]:
+        """
+        Function requesting a new Business Core API token.
+
+        Args:
+            url (str): The URL of the login endpoint.
+
+        Returns:
+        Tuple[str, int]: Business Core API token and its lifetime in seconds.
+        """
 
         payload = f'grant_type=password&username={self.credentials.get("username")}&password={self.credentials.get("password")}&scope='
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
         response = handle_api_response(
             url=url, headers=headers, method="GET", body=payload, verify=self.verify
         )
-        token = json.loads(response.text).get("access_token")
-        self.token = token
-        return token
+        response_json = json.loads(response.text)
+        return response_json.get("access_token"), response_json.get("expires_in")
 
     def clean_filters_dict(self) -> Dict:
         """
@@ -113,18 +135,23 @@ class BusinessCore(Source):
             + "ToDate"
             + str(filters.get("ToDate"))
         )
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Authorization": "Bearer " + self.generate_token(),
-        }
+
+        def _get(token: str) -> Any:
+            self.token = token
+            headers = {
+                "Content-Type": "application/x-www-form-urlencoded",
+                "Authorization": "Bearer " + token,
+            }
+            return handle_api_response(
+                url=self.url,
+                headers=headers,
+                method="GET",
+                body=payload,
+                verify=self.verify,
+            )
+
         logger.info("Downloading the data...")
-        response = handle_api_response(
-            url=self.url,
-            headers=headers,
-            method="GET",
-            body=payload,
-            verify=self.verify,
-        )
+        response = token_cache.call(*self._token_cache_entry(), _get)
         logger.info("Data was downloaded successfully.")
         return json.loads(response.text)
 
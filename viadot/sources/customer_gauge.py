@@ -1,9 +1,10 @@
 from datetime import datetime
-from typing import Any, Dict, Literal
+from typing import Any, Callable, Dict, Literal, Tuple
 
 import pandas as pd
 from prefect.utilities import logging
 
+from viadot.cache import token_cache
 from viadot.config import local_config
 from viadot.exceptions import APIError, CredentialError
 from viadot.sources.base import Source
@@ -65,7 +66,8 @@ class CustomerGauge(Source):
 
     def get_token(self) -> str:
         """
-        Gets Bearer Token using POST request method.
+        Gets Bearer Token using POST request method. The token is cached, and only
+        generated again shortly before it expires.
 
         Raises:
             APIError: If token is not returned.
@@ -73,7 +75,29 @@ class CustomerGauge(Source):
         Returns:
             str: Bearer Token value.
         """
+        return token_cache.get_or_fetch(*self._token_cache_entry())
+
+    def _token_cache_entry(
+        self,
+    ) -> Tuple[Tuple[str, str], Callable[[], Tuple[str, int]]]:
+        """The key of the API access token in the token cache, and the function generating it."""
         url = "https://auth.EU.customergauge.com/oauth2/token"
+        key = token_cache.make_key(url, self.credentials)
+        return key, lambda: self._generate_token(url)
+
+    def _generate_token(self, url: str) -> Tuple[str, int]:
+        """
+        Generates Bearer Token using POST request method.
+
+        Args:
+            url (str): The URL of the OAuth token endpoint.
+
+        Raises:
+            APIError: If token is not returned.
+
+        Returns:
+            Tuple[str, int]: Bearer Token value and its lifetime in seconds.
+        """
         client_id = self.credentials.get("client_id", None)
         client_secret = self.credentials.get("client_secret", None)
 
@@ -86,12 +110,13 @@ class CustomerGauge(Source):
         api_response = handle_api_response(
             url=url, params=body, headers=headers, method="POST"
         )
-        token = api_response.json().get("access_token")
+        response_json = api_response.json()
+        token = response_json.get("access_token")
 
         if token is None:
             raise APIError("The token could not be generated. Check your credentials.")
 
-        return token
+        return token, response_json.get("expires_in")
 
     def get_json_response(
         self,
@@ -138,8 +163,11 @@ class CustomerGauge(Source):
                     "Missing date arguments: 'date_field', 'start_date', 'end_date'. Provide all 3 arguments or skip all of them."
                 )
 
-        header = {"Authorization": f"Bearer {self.get_token()}"}
-        api_response = handle_api_response(url=url, headers=header, params=params)
+        def _get(token: str) -> Any:
+            header = {"Authorization": f"Bearer {token}"}
+            return handle_api_response(url=url, headers=header, params=params)
+
+        api_response = token_cache.call(*self._token_cache_entry(), _get)
         response = api_response.json()
 
         if response is None:
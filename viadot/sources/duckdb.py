@@ -1,5 +1,10 @@
+import os
 import re
-from typing import Any, List, Literal, NoReturn, Tuple, Union
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Any, Dict, Generator, List, Literal, NoReturn, Tuple, Union
 
 import duckdb
 import pandas as pd
@@ -8,12 +13,32 @@ from prefect.utilities import logging
 from ..config import local_config
 from ..exceptions import CredentialError
 from ..signals import SKIP
+from ..utils import write_csv_files
 from .base import Source
 
 logger = logging.get_logger(__name__)
 
 Record = Tuple[Any]
 
+# Patterns used to infer the tables a SQL script creates, modifies and reads.
+TABLE_NAME_PATTERN = r'([\w"]+(?:\.[\w"]+)?)'
+CREATE_PATTERN = re.compile(
+    r"CREATE\s+(?:OR\s+REPLACE\s+)?(?:TEMP(?:ORARY)?\s+)?(?:TABLE|VIEW)\s+"
+    r"(?:IF\s+NOT\s+EXISTS\s+)?" + TABLE_NAME_PATTERN,
+    re.IGNORECASE,
+)
+MODIFY_PATTERN = re.compile(
+    r"(?:INSERT\s+(?:OR\s+\w+\s+)?INTO|UPDATE|DELETE\s+FROM)\s+" + TABLE_NAME_PATTERN,
+    re.IGNORECASE,
+)
+READ_PATTERN = re.compile(r"(?:FROM|JOIN)\s+" + TABLE_NAME_PATTERN, re.IGNORECASE)
+DEPENDS_ON_PATTERN = re.compile(r"^\s*--\s*depends_on\s*:(.*)$", re.IGNORECASE)
+# Matches string literals and quoted identifiers (group 1), which are kept as they are,
+# and line and block comments, which are removed.
+COMMENT_PATTERN = re.compile(
+    r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")|--[^\n]*|/\*.*?\*/", re.DOTALL
+)
+
 
 class DuckDB(Source):
     DEFAULT_SCHEMA = "main"
@@ -138,6 +163,47 @@ class DuckDB(Source):
         cursor.close()
         return result
 
+    def to_csv_files(
+        self,
+        query: str,
+        path: str,
+        sep: str = "\t",
+        batch_size: int = 100_000,
+        rows_per_file: int = 1_000_000,
+    ) -> Generator[str, None, None]:
+        """Stream the result of a query into rotating CSV files.
+
+        The result is fetched in record batches, so that only `batch_size` rows are held
+        in memory at a time. A new file is started every `rows_per_file` rows, and each
+        file's path is yielded as soon as the file is complete, so that it can be
+        processed (eg. loaded with bcp) while the next one is being written.
+
+        Args:
+            query (str): The SELECT query to execute.
+            path (str): The base path of the CSV files. A file number is appended to
+            the file name, eg. `data.csv` produces `data_0.csv`, `data_1.csv`, etc.
+            sep (str, optional): The separator to use in the CSV. Defaults to "\t".
+            batch_size (int, optional): The number of rows fetched at a time.
+            Defaults to 100 000.
+            rows_per_file (int, optional): The maximum number of rows in a single file.
+            Defaults to 1 000 000.
+
+        Yields:
+            Generator[str, None, None]: The paths of the completed CSV files.
+        """
+        cursor = self.con.cursor()
+        cursor.execute(query)
+        reader = cursor.fetch_record_batch(batch_size)
+        try:
+            yield from write_csv_files(
+                (batch.to_pandas() for batch in reader),
+                path=path,
+                sep=sep,
+                rows_per_file=rows_per_file,
+            )
+        finally:
+            cursor.close()
+
     def _handle_if_empty(self, if_empty: str = "warn") -> NoReturn:
         if if_empty == "warn":
             logger.warning("The query produced no data.")
@@ -237,3 +303,291 @@ class DuckDB(Source):
             return True
         fqns = self.tables
         return any((fqn.split(".")[0] == schema for fqn in fqns))
+
+    @staticmethod
+    def _normalize_table_name(name: str) -> str:
+        name = name.replace('"', "").lower()
+        if "." not in name:
+            name = DuckDB.DEFAULT_SCHEMA + "." + name
+        return name
+
+    @staticmethod
+    def _parse_sql_script(sql: str) -> Dict[str, Any]:
+        """Extract the tables created, modified and read by a SQL script, as well
+        as the dependencies declared with `-- depends_on: script_a, script_b` comments.
+
+        Args:
+            sql (str): The content of the SQL script.
+
+        Returns:
+            Dict[str, Any]: A dictionary with the `creates`, `modifies`, `reads`
+            and `depends_on` keys.
+        """
+        depends_on = set()
+        for line in sql.splitlines():
+            depends_on_match = DEPENDS_ON_PATTERN.match(line)
+            if depends_on_match:
+                declared = depends_on_match.group(1).split(",")
+                depends_on.update(dep.strip() for dep in declared if dep.strip())
+        code = COMMENT_PATTERN.sub(lambda match: match.group(1) or " ", sql)
+
+        creates = {
+            DuckDB._normalize_table_name(t) for t in CREATE_PATTERN.findall(code)
+        }
+        modifies = {
+            DuckDB._normalize_table_name(t) for t in MODIFY_PATTERN.findall(code)
+        }
+        reads = {DuckDB._normalize_table_name(t) for t in READ_PATTERN.findall(code)}
+        return dict(
+            creates=creates,
+            modifies=modifies - creates,
+            reads=reads - creates - modifies,
+            depends_on=depends_on,
+        )
+
+    @staticmethod
+    def get_scripts_dependencies(
+        scripts: Dict[str, str], dependencies: Dict[str, List[str]] = None
+    ) -> Dict[str, List[str]]:
+        """Build the dependency graph of a set of SQL scripts.
+
+        A script depends on every script that creates a table it reads or modifies,
+        and on every script that modifies a table it reads. Scripts writing to the
+        same table otherwise run in the order of `scripts`. Dependencies declared
+        explicitly, either in the `dependencies` parameter or with
+        `-- depends_on: script_a, script_b` comments, are added to the inferred ones.
+
+        Args:
+            scripts (Dict[str, str]): Mapping of script names to their SQL.
+            dependencies (Dict[str, List[str]], optional): Explicitly declared
+            dependencies, mapping script names to the scripts they depend on.
+            Defaults to None.
+
+        Raises:
+            ValueError: If a dependency references an unknown script or the
+            dependencies contain a cycle.
+
+        Returns:
+            Dict[str, List[str]]: Mapping of script names to the scripts they depend on.
+        """
+        dependencies = dependencies or {}
+        parsed = {name: DuckDB._parse_sql_script(sql) for name, sql in scripts.items()}
+
+        inferred = {}
+        for name, meta in parsed.items():
+            upstream = set()
+            for other_name, other_meta in parsed.items():
+                if other_name == name:
+                    continue
+                if other_meta["creates"] & (meta["reads"] | meta["modifies"]):
+                    upstream.add(other_name)
+                elif other_meta["modifies"] & meta["reads"]:
+                    upstream.add(other_name)
+            inferred[name] = upstream
+
+        # Scripts writing to the same table run in script order, unless the
+        # dependencies above already order them the other way round.
+        names = list(parsed)
+        for position, name in enumerate(names):
+            writes = parsed[name]["creates"] | parsed[name]["modifies"]
+            for other_name in names[:position]:
+                other_meta = parsed[other_name]
+                if (other_meta["creates"] | other_meta["modifies"]) & writes:
+                    if name not in inferred[other_name]:
+                        inferred[name].add(other_name)
+
+        graph = {}
+        for name, meta in parsed.items():
+            upstream = (
+                inferred[name]
+                | set(meta["depends_on"])
+                | set(dependencies.get(name, []))
+            )
+            unknown = upstream - set(scripts)
+            if unknown:
+                raise ValueError(
+                    f"Script '{name}' depends on unknown script(s): {sorted(unknown)}."
+                )
+            graph[name] = sorted(upstream)
+
+        # Kahn's algorithm, only used to detect cycles.
+        in_degree = {name: len(upstream) for name, upstream in graph.items()}
+        ready = [name for name, degree in in_degree.items() if degree == 0]
+        visited = 0
+        while ready:
+            current = ready.pop()
+            visited += 1
+            for name, upstream in graph.items():
+                if current in upstream:
+                    in_degree[name] -= 1
+                    if in_degree[name] == 0:
+                        ready.append(name)
+        if visited != len(graph):
+            cyclic = sorted(name for name, degree in in_degree.items() if degree > 0)
+            raise ValueError(f"Circular dependency detected between scripts {cyclic}.")
+
+        return graph
+
+    def run_scripts(
+        self,
+        path: str,
+        dependencies: Dict[str, List[str]] = None,
+        max_workers: int = 4,
+        log_table: str = "run_log",
+        log_schema: str = None,
+    ) -> List[Dict[str, Any]]:
+        """Run a directory of SQL scripts, executing independent scripts
+        concurrently on separate cursors of one database connection.
+
+        The execution order is taken from `dependencies`, `-- depends_on:` comments
+        and the table names each script reads and writes
+        (see `DuckDB.get_scripts_dependencies()`). Scripts are named after their
+        file name without the `.sql` extension. The runtime of every script is
+        recorded in the `log_table` table.
+
+        Args:
+            path (str): The directory containing the `.sql` files.
+            dependencies (Dict[str, List[str]], optional): Explicitly declared
+            dependencies, mapping script names to the scripts they depend on.
+            Defaults to None.
+            max_workers (int, optional): The maximum number of scripts run
+            concurrently. Defaults to 4.
+            log_table (str, optional): The table in which to record the runtime
+            of each script. Defaults to "run_log".
+            log_schema (str, optional): The schema of the log table. Defaults to None.
+
+        Raises:
+            ValueError: If the directory contains no SQL scripts or the
+            dependencies are invalid.
+            Exception: The first exception raised by a failed script, once all the
+            other scripts have run. Scripts depending, directly or not, on a failed
+            script are not run, and are recorded with the "skipped" status.
+
+        Returns:
+            List[Dict[str, Any]]: The log records of the scripts.
+        """
+        scripts = {}
+        for file_name in sorted(os.listdir(path)):
+            if file_name.lower().endswith(".sql"):
+                with open(os.path.join(path, file_name)) as f:
+                    scripts[os.path.splitext(file_name)[0]] = f.read()
+        if not scripts:
+            raise ValueError(f"No SQL scripts found in {path}.")
+
+        graph = self.get_scripts_dependencies(scripts, dependencies=dependencies)
+
+        run_id = uuid.uuid4().hex
+        con = self.con
+
+        def _run_script(name: str) -> Tuple[Dict[str, Any], Exception]:
+            cursor = con.cursor()
+            started_at = datetime.now()
+            start = time.perf_counter()
+            error = None
+            try:
+                cursor.execute(scripts[name])
+            except Exception as e:
+                error = e
+            finally:
+                cursor.close()
+            record = dict(
+                run_id=run_id,
+                script=name,
+                started_at=started_at,
+                finished_at=datetime.now(),
+                duration_seconds=time.perf_counter() - start,
+                status="failed" if error else "success",
+                error=str(error) if error else None,
+            )
+            return record, error
+
+        records = []
+        first_error = None
+        done = set()
+        not_done = set()
+        pending = {}
+        remaining = dict(graph)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                while remaining or pending:
+                    # Skip the scripts depending on a failed or skipped script.
+                    while True:
+                        skipped = [
+                            name
+                            for name, upstream in remaining.items()
+                            if any(dep in not_done for dep in upstream)
+                        ]
+                        if not skipped:
+                            break
+                        for name in skipped:
+                            failed_upstream = sorted(set(remaining[name]) & not_done)
+                            self.logger.warning(
+                                f"Skipping script {name}, as {failed_upstream} did not succeed."
+                            )
+                            records.append(
+                                dict(
+                                    run_id=run_id,
+                                    script=name,
+                                    started_at=None,
+                                    finished_at=None,
+                                    duration_seconds=None,
+                                    status="skipped",
+                                    error=f"Upstream scripts did not succeed: {failed_upstream}",
+                                )
+                            )
+                            not_done.add(name)
+                            del remaining[name]
+
+                    ready = [
+                        name
+                        for name, upstream in remaining.items()
+                        if all(dep in done for dep in upstream)
+                    ]
+                    for name in ready:
+                        self.logger.info(f"Running script {name}...")
+                        pending[executor.submit(_run_script, name)] = name
+                        del remaining[name]
+                    if not pending:
+                        break
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        name = pending.pop(future)
+                        record, error = future.result()
+                        records.append(record)
+                        if error:
+                            self.logger.error(f"Script {name} failed: {error}")
+                            first_error = first_error or error
+                            not_done.add(name)
+                        else:
+                            self.logger.info(
+                                f"Script {name} finished in {record['duration_seconds']:.2f}s."
+                            )
+                            done.add(name)
+
+            log_schema = log_schema or DuckDB.DEFAULT_SCHEMA
+            log_fqn = log_schema + "." + log_table
+            cursor = con.cursor()
+            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {log_schema}")
+            cursor.execute(
+                f"""CREATE TABLE IF NOT EXISTS {log_fqn} (
+                    run_id VARCHAR,
+                    script VARCHAR,
+                    started_at TIMESTAMP,
+                    finished_at TIMESTAMP,
+                    duration_seconds DOUBLE,
+                    status VARCHAR,
+                    error VARCHAR
+                )"""
+            )
+            cursor.executemany(
+                f"INSERT INTO {log_fqn} VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [list(record.values()) for record in records],
+            )
+            cursor.close()
+        finally:
+            con.close()
+
+        if first_error is not None:
+            raise first_error
+
+        return records
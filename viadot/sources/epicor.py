@@ -1,9 +1,10 @@
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import pandas as pd
 from pydantic import BaseModel
 
+from ..cache import token_cache
 from ..config import local_config
 from ..exceptions import CredentialError, DataRangeError
 from ..utils import handle_api_response
@@ -223,11 +224,17 @@ class Epicor(Source):
 
     def generate_token(self) -> str:
         """Function to generate API access token that is valid for 24 hours.
+        The token is cached, and only generated again shortly before it expires.
 
         Returns:
             str: Generated token.
         """
+        return token_cache.get_or_fetch(*self._token_cache_entry())
 
+    def _token_cache_entry(
+        self,
+    ) -> Tuple[Tuple[str, str], Callable[[], Tuple[str, int]]]:
+        """The key of the API access token in the token cache, and the function generating it."""
         url = (
             "http://"
             + self.credentials["host"]
@@ -235,6 +242,18 @@ class Epicor(Source):
             + str(self.credentials["port"])
             + "/api/security/token/"
         )
+        key = token_cache.make_key(url, self.credentials)
+        return key, lambda: self._generate_token(url)
+
+    def _generate_token(self, url: str) -> Tuple[str, int]:
+        """Function requesting a new API access token.
+
+        Args:
+            url (str): The URL of the token endpoint.
+
+        Returns:
+            Tuple[str, int]: Generated token and its lifetime in seconds.
+        """
 
         headers = {
             "Content-Type": "application/json",
@@ -245,7 +264,7 @@ class Epicor(Source):
         response = handle_api_response(url=url, headers=headers, method="POST")
         root = ET.fromstring(response.text)
         token = root.find("AccessToken").text
-        return token
+        return token, 24 * 60 * 60
 
     def generate_url(self) -> str:
         """Function to generate url to download data
@@ -282,14 +301,17 @@ class Epicor(Source):
             self.validate_filter()
         payload = self.filters_xml
         url = self.generate_url()
-        headers = {
-            "Content-Type": "application/xml",
-            "Authorization": "Bearer " + self.generate_token(),
-        }
-        response = handle_api_response(
-            url=url, headers=headers, body=payload, method="POST"
-        )
-        return response
+
+        def _post(token: str) -> Any:
+            headers = {
+                "Content-Type": "application/xml",
+                "Authorization": "Bearer " + token,
+            }
+            return handle_api_response(
+                url=url, headers=headers, body=payload, method="POST"
+            )
+
+        return token_cache.call(*self._token_cache_entry(), _post)
 
     def to_df(self) -> pd.DataFrame:
         """Function for creating pandas DataFrame from Epicor API response
@@ -2,16 +2,19 @@ import asyncio
 import base64
 import json
 import os
+import random
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 
 import aiohttp
 import pandas as pd
 import prefect
-from aiolimiter import AsyncLimiter
 from prefect.engine import signals
 
+from viadot.cache import token_cache
 from viadot.config import local_config
 from viadot.exceptions import APIError, CredentialError
 from viadot.sources.base import Source
@@ -20,6 +23,74 @@ from viadot.utils import handle_api_response
 warnings.simplefilter("ignore")
 
 
+class RateLimiter:
+    """An asynchronous token bucket, following the rate limit headers of the Genesys API.
+
+    Genesys returns the number of requests allowed per window (`inin-ratelimit-allowed`),
+    the number already made (`inin-ratelimit-count`) and the seconds until the window
+    resets (`inin-ratelimit-reset`). The remaining budget is spread over the rest of the
+    window, so that a run slows down before it's rejected rather than after.
+    """
+
+    # 300 requests per minute, the default limit of an OAuth client.
+    DEFAULT_RATE = 5
+
+    def __init__(
+        self, rate: float = DEFAULT_RATE, capacity: int = 1, max_rate: float = None
+    ):
+        self.rate = rate
+        self.max_rate = max_rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a request can be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def update(self, headers: Dict[str, str]) -> None:
+        """Adjust the rate to the rate limit headers of a response."""
+        try:
+            allowed = int(headers["inin-ratelimit-allowed"])
+            count = int(headers["inin-ratelimit-count"])
+            reset = float(headers["inin-ratelimit-reset"])
+        except (KeyError, ValueError):
+            return
+        remaining = max(allowed - count, 0)
+        self._refill()
+        self.tokens = min(self.tokens, remaining)
+        if remaining == 0:
+            self.pause(reset)
+        elif reset > 0:
+            self.rate = remaining / reset
+            if self.max_rate is not None:
+                self.rate = min(self.rate, self.max_rate)
+
+    def pause(self, seconds: float) -> None:
+        """Stop sending requests for `seconds`, eg. after a 429 response."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0
+
+
 class Genesys(Source):
     def __init__(
         self,
@@ -96,6 +167,8 @@ class Genesys(Source):
         """
         Get authorization token with request headers.
 
+        The token is cached, and only generated again shortly before it expires.
+
         Args:
             CLIENT_SECRET, SCHEDULE_ID and host server. Defaults to None.
             verbose (bool, optional): Switch on/off for logging messages. Defaults to False.
@@ -103,6 +176,45 @@ class Genesys(Source):
         Returns:
             Dict: request headers with token.
         """
+        authorization = token_cache.get_or_fetch(*self._token_cache_entry(verbose))
+        return self._request_headers(authorization)
+
+    def _token_cache_entry(
+        self, verbose: bool = False
+    ) -> Tuple[Tuple[str, str], Callable[[], Tuple[str, int]]]:
+        """The key of the OAuth token in the token cache, and the function generating it."""
+        url = f"https://login.{self.environment}/oauth/token"
+        key = token_cache.make_key(url, self.credentials)
+        return key, lambda: self._generate_token(url, verbose=verbose)
+
+    @staticmethod
+    def _request_headers(authorization: str) -> Dict[str, str]:
+        return {
+            "Authorization": authorization,
+            "Content-Type": "application/json",
+        }
+
+    def _handle_api_response(self, **kwargs) -> Any:
+        """Send a request with `handle_api_response()` and the cached OAuth token,
+        renewing the token once if it is rejected."""
+        return token_cache.call(
+            *self._token_cache_entry(),
+            lambda authorization: handle_api_response(
+                headers=self._request_headers(authorization), **kwargs
+            ),
+        )
+
+    def _generate_token(self, url: str, verbose: bool = False) -> Tuple[str, int]:
+        """
+        Generate an OAuth token with the client credentials.
+
+        Args:
+            url (str): The URL of the OAuth token endpoint.
+            verbose (bool, optional): Switch on/off for logging messages. Defaults to False.
+
+        Returns:
+            Tuple[str, int]: The value of the Authorization header and the lifetime of the token in seconds.
+        """
         CLIENT_ID = self.credentials.get("CLIENT_ID", None)
         CLIENT_SECRET = self.credentials_genesys.get("CLIENT_SECRET", None)
         authorization = base64.b64encode(
@@ -114,7 +226,7 @@ class Genesys(Source):
         }
         request_body = {"grant_type": "client_credentials"}
         response = handle_api_response(
-            f"https://login.{self.environment}/oauth/token",
+            url,
             body=request_body,
             headers=request_headers,
             method="POST",
@@ -128,71 +240,128 @@ class Genesys(Source):
                     f"Failure: { str(response.status_code) } - { response.reason }"
                 )
         response_json = response.json()
-        request_headers = {
-            "Authorization": f"{ response_json['token_type'] } { response_json['access_token']}",
-            "Content-Type": "application/json",
-        }
+        authorization = (
+            f"{ response_json['token_type'] } { response_json['access_token']}"
+        )
 
-        return request_headers
+        return authorization, response_json.get("expires_in")
 
     def genesys_api_connection(
         self,
-        post_data_list: List[str],
+        post_data_list: List[Dict[str, Any]] = None,
         end_point: str = "analytics/reporting/exports",
         params: Dict[str, Any] = None,
         method: Literal["POST", "GET"] = "POST",
-        sleep_time: int = 0.5,
-    ) -> Optional[dict]:
-        """Function that make POST request method to Genesys API given and endpoint.
+        sleep_time: float = None,
+        max_concurrency: int = 10,
+        max_retries: int = 5,
+    ) -> List[Dict[str, Any]]:
+        """Function that make requests to Genesys API given and endpoint, one per element of `post_data_list`.
+
+        The requests are sent concurrently over a single session, at most `max_concurrency` at a
+        time, and throttled with a token bucket following the rate limit headers returned by
+        Genesys. Requests rejected with 429 Too Many Requests are retried after `Retry-After`.
 
         Args:
-            post_data_list (List[str], optional): List of string templates to generate json body. Defaults to None.
+            post_data_list (List[Dict[str, Any]], optional): List of json bodies to post. For the GET method,
+                one request is sent per element. Defaults to None (a single request).
             end_point (str, optional): Final end point for Genesys connection. Defaults to "analytics/reporting/exports".
-            params (Dict[str, Any], optional): Parameters to be passed into the POST call. Defaults to None.
+            params (Dict[str, Any], optional): Parameters to be passed into the GET call. Defaults to None.
             method (Literal["POST", "GET"], optional): Type of connection to the API. Defaults to "POST".
-            sleep_time (int, optional): The time, in seconds, to sleep the script between calls to the API. Defaults to 0.5
+            sleep_time (float, optional): The minimum time, in seconds, between two calls to the API. Defaults to None
+                (limited by the rate limit headers only).
+            max_concurrency (int, optional): The maximum number of requests in flight. Defaults to 10.
+            max_retries (int, optional): How many times to retry a request rejected with 429. Defaults to 5.
 
         Returns:
-            Optional[dict]: Dict when the "conversations" endpoint is called, otherwise returns None.
+            List[Dict[str, Any]]: The json responses, in the order of `post_data_list`.
         """
-
-        limiter = AsyncLimiter(2, 15)
-        semaphore = asyncio.Semaphore(value=1)
         url = f"https://api.{self.environment}/api/v2/{end_point}"
+        requests = [
+            (method, url, params, json.dumps(data) if method == "POST" else None)
+            for data in (post_data_list or [None])
+        ]
+        return asyncio.run(
+            self._send_requests(
+                requests,
+                max_concurrency=max_concurrency,
+                max_retries=max_retries,
+                min_interval=sleep_time,
+            )
+        )
+
+    async def _send_requests(
+        self,
+        requests: List[Tuple[str, str, Optional[Dict[str, Any]], Optional[str]]],
+        max_concurrency: int = 10,
+        max_retries: int = 5,
+        min_interval: float = None,
+    ) -> List[Dict[str, Any]]:
+        """Send requests concurrently and return their json responses, in input order.
 
-        async def generate_post():
-            for data_to_post in post_data_list:
-                payload = json.dumps(data_to_post)
-                async with aiohttp.ClientSession() as session:
-                    await semaphore.acquire()
-                    async with limiter:
-                        if method == "POST":
-                            async with session.post(
-                                url,
-                                headers=self.authorization_token,
-                                data=payload,
-                            ) as resp:
-                                global new_report
-                                new_report = await resp.read()
-                                self.logger.info(
-                                    f"Generated report export --- \n {payload}."
-                                )
-                                semaphore.release()
-                        elif method == "GET":
-                            async with session.get(
-                                url,
-                                headers=self.authorization_token,
-                                params=params,
-                            ) as resp:
-                                new_report = await resp.read()
-                                semaphore.release()
-                await asyncio.sleep(sleep_time)
-
-        loop = asyncio.get_event_loop()
-        coroutine = generate_post()
-        loop.run_until_complete(coroutine)
-
-        return json.loads(new_report.decode("utf-8"))
+        Args:
+            requests (List[Tuple[str, str, Optional[Dict[str, Any]], Optional[str]]]): The method, url,
+                params and body of each request.
+            max_concurrency (int, optional): The maximum number of requests in flight. Defaults to 10.
+            max_retries (int, optional): How many times to retry a request rejected with 429. Defaults to 5.
+            min_interval (float, optional): The minimum time, in seconds, between two requests. Defaults to None.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        if min_interval:
+            rate_limiter = RateLimiter(
+                rate=1 / min_interval, capacity=1, max_rate=1 / min_interval
+            )
+        else:
+            rate_limiter = RateLimiter(capacity=max_concurrency)
+
+        token_key, fetch_token = self._token_cache_entry()
+
+        async def send(session, method, url, params, body):
+            async with semaphore:
+                token_renewed = False
+                attempt = 0
+                while True:
+                    await rate_limiter.acquire()
+                    authorization = token_cache.get_or_fetch(token_key, fetch_token)
+                    async with session.request(
+                        method,
+                        url,
+                        headers=self._request_headers(authorization),
+                        params=params,
+                        data=body,
+                    ) as resp:
+                        rate_limiter.update(resp.headers)
+                        content = await resp.read()
+                        if resp.status == 401 and not token_renewed:
+                            self.logger.warning(
+                                "The access token was rejected. Retrying with a new token."
+                            )
+                            token_cache.invalidate(token_key, token=authorization)
+                            token_renewed = True
+                            continue
+                        if resp.status == 429 and attempt < max_retries:
+                            retry_after = float(resp.headers.get("Retry-After", 1))
+                            self.logger.warning(
+                                f"Rate limit exceeded. Retrying in {retry_after}s."
+                            )
+                            rate_limiter.pause(retry_after)
+                            attempt += 1
+                            continue
+                        if resp.status >= 400:
+                            raise APIError(
+                                f"The API call to {url} failed with status {resp.status}: "
+                                f"{content.decode('utf-8', errors='replace')}"
+                            )
+                        break
+                if method == "POST":
+                    self.logger.info(f"Generated report export --- \n {body}.")
+                return json.loads(content.decode("utf-8")) if content else None
+
+        connector = aiohttp.TCPConnector(limit=max_concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(
+                *(send(session, *request) for request in requests)
+            )
 
     def load_reporting_exports(self, page_size: int = 100, verbose: bool = False):
         """
@@ -206,9 +375,8 @@ class Genesys(Source):
         Returns:
             Dict[str, Any]: schedule genesys report.
         """
-        new_report = handle_api_response(
+        new_report = self._handle_api_response(
             url=f"https://api.{self.environment}/api/v2/analytics/reporting/exports?pageSize={page_size}",
-            headers=self.authorization_token,
             method="GET",
         )
 
@@ -231,19 +399,27 @@ class Genesys(Source):
             assert type(entities) == list
             if len(entities) != 0:
                 for entity in entities:
-                    tmp = [
-                        entity.get("id"),
-                        entity.get("downloadUrl"),
-                        entity.get("filter").get("queueIds", [-1])[0],
-                        entity.get("filter").get("mediaTypes", [-1])[0],
-                        entity.get("viewType"),
-                        entity.get("interval"),
-                        entity.get("status"),
-                    ]
-                    self.report_data.append(tmp)
+                    self.report_data.append(self._get_report_data(entity))
             assert len(self.report_data) > 0
         self.logger.info("Generated list of reports entities.")
 
+    @staticmethod
+    def _get_report_data(entity: Dict[str, Any]) -> List[Any]:
+        """Extract the metadata of a report from a reporting export entity.
+
+        Returns:
+            List[Any]: The ID, download URL, queue ID, media type, view type, interval and status of the report.
+        """
+        return [
+            entity.get("id"),
+            entity.get("downloadUrl"),
+            entity.get("filter").get("queueIds", [-1])[0],
+            entity.get("filter").get("mediaTypes", [-1])[0],
+            entity.get("viewType"),
+            entity.get("interval"),
+            entity.get("status"),
+        ]
+
     def download_report(
         self,
         report_url: str,
@@ -264,9 +440,7 @@ class Genesys(Source):
             sep (str, optional): Separator in csv file. Defaults to "\t".
             drop_duplicates (bool, optional): Decide if drop duplicates. Defaults to True.
         """
-        response_file = handle_api_response(
-            url=f"{report_url}", headers=self.authorization_token
-        )
+        response_file = self._handle_api_response(url=f"{report_url}")
         if output_file_name is None:
             final_file_name = f"Genesys_Queue_Metrics_Interval_Export.{file_extension}"
         else:
@@ -278,6 +452,42 @@ class Genesys(Source):
             df.drop_duplicates(inplace=True, ignore_index=True)
         df.to_csv(os.path.join(path, final_file_name), index=False, sep=sep)
 
+    def _get_report_file_name(self, single_report: List[Any]) -> Optional[str]:
+        """Get the name of the file to download a completed report to.
+
+        Args:
+            single_report (List[Any]): The metadata of the report, see `_get_report_data()`.
+
+        Returns:
+            Optional[str]: The file name, without extension, or None if the report doesn't
+            match the interval of this instance.
+        """
+        if self.start_date not in single_report[5]:
+            self.logger.warning(
+                f"The report with ID {single_report[0]} doesn't match with the interval date that you have already defined. \
+                    The report won't be downloaded but will be deleted."
+            )
+            return None
+
+        date = self.start_date.replace("-", "")
+        if single_report[4].lower() in [
+            "queue_performance_detail_view",
+            "queue_interaction_detail_view",
+            "agent_status_detail_view",
+            "agent_interaction_detail_view",
+            "agent_timeline_summary_view",
+        ]:
+            return f"{self.view_type.upper()}_{next(self.count)}_{date}"
+        elif single_report[4].lower() in [
+            "agent_performance_summary_view",
+            "agent_status_summary_view",
+        ]:
+            return self.view_type.upper() + "_" + f"{date}"
+        else:
+            raise signals.SKIP(
+                message=f"View type {self.view_type} not defined in viadot, yet..."
+            )
+
     def download_all_reporting_exports(
         self, store_file_names: bool = True, path: str = ""
     ) -> List[str]:
@@ -310,31 +520,10 @@ class Genesys(Source):
                     "This message 'FAILED_GETTING_DATA_FROM_SERVICE' raised during script execution."
                 )
                 continue
-            elif self.start_date not in single_report[5]:
-                self.logger.warning(
-                    f"The report with ID {single_report[0]} doesn't match with the interval date that you have already defined. \
-                        The report won't be downloaded but will be deleted."
-                )
-                continue
 
-            date = self.start_date.replace("-", "")
-            if single_report[4].lower() in [
-                "queue_performance_detail_view",
-                "queue_interaction_detail_view",
-                "agent_status_detail_view",
-                "agent_interaction_detail_view",
-                "agent_timeline_summary_view",
-            ]:
-                file_name = f"{self.view_type.upper()}_{next(self.count)}_{date}"
-            elif single_report[4].lower() in [
-                "agent_performance_summary_view",
-                "agent_status_summary_view",
-            ]:
-                file_name = self.view_type.upper() + "_" + f"{date}"
-            else:
-                raise signals.SKIP(
-                    message=f"View type {self.view_type} not defined in viadot, yet..."
-                )
+            file_name = self._get_report_file_name(single_report)
+            if file_name is None:
+                continue
 
             self.download_report(
                 report_url=single_report[1],
@@ -360,9 +549,8 @@ class Genesys(Source):
         Returns:
             delete_method.status_code: status code
         """
-        delete_method = handle_api_response(
+        delete_method = self._handle_api_response(
             url=f"https://api.{self.environment}/api/v2/analytics/reporting/exports/{report_id}",
-            headers=self.authorization_token,
             method="DELETE",
         )
         if delete_method.status_code < 300:
@@ -385,3 +573,122 @@ class Genesys(Source):
             assert status_code < 300
 
         self.logger.info("Successfully removed all reports.")
+
+    def process_reporting_exports(
+        self,
+        expected_count: int = 1,
+        path: str = "",
+        timeout: float = 600,
+        initial_delay: float = 1,
+        max_delay: float = 30,
+        max_workers: int = 4,
+    ) -> List[str]:
+        """
+        Wait for the reporting exports to be generated, downloading and deleting each
+        report as soon as it's completed, while polling for the others.
+
+        The exports are polled with exponential backoff and jitter, starting every
+        `initial_delay` seconds and slowing down to every `max_delay` seconds while none
+        of them changes status. Failed reports are deleted without being downloaded, and
+        the reports still running after `timeout` seconds are deleted as well.
+
+        Args:
+            expected_count (int, optional): The number of exports created, ie. which must be listed
+                before returning. Defaults to 1.
+            path (str, optional): Path to the downloaded files. Defaults to empty string.
+            timeout (float, optional): Maximum time, in seconds, to wait for the reports. Defaults to 600.
+            initial_delay (float, optional): Initial time, in seconds, between two polls. Defaults to 1.
+            max_delay (float, optional): Maximum time, in seconds, between two polls. Defaults to 30.
+            max_workers (int, optional): How many reports to download concurrently. Defaults to 4.
+
+        Returns:
+            List[str]: all file names of downloaded files
+        """
+        if self.ids_mapping is None:
+            self.logger.warning("IDS_MAPPING is not provided in you credentials.")
+
+        reports = {}
+        processed = set()
+        futures = []
+        deadline = time.monotonic() + timeout
+        delay = initial_delay
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                progress = False
+                request_json = self.load_reporting_exports() or {}
+                for entity in request_json.get("entities") or []:
+                    single_report = self._get_report_data(entity)
+                    report_id, download_url, status = (
+                        single_report[0],
+                        single_report[1],
+                        single_report[-1],
+                    )
+                    reports[report_id] = single_report
+                    is_done = status == "FAILED" or (
+                        status == "COMPLETED" and download_url is not None
+                    )
+                    if report_id in processed or not is_done:
+                        continue
+                    processed.add(report_id)
+                    progress = True
+                    futures.append(
+                        executor.submit(self._process_report, single_report, path)
+                    )
+
+                pending = [id_ for id_ in reports if id_ not in processed]
+                if len(reports) >= expected_count and not pending:
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.logger.warning(
+                        f"{len(pending)} report(s) still in progress after {timeout}s "
+                        "will be deleted, consider increasing the timeout."
+                    )
+                    for report_id in pending:
+                        futures.append(
+                            executor.submit(self.delete_reporting_exports, report_id)
+                        )
+                    break
+
+                delay = initial_delay if progress else min(delay * 2, max_delay)
+                time.sleep(min(remaining, delay / 2 + random.uniform(0, delay / 2)))
+
+            results = [future.result() for future in futures]
+
+        self.report_data = list(reports.values())
+        self.logger.info("All reports were successfully downloaded.")
+        # The deletions of the reports which timed out return status codes.
+        return [result for result in results if isinstance(result, str)]
+
+    def _process_report(
+        self, single_report: List[Any], path: str = ""
+    ) -> Optional[str]:
+        """
+        Download a completed report and delete it.
+
+        Args:
+            single_report (List[Any]): The metadata of the report, see `_get_report_data()`.
+            path (str, optional): Path to the downloaded file. Defaults to empty string.
+
+        Returns:
+            Optional[str]: The name of the downloaded file, or None if the report wasn't downloaded.
+        """
+        file_name = None
+        if single_report[-1] == "FAILED":
+            self.logger.warning(
+                f"The report with ID {single_report[0]} failed and will be deleted."
+            )
+        else:
+            file_name = self._get_report_file_name(single_report)
+            if file_name is not None:
+                self.download_report(
+                    report_url=single_report[1],
+                    path=path,
+                    output_file_name=file_name,
+                    file_extension=self.file_extension,
+                )
+                file_name = f"{file_name}.{self.file_extension}"
+        self.delete_reporting_exports(report_id=single_report[0])
+        return file_name
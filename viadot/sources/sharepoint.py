@@ -1,19 +1,27 @@
+import hashlib
+import json
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime
 from fnmatch import fnmatch
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
+from urllib.parse import quote
 
 import pandas as pd
+import requests
 import sharepy
 from office365.runtime.auth.authentication_context import AuthenticationContext
 from office365.runtime.client_request_exception import ClientRequestException
+from office365.runtime.http.request_options import RequestOptions
 from office365.sharepoint.client_context import ClientContext
 from prefect.utilities import logging
 
 from viadot.utils import get_nested_value
 
 from ..config import local_config
-from ..exceptions import CredentialError
+from ..exceptions import CredentialError, ValidationError
 from .base import Source
 
 logger = logging.get_logger()
@@ -24,6 +32,59 @@ def log_of_progress(items):
     logger.info("Items read: {0}".format(len(items)))
 
 
+def _strip_odata_metadata(value: Any) -> Any:
+    """Remove the OData metadata (eg. `__metadata`, `odata.type`) from a JSON object."""
+    if not isinstance(value, dict):
+        return value
+    return {
+        key: val
+        for key, val in value.items()
+        if not key.startswith(("__", "odata.", "@odata."))
+    }
+
+
+def _get_file_version(response: requests.Response) -> Dict[str, Any]:
+    """Get the version of a remote file (ETag, Last-Modified and size) from its headers."""
+    size = response.headers.get("Content-Length")
+    return {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "size": int(size) if size is not None else None,
+    }
+
+
+def _is_same_version(cached: Dict[str, Any], remote: Dict[str, Any]) -> bool:
+    """Whether the cached version of a file is the same as the remote one."""
+    if remote["etag"]:
+        return cached.get("etag") == remote["etag"]
+    if remote["last_modified"]:
+        return (
+            cached.get("last_modified") == remote["last_modified"]
+            and cached.get("size") == remote["size"]
+        )
+    return False
+
+
+def _read_download_cache(path: str) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_download_cache(path: str, version: Dict[str, Any]) -> None:
+    with open(path, "w") as f:
+        json.dump(version, f)
+
+
+def _file_digest(path: str, algorithm: str = "sha256") -> str:
+    file_hash = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
 class Sharepoint(Source):
     """
     A Sharepoint class to connect and download specific Excel file from Sharepoint.
@@ -66,21 +127,149 @@ class Sharepoint(Source):
         self,
         download_from_path: str = None,
         download_to_path: str = "Sharepoint_file.xlsm",
-    ) -> None:
+        chunk_size: int = 8 * 1024 * 1024,
+        checksum: str = None,
+        checksum_algorithm: str = "sha256",
+        skip_if_unchanged: bool = True,
+        max_retries: int = 3,
+    ) -> bool:
         """Function to download files from Sharepoint.
+
+        The file is streamed to disk in chunks of `chunk_size` bytes, requested with HTTP
+        range requests, into a `<download_to_path>.part` file. It's only renamed to
+        `download_to_path` once complete. If the transfer fails, the next chunks are requested
+        from where it stopped, up to `max_retries` times in a row, and an interrupted download
+        is resumed by the next call as long as the file hasn't changed on the server.
+
+        The ETag and Last-Modified headers of the downloaded file are cached in
+        `<download_to_path>.download.json`, so that a file which hasn't changed since the
+        last download is not downloaded again.
+
         Args:
             download_from_path (str): Path from which to download file. Defaults to None.
             download_to_path (str, optional): Path to destination file. Defaults to "Sharepoint_file.xlsm".
+            chunk_size (int, optional): The size of the range requests, in bytes. Defaults to 8 MiB.
+            checksum (str, optional): The expected hex digest of the file. Defaults to None.
+            checksum_algorithm (str, optional): The `hashlib` algorithm of `checksum`. Defaults to "sha256".
+            skip_if_unchanged (bool, optional): Whether to skip the download if the file hasn't
+                changed since it was last downloaded to `download_to_path`. Defaults to True.
+            max_retries (int, optional): How many times in a row to retry a failed chunk. Defaults to 3.
+
+        Returns:
+            bool: Whether the file was downloaded (False if it was unchanged).
         """
         download_from_path = download_from_path or self.url
         if not download_from_path:
             raise ValueError("Missing required parameter 'download_from_path'.")
 
         conn = self.get_connection()
-        conn.getfile(
-            url=download_from_path,
-            filename=download_to_path,
-        )
+        response = conn.head(download_from_path, allow_redirects=True)
+        response.raise_for_status()
+        remote = _get_file_version(response)
+
+        cache_path = download_to_path + ".download.json"
+        part_path = download_to_path + ".part"
+        cached = _read_download_cache(cache_path)
+        is_unchanged = _is_same_version(cached, remote)
+
+        if (
+            skip_if_unchanged
+            and is_unchanged
+            and cached.get("complete")
+            and os.path.exists(download_to_path)
+            and os.path.getsize(download_to_path) == cached.get("size")
+        ):
+            logger.info(f"{download_to_path} is up to date. Skipping the download.")
+            return False
+
+        if not (is_unchanged and os.path.exists(part_path)):
+            # The partial file, if any, is from another version of the file.
+            with open(part_path, "wb"):
+                pass
+        _write_download_cache(cache_path, dict(remote, complete=False))
+
+        size = remote["size"]
+        retries = 0
+        while size is None or os.path.getsize(part_path) < size:
+            offset = os.path.getsize(part_path)
+            try:
+                is_complete = self._download_range(
+                    conn,
+                    url=download_from_path,
+                    part_path=part_path,
+                    offset=offset,
+                    chunk_size=chunk_size if size is not None else None,
+                    version=remote,
+                )
+            except (
+                requests.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+                requests.Timeout,
+            ) as e:
+                # Only count the consecutive failures which didn't make any progress.
+                retries = 0 if os.path.getsize(part_path) > offset else retries + 1
+                if retries > max_retries:
+                    raise
+                logger.warning(
+                    f"Downloading {download_from_path} failed at byte "
+                    f"{os.path.getsize(part_path)} ({e}). Resuming..."
+                )
+                continue
+            retries = 0
+            if is_complete:
+                break
+
+        if checksum:
+            digest = _file_digest(part_path, algorithm=checksum_algorithm)
+            if digest.lower() != checksum.lower():
+                os.remove(part_path)
+                raise ValidationError(
+                    f"The {checksum_algorithm} checksum of {download_from_path} "
+                    f"({digest}) doesn't match the expected one ({checksum})."
+                )
+
+        os.replace(part_path, download_to_path)
+        remote["size"] = os.path.getsize(download_to_path)
+        _write_download_cache(cache_path, dict(remote, complete=True))
+        logger.info(f"Downloaded {download_from_path} to {download_to_path}.")
+        return True
+
+    @staticmethod
+    def _download_range(
+        conn: requests.Session,
+        url: str,
+        part_path: str,
+        offset: int,
+        chunk_size: int = None,
+        version: Dict[str, Any] = None,
+    ) -> bool:
+        """Append the bytes of the file starting at `offset` to `part_path`.
+
+        Returns:
+            bool: Whether the whole file has been downloaded.
+        """
+        headers = {}
+        if chunk_size:
+            headers["Range"] = f"bytes={offset}-{offset + chunk_size - 1}"
+        elif offset:
+            headers["Range"] = f"bytes={offset}-"
+        if headers and (version.get("etag") or version.get("last_modified")):
+            # Get the whole file rather than a range of another version of the file.
+            headers["If-Range"] = version.get("etag") or version["last_modified"]
+
+        with conn.get(url, headers=headers, stream=True) as response:
+            if response.status_code == 416:
+                return True
+            response.raise_for_status()
+            if response.status_code != 206:
+                # The server doesn't support ranges, or the file has changed.
+                offset = 0
+            with open(part_path, "r+b") as f:
+                f.seek(offset)
+                f.truncate()
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+            return response.status_code != 206
 
 
 class SharepointList(Source):
@@ -196,6 +385,256 @@ class SharepointList(Source):
             )
         return new_dict
 
+    def _get_unpacker(self, field: str, selected_fields: dict) -> Callable[[Any], Any]:
+        """Return the function unpacking the values of a field, based on its type, in the same
+        way as `_unpack_fields()`.
+
+        Args:
+            field (str): The internal name of the field.
+            selected_fields (dict): A dict with fields selected for ingestion, generated by SharepointList.select_fields()
+
+        Returns:
+            Callable[[Any], Any]: The function unpacking a single value.
+        """
+        if field in selected_fields["FieldToExpand"]:
+            field_property = selected_fields["FieldExpandProperty"]
+
+            def _unpack(value):
+                value = _strip_odata_metadata(value)
+                if not value:
+                    return None
+                nested_value = value.get(field_property)
+                if nested_value is None:
+                    raise ValueError("Check if given field property is valid!")
+                return nested_value
+
+        elif field in selected_fields["MultiChoiceField"]:
+
+            def _unpack(value):
+                value = _strip_odata_metadata(value)
+                if not value:
+                    return None
+                if isinstance(value, dict):
+                    value = value.get("results", list(value.values()))
+                return ";".join(value)
+
+        else:
+
+            def _unpack(value):
+                if isinstance(value, dict):
+                    if _strip_odata_metadata(value):
+                        raise ValueError(
+                            "Get nested dict for not recognized type of field! Check field types in the source."
+                        )
+                    return None
+                return value
+
+        return _unpack
+
+    def _get_items_page(self, url: str) -> Tuple[List[dict], Union[str, None]]:
+        """Get a page of list items as JSON objects.
+
+        Args:
+            url (str): The URL of the page.
+
+        Returns:
+            Tuple[List[dict], Union[str, None]]: The items and the URL of the next page, if any.
+        """
+        response = self.ctx.pending_request().execute_request_direct(
+            RequestOptions(url)
+        )
+        response.raise_for_status()
+        data = response.json()
+        if "d" in data:
+            data = data["d"]
+            if isinstance(data, list):
+                return data, None
+            return data.get("results", []), data.get("__next")
+        next_url = data.get("odata.nextLink", data.get("@odata.nextLink"))
+        return data.get("value", []), next_url
+
+    def _items_url(self, site_url: str, list_title: str, **query_options) -> str:
+        """Build the URL of a list items REST API request.
+
+        Args:
+            site_url (str): URL to the sharepoint list.
+            list_title (str): Name of the sharepoint list.
+            query_options: The OData query options, eg. `top=100` for `$top=100`.
+
+        Returns:
+            str: The URL.
+        """
+        list_title = quote(list_title.replace("'", "''"))
+        url = f"{site_url.rstrip('/')}/_api/web/lists/GetByTitle('{list_title}')/items"
+        query = "&".join(
+            f"${option}={value}" for option, value in query_options.items() if value
+        )
+        return f"{url}?{query}"
+
+    def _items_to_df(
+        self, pages: Iterator[List[dict]], selected_fields: dict
+    ) -> pd.DataFrame:
+        """Unpack pages of list items straight into the columns of a DataFrame, releasing
+        each page once it's unpacked.
+
+        Args:
+            pages (Iterator[List[dict]]): The pages of items, as JSON objects.
+            selected_fields (dict): A dict with fields selected for ingestion, generated by SharepointList.select_fields()
+
+        Returns:
+            pd.DataFrame: The list items.
+        """
+        columns: Dict[str, List[Any]] = {}
+        unpackers: Dict[str, Callable[[Any], Any]] = {}
+        n_rows = 0
+        for page in pages:
+            items = [_strip_odata_metadata(item) for item in page]
+            if not items:
+                continue
+            page_fields = list(dict.fromkeys(key for item in items for key in item))
+            for field in page_fields:
+                if field not in unpackers:
+                    unpackers[field] = self._get_unpacker(field, selected_fields)
+                    columns[field] = [None] * n_rows
+                unpack = unpackers[field]
+                columns[field].extend(unpack(item.get(field)) for item in items)
+            for field in columns.keys() - set(page_fields):
+                columns[field].extend([None] * len(items))
+            n_rows += len(items)
+            logger.info(f"Items read: {n_rows}")
+        return pd.DataFrame(columns)
+
+    def get_all_items_df(
+        self,
+        list_title: str,
+        site_url: str,
+        selected_fields: dict,
+        row_count: int = 5000,
+        max_workers: int = 4,
+        modified_since: str = None,
+    ) -> pd.DataFrame:
+        """
+        Download all items of a list into a DataFrame. The list is split into pages of item IDs,
+        requested concurrently with `$skiptoken`, and each page is unpacked into the columns of the
+        DataFrame as soon as it's downloaded, in ID order, so that at most `max_workers` pages are
+        held in memory.
+
+        If `modified_since` is provided, only the items modified since then are requested, with a
+        server-side `$filter` on the `Modified` column, following the pages one by one. On lists
+        above the view threshold, the `Modified` column must be indexed.
+
+        Args:
+            list_title (str): Name of the sharepoint list.
+            site_url (str): URL to the sharepoint list.
+            selected_fields (dict): A dict with fields selected for ingestion, generated by SharepointList.select_fields()
+            row_count (int, optional): The maximum number of items in a page. Defaults to 5000.
+            max_workers (int, optional): The maximum number of pages downloaded concurrently. Defaults to 4.
+            modified_since (str, optional): Only get the items modified at or after this ISO 8601 timestamp,
+                eg. "2023-05-01T10:00:00Z". Defaults to None.
+
+        Returns:
+            pd.DataFrame: The list items.
+        """
+        fields = selected_fields["FieldInternalNames"]
+        added_fields = [field for field in ["ID", "Modified"] if field not in fields]
+        if modified_since is None:
+            added_fields.remove("Modified")
+        select = ",".join(fields + added_fields)
+        expand = ",".join(selected_fields["FieldToExpand"])
+
+        if modified_since is not None:
+            pages = self._iter_modified_pages(
+                list_title=list_title,
+                site_url=site_url,
+                select=select,
+                expand=expand,
+                row_count=row_count,
+                modified_since=modified_since,
+            )
+        else:
+            pages = self._iter_pages_concurrently(
+                list_title=list_title,
+                site_url=site_url,
+                select=select,
+                expand=expand,
+                row_count=row_count,
+                max_workers=max_workers,
+            )
+
+        df = self._items_to_df(pages, selected_fields)
+        return df.drop(columns=added_fields, errors="ignore")
+
+    def _iter_pages_concurrently(
+        self,
+        list_title: str,
+        site_url: str,
+        select: str,
+        expand: str,
+        row_count: int,
+        max_workers: int,
+    ) -> Iterator[List[dict]]:
+        # The ID column is indexed, so sorting by it works on lists above the view threshold.
+        last_item, _ = self._get_items_page(
+            self._items_url(site_url, list_title, select="ID", orderby="ID desc", top=1)
+        )
+        if not last_item:
+            return
+        max_id = last_item[0].get("ID", last_item[0].get("Id"))
+
+        def _get_page(start: int) -> List[dict]:
+            url = self._items_url(
+                site_url,
+                list_title,
+                select=select,
+                expand=expand,
+                top=row_count,
+                skiptoken=f"Paged%3DTRUE%26p_ID%3D{start}",
+            )
+            items, _ = self._get_items_page(url)
+            # A page holds the items with IDs in (start, start + row_count].
+            return [
+                item
+                for item in items
+                if item.get("ID", item.get("Id")) <= start + row_count
+            ]
+
+        starts = iter(range(0, max_id, row_count))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = deque(
+                executor.submit(_get_page, start)
+                for _, start in zip(range(max_workers), starts)
+            )
+            while pages:
+                page = pages.popleft().result()
+                next_start = next(starts, None)
+                if next_start is not None:
+                    pages.append(executor.submit(_get_page, next_start))
+                yield page
+
+    def _iter_modified_pages(
+        self,
+        list_title: str,
+        site_url: str,
+        select: str,
+        expand: str,
+        row_count: int,
+        modified_since: str,
+    ) -> Iterator[List[dict]]:
+        # `ge` rather than `gt`, as `Modified` is only precise to the second.
+        # The items modified within the same second are downloaded twice and
+        # deduplicated by ID when merged.
+        url = self._items_url(
+            site_url,
+            list_title,
+            select=select,
+            expand=expand,
+            filter=quote(f"Modified ge datetime'{modified_since}'"),
+            top=row_count,
+        )
+        while url:
+            items, url = self._get_items_page(url)
+            yield items
+
     def get_fields(
         self,
         list_title: str,
@@ -580,6 +1019,8 @@ class SharepointList(Source):
         field_property: str = "Title",
         filters: dict = None,
         row_count: int = 5000,
+        max_workers: int = 4,
+        modified_since: str = None,
     ):
         """
         Method to extract data from Sharepoint List into DataFrame.
@@ -620,6 +1061,11 @@ class SharepointList(Source):
                                     },
                             }
             row_count (int): Number of downloaded rows in single request. Default to 5000.
+            max_workers (int): The maximum number of requests sent concurrently when downloading all the data.
+                Default to 4.
+            modified_since (str, optional): Only extract the items modified at or after this ISO 8601 timestamp,
+                with a server-side filter on the `Modified` column. The `filters` are then applied on DataFrame
+                level. Default to None.
 
         Raises:
             AttributeError: If filter column not included inside required fields list.
@@ -652,37 +1098,55 @@ class SharepointList(Source):
             field_property=field_property,
         )
 
-        try:
-            # Extract data below 5k rows or max limitation of the specific SP List with basic filtering.
-            if filters is None:
-                raise ValueError("There is no filter. Switching to extract all fields.")
-            else:
-                list_items = (
-                    self.list_object.items.filter(filter_text)
-                    .select(selected_fields["FieldInternalNames"])
-                    .top(row_count)
-                    .expand(selected_fields["FieldToExpand"])
-                )
-            self.ctx.load(list_items)
-            self.ctx.execute_query()
-
-        except (ClientRequestException, ValueError) as e:
-            # Extract all data from specific SP List without basic filtering. Additional logic for filtering applied on DataFrame level.
-            logger.info(f"Exception SPQueryThrottledException occurred: {e}")
-            list_items = (
-                self.list_object.items.get_all(row_count, log_of_progress)
-                .select(selected_fields["FieldInternalNames"])
-                .expand(selected_fields["FieldToExpand"])
+        if modified_since is not None:
+            # Incremental extraction: the filters are applied on DataFrame level.
+            logger.info(f"Extracting the items modified since {modified_since}.")
+            df = self.get_all_items_df(
+                list_title=list_title,
+                site_url=site_url,
+                selected_fields=selected_fields,
+                row_count=row_count,
+                modified_since=modified_since,
             )
-            self.ctx.load(list_items)
-            self.ctx.execute_query()
             download_all = True
+        else:
+            try:
+                # Extract data below 5k rows or max limitation of the specific SP List with basic filtering.
+                if filters is None:
+                    raise ValueError(
+                        "There is no filter. Switching to extract all fields."
+                    )
+                else:
+                    list_items = (
+                        self.list_object.items.filter(filter_text)
+                        .select(selected_fields["FieldInternalNames"])
+                        .top(row_count)
+                        .expand(selected_fields["FieldToExpand"])
+                    )
+                self.ctx.load(list_items)
+                self.ctx.execute_query()
+
+            except (ClientRequestException, ValueError) as e:
+                # Extract all data from specific SP List without basic filtering. Additional logic for filtering applied on DataFrame level.
+                logger.info(f"Exception SPQueryThrottledException occurred: {e}")
+                df = self.get_all_items_df(
+                    list_title=list_title,
+                    site_url=site_url,
+                    selected_fields=selected_fields,
+                    row_count=row_count,
+                    max_workers=max_workers,
+                )
+                download_all = True
+
+        if not download_all:
+            df = pd.DataFrame(
+                [
+                    self._unpack_fields(row_item, selected_fields)
+                    for row_item in list_items
+                ]
+            )
 
-        df = pd.DataFrame(
-            [self._unpack_fields(row_item, selected_fields) for row_item in list_items]
-        )
-
-        if download_all == True and filters is not None:
+        if download_all == True and filters is not None and not df.empty:
             # Apply filters to the data frame -> accordingly to the filter dict passed as na parameter
             self.logger.info("Filtering df with all data output")
             filter_for_df = self.make_filter_for_df(filters)
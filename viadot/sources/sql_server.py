@@ -1,9 +1,83 @@
 import struct
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import Any, Dict, List, Sequence, Tuple
 
+import numpy as np
+import pandas as pd
+import pyodbc
+
+from ..utils import get_sql_server_table_columns
 from .base import SQL
 
+# The ODBC type code and memory layout of SQL Server's DATETIMEOFFSET
+# (SQL_SS_TIMESTAMPOFFSET_STRUCT).
+SQL_SS_TIMESTAMPOFFSET = -155
+DATETIMEOFFSET_DTYPE = np.dtype(
+    [
+        ("year", "<i2"),
+        ("month", "<u2"),
+        ("day", "<u2"),
+        ("hour", "<u2"),
+        ("minute", "<u2"),
+        ("second", "<u2"),
+        ("nanoseconds", "<u4"),
+        ("offset_hours", "<i2"),
+        ("offset_minutes", "<i2"),
+    ]
+)
+# datetime64[ns] only covers the years 1677-2262.
+_DATETIME64_NS_YEARS = (1678, 2261)
+
+
+class _DatetimeOffsetBytes(bytes):
+    """The raw value of a DATETIMEOFFSET cell, marked for bulk decoding."""
+
+
+def decode_datetimeoffset(values: Sequence[bytes]) -> Tuple[np.ndarray, np.ndarray]:
+    """Decode raw SQL Server DATETIMEOFFSET values in a single vectorized step.
+
+    Args:
+        values (Sequence[bytes]): The raw 20-byte values, as returned by ODBC. Missing
+        values (None) are decoded as NaT.
+
+    Raises:
+        ValueError: If any of the dates can't be represented as `datetime64[ns]`.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The UTC timestamps as `datetime64[ns]`, and the
+        UTC offsets in minutes.
+    """
+    is_null = np.fromiter((value is None for value in values), bool, len(values))
+    null_value = bytes(DATETIMEOFFSET_DTYPE.itemsize)
+    buffer = b"".join(null_value if value is None else value for value in values)
+    raw = np.frombuffer(buffer, dtype=DATETIMEOFFSET_DTYPE)
+
+    years = raw["year"][~is_null]
+    if years.size and (
+        years.min() < _DATETIME64_NS_YEARS[0] or years.max() > _DATETIME64_NS_YEARS[1]
+    ):
+        raise ValueError("The dates are out of the datetime64[ns] range.")
+
+    months = (raw["year"].astype("i8") - 1970) * 12 + raw["month"] - 1
+    days = months.astype("datetime64[M]").astype("datetime64[D]") + (
+        raw["day"].astype("i8") - 1
+    ).astype("timedelta64[D]")
+    offsets = raw["offset_hours"].astype("i8") * 60 + raw["offset_minutes"]
+    # The date and time are local, so the offset is subtracted to get UTC.
+    seconds = (
+        raw["hour"].astype("i8") * 3600
+        + raw["minute"].astype("i8") * 60
+        + raw["second"]
+        - offsets * 60
+    )
+    timestamps = (
+        days.astype("datetime64[ns]")
+        + seconds.astype("timedelta64[s]")
+        + raw["nanoseconds"].astype("timedelta64[ns]")
+    )
+    timestamps[is_null] = np.datetime64("NaT")
+    return timestamps, offsets.astype("i2")
+
 
 class SQLServer(SQL):
     DEFAULT_SCHEMA = "dbo"
@@ -16,7 +90,11 @@ class SQLServer(SQL):
         **kwargs,
     ):
         super().__init__(*args, driver=driver, config_key=config_key, **kwargs)
-        self.con.add_output_converter(-155, self._handle_datetimeoffset)
+
+    def _connect(self) -> pyodbc.Connection:
+        con = super()._connect()
+        con.add_output_converter(SQL_SS_TIMESTAMPOFFSET, self._handle_datetimeoffset)
+        return con
 
     @property
     def schemas(self) -> List[str]:
@@ -63,6 +141,98 @@ class SQLServer(SQL):
         )
         return dt
 
+    def to_df(
+        self,
+        query: str,
+        con: pyodbc.Connection = None,
+        if_empty: str = None,
+        params: Sequence[Any] = None,
+        utc_datetimeoffset: bool = False,
+        chunksize: int = 100_000,
+    ) -> pd.DataFrame:
+        """Creates DataFrame form SQL query.
+
+        Args:
+            query (str): SQL query. If don't start with "SELECT" returns empty DataFrame.
+            con (pyodbc.Connection, optional): The connection to use to pull the data.
+            if_empty (str, optional): What to do if the query returns no data. Defaults to None.
+            params (Sequence[Any], optional): Values of the `?` parameters of the query. Defaults to None.
+            utc_datetimeoffset (bool, optional): Whether to decode DATETIMEOFFSET columns in bulk
+            into UTC timestamps (`datetime64[ns, UTC]`), instead of into a `datetime` with its own
+            timezone per value. Much faster for large results. Columns with dates out of the
+            `datetime64[ns]` range are decoded per value. Defaults to False.
+            chunksize (int, optional): The number of rows fetched at a time when
+            `utc_datetimeoffset` is set. Defaults to 100 000.
+        """
+        if not utc_datetimeoffset:
+            return super().to_df(query=query, con=con, if_empty=if_empty, params=params)
+
+        query_sanitized = query.strip().upper()
+        if not (
+            query_sanitized.startswith("SELECT") or query_sanitized.startswith("WITH")
+        ):
+            return pd.DataFrame()
+
+        conn = con or self.con
+        conn.add_output_converter(SQL_SS_TIMESTAMPOFFSET, _DatetimeOffsetBytes)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(query, *(params or []))
+            columns = [column[0] for column in cursor.description]
+            chunks = []
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                chunks.append(
+                    pd.DataFrame.from_records(
+                        [tuple(row) for row in rows], columns=columns
+                    )
+                )
+            cursor.close()
+        finally:
+            conn.add_output_converter(
+                SQL_SS_TIMESTAMPOFFSET, self._handle_datetimeoffset
+            )
+
+        if chunks:
+            # Decode each column once, so that its dtype doesn't depend on where the
+            # chunks split, eg. when a chunk has only NULLs or out-of-range dates.
+            df = self._decode_datetimeoffset_columns(
+                pd.concat(chunks, ignore_index=True)
+            )
+        else:
+            df = pd.DataFrame(columns=columns)
+        if df.empty:
+            self._handle_if_empty(if_empty=if_empty)
+        return df
+
+    def _decode_datetimeoffset_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        for column in df.columns:
+            values = df[column]
+            first_valid_index = values.first_valid_index()
+            if first_valid_index is None or not isinstance(
+                values[first_valid_index], _DatetimeOffsetBytes
+            ):
+                continue
+            values = values.where(values.notna(), None).tolist()
+            try:
+                timestamps, _ = decode_datetimeoffset(values)
+                df[column] = pd.Series(timestamps, index=df.index).dt.tz_localize("UTC")
+            except ValueError:
+                df[column] = [
+                    None if value is None else self._handle_datetimeoffset(value)
+                    for value in values
+                ]
+        return df
+
+    def _fetch_table_metadata(
+        self, table: str, schema: str = None
+    ) -> List[Dict[str, Any]]:
+        return get_sql_server_table_columns(
+            table=table, con=self.con, schema=schema, use_cache=False
+        )
+
     def exists(self, table: str, schema: str = None) -> bool:
         """Check whether a table exists.
         Args:
@@ -75,12 +245,19 @@ class SQLServer(SQL):
         if not schema:
             schema = self.DEFAULT_SCHEMA
 
-        list_table_info_query = f"""
-            SELECT *
-            FROM sys.tables t
-            JOIN sys.schemas s
-                ON t.schema_id = s.schema_id
-            WHERE s.name = '{schema}' AND t.name = '{table}'
+        return bool(self.get_table_metadata(table=table, schema=schema))
+
+    def _check_if_table_exists(self, table: str, schema: str = None) -> bool:
+        """Checks if table or view exists.
+        Args:
+            table (str): Table or view name.
+            schema (str, optional): Schema name. Defaults to None.
+        """
+        # The table metadata only covers tables, so views are looked up separately.
+        if super()._check_if_table_exists(table=table, schema=schema):
+            return True
+        query = f"""
+        SELECT * FROM INFORMATION_SCHEMA.VIEWS
+        WHERE TABLE_SCHEMA = '{schema}' AND TABLE_NAME = '{table}'
         """
-        exists = bool(self.run(list_table_info_query))
-        return exists
+        return bool(self.run(query))
@@ -1,3 +1,6 @@
+import re
+from typing import Any, Dict, List
+
 from .base import SQL
 
 
@@ -39,15 +42,30 @@ class SQLite(SQL):
 
         return conn_str
 
-    def _check_if_table_exists(self, table: str, schema: str = None) -> bool:
-        """Checks if table exists.
-        Args:
-            table (str): Table name.
-            schema (str, optional): Schema name. Defaults to None.
-        """
+    def _fetch_table_metadata(
+        self, table: str, schema: str = None
+    ) -> List[Dict[str, Any]]:
         fqn = f"{schema}.{table}" if schema is not None else table
         exists_query = (
             f"SELECT name FROM sqlite_master WHERE type='table' AND name='{fqn}'"
         )
-        exists = bool(self.run(exists_query))
-        return exists
+        if not self.run(exists_query):
+            return []
+
+        columns = []
+        # PRAGMA doesn't start with SELECT, so `run()` wouldn't fetch its result.
+        cursor = self.con.cursor()
+        for _, name, dtype, _, _, pk in cursor.execute(
+            f"PRAGMA table_info('{fqn}')"
+        ).fetchall():
+            length = re.search(r"\((\d+)\)", dtype)
+            columns.append(
+                dict(
+                    name=name,
+                    type=dtype.split("(")[0].lower(),
+                    max_length=int(length.group(1)) if length else None,
+                    is_key=bool(pk),
+                )
+            )
+        cursor.close()
+        return columns
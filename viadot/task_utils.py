@@ -1,12 +1,11 @@
 import copy
 import json
 import os
-import re
 import shutil
 import pendulum
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, List, Literal, Union, cast, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Union, cast, Tuple
 
 import pandas as pd
 import prefect
@@ -27,7 +26,9 @@ from visions.typesets.complete_set import CompleteSet
 
 from viadot.config import local_config
 from viadot.exceptions import CredentialError, ValidationError
-from viadot.tasks import AzureDataLakeUpload, AzureKeyVaultSecret
+from viadot.tasks import AzureDataLakeToDF, AzureDataLakeUpload, AzureKeyVaultSecret
+from viadot.utils import DFStreamValidator, merge_df_with_snapshot
+from viadot.watermarks import WatermarkStore, get_watermark_store
 
 
 logger = logging.get_logger()
@@ -518,6 +519,75 @@ def set_new_kv(kv_name: str, df: pd.DataFrame, filter_column: str):
         set_key_value(key=kv_name, value=new_value)
 
 
+@task(timeout=3600)
+def set_watermark(
+    df: pd.DataFrame,
+    column: str,
+    key: str,
+    store: Union[str, WatermarkStore] = "local",
+):
+    """
+    Task for committing the watermark of an incremental extraction, based on the newest
+    value of `column` in the extracted DataFrame. It should run downstream of the task
+    loading the data, so that the watermark only moves forward once the load succeeded.
+
+    Args:
+        df (pd.DataFrame): The extracted DataFrame.
+        column (str): The column tracking changes, eg. a `rowversion` column.
+        key (str): The key of the watermark.
+        store (Union[str, WatermarkStore], optional): The store holding the watermark: "local",
+            "duckdb", "prefect" (the Prefect KV Store) or a `WatermarkStore`. Defaults to "local".
+    """
+    if df.empty:
+        logger.warning("Input DataFrame is empty. The watermark was not updated.")
+        return
+    get_watermark_store(store).set(key, df[column].max())
+
+
+@task(timeout=3600)
+def merge_with_adls_snapshot(
+    df: pd.DataFrame,
+    path: str,
+    key_columns: List[str],
+    sep: str = "\t",
+    sp_credentials_secret: str = None,
+    vault_name: str = None,
+) -> pd.DataFrame:
+    """
+    Task for merging the rows changed since the last incremental extraction into the
+    previous snapshot of the data stored in ADLS. The rows of the snapshot with the same key
+    as a changed row are replaced, and new rows are appended.
+
+    Args:
+        df (pd.DataFrame): The changed rows.
+        path (str): The path to the snapshot (a CSV or Parquet file) in ADLS.
+        key_columns (List[str]): The columns identifying a row, eg. `["ID"]`.
+        sep (str, optional): The separator of the CSV file. Defaults to "\t".
+        sp_credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary with
+            ACCOUNT_NAME and Service Principal credentials (TENANT_ID, CLIENT_ID, CLIENT_SECRET). Defaults to None.
+        vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
+
+    Returns:
+        pd.DataFrame: The new snapshot.
+    """
+    try:
+        snapshot = AzureDataLakeToDF().run(
+            path=path,
+            sep=sep,
+            sp_credentials_secret=sp_credentials_secret,
+            vault_name=vault_name,
+        )
+    except FileNotFoundError:
+        logger.info(f"No snapshot found at {path}. Using the extracted data.")
+        return df
+
+    merged = merge_df_with_snapshot(snapshot, df, key_columns=key_columns)
+    logger.info(
+        f"Merged {len(df)} changed rows into the snapshot of {len(snapshot)} rows."
+    )
+    return merged
+
+
 class Git(Git):
     @property
     def git_clone_url(self):
@@ -577,8 +647,12 @@ def adls_bulk_upload(
     adls_sp_credentials_secret: str = None,
     adls_overwrite: bool = True,
     timeout: int = 3600,
-) -> None:
+    max_workers: int = 8,
+) -> Dict[str, Any]:
     """Function that upload files to defined path in ADLS.
+
+    The files are uploaded concurrently, authenticating and creating the ADLS client only once.
+
     Args:
         file_names (List[str]): List of file names to generate paths.
         file_name_relative_path (str, optional): Path where to save the file locally. Defaults to ''.
@@ -588,17 +662,22 @@ def adls_bulk_upload(
         adls_overwrite (bool, optional): Whether to overwrite files in the data lake. Defaults to True.
         timeout (int, optional): The amount of time (in seconds) to wait while running this task before
             a timeout occurs. Defaults to 3600.
+        max_workers (int, optional): The maximum number of files uploaded concurrently. Defaults to 8.
+
+    Returns:
+        Dict[str, Any]: The upload summary returned by `AzureDataLakeUpload`, with the per-file results
+        and the throughput.
     """
 
     file_to_adls_task = AzureDataLakeUpload(timeout=timeout)
 
-    for file in file_names:
-        file_to_adls_task.run(
-            from_path=os.path.join(file_name_relative_path, file),
-            to_path=os.path.join(adls_file_path, file),
-            sp_credentials_secret=adls_sp_credentials_secret,
-            overwrite=adls_overwrite,
-        )
+    return file_to_adls_task.run(
+        from_path=[os.path.join(file_name_relative_path, file) for file in file_names],
+        to_path=[os.path.join(adls_file_path, file) for file in file_names],
+        sp_credentials_secret=adls_sp_credentials_secret,
+        overwrite=adls_overwrite,
+        max_workers=max_workers,
+    )
 
 
 @task(timeout=3600)
@@ -693,108 +772,12 @@ def validate_df(df: pd.DataFrame, tests: dict = None) -> None:
     Raises:
         ValidationError: If validation failed for at least one test.
     """
-    failed_tests = 0
-    failed_tests_list = []
-
-    if tests is not None:
-        if "column_size" in tests:
-            try:
-                for k, v in tests["column_size"].items():
-                    column_max_length = (
-                        df.astype(str).apply(lambda s: s.str.len()).max().to_dict()
-                    )
-                    try:
-                        if v == column_max_length[k]:
-                            logger.info(f"[column_size] for {k} passed.")
-                        else:
-                            logger.error(
-                                f"[column_size] test for {k} failed. field lenght is different than {v}"
-                            )
-                            failed_tests += 1
-                            failed_tests_list.append("column_size error")
-                    except Exception as e:
-                        logger.error(f"{e}")
-            except TypeError as e:
-                logger.error(
-                    "Please provide `column_size` parameter as dictionary {'columns': value}."
-                )
-
-        if "column_unique_values" in tests:
-            for column in tests["column_unique_values"]:
-                df_size = df.shape[0]
-                if df[column].nunique() == df_size:
-                    logger.info(
-                        f"[column_unique_values] Values are unique for {column} column."
-                    )
-                else:
-                    failed_tests += 1
-                    failed_tests_list.append("column_unique_values error")
-                    logger.error(
-                        f"[column_unique_values] Values for {column} are not unique."
-                    )
-
-        if "column_list_to_match" in tests:
-            if set(tests["column_list_to_match"]) == set(df.columns):
-                logger.info(f"[column_list_to_match] passed.")
-            else:
-                failed_tests += 1
-                failed_tests_list.append("column_list_to_match error")
-                logger.error(
-                    "[column_list_to_match] failed. Columns are different than expected."
-                )
-
-        if "dataset_row_count" in tests:
-            row_count = len(df.iloc[:, 0])
-            max_value = tests["dataset_row_count"]["max"] or 100_000_000
-            min_value = tests["dataset_row_count"]["min"] or 0
-
-            if (row_count > min_value) and (row_count < max_value):
-                logger.info("[dataset_row_count] passed.")
-            else:
-                failed_tests += 1
-                failed_tests_list.append("dataset_row_count error")
-                logger.error(
-                    f"[dataset_row_count] Row count ({row_count}) is not between {min_value} and {max_value}."
-                )
-
-        if "column_match_regex" in tests:
-            for k, v in tests["column_match_regex"].items():
-                try:
-                    matches = df[k].apply(lambda x: bool(re.match(v, str(x))))
-                    if all(matches):
-                        logger.info(f"[column_match_regex] on {k} column passed.")
-                    else:
-                        failed_tests += 1
-                        failed_tests_list.append("column_match_regex error")
-                        logger.error(f"[column_match_regex] on {k} column failed!")
-                except Exception as e:
-                    failed_tests += 1
-                    failed_tests_list.append("column_match_regex error")
-                    logger.error(f"[column_match_regex] Error in {k} column: {e}")
-
-        if "column_sum" in tests:
-            for column, bounds in tests["column_sum"].items():
-                col_sum = df[column].sum()
-                min_bound = bounds["min"]
-                max_bound = bounds["max"]
-                if min_bound <= col_sum <= max_bound:
-                    logger.info(
-                        f"[column_sum] Sum of {col_sum} for {column} is within the expected range."
-                    )
-                else:
-                    failed_tests += 1
-                    failed_tests_list.append("column_sum error")
-                    logger.error(
-                        f"[column_sum] Sum of {col_sum} for {column} is out of the expected range - <{min_bound}:{max_bound}>"
-                    )
-    else:
+    if tests is None:
         return "No dataframe tests to run."
 
-    if failed_tests > 0:
-        failed_tests_msg = ", ".join(failed_tests_list)
-        raise ValidationError(
-            f"Validation failed for {failed_tests} test/tests: {failed_tests_msg}"
-        )
+    validator = DFStreamValidator(tests)
+    validator.update(df)
+    validator.validate()
 
 
 @task(timeout=3600, slug="check_df")
@@ -5,6 +5,7 @@ from .azure_data_lake import (
     AzureDataLakeDownload,
     AzureDataLakeList,
     AzureDataLakeRemove,
+    AzureDataLakeToAzureSQLStream,
     AzureDataLakeToDF,
     AzureDataLakeUpload,
 )
@@ -47,7 +48,13 @@ except ImportError:
 
 from .business_core import BusinessCoreToParquet
 from .customer_gauge import CustomerGaugeToDF
-from .duckdb import DuckDBCreateTableFromParquet, DuckDBQuery, DuckDBToDF
+from .duckdb import (
+    DuckDBCreateTableFromParquet,
+    DuckDBQuery,
+    DuckDBRunScripts,
+    DuckDBToDF,
+    DuckDBToSQLServerStream,
+)
 from .epicor import EpicorOrdersToDF
 from .eurostat import EurostatToDF
 from .git import CloneRepo
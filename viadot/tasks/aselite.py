@@ -1,12 +1,14 @@
 import json
-from typing import Any, Dict
+from typing import Any, Dict, Union
 
 import prefect
 from prefect import Task
 from prefect.tasks.secrets import PrefectSecret
+from prefect.utilities.tasks import defaults_from_attrs
 
 from viadot.config import local_config
 from viadot.sources import AzureSQL
+from viadot.watermarks import WatermarkStore, apply_watermark
 
 from .azure_key_vault import AzureKeyVaultSecret
 
@@ -16,6 +18,9 @@ class ASELiteToDF(Task):
         self,
         credentials: Dict[str, Any] = None,
         query: str = None,
+        incremental_column: str = None,
+        watermark_key: str = None,
+        watermark_store: Union[str, WatermarkStore] = "local",
         timeout: int = 3600,
         *args,
         **kwargs
@@ -25,12 +30,22 @@ class ASELiteToDF(Task):
         Args:
             credentials (Dict[str, Any], optional): ASElite SQL Database credentials. Defaults to None.
             query(str, optional): Query to perform on a database. Defaults to None.
+            incremental_column (str, optional): The column tracking changes, a `rowversion` column, whose values are
+                unique and increasing (timestamp columns such as `modified_at` are not supported). If provided, only
+                the rows changed since the watermark stored under `watermark_key` are downloaded. The watermark is
+                not updated by this task (see `viadot.task_utils.set_watermark`). Defaults to None.
+            watermark_key (str, optional): The key of the watermark, unique per flow and table. Defaults to None.
+            watermark_store (Union[str, WatermarkStore], optional): The store holding the watermark: "local",
+                "duckdb", "prefect" (the Prefect KV Store) or a `WatermarkStore`. Defaults to "local".
             timeout(int, optional): The amount of time (in seconds) to wait while running this task before
                 a timeout occurs. Defaults to 3600.
         Returns: Pandas DataFrame
         """
         self.credentials = credentials
         self.query = query
+        self.incremental_column = incremental_column
+        self.watermark_key = watermark_key
+        self.watermark_store = watermark_store
 
         super().__init__(
             name="ASElite_to_df",
@@ -43,12 +58,16 @@ class ASELiteToDF(Task):
         """Download from aselite database to df"""
         return super().__call__(*args, **kwargs)
 
+    @defaults_from_attrs("incremental_column", "watermark_key", "watermark_store")
     def run(
         self,
         query: str,
         credentials: Dict[str, Any] = None,
         credentials_secret: str = None,
         vault_name: str = None,
+        incremental_column: str = None,
+        watermark_key: str = None,
+        watermark_store: Union[str, WatermarkStore] = None,
     ):
         logger = prefect.context.get("logger")
         if not credentials_secret:
@@ -67,6 +86,14 @@ class ASELiteToDF(Task):
             credentials = local_config.get("ASELite_SQL")
             logger.info("Loaded credentials from local source")
 
+        if incremental_column:
+            query = apply_watermark(
+                query,
+                column=incremental_column,
+                key=watermark_key,
+                store=watermark_store,
+            )
+
         aselite = AzureSQL(credentials=credentials)
         logger.info("Connected to ASELITE SOURCE")
         df = aselite.to_df(query=query)
@@ -1,16 +1,80 @@
 import json
 import os
+import time
+import uuid
 from datetime import timedelta
-from typing import List
+from typing import Any, Dict, List, Literal, Union
 
-import numpy as np
 import pandas as pd
 from prefect import Task
+from prefect.engine import signals
 from prefect.tasks.secrets import PrefectSecret
 from prefect.utilities.tasks import defaults_from_attrs
 
-from ..sources import AzureDataLake
+from ..cache import DownloadCache
+from ..exceptions import ValidationError
+from ..sources import AzureDataLake, AzureSQL
+from ..utils import DFStreamValidator, write_csv_files
 from .azure_key_vault import AzureKeyVaultSecret
+from .bcp import BCP_PATH, bcp_load_files, get_bcp_credentials
+
+
+def _get_credentials(
+    sp_credentials_secret: str = None, vault_name: str = None
+) -> Dict[str, Any]:
+    if not sp_credentials_secret:
+        # attempt to read a default for the service principal secret name
+        try:
+            sp_credentials_secret = PrefectSecret(
+                "AZURE_DEFAULT_ADLS_SERVICE_PRINCIPAL_SECRET"
+            ).run()
+        except ValueError:
+            pass
+
+    if sp_credentials_secret:
+        azure_secret_task = AzureKeyVaultSecret()
+        credentials_str = azure_secret_task.run(
+            secret=sp_credentials_secret, vault_name=vault_name
+        )
+        credentials = json.loads(credentials_str)
+    else:
+        credentials = {
+            "ACCOUNT_NAME": os.environ["AZURE_ACCOUNT_NAME"],
+            "AZURE_TENANT_ID": os.environ["AZURE_TENANT_ID"],
+            "AZURE_CLIENT_ID": os.environ["AZURE_CLIENT_ID"],
+            "AZURE_CLIENT_SECRET": os.environ["AZURE_CLIENT_SECRET"],
+        }
+    return credentials
+
+
+def _summarize_transfers(
+    results: List[Dict[str, Any]], seconds: float, action: str, logger: Any
+) -> Dict[str, Any]:
+    """Log the results of `AzureDataLake.upload_many()` or `AzureDataLake.copy_many()`
+    and fail if any of the files could not be transferred."""
+    transferred_bytes = sum(result["bytes"] for result in results)
+    summary = dict(
+        files=results,
+        bytes=transferred_bytes,
+        seconds=seconds,
+        bytes_per_second=transferred_bytes / seconds if seconds else 0.0,
+    )
+
+    failed = [result for result in results if result["status"] == "failed"]
+    for result in failed:
+        logger.error(
+            f"Failed to {action} {result['from_path']} to {result['to_path']}: {result['error']}"
+        )
+    logger.info(
+        f"Transferred {len(results) - len(failed)}/{len(results)} files "
+        f"({transferred_bytes / 1024**2:.2f} MiB) in {seconds:.2f} seconds "
+        f"({summary['bytes_per_second'] / 1024**2:.2f} MiB/s)."
+    )
+    if failed:
+        raise signals.FAIL(
+            message=f"Failed to {action} {len(failed)} of {len(results)} files."
+        )
+    return summary
 
 
 class AzureDataLakeDownload(Task):
@@ -22,6 +86,10 @@ class AzureDataLakeDownload(Task):
         to_path (str, optional): The destination path. Defaults to None.
         recursive (bool, optional): Set this to true if downloading entire directories.
         gen (int, optional): The generation of the Azure Data Lake. Defaults to 2.
+        use_cache (bool, optional): Whether to keep a local copy of downloaded files and reuse it while
+            the file's ETag (or last modification time) in the lake is unchanged. Defaults to False.
+        cache_max_size (int, optional): The maximum total size of the local copies in bytes, above which the
+            least recently used ones are removed. Defaults to 1 GiB.
         vault_name (str, optional): The name of the vault from which to fetch the secret. Defaults to None.
         timeout(int, optional): The amount of time (in seconds) to wait while running this task before
             a timeout occurs. Defaults to 3600.
@@ -35,6 +103,8 @@ class AzureDataLakeDownload(Task):
         to_path: str = None,
         recursive: bool = False,
         gen: int = 2,
+        use_cache: bool = False,
+        cache_max_size: int = 1024**3,
         vault_name: str = None,
         timeout: int = 3600,
         max_retries: int = 3,
@@ -46,6 +116,8 @@ class AzureDataLakeDownload(Task):
         self.to_path = to_path
         self.recursive = recursive
         self.gen = gen
+        self.use_cache = use_cache
+        self.cache_max_size = cache_max_size
         self.vault_name = vault_name
 
         super().__init__(
@@ -66,6 +138,8 @@ class AzureDataLakeDownload(Task):
         "to_path",
         "recursive",
         "gen",
+        "use_cache",
+        "cache_max_size",
         "vault_name",
         "max_retries",
         "retry_delay",
@@ -76,6 +150,8 @@ class AzureDataLakeDownload(Task):
         to_path: str = None,
         recursive: bool = None,
         gen: int = None,
+        use_cache: bool = None,
+        cache_max_size: int = None,
         sp_credentials_secret: str = None,
         vault_name: str = None,
         max_retries: int = None,
@@ -88,6 +164,9 @@ class AzureDataLakeDownload(Task):
             to_path (str): The destination path.
             recursive (bool): Set this to true if downloading entire directories.
             gen (int): The generation of the Azure Data Lake.
+            use_cache (bool, optional): Whether to reuse a local copy of the file if it is unchanged in the lake.
+            Defaults to None.
+            cache_max_size (int, optional): The maximum total size of the local copies in bytes. Defaults to None.
             sp_credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary with
             ACCOUNT_NAME and Service Principal credentials (TENANT_ID, CLIENT_ID, CLIENT_SECRET). Defaults to None.
             vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
@@ -121,18 +200,29 @@ class AzureDataLakeDownload(Task):
 
         full_dl_path = os.path.join(credentials["ACCOUNT_NAME"], from_path)
         self.logger.info(f"Downloading data from {full_dl_path} to {to_path}...")
-        lake.download(from_path=from_path, to_path=to_path, recursive=recursive)
+        cache = DownloadCache(max_size=cache_max_size) if use_cache else None
+        lake.download(
+            from_path=from_path, to_path=to_path, recursive=recursive, cache=cache
+        )
         self.logger.info(f"Successfully downloaded data to {to_path}.")
 
 
 class AzureDataLakeUpload(Task):
     """Upload file(s) to Azure Data Lake.
 
+    If lists of paths are passed as `from_path` and `to_path`, the files are uploaded
+    concurrently, resolving the credentials and creating the filesystem client only once.
+
     Args:
-        from_path (str, optional): The local path from which to upload the file(s). Defaults to None.
-        to_path (str, optional): The destination path. Defaults to None.
+        from_path (Union[str, List[str]], optional): The local path(s) from which to upload the file(s).
+            Defaults to None.
+        to_path (Union[str, List[str]], optional): The destination path(s). Defaults to None.
         recursive (bool, optional): Set this to true if uploading entire directories. Defaults to False.
         overwrite (bool, optional): Whether to overwrite files in the lake. Defaults to False.
+        max_workers (int, optional): The maximum number of files uploaded concurrently when uploading
+            multiple files. Defaults to 8.
+        chunk_size (int, optional): The size of the uploaded blocks in bytes when uploading multiple files.
+            Defaults to 4 MiB.
         gen (int, optional): The generation of the Azure Data Lake. Defaults to 2.
         vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
         timeout(int, optional): The amount of time (in seconds) to wait while running this task before
@@ -141,10 +231,12 @@ class AzureDataLakeUpload(Task):
 
     def __init__(
         self,
-        from_path: str = None,
-        to_path: str = None,
+        from_path: Union[str, List[str]] = None,
+        to_path: Union[str, List[str]] = None,
         recursive: bool = False,
         overwrite: bool = False,
+        max_workers: int = 8,
+        chunk_size: int = 4 * 1024 * 1024,
         gen: int = 2,
         vault_name: str = None,
         timeout: int = 3600,
@@ -157,6 +249,8 @@ class AzureDataLakeUpload(Task):
         self.to_path = to_path
         self.recursive = recursive
         self.overwrite = overwrite
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
         self.gen = gen
         self.vault_name = vault_name
 
@@ -178,6 +272,8 @@ class AzureDataLakeUpload(Task):
         "to_path",
         "recursive",
         "overwrite",
+        "max_workers",
+        "chunk_size",
         "gen",
         "vault_name",
         "max_retries",
@@ -185,27 +281,39 @@ class AzureDataLakeUpload(Task):
     )
     def run(
         self,
-        from_path: str = None,
-        to_path: str = None,
+        from_path: Union[str, List[str]] = None,
+        to_path: Union[str, List[str]] = None,
         recursive: bool = None,
         overwrite: bool = None,
+        max_workers: int = None,
+        chunk_size: int = None,
         gen: int = None,
         sp_credentials_secret: str = None,
         vault_name: str = None,
         max_retries: int = None,
         retry_delay: timedelta = None,
-    ) -> None:
+    ) -> Union[Dict[str, Any], None]:
         """Task run method.
 
         Args:
-            from_path (str): The path from which to upload the file(s).
-            to_path (str): The destination path.
+            from_path (Union[str, List[str]]): The path(s) from which to upload the file(s).
+            to_path (Union[str, List[str]]): The destination path(s).
             recursive (bool): Set to true if uploading entire directories.
             overwrite (bool): Whether to overwrite the file(s) if they exist.
+            max_workers (int): The maximum number of files uploaded concurrently when uploading multiple files.
+            chunk_size (int): The size of the uploaded blocks in bytes when uploading multiple files.
             gen (int): The generation of the Azure Data Lake.
             sp_credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary with
             ACCOUNT_NAME and Service Principal credentials (TENANT_ID, CLIENT_ID, CLIENT_SECRET). Defaults to None.
             vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
+
+        Raises:
+            signals.FAIL: If any of multiple files could not be uploaded.
+
+        Returns:
+            Union[Dict[str, Any], None]: When uploading multiple files, a summary with the per-file
+            results (`files`), the number of uploaded bytes (`bytes`), the duration (`seconds`)
+            and the throughput (`bytes_per_second`).
         """
 
         if not sp_credentials_secret:
@@ -232,6 +340,16 @@ class AzureDataLakeUpload(Task):
             }
         lake = AzureDataLake(gen=gen, credentials=credentials)
 
+        if isinstance(from_path, (list, tuple)):
+            return self._upload_many(
+                lake=lake,
+                from_paths=list(from_path),
+                to_paths=list(to_path),
+                overwrite=overwrite,
+                max_workers=max_workers,
+                chunk_size=chunk_size,
+            )
+
         full_to_path = os.path.join(credentials["ACCOUNT_NAME"], to_path)
         self.logger.info(f"Uploading data from {from_path} to {full_to_path}...")
         lake.upload(
@@ -242,6 +360,30 @@ class AzureDataLakeUpload(Task):
         )
         self.logger.info(f"Successfully uploaded data to {full_to_path}.")
 
+    def _upload_many(
+        self,
+        lake: AzureDataLake,
+        from_paths: List[str],
+        to_paths: List[str],
+        overwrite: bool,
+        max_workers: int,
+        chunk_size: int,
+    ) -> Dict[str, Any]:
+        self.logger.info(
+            f"Uploading {len(from_paths)} files using {max_workers} workers..."
+        )
+        start = time.perf_counter()
+        results = lake.upload_many(
+            from_paths=from_paths,
+            to_paths=to_paths,
+            overwrite=overwrite,
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+        )
+        return _summarize_transfers(
+            results, time.perf_counter() - start, action="upload", logger=self.logger
+        )
+
 
 class AzureDataLakeToDF(Task):
     def __init__(
@@ -251,6 +393,11 @@ class AzureDataLakeToDF(Task):
         quoting: int = 0,
         lineterminator: str = None,
         error_bad_lines: bool = None,
+        columns: List[str] = None,
+        filters: List[Any] = None,
+        add_source_file: bool = False,
+        limit: int = None,
+        max_workers: int = 8,
         gen: int = 2,
         vault_name: str = None,
         timeout: int = 3600,
@@ -268,6 +415,15 @@ class AzureDataLakeToDF(Task):
             quoting (int, optional): The quoting mode to use when reading a CSV file. Defaults to 0.
             lineterminator (str, optional): The newline separator to use when reading a CSV file. Defaults to None.
             error_bad_lines (bool, optional): Whether to raise an exception on bad lines. Defaults to None.
+            columns (List[str], optional): The columns to read. Defaults to None (all columns).
+            filters (List[Any], optional): Row filters in the format used by `pandas.read_parquet()`,
+                eg. `[("country", "=", "italy"), ("sales", ">", 50)]`. For Parquet files and directories,
+                the filters are pushed down to the reader. Defaults to None.
+            add_source_file (bool, optional): Whether to add a `_source_file` column with the path of the file
+                each row was read from. Defaults to False.
+            limit (int, optional): The maximum number of rows to read. Defaults to None (all rows).
+            max_workers (int, optional): The maximum number of files read concurrently when reading a directory
+                or a glob, eg. `raw/sales/2023-*.csv`. Defaults to 8.
             gen (int, optional): The generation of the Azure Data Lake. Defaults to 2.
             vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
             timeout(int, optional): The amount of time (in seconds) to wait while running this task before
@@ -278,6 +434,11 @@ class AzureDataLakeToDF(Task):
         self.quoting = quoting
         self.lineterminator = lineterminator
         self.error_bad_lines = error_bad_lines
+        self.columns = columns
+        self.filters = filters
+        self.add_source_file = add_source_file
+        self.limit = limit
+        self.max_workers = max_workers
 
         self.gen = gen
         self.vault_name = vault_name
@@ -300,6 +461,11 @@ class AzureDataLakeToDF(Task):
         "quoting",
         "lineterminator",
         "error_bad_lines",
+        "columns",
+        "filters",
+        "add_source_file",
+        "limit",
+        "max_workers",
         "gen",
         "vault_name",
         "max_retries",
@@ -312,6 +478,11 @@ class AzureDataLakeToDF(Task):
         quoting: int = None,
         lineterminator: str = None,
         error_bad_lines: bool = None,
+        columns: List[str] = None,
+        filters: List[Any] = None,
+        add_source_file: bool = None,
+        limit: int = None,
+        max_workers: int = None,
         gen: int = None,
         sp_credentials_secret: str = None,
         vault_name: str = None,
@@ -326,6 +497,12 @@ class AzureDataLakeToDF(Task):
             quoting (int, optional): The quoting mode to use when reading a CSV file. Defaults to 0.
             lineterminator (str, optional): The newline separator to use when reading a CSV file. Defaults to None.
             error_bad_lines (bool, optional): Whether to raise an exception on bad lines. Defaults to None.
+            columns (List[str], optional): The columns to read. Defaults to None (all columns).
+            filters (List[Any], optional): Row filters in the format used by `pandas.read_parquet()`.
+                Defaults to None.
+            add_source_file (bool, optional): Whether to add a `_source_file` column. Defaults to None.
+            limit (int, optional): The maximum number of rows to read. Defaults to None.
+            max_workers (int, optional): The maximum number of files read concurrently. Defaults to None.
             gen (int): The generation of the Azure Data Lake.
             sp_credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary with
             ACCOUNT_NAME and Service Principal credentials (TENANT_ID, CLIENT_ID, CLIENT_SECRET). Defaults to None.
@@ -369,6 +546,11 @@ class AzureDataLakeToDF(Task):
             quoting=quoting,
             lineterminator=lineterminator,
             error_bad_lines=error_bad_lines,
+            columns=columns,
+            filters=filters,
+            add_source_file=add_source_file,
+            limit=limit,
+            max_workers=max_workers,
         )
         self.logger.info(f"Successfully loaded data.")
         return df
@@ -378,11 +560,25 @@ class AzureDataLakeCopy(Task):
     """
     Task for copying data between the Azure Data lakes files.
 
+    Files are copied concurrently. Within one lake, a server-side copy is used where
+    the lake supports it; files copied to another lake (`to_gen`, `to_sp_credentials_secret`)
+    or with `metadata_columns` are streamed between the lakes without local staging.
+
     Args:
-        from_path (str, optional): The path from which to copy the file(s). Defaults to None.
-        to_path (str, optional): The destination path. Defaults to None.
+        from_path (Union[str, List[str]], optional): The path(s) from which to copy the file(s).
+            Defaults to None.
+        to_path (Union[str, List[str]], optional): The destination path(s). Defaults to None.
         recursive (bool, optional): Set this to true if copy entire directories.
+        overwrite (bool, optional): Whether to overwrite the destination files. Defaults to True.
+        max_workers (int, optional): The maximum number of files copied concurrently. Defaults to 8.
+        metadata_columns (Dict[str, Any], optional): Columns to add to each copied CSV or Parquet file,
+            eg. `{"_viadot_downloaded_at_utc": datetime.now(timezone.utc)}`. Defaults to None.
+        file_format (Literal["csv", "parquet"], optional): The format of the files, used with
+            `metadata_columns`. Defaults to None (inferred from the file extension).
+        sep (str, optional): The separator of CSV files, used with `metadata_columns`. Defaults to "\t".
         gen (int, optional): The generation of the Azure Data Lake. Defaults to 2.
+        to_gen (int, optional): The generation of the destination Azure Data Lake. Defaults to None
+            (same as `gen`).
         vault_name (str, optional): The name of the vault from which to fetch the secret. Defaults to None.
         timeout(int, optional): The amount of time (in seconds) to wait while running this task before
             a timeout occurs. Defaults to 3600.
@@ -395,7 +591,13 @@ class AzureDataLakeCopy(Task):
         from_path: str = None,
         to_path: str = None,
         recursive: bool = False,
+        overwrite: bool = True,
+        max_workers: int = 8,
+        metadata_columns: Dict[str, Any] = None,
+        file_format: Literal["csv", "parquet"] = None,
+        sep: str = "\t",
         gen: int = 2,
+        to_gen: int = None,
         vault_name: str = None,
         timeout: int = 3600,
         max_retries: int = 3,
@@ -406,7 +608,13 @@ class AzureDataLakeCopy(Task):
         self.from_path = from_path
         self.to_path = to_path
         self.recursive = recursive
+        self.overwrite = overwrite
+        self.max_workers = max_workers
+        self.metadata_columns = metadata_columns
+        self.file_format = file_format
+        self.sep = sep
         self.gen = gen
+        self.to_gen = to_gen
         self.vault_name = vault_name
 
         super().__init__(
@@ -426,64 +634,104 @@ class AzureDataLakeCopy(Task):
         "from_path",
         "to_path",
         "recursive",
+        "overwrite",
+        "max_workers",
+        "metadata_columns",
+        "file_format",
+        "sep",
         "gen",
+        "to_gen",
         "vault_name",
         "max_retries",
         "retry_delay",
     )
     def run(
         self,
-        from_path: str = None,
-        to_path: str = None,
+        from_path: Union[str, List[str]] = None,
+        to_path: Union[str, List[str]] = None,
         recursive: bool = None,
+        overwrite: bool = None,
+        max_workers: int = None,
+        metadata_columns: Dict[str, Any] = None,
+        file_format: Literal["csv", "parquet"] = None,
+        sep: str = None,
         gen: int = None,
+        to_gen: int = None,
         sp_credentials_secret: str = None,
+        to_sp_credentials_secret: str = None,
         vault_name: str = None,
         max_retries: int = None,
         retry_delay: timedelta = None,
-    ) -> None:
+    ) -> Dict[str, Any]:
         """Task run method.
 
         Args:
-            from_path (str): The path from which to copy the file(s).
-            to_path (str): The destination path.
+            from_path (Union[str, List[str]]): The path(s) from which to copy the file(s).
+            to_path (Union[str, List[str]]): The destination path(s).
             recursive (bool): Set this to true if copying entire directories.
+            overwrite (bool): Whether to overwrite the destination files.
+            max_workers (int): The maximum number of files copied concurrently.
+            metadata_columns (Dict[str, Any], optional): Columns to add to each copied CSV or Parquet file.
+            Defaults to None.
+            file_format (Literal["csv", "parquet"], optional): The format of the files, used with
+            `metadata_columns`. Defaults to None (inferred from the file extension).
+            sep (str): The separator of CSV files, used with `metadata_columns`.
             gen (int): The generation of the Azure Data Lake.
+            to_gen (int, optional): The generation of the destination Azure Data Lake. Defaults to None.
             sp_credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary with
             ACCOUNT_NAME and Service Principal credentials (TENANT_ID, CLIENT_ID, CLIENT_SECRET). Defaults to None.
+            to_sp_credentials_secret (str, optional): The name of the Azure Key Vault secret with the credentials
+            to the destination lake, if it is different from the source lake. Defaults to None.
             vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
-        """
-        file_name = from_path.split("/")[-1]
-        to_path = to_path or file_name
 
-        if not sp_credentials_secret:
-            # attempt to read a default for the service principal secret name
-            try:
-                sp_credentials_secret = PrefectSecret(
-                    "AZURE_DEFAULT_ADLS_SERVICE_PRINCIPAL_SECRET"
-                ).run()
-            except ValueError:
-                pass
+        Raises:
+            signals.FAIL: If any of the files could not be copied.
 
-        if sp_credentials_secret:
-            azure_secret_task = AzureKeyVaultSecret()
-            credentials_str = azure_secret_task.run(
-                secret=sp_credentials_secret, vault_name=vault_name
+        Returns:
+            Dict[str, Any]: A summary with the per-file results (`files`), the number of copied bytes
+            (`bytes`), the duration (`seconds`) and the throughput (`bytes_per_second`).
+        """
+        credentials = _get_credentials(sp_credentials_secret, vault_name=vault_name)
+        lake = AzureDataLake(gen=gen, credentials=credentials)
+
+        to_lake = None
+        if to_sp_credentials_secret or (to_gen is not None and to_gen != gen):
+            to_credentials = _get_credentials(
+                to_sp_credentials_secret, vault_name=vault_name
             )
-            credentials = json.loads(credentials_str)
+            to_lake = AzureDataLake(gen=to_gen or gen, credentials=to_credentials)
+
+        if isinstance(from_path, (list, tuple)):
+            from_paths, to_paths = list(from_path), list(to_path)
+        elif recursive:
+            from_dir = from_path.rstrip("/")
+            from_paths = sorted(lake.iter_files(from_dir, max_workers=max_workers))
+            to_paths = [
+                os.path.join(to_path, path[len(from_dir) + 1 :]) for path in from_paths
+            ]
         else:
-            credentials = {
-                "ACCOUNT_NAME": os.environ["AZURE_ACCOUNT_NAME"],
-                "AZURE_TENANT_ID": os.environ["AZURE_TENANT_ID"],
-                "AZURE_CLIENT_ID": os.environ["AZURE_CLIENT_ID"],
-                "AZURE_CLIENT_SECRET": os.environ["AZURE_CLIENT_SECRET"],
-            }
-        lake = AzureDataLake(gen=gen, credentials=credentials)
+            from_paths, to_paths = [from_path], [to_path or from_path.split("/")[-1]]
 
-        full_dl_path = os.path.join(credentials["ACCOUNT_NAME"], from_path)
-        self.logger.info(f"Copying data from {full_dl_path} to {to_path}...")
-        lake.cp(from_path=from_path, to_path=to_path, recursive=recursive)
+        full_dl_path = os.path.join(credentials["ACCOUNT_NAME"], str(from_path))
+        self.logger.info(
+            f"Copying {len(from_paths)} file(s) from {full_dl_path} to {to_path}..."
+        )
+        start = time.perf_counter()
+        results = lake.copy_many(
+            from_paths=from_paths,
+            to_paths=to_paths,
+            to_lake=to_lake,
+            overwrite=overwrite,
+            max_workers=max_workers,
+            metadata_columns=metadata_columns,
+            file_format=file_format,
+            sep=sep,
+        )
+        summary = _summarize_transfers(
+            results, time.perf_counter() - start, action="copy", logger=self.logger
+        )
         self.logger.info(f"Successfully copied data to {to_path}.")
+        return summary
 
 
 class AzureDataLakeList(Task):
@@ -492,6 +740,11 @@ class AzureDataLakeList(Task):
 
     Args:
         path (str, optional): The path to the directory which contents you want to list. Defaults to None.
+        pattern (str, optional): A glob pattern the listed paths (relative to `path`) must match,
+            eg. `2023/*/sales_*.csv` or `**/*.parquet`. Defaults to None.
+        max_workers (int, optional): The maximum number of directories listed concurrently. Defaults to 8.
+        cache_ttl (int, optional): For how many seconds to reuse a listing of the same path and pattern
+            within the process. Defaults to None (no caching).
         gen (int, optional): The generation of the Azure Data Lake. Defaults to 2.
         vault_name (str, optional): The name of the vault from which to fetch the secret. Defaults to None.
         timeout(int, optional): The amount of time (in seconds) to wait while running this task before
@@ -509,6 +762,9 @@ class AzureDataLakeList(Task):
     def __init__(
         self,
         path: str = None,
+        pattern: str = None,
+        max_workers: int = 8,
+        cache_ttl: int = None,
         gen: int = 2,
         vault_name: str = None,
         timeout: int = 3600,
@@ -518,6 +774,9 @@ class AzureDataLakeList(Task):
         **kwargs,
     ):
         self.path = path
+        self.pattern = pattern
+        self.max_workers = max_workers
+        self.cache_ttl = cache_ttl
         self.gen = gen
         self.vault_name = vault_name
 
@@ -532,6 +791,9 @@ class AzureDataLakeList(Task):
 
     @defaults_from_attrs(
         "path",
+        "pattern",
+        "max_workers",
+        "cache_ttl",
         "gen",
         "vault_name",
         "max_retries",
@@ -542,6 +804,9 @@ class AzureDataLakeList(Task):
         path: str = None,
         recursive: bool = False,
         file_to_match: str = None,
+        pattern: str = None,
+        max_workers: int = None,
+        cache_ttl: int = None,
         gen: int = None,
         sp_credentials_secret: str = None,
         vault_name: str = None,
@@ -554,6 +819,12 @@ class AzureDataLakeList(Task):
             path (str, optional): The path to the directory which contents you want to list. Defaults to None.
             recursive (bool, optional): If True, recursively list all subdirectories and files. Defaults to False.
             file_to_match (str, optional): If exist it only returns files with that name. Defaults to None.
+            pattern (str, optional): A glob pattern the listed paths (relative to `path`) must match,
+            eg. `2023/*/sales_*.csv` or `**/*.parquet`. Only the part of the tree which can contain
+            matches is listed. Defaults to None.
+            max_workers (int, optional): The maximum number of directories listed concurrently. Defaults to None.
+            cache_ttl (int, optional): For how many seconds to reuse a listing of the same path and pattern
+            within the process. Defaults to None.
             gen (int): The generation of the Azure Data Lake. Defaults to None.
             sp_credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary with
             ACCOUNT_NAME and Service Principal credentials (TENANT_ID, CLIENT_ID, CLIENT_SECRET). Defaults to None.
@@ -593,19 +864,23 @@ class AzureDataLakeList(Task):
         full_dl_path = os.path.join(credentials["ACCOUNT_NAME"], path)
 
         self.logger.info(f"Listing files in {full_dl_path}.")
-        if recursive:
-            self.logger.info("Loading ADLS directories recursively.")
-            files = lake.find(path)
+        if recursive or pattern:
+            if recursive:
+                self.logger.info("Loading ADLS directories recursively.")
+            files = lake.iter_files(
+                path,
+                pattern=pattern,
+                recursive=recursive,
+                max_workers=max_workers,
+                cache_ttl=cache_ttl,
+            )
             if file_to_match:
-                conditions = [file_to_match in item for item in files]
-                valid_files = np.array([])
-                if any(conditions):
-                    index = np.where(conditions)[0]
-                    files = list(np.append(valid_files, [files[i] for i in index]))
-                else:
+                files = [file for file in files if file_to_match in file]
+                if not files:
                     raise FileExistsError(
                         f"There are not any available file named {file_to_match}."
                     )
+            files = sorted(files)
         else:
             files = lake.ls(path)
 
@@ -716,3 +991,250 @@ class AzureDataLakeRemove(Task):
         self.logger.info(f"Deleting {logger_details} {full_path}...")
         lake.rm(path, recursive=recursive)
         self.logger.info(f"Successfully deleted {logger_details} {full_path}.")
+
+
+class AzureDataLakeToAzureSQLStream(Task):
+    """
+    Stream a CSV or Parquet file from Azure Data Lake into an existing Azure SQL table.
+
+    The file is read in batches of `batch_size` rows, which are written into rotating
+    CSV files of at most `rows_per_file` rows. Each file is loaded with bcp (with `TABLOCK`)
+    as soon as it is complete, while the next one is being written, and removed once
+    loaded. At most `max_concurrent_loads` bcp processes run at the same time.
+
+    Each batch gets the same preparation as in `ADLSToAzureSQL`: column names are
+    stripped, columns are reordered to `columns` and tabs are removed if `remove_tab`
+    is set. The `validate_df_dict` tests are evaluated on the whole file with
+    `DFStreamValidator`. Since they can only be evaluated once all the data is loaded,
+    the data is then loaded into a heap staging table first, and only moved into the
+    target table if the validation passes.
+
+    Args:
+        columns (List[str], optional): The columns of the target table, in order. Defaults to None
+            (the order of the file).
+        read_sep (str, optional): The separator of the source CSV file. Defaults to "\t".
+        write_sep (str, optional): The separator of the intermediate CSV files. Defaults to "\t".
+        remove_tab (bool, optional): Whether to remove tabs from the data. Defaults to False.
+        batch_size (int, optional): The number of rows read at a time. Defaults to 100 000.
+        rows_per_file (int, optional): The maximum number of rows in a single intermediate file.
+            Defaults to 1 000 000.
+        max_concurrent_loads (int, optional): The maximum number of concurrent bcp processes.
+            Defaults to 4.
+        chunksize (int, optional): The bcp batch size. Defaults to 5000.
+        on_error (Literal["skip", "fail"], optional): What to do if a bcp error occurs.
+            Defaults to "skip".
+        error_log_file_path (str, optional): Full path of the bcp error file. Defaults to "./log_file.log".
+        use_staging_table (bool, optional): Whether to load the data into a heap staging table, and move
+            it into the target table once all files are loaded. Always used with `validate_df_dict`.
+            Defaults to False.
+        validate_df_dict (Dict[str, Any], optional): Tests to run on the data, in the format used by
+            `validate_df`. Defaults to None.
+        bcp_path (str, optional): The path to the bcp executable. Defaults to BCP_PATH.
+        gen (int, optional): The generation of the Azure Data Lake. Defaults to 2.
+        vault_name (str, optional): The name of the vault from which to obtain the secrets. Defaults to None.
+        timeout(int, optional): The amount of time (in seconds) to wait while running this task before
+            a timeout occurs. Defaults to 3600.
+    """
+
+    def __init__(
+        self,
+        columns: List[str] = None,
+        read_sep: str = "\t",
+        write_sep: str = "\t",
+        remove_tab: bool = False,
+        batch_size: int = 100_000,
+        rows_per_file: int = 1_000_000,
+        max_concurrent_loads: int = 4,
+        chunksize: int = 5000,
+        on_error: Literal["skip", "fail"] = "skip",
+        error_log_file_path: str = "./log_file.log",
+        use_staging_table: bool = False,
+        validate_df_dict: Dict[str, Any] = None,
+        bcp_path: str = BCP_PATH,
+        gen: int = 2,
+        vault_name: str = None,
+        timeout: int = 3600,
+        *args,
+        **kwargs,
+    ):
+        self.columns = columns
+        self.read_sep = read_sep
+        self.write_sep = write_sep
+        self.remove_tab = remove_tab
+        self.batch_size = batch_size
+        self.rows_per_file = rows_per_file
+        self.max_concurrent_loads = max_concurrent_loads
+        self.chunksize = chunksize
+        self.on_error = on_error
+        self.error_log_file_path = error_log_file_path
+        self.use_staging_table = use_staging_table
+        self.validate_df_dict = validate_df_dict
+        self.bcp_path = bcp_path
+        self.gen = gen
+        self.vault_name = vault_name
+
+        super().__init__(
+            name="adls_to_azure_sql_stream", timeout=timeout, *args, **kwargs
+        )
+
+    @staticmethod
+    def _prepare_batch(df: pd.DataFrame, columns: List[str] = None) -> pd.DataFrame:
+        df = df.rename(columns=lambda column: column.strip())
+        if columns:
+            if set(df.columns) != set(columns):
+                raise ValidationError(
+                    "Detected discrepancies in number of columns or different column names between the CSV file and the SQL table!"
+                )
+            df = df.loc[:, columns]
+        return df
+
+    @staticmethod
+    def _remove_tab(df: pd.DataFrame) -> pd.DataFrame:
+        df = df.copy()
+        for column in df.columns:
+            df[column] = df[column].astype(str).str.replace(r"\t", "", regex=True)
+        return df
+
+    @staticmethod
+    def _execute(azure_sql: AzureSQL, query: str) -> None:
+        cursor = azure_sql.con.cursor()
+        cursor.execute(query)
+        azure_sql.con.commit()
+        cursor.close()
+
+    @defaults_from_attrs(
+        "columns",
+        "read_sep",
+        "write_sep",
+        "remove_tab",
+        "batch_size",
+        "rows_per_file",
+        "max_concurrent_loads",
+        "chunksize",
+        "on_error",
+        "error_log_file_path",
+        "use_staging_table",
+        "validate_df_dict",
+        "bcp_path",
+        "gen",
+        "vault_name",
+    )
+    def run(
+        self,
+        path: str,
+        local_path: str,
+        table: str,
+        schema: str = None,
+        columns: List[str] = None,
+        read_sep: str = None,
+        write_sep: str = None,
+        remove_tab: bool = None,
+        batch_size: int = None,
+        rows_per_file: int = None,
+        max_concurrent_loads: int = None,
+        chunksize: int = None,
+        on_error: Literal["skip", "fail"] = None,
+        error_log_file_path: str = None,
+        use_staging_table: bool = None,
+        validate_df_dict: Dict[str, Any] = None,
+        bcp_path: str = None,
+        gen: int = None,
+        sp_credentials_secret: str = None,
+        sqldb_credentials: dict = None,
+        sqldb_credentials_secret: str = None,
+        vault_name: str = None,
+    ) -> Dict[str, Any]:
+        """
+        Stream a file from Azure Data Lake into an existing Azure SQL table.
+
+        Args:
+            path (str, required): The path to the CSV or Parquet file in the lake.
+            local_path (str, required): The base path of the intermediate CSV files.
+            table (str, required): The destination table.
+            schema (str, optional): The destination schema. Defaults to None.
+            columns (List[str], optional): The columns of the target table, in order.
+            read_sep (str, optional): The separator of the source CSV file.
+            write_sep (str, optional): The separator of the intermediate CSV files.
+            remove_tab (bool, optional): Whether to remove tabs from the data.
+            batch_size (int, optional): The number of rows read at a time.
+            rows_per_file (int, optional): The maximum number of rows in a single intermediate file.
+            max_concurrent_loads (int, optional): The maximum number of concurrent bcp processes.
+            chunksize (int, optional): The bcp batch size.
+            on_error (Literal["skip", "fail"], optional): What to do if a bcp error occurs.
+            error_log_file_path (str, optional): Full path of the bcp error file.
+            use_staging_table (bool, optional): Whether to load the data through a heap staging table.
+            validate_df_dict (Dict[str, Any], optional): Tests to run on the data.
+            bcp_path (str, optional): The path to the bcp executable.
+            gen (int, optional): The generation of the Azure Data Lake.
+            sp_credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary with
+            ACCOUNT_NAME and Service Principal credentials (TENANT_ID, CLIENT_ID, CLIENT_SECRET). Defaults to None.
+            sqldb_credentials (dict, optional): The credentials to use for connecting with Azure SQL Database.
+            Defaults to None.
+            sqldb_credentials_secret (str, optional): The name of the Azure Key Vault secret containing
+            Azure SQL Database credentials (server, db_name, user, password). Defaults to None.
+            vault_name (str, optional): The name of the vault from which to obtain the secrets.
+
+        Raises:
+            signals.FAIL: If any of the bcp processes fails.
+            ValidationError: If the columns differ from `columns` or the validation tests fail.
+
+        Returns:
+            Dict[str, Any]: The number of files and rows loaded, and the total time in seconds.
+        """
+        credentials = _get_credentials(sp_credentials_secret, vault_name=vault_name)
+        lake = AzureDataLake(gen=gen, credentials=credentials)
+        sqldb_credentials = get_bcp_credentials(
+            credentials=sqldb_credentials,
+            credentials_secret=sqldb_credentials_secret,
+            vault_name=vault_name,
+        )
+        fqn = f"{schema}.{table}" if schema else table
+        validator = DFStreamValidator(validate_df_dict) if validate_df_dict else None
+
+        def _batches():
+            batches = lake.iter_batches(path, batch_size=batch_size, sep=read_sep)
+            for batch in batches:
+                batch = self._prepare_batch(batch, columns)
+                # Validate the data as read, before it is converted for bcp.
+                if validator is not None:
+                    validator.update(batch)
+                if remove_tab:
+                    batch = self._remove_tab(batch)
+                yield batch
+
+        load_fqn = fqn
+        azure_sql = None
+        if use_staging_table or validator is not None:
+            azure_sql = AzureSQL(credentials=sqldb_credentials)
+            load_fqn = f"{fqn}_staging_{uuid.uuid4().hex[:8]}"
+            self.logger.info(f"Loading the data through the staging table {load_fqn}.")
+            # SELECT INTO creates a heap, without the target's indexes and constraints.
+            self._execute(azure_sql, f"SELECT TOP 0 * INTO {load_fqn} FROM {fqn}")
+
+        try:
+            files = write_csv_files(
+                _batches(), path=local_path, sep=write_sep, rows_per_file=rows_per_file
+            )
+            result = bcp_load_files(
+                files,
+                fqn=load_fqn,
+                credentials=sqldb_credentials,
+                max_concurrent_loads=max_concurrent_loads,
+                chunksize=chunksize,
+                error_log_file_path=error_log_file_path,
+                on_error=on_error,
+                bcp_path=bcp_path,
+                logger=self.logger,
+            )
+            if validator is not None:
+                validator.validate()
+            if load_fqn != fqn:
+                self._execute(
+                    azure_sql,
+                    f"INSERT INTO {fqn} WITH (TABLOCK) SELECT * FROM {load_fqn}",
+                )
+        finally:
+            if load_fqn != fqn:
+                self._execute(azure_sql, f"DROP TABLE IF EXISTS {load_fqn}")
+
+        return result
@@ -1,7 +1,10 @@
 import json
+import os
+import tempfile
+import uuid
 from asyncio.log import logger
 from datetime import timedelta
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Union
 
 import pandas as pd
 from prefect import Task
@@ -12,10 +15,12 @@ from ..exceptions import ValidationError
 from ..sources import AzureSQL
 from ..utils import (
     build_merge_query,
-    gen_bulk_insert_query_from_df,
     get_sql_server_table_dtypes,
+    write_csv_files,
 )
+from ..watermarks import WatermarkStore, apply_watermark
 from .azure_key_vault import AzureKeyVaultSecret
+from .bcp import BCP_PATH, bcp_load_files
 
 
 def get_credentials(credentials_secret: str, vault_name: str = None):
@@ -302,6 +307,23 @@ class AzureSQLToDF(Task):
         credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary
         with SQL db credentials (server, db_name, user, and password).
         vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
+        utc_datetimeoffset (bool, optional): Whether to decode DATETIMEOFFSET columns in bulk into UTC
+            timestamps. Much faster for large results. Defaults to False.
+        partition_column (str, optional): The column by which to partition the query. If provided, the key
+            ranges of the result are read concurrently, on separate connections. Defaults to None.
+        partitions (int, optional): The number of partitions. Defaults to 4.
+        partition_method (Literal["range", "ntile"], optional): How to split the range of `partition_column`:
+            into equal ranges between its minimum and maximum, or into parts with the same number of rows
+            with NTILE. Defaults to "range".
+        max_workers (int, optional): The maximum number of partitions read concurrently. Defaults to None
+            (all of them).
+        incremental_column (str, optional): The column tracking changes, a `rowversion` column, whose values are
+            unique and increasing (timestamp columns such as `modified_at` are not supported). If provided, only
+            the rows changed since the watermark stored under `watermark_key` are downloaded. The watermark is
+            not updated by this task (see `viadot.task_utils.set_watermark`). Defaults to None.
+        watermark_key (str, optional): The key of the watermark, unique per flow and table. Defaults to None.
+        watermark_store (Union[str, WatermarkStore], optional): The store holding the watermark: "local",
+            "duckdb", "prefect" (the Prefect KV Store) or a `WatermarkStore`. Defaults to "local".
         timeout(int, optional): The amount of time (in seconds) to wait while running this task before
             a timeout occurs. Defaults to 3600.
     """
@@ -310,20 +332,54 @@ class AzureSQLToDF(Task):
         self,
         credentials_secret: str = None,
         vault_name: str = None,
+        utc_datetimeoffset: bool = False,
+        partition_column: str = None,
+        partitions: int = 4,
+        partition_method: Literal["range", "ntile"] = "range",
+        max_workers: int = None,
+        incremental_column: str = None,
+        watermark_key: str = None,
+        watermark_store: Union[str, WatermarkStore] = "local",
         timeout: int = 3600,
         *args,
         **kwargs,
     ):
         self.credentials_secret = credentials_secret
         self.vault_name = vault_name
+        self.utc_datetimeoffset = utc_datetimeoffset
+        self.partition_column = partition_column
+        self.partitions = partitions
+        self.partition_method = partition_method
+        self.max_workers = max_workers
+        self.incremental_column = incremental_column
+        self.watermark_key = watermark_key
+        self.watermark_store = watermark_store
 
         super().__init__(name="azure_sql_to_df", timeout=timeout, *args, **kwargs)
 
+    @defaults_from_attrs(
+        "utc_datetimeoffset",
+        "partition_column",
+        "partitions",
+        "partition_method",
+        "max_workers",
+        "incremental_column",
+        "watermark_key",
+        "watermark_store",
+    )
     def run(
         self,
         query: str,
         credentials_secret: str = None,
         vault_name: str = None,
+        utc_datetimeoffset: bool = None,
+        partition_column: str = None,
+        partitions: int = None,
+        partition_method: Literal["range", "ntile"] = None,
+        max_workers: int = None,
+        incremental_column: str = None,
+        watermark_key: str = None,
+        watermark_store: Union[str, WatermarkStore] = None,
     ):
         """Load the result of an Azure SQL Database query into a pandas DataFrame.
 
@@ -332,12 +388,41 @@ class AzureSQLToDF(Task):
             credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary
             with SQL db credentials (server, db_name, user, and password).
             vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
+            utc_datetimeoffset (bool, optional): Whether to decode DATETIMEOFFSET columns in bulk into UTC
+                timestamps. Defaults to None.
+            partition_column (str, optional): The column by which to partition the query. Defaults to None.
+            partitions (int, optional): The number of partitions. Defaults to None.
+            partition_method (Literal["range", "ntile"], optional): How to split the range of `partition_column`.
+                Defaults to None.
+            max_workers (int, optional): The maximum number of partitions read concurrently. Defaults to None.
+            incremental_column (str, optional): The column tracking changes. Defaults to None.
+            watermark_key (str, optional): The key of the watermark. Defaults to None.
+            watermark_store (Union[str, WatermarkStore], optional): The store holding the watermark.
+                Defaults to None.
         """
 
         credentials = get_credentials(credentials_secret, vault_name=vault_name)
         azure_sql = AzureSQL(credentials=credentials)
 
-        df = azure_sql.to_df(query)
+        if incremental_column:
+            query = apply_watermark(
+                query,
+                column=incremental_column,
+                key=watermark_key,
+                store=watermark_store,
+            )
+
+        if partition_column:
+            df = azure_sql.to_df_partitioned(
+                query=query,
+                partition_column=partition_column,
+                partitions=partitions,
+                partition_method=partition_method,
+                max_workers=max_workers,
+                utc_datetimeoffset=utc_datetimeoffset,
+            )
+        else:
+            df = azure_sql.to_df(query, utc_datetimeoffset=utc_datetimeoffset)
         nrows = df.shape[0]
         ncols = df.shape[1]
 
@@ -423,9 +508,8 @@ class CheckColumnOrder(Task):
         credentials = get_credentials(credentials_secret, vault_name=vault_name)
         azure_sql = AzureSQL(credentials=credentials)
         df = self.sanitize_columns(df)
-        query = f"SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS WHERE TABLE_SCHEMA = '{schema}' AND TABLE_NAME = '{table}'"
-        result = azure_sql.run(query=query)
-        table_exists = len(result) != 0
+        columns = azure_sql.get_table_metadata(table=table, schema=schema)
+        table_exists = len(columns) != 0
         if not table_exists:
             self.logger.warning("Target table doesn't exists.")
             return df
@@ -434,7 +518,7 @@ class CheckColumnOrder(Task):
                 "The table already exists and 'if_exists' is set to 'fail'."
             )
         if if_exists in ["append", "delete"]:
-            sql_column_list = [row[0] for row in result]
+            sql_column_list = [column["name"] for column in columns]
             df_column_list = list(df.columns)
             if sql_column_list != df_column_list:
                 self.logger.warning(
@@ -454,7 +538,14 @@ class AzureSQLUpsert(Task):
     Args:
         schema (str, optional): The schema where the data should be upserted. Defaults to None.
         table (str, optional): The table where the data should be upserted. Defaults to None.
-        on (str, optional): The field on which to merge (upsert). Defaults to None.
+        on (Union[str, List[str]], optional): The field or fields on which to merge (upsert). Defaults to None.
+        load_method (Literal["fast_executemany", "bcp"], optional): How to load the staging table.
+            "fast_executemany" sends parameterized batches of rows to a temporary table, while "bcp"
+            loads a regular staging table with bcp, which is faster for large DataFrames. Defaults to
+            "fast_executemany".
+        batch_size (int, optional): The number of rows loaded into the staging table in a single batch.
+            Defaults to 10 000.
+        bcp_path (str, optional): The path to the bcp executable. Defaults to BCP_PATH.
         credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary
         vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
         timeout(int, optional): The amount of time (in seconds) to wait while running this task before
@@ -465,7 +556,10 @@ class AzureSQLUpsert(Task):
         self,
         schema: str = None,
         table: str = None,
-        on: str = None,
+        on: Union[str, List[str]] = None,
+        load_method: Literal["fast_executemany", "bcp"] = "fast_executemany",
+        batch_size: int = 10_000,
+        bcp_path: str = BCP_PATH,
         credentials_secret: str = None,
         timeout: int = 3600,
         *args,
@@ -474,6 +568,9 @@ class AzureSQLUpsert(Task):
         self.schema = schema
         self.table = table
         self.on = on
+        self.load_method = load_method
+        self.batch_size = batch_size
+        self.bcp_path = bcp_path
         self.credentials_secret = credentials_secret
         super().__init__(name="azure_sql_upsert", timeout=timeout, *args, **kwargs)
 
@@ -481,6 +578,9 @@ class AzureSQLUpsert(Task):
         "schema",
         "table",
         "on",
+        "load_method",
+        "batch_size",
+        "bcp_path",
         "credentials_secret",
     )
     def run(
@@ -488,17 +588,23 @@ class AzureSQLUpsert(Task):
         df: pd.DataFrame,
         schema: str = None,
         table: str = None,
-        on: str = None,
+        on: Union[str, List[str]] = None,
+        load_method: Literal["fast_executemany", "bcp"] = None,
+        batch_size: int = None,
+        bcp_path: str = None,
         credentials_secret: str = None,
         vault_name: str = None,
     ):
-        """Upsert data from a pandas DataFrame into AzureSQL using a temporary staging table.
+        """Upsert data from a pandas DataFrame into AzureSQL using a staging table.
 
         Args:
             df (pd.DataFrame): The DataFrame to upsert.
             schema (str, optional): The schema where the data should be upserted. Defaults to None.
             table (str, optional): The table where the data should be upserted. Defaults to None.
-            on (str, optional): The field on which to merge (upsert). Defaults to None.
+            on (Union[str, List[str]], optional): The field or fields on which to merge (upsert). Defaults to None.
+            load_method (Literal["fast_executemany", "bcp"], optional): How to load the staging table.
+            batch_size (int, optional): The number of rows loaded into the staging table in a single batch.
+            bcp_path (str, optional): The path to the bcp executable.
             credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary
             vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
         """
@@ -509,35 +615,72 @@ class AzureSQLUpsert(Task):
         if not on:
             raise ValueError("'on' was not provided.")
 
+        if load_method not in ("fast_executemany", "bcp"):
+            raise ValueError(
+                "Please provide correct 'load_method' parameter value - 'fast_executemany' or 'bcp'."
+            )
+
         credentials = get_credentials(credentials_secret, vault_name=vault_name)
         azure_sql = AzureSQL(credentials=credentials)
 
-        # Create a temporary staging table.
-        # Hashtag marks a temp table in SQL server.
-        stg_table = "#" + "stg_" + table
         dtypes = get_sql_server_table_dtypes(
             schema=schema, table=table, con=azure_sql.con
         )
-        created = azure_sql.create_table(
+        if load_method == "bcp":
+            # bcp loads the columns by position, in the order of the staging table.
+            if set(df.columns) != set(dtypes):
+                raise ValidationError(
+                    "Detected discrepancies in number of columns or different column names between the DataFrame and the SQL table!"
+                )
+            df = df[list(dtypes)]
+            # bcp runs in a separate session, so it can't see a temporary table.
+            stg_table = f"stg_{table}_{uuid.uuid4().hex[:8]}"
+        else:
+            # Hashtag marks a temp table in SQL server.
+            stg_table = "#" + "stg_" + table
+        azure_sql.create_table(
             schema=schema, table=stg_table, dtypes=dtypes, if_exists="fail"
         )
 
-        # Insert data into the temp table
-        stg_table_fqn = f"{schema}.{stg_table}"
-        insert_query = gen_bulk_insert_query_from_df(df, table_fqn=stg_table_fqn)
-        inserted = azure_sql.run(insert_query)
-
-        # Upsert into prod table
-        merge_query = build_merge_query(
-            stg_schema=schema,
-            stg_table=stg_table,
-            schema=schema,
-            table=table,
-            primary_key=on,
-            con=azure_sql.con,
-        )
+        try:
+            # Insert data into the staging table
+            if load_method == "bcp":
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    files = write_csv_files(
+                        [df], path=os.path.join(tmp_dir, f"{stg_table}.csv")
+                    )
+                    bcp_load_files(
+                        files,
+                        fqn=f"{schema}.{stg_table}",
+                        credentials=azure_sql.credentials,
+                        chunksize=batch_size,
+                        error_log_file_path=os.path.join(tmp_dir, "log_file.log"),
+                        on_error="fail",
+                        bcp_path=bcp_path,
+                        logger=self.logger,
+                    )
+            else:
+                azure_sql.insert_df(
+                    df,
+                    table=stg_table,
+                    schema=schema,
+                    batch_size=batch_size,
+                    fast_executemany=True,
+                )
 
-        merged = azure_sql.run(merge_query)
+            # Upsert into prod table
+            merge_query = build_merge_query(
+                stg_schema=schema,
+                stg_table=stg_table,
+                schema=schema,
+                table=table,
+                primary_key=on,
+                con=azure_sql.con,
+            )
+            merged = azure_sql.run(merge_query)
+        finally:
+            if load_method == "bcp":
+                azure_sql.run(f"DROP TABLE IF EXISTS {schema}.{stg_table}")
 
         if merged:
             rows = df.shape[0]
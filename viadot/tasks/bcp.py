@@ -1,16 +1,26 @@
 import json
+import os
+import re
+import subprocess
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import timedelta
-from typing import Literal
+from typing import Any, Dict, Generator, Iterable, Literal, Tuple, Union
 
+from prefect.engine import signals
 from prefect.tasks.secrets import PrefectSecret
 from prefect.tasks.shell import ShellTask
 from prefect.utilities import logging
 from prefect.utilities.tasks import defaults_from_attrs
 
+from ..sources import SQLServer
 from .azure_key_vault import AzureKeyVaultSecret
 
 logger = logging.get_logger(__name__)
 
+BCP_PATH = "/opt/mssql-tools/bin/bcp"
+
 
 def parse_logs(log_file_path: str):
     with open(log_file_path) as log_file:
@@ -22,6 +32,280 @@ def parse_logs(log_file_path: str):
             logger.warning(line)
 
 
+def get_bcp_credentials(
+    credentials: dict = None, credentials_secret: str = None, vault_name: str = None
+) -> dict:
+    """Return the credentials to use with bcp, reading them from Azure Key Vault
+    if they're not provided directly.
+
+    Args:
+        credentials (dict, optional): The credentials to use for connecting with SQL Server.
+        credentials_secret (str, optional): The name of the Key Vault secret containing
+        database credentials (server, db_name, user, password).
+        vault_name (str, optional): The name of the vault from which to fetch the secret.
+
+    Returns:
+        dict: The database credentials.
+    """
+    if not credentials:
+        if not credentials_secret:
+            # attempt to read a default for the service principal secret name
+            try:
+                credentials_secret = PrefectSecret(
+                    "AZURE_DEFAULT_SQLDB_SERVICE_PRINCIPAL_SECRET"
+                ).run()
+            except ValueError:
+                pass
+
+        if credentials_secret:
+            credentials_str = AzureKeyVaultSecret(
+                credentials_secret, vault_name=vault_name
+            ).run()
+            credentials = json.loads(credentials_str)
+    return credentials
+
+
+def build_bcp_command(
+    path: str,
+    fqn: str,
+    credentials: dict,
+    chunksize: int = 5000,
+    error_log_file_path: str = "./log_file.log",
+    on_error: Literal["skip", "fail"] = "skip",
+    bcp_path: str = BCP_PATH,
+) -> str:
+    """Build the bcp CLI command inserting a local CSV file into a table.
+
+    Args:
+        path (str): The path to the local CSV file to be inserted.
+        fqn (str): The fully qualified name of the destination table.
+        credentials (dict): The credentials to use for connecting with SQL Server.
+        chunksize (int, optional): The chunk size to use. Defaults to 5000.
+        error_log_file_path (str, optional): Full path of an error file. Defaults to "./log_file.log".
+        on_error (Literal["skip", "fail"], optional): What to do if error occurs. Defaults to "skip".
+        bcp_path (str, optional): The path to the bcp executable. Defaults to BCP_PATH.
+
+    Raises:
+        ValueError: If `on_error` is incorrect.
+
+    Returns:
+        str: The bcp command.
+    """
+    server = credentials["server"]
+    db_name = credentials["db_name"]
+    uid = credentials["user"]
+    pwd = credentials["password"]
+
+    if "," in server:
+        # A space after the comma is allowed in the ODBC connection string
+        # but not in BCP's 'server' argument.
+        server = server.replace(" ", "")
+
+    if on_error == "skip":
+        max_error = 0
+    elif on_error == "fail":
+        max_error = 1
+    else:
+        raise ValueError(
+            "Please provide correct 'on_error' parameter value - 'skip' or 'fail'. "
+        )
+    return f"{bcp_path} {fqn} in '{path}' -S {server} -d {db_name} -U {uid} -P '{pwd}' -c -F 2 -b {chunksize} -h 'TABLOCK' -e '{error_log_file_path}' -m {max_error}"
+
+
+def run_bcp_command(command: str) -> subprocess.CompletedProcess:
+    """Run a bcp command outside of a Prefect task, eg. from a worker thread.
+
+    Args:
+        command (str): The bcp command, eg. built with `build_bcp_command()`.
+
+    Returns:
+        subprocess.CompletedProcess: The completed bcp process.
+    """
+    return subprocess.run(
+        ["bash", "-c", command],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+
+
+def split_file(
+    path: str, n_parts: int, chunk_size: int = 4 * 1024**2
+) -> Generator[str, None, None]:
+    """Split a CSV file at line boundaries into parts of roughly the same size.
+
+    Each part gets a copy of the header, so that it can be loaded like the original
+    file (bcp skips the first row with `-F 2`). The parts are named after the file,
+    eg. `data.csv` is split into `data_part0.csv`, `data_part1.csv`, etc.
+
+    Args:
+        path (str): The path to the CSV file.
+        n_parts (int): The number of parts. Small files may be split into fewer parts.
+        chunk_size (int, optional): The size of the chunks in which the data is copied.
+        Defaults to 4 MiB.
+
+    Yields:
+        Generator[str, None, None]: The paths of the parts, each as soon as it's written.
+    """
+    base_path, extension = os.path.splitext(path)
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        header = f.readline()
+        data_start = f.tell()
+
+        # Move each boundary forward to the start of the next line.
+        boundaries = [data_start]
+        for part_number in range(1, n_parts):
+            offset = data_start + part_number * (size - data_start) // n_parts
+            if offset <= boundaries[-1]:
+                continue
+            f.seek(offset - 1)
+            f.readline()
+            if f.tell() >= size:
+                break
+            if f.tell() > boundaries[-1]:
+                boundaries.append(f.tell())
+        boundaries.append(size)
+
+        for part_number, (start, end) in enumerate(zip(boundaries, boundaries[1:])):
+            part_path = f"{base_path}_part{part_number}{extension}"
+            f.seek(start)
+            with open(part_path, "wb") as part:
+                part.write(header)
+                remaining = end - start
+                while remaining > 0:
+                    chunk = f.read(min(chunk_size, remaining))
+                    part.write(chunk)
+                    remaining -= len(chunk)
+            yield part_path
+
+
+def bcp_load_files(
+    files: Iterable[str],
+    fqn: str,
+    credentials: dict,
+    max_concurrent_loads: int = 4,
+    chunksize: int = 5000,
+    error_log_file_path: str = "./log_file.log",
+    on_error: Literal["skip", "fail"] = "skip",
+    bcp_path: str = BCP_PATH,
+    remove_files: bool = True,
+    logger: Any = logger,
+) -> Dict[str, Any]:
+    """Load CSV files into a table with concurrent bcp processes.
+
+    Each file is loaded as soon as it is produced by `files`, so that files can be
+    loaded while the next ones are being written, eg. by `write_csv_files()`. At most
+    `max_concurrent_loads` bcp processes run at the same time; while they are all busy,
+    no further files are taken from `files`, which bounds the number of files on disk.
+    Once a load fails, no further files are loaded.
+
+    The error logs of the bcp processes are merged into `error_log_file_path`.
+
+    Args:
+        files (Iterable[str]): The paths to the CSV files, eg. a generator.
+        fqn (str): The fully qualified name of the destination table.
+        credentials (dict): The credentials to use for connecting with SQL Server.
+        max_concurrent_loads (int, optional): The maximum number of concurrent bcp processes.
+        Defaults to 4.
+        chunksize (int, optional): The bcp batch size. Defaults to 5000.
+        error_log_file_path (str, optional): Full path of the bcp error file. Defaults to "./log_file.log".
+        on_error (Literal["skip", "fail"], optional): What to do if a bcp error occurs. Defaults to "skip".
+        bcp_path (str, optional): The path to the bcp executable. Defaults to BCP_PATH.
+        remove_files (bool, optional): Whether to remove the files once loaded. Defaults to True.
+        logger (Any, optional): The logger to use. Defaults to the module's logger.
+
+    Raises:
+        signals.FAIL: If any of the bcp processes fails.
+
+    Returns:
+        Dict[str, Any]: The number of files and rows loaded, the total time in seconds
+        and the load rate in rows per second.
+    """
+    error_log_base_path, error_log_extension = os.path.splitext(error_log_file_path)
+
+    def _load_file(file_path: str, file_number: int) -> Tuple[str, Any]:
+        part_error_log_path = (
+            f"{error_log_base_path}_{file_number}{error_log_extension}"
+        )
+        command = build_bcp_command(
+            path=file_path,
+            fqn=fqn,
+            credentials=credentials,
+            chunksize=chunksize,
+            error_log_file_path=part_error_log_path,
+            on_error=on_error,
+            bcp_path=bcp_path,
+        )
+        return part_error_log_path, run_bcp_command(command)
+
+    start = time.perf_counter()
+    n_files = 0
+    n_rows = 0
+    failed = []
+    pending = {}
+
+    def _collect(futures) -> None:
+        nonlocal n_rows
+        for future in futures:
+            file_path = pending.pop(future)
+            part_error_log_path, process = future.result()
+            if os.path.exists(part_error_log_path):
+                with open(part_error_log_path) as part_log:
+                    with open(error_log_file_path, "a") as log:
+                        log.write(part_log.read())
+                os.remove(part_error_log_path)
+            if process.returncode != 0:
+                logger.error(
+                    f"Loading {file_path} failed: {process.stderr or process.stdout}"
+                )
+                failed.append(file_path)
+            else:
+                rows_copied = re.search(r"(\d+) rows copied", process.stdout)
+                if rows_copied:
+                    n_rows += int(rows_copied.group(1))
+                logger.info(f"Successfully loaded {file_path}.")
+            if remove_files:
+                os.remove(file_path)
+
+    if os.path.exists(error_log_file_path):
+        os.remove(error_log_file_path)
+
+    files = iter(files)
+    try:
+        with ThreadPoolExecutor(max_workers=max_concurrent_loads) as executor:
+            for file_path in files:
+                logger.info(f"Loading {file_path} into {fqn}...")
+                pending[executor.submit(_load_file, file_path, n_files)] = file_path
+                n_files += 1
+                if failed:
+                    break
+                if len(pending) >= max_concurrent_loads:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    _collect(finished)
+            _collect(list(pending))
+    finally:
+        if hasattr(files, "close"):
+            files.close()
+
+    try:
+        parse_logs(error_log_file_path)
+    except:
+        logger.warning("BCP logs couldn't be parsed.")
+
+    if failed:
+        raise signals.FAIL(message=f"Loading files {failed} into {fqn} failed.")
+
+    elapsed = time.perf_counter() - start
+    rows_per_second = n_rows / elapsed if elapsed else 0
+    logger.info(
+        f"Loaded {n_files} files ({n_rows} rows) into {fqn} in {elapsed:.2f}s ({rows_per_second:.0f} rows/s)."
+    )
+    return dict(
+        files=n_files, rows=n_rows, seconds=elapsed, rows_per_second=rows_per_second
+    )
+
+
 class BCPTask(ShellTask):
     """
     Task for bulk inserting data into SQL Server-compatible databases.
@@ -34,6 +318,11 @@ class BCPTask(ShellTask):
         - on_error (Literal["skip", "fail"], optional): What to do if error occurs. Defaults to "skip".
         - credentials (dict, optional): The credentials to use for connecting with the database.
         - vault_name (str): The name of the vault from which to fetch the secret.
+        - bcp_path (str, optional): The path to the bcp executable. Defaults to BCP_PATH.
+        - parallel (int, optional): The number of bcp processes to load the file with. If greater than 1,
+            the file is split at line boundaries into `parallel` parts, which are loaded concurrently
+            into a staging table. The staging table is only inserted into the destination table once all
+            parts are loaded, so that retrying a failed load doesn't duplicate rows. Defaults to 1.
         - timeout(int, optional): The amount of time (in seconds) to wait while running this task before
             a timeout occurs. Defaults to 3600.
         - **kwargs (dict, optional): Additional keyword arguments to pass to the Task constructor.
@@ -49,6 +338,8 @@ class BCPTask(ShellTask):
         on_error: Literal["skip", "fail"] = "skip",
         credentials: dict = None,
         vault_name: str = None,
+        bcp_path: str = BCP_PATH,
+        parallel: int = 1,
         max_retries: int = 3,
         retry_delay: timedelta = timedelta(seconds=10),
         timeout: int = 3600,
@@ -63,6 +354,8 @@ class BCPTask(ShellTask):
         self.on_error = on_error
         self.credentials = credentials
         self.vault_name = vault_name
+        self.bcp_path = bcp_path
+        self.parallel = parallel
 
         super().__init__(
             name="bcp",
@@ -75,6 +368,13 @@ class BCPTask(ShellTask):
             **kwargs,
         )
 
+    @staticmethod
+    def _execute(sql_server: SQLServer, query: str) -> None:
+        cursor = sql_server.con.cursor()
+        cursor.execute(query)
+        sql_server.con.commit()
+        cursor.close()
+
     @defaults_from_attrs(
         "path",
         "schema",
@@ -84,6 +384,8 @@ class BCPTask(ShellTask):
         "on_error",
         "credentials",
         "vault_name",
+        "bcp_path",
+        "parallel",
         "max_retries",
         "retry_delay",
     )
@@ -98,10 +400,12 @@ class BCPTask(ShellTask):
         credentials: dict = None,
         credentials_secret: str = None,
         vault_name: str = None,
+        bcp_path: str = None,
+        parallel: int = None,
         max_retries: int = None,
         retry_delay: timedelta = None,
         **kwargs,
-    ) -> str:
+    ) -> Union[str, Dict[str, Any]]:
         """
         Task run method.
         Args:
@@ -115,46 +419,57 @@ class BCPTask(ShellTask):
         - credentials_secret (str, optional): The name of the Key Vault secret containing database credentials.
         (server, db_name, user, password)
         - vault_name (str): The name of the vault from which to fetch the secret.
+        - bcp_path (str, optional): The path to the bcp executable.
+        - parallel (int, optional): The number of bcp processes to load the file with, through a staging table.
         Returns:
-            str: The output of the bcp CLI command.
+            Union[str, Dict[str, Any]]: The output of the bcp CLI command or, with `parallel` greater than 1,
+            the number of parts and rows loaded, the total time in seconds and the load rate in rows per second.
         """
-        if not credentials:
-            if not credentials_secret:
-                # attempt to read a default for the service principal secret name
-                try:
-                    credentials_secret = PrefectSecret(
-                        "AZURE_DEFAULT_SQLDB_SERVICE_PRINCIPAL_SECRET"
-                    ).run()
-                except ValueError:
-                    pass
-
-            if credentials_secret:
-                credentials_str = AzureKeyVaultSecret(
-                    credentials_secret, vault_name=vault_name
-                ).run()
-                credentials = json.loads(credentials_str)
+        credentials = get_bcp_credentials(
+            credentials=credentials,
+            credentials_secret=credentials_secret,
+            vault_name=vault_name,
+        )
 
         fqn = f"{schema}.{table}" if schema else table
-
-        server = credentials["server"]
-        db_name = credentials["db_name"]
-        uid = credentials["user"]
-        pwd = credentials["password"]
-
-        if "," in server:
-            # A space after the comma is allowed in the ODBC connection string
-            # but not in BCP's 'server' argument.
-            server = server.replace(" ", "")
-
-        if on_error == "skip":
-            max_error = 0
-        elif on_error == "fail":
-            max_error = 1
-        else:
-            raise ValueError(
-                "Please provide correct 'on_error' parameter value - 'skip' or 'fail'. "
+        if parallel > 1:
+            # The parts are committed independently, so they're loaded into a staging table,
+            # and only moved into the destination table once they're all loaded.
+            sql_server = SQLServer(credentials={**credentials})
+            staging_fqn = f"{fqn}_staging_{uuid.uuid4().hex[:8]}"
+            self.logger.info(
+                f"Loading the parts through the staging table {staging_fqn}."
             )
-        command = f"/opt/mssql-tools/bin/bcp {fqn} in '{path}' -S {server} -d {db_name} -U {uid} -P '{pwd}' -c -F 2 -b {chunksize} -h 'TABLOCK' -e '{error_log_file_path}' -m {max_error}"
+            self._execute(sql_server, f"SELECT TOP 0 * INTO {staging_fqn} FROM {fqn}")
+            try:
+                result = bcp_load_files(
+                    split_file(path, n_parts=parallel),
+                    fqn=staging_fqn,
+                    credentials=credentials,
+                    max_concurrent_loads=parallel,
+                    chunksize=chunksize,
+                    error_log_file_path=error_log_file_path,
+                    on_error=on_error,
+                    bcp_path=bcp_path,
+                    logger=self.logger,
+                )
+                self._execute(
+                    sql_server,
+                    f"INSERT INTO {fqn} WITH (TABLOCK) SELECT * FROM {staging_fqn}",
+                )
+            finally:
+                self._execute(sql_server, f"DROP TABLE IF EXISTS {staging_fqn}")
+            return result
+
+        command = build_bcp_command(
+            path=path,
+            fqn=fqn,
+            credentials=credentials,
+            chunksize=chunksize,
+            error_log_file_path=error_log_file_path,
+            on_error=on_error,
+            bcp_path=bcp_path,
+        )
         run_command = super().run(command=command, **kwargs)
         try:
             parse_logs(error_log_file_path)
@@ -1,4 +1,4 @@
-from typing import Any, List, Literal, NoReturn, Tuple, Union
+from typing import Any, Dict, List, Literal, NoReturn, Tuple, Union
 
 import pandas as pd
 from prefect import Task
@@ -7,6 +7,7 @@ from prefect.utilities.tasks import defaults_from_attrs
 from ..signals import SKIP
 from ..sources import DuckDB
 from ..utils import check_if_empty_file
+from .bcp import BCP_PATH, bcp_load_files, get_bcp_credentials
 
 Record = Tuple[Any]
 
@@ -61,6 +62,82 @@ class DuckDBQuery(Task):
         return result
 
 
+class DuckDBRunScripts(Task):
+    """
+    Task for running a directory of dependent SQL scripts on DuckDB, executing
+    independent scripts concurrently.
+
+    Args:
+        dependencies (Dict[str, List[str]], optional): Explicitly declared dependencies,
+            mapping script names to the scripts they depend on. Defaults to None.
+        max_workers (int, optional): The maximum number of scripts run concurrently.
+            Defaults to 4.
+        log_table (str, optional): The table in which to record the runtime of each
+            script. Defaults to "run_log".
+        log_schema (str, optional): The schema of the log table. Defaults to None.
+        credentials (dict, optional): The config to use for connecting with the db.
+        timeout(int, optional): The amount of time (in seconds) to wait while running this task before
+            a timeout occurs. Defaults to 3600.
+    """
+
+    def __init__(
+        self,
+        dependencies: Dict[str, List[str]] = None,
+        max_workers: int = 4,
+        log_table: str = "run_log",
+        log_schema: str = None,
+        credentials: dict = None,
+        timeout: int = 3600,
+        *args,
+        **kwargs,
+    ):
+        self.dependencies = dependencies
+        self.max_workers = max_workers
+        self.log_table = log_table
+        self.log_schema = log_schema
+        self.credentials = credentials
+        super().__init__(name="run_duckdb_scripts", timeout=timeout, *args, **kwargs)
+
+    @defaults_from_attrs(
+        "dependencies", "max_workers", "log_table", "log_schema", "credentials"
+    )
+    def run(
+        self,
+        path: str,
+        dependencies: Dict[str, List[str]] = None,
+        max_workers: int = None,
+        log_table: str = None,
+        log_schema: str = None,
+        credentials: dict = None,
+    ) -> List[Dict[str, Any]]:
+        """Run the SQL scripts from a directory on DuckDB.
+
+        Args:
+            path (str, required): The directory containing the `.sql` files.
+            dependencies (Dict[str, List[str]], optional): Explicitly declared
+            dependencies, mapping script names to the scripts they depend on.
+            max_workers (int, optional): The maximum number of scripts run concurrently.
+            log_table (str, optional): The table in which to record the runtime of each script.
+            log_schema (str, optional): The schema of the log table.
+            credentials (dict, optional): The config to use for connecting with the db.
+
+        Returns:
+            List[Dict[str, Any]]: The log records of the scripts that were run.
+        """
+
+        duckdb = DuckDB(credentials=credentials)
+        records = duckdb.run_scripts(
+            path=path,
+            dependencies=dependencies,
+            max_workers=max_workers,
+            log_table=log_table,
+            log_schema=log_schema,
+        )
+
+        self.logger.info(f"Successfully ran {len(records)} scripts.")
+        return records
+
+
 class DuckDBCreateTableFromParquet(Task):
     """
     Task for creating a DuckDB table with a CTAS from Parquet file(s).
@@ -219,3 +296,153 @@ class DuckDBToDF(Task):
 
         self.logger.info(f"Data has been loaded sucessfully.")
         return df
+
+
+class DuckDBToSQLServerStream(Task):
+    """
+    Stream the result of a DuckDB query into an existing SQL Server table.
+
+    The data is fetched from DuckDB in record batches and written into rotating CSV
+    files of at most `rows_per_file` rows. Each file is loaded with bcp as soon as
+    it is complete, while the next one is being extracted, and removed once loaded.
+    At most `max_concurrent_loads` bcp processes run at the same time, which also
+    bounds the number of files kept on disk.
+
+    Args:
+        sep (str, optional): The separator to use in the CSV files. Defaults to "\t".
+        batch_size (int, optional): The number of rows fetched from DuckDB at a time.
+            Defaults to 100 000.
+        rows_per_file (int, optional): The maximum number of rows in a single CSV file.
+            Defaults to 1 000 000.
+        max_concurrent_loads (int, optional): The maximum number of concurrent bcp processes.
+            Defaults to 4.
+        chunksize (int, optional): The bcp batch size. Defaults to 5000.
+        on_error (Literal["skip", "fail"], optional): What to do if a bcp error occurs.
+            Defaults to "skip".
+        error_log_file_path (str, optional): Full path of the bcp error file. Defaults to "./log_file.log".
+        if_empty (Literal["warn", "skip", "fail"], optional): What to do if the query returns no data.
+            Defaults to "warn".
+        bcp_path (str, optional): The path to the bcp executable. Defaults to BCP_PATH.
+        duckdb_credentials (dict, optional): The config to use for connecting with DuckDB.
+        sql_server_credentials (dict, optional): The credentials to use for connecting with SQL Server.
+        timeout(int, optional): The amount of time (in seconds) to wait while running this task before
+            a timeout occurs. Defaults to 3600.
+    """
+
+    def __init__(
+        self,
+        sep: str = "\t",
+        batch_size: int = 100_000,
+        rows_per_file: int = 1_000_000,
+        max_concurrent_loads: int = 4,
+        chunksize: int = 5000,
+        on_error: Literal["skip", "fail"] = "skip",
+        error_log_file_path: str = "./log_file.log",
+        if_empty: Literal["warn", "skip", "fail"] = "warn",
+        bcp_path: str = BCP_PATH,
+        duckdb_credentials: dict = None,
+        sql_server_credentials: dict = None,
+        timeout: int = 3600,
+        *args,
+        **kwargs,
+    ):
+        self.sep = sep
+        self.batch_size = batch_size
+        self.rows_per_file = rows_per_file
+        self.max_concurrent_loads = max_concurrent_loads
+        self.chunksize = chunksize
+        self.on_error = on_error
+        self.error_log_file_path = error_log_file_path
+        self.if_empty = if_empty
+        self.bcp_path = bcp_path
+        self.duckdb_credentials = duckdb_credentials
+        self.sql_server_credentials = sql_server_credentials
+
+        super().__init__(
+            name="duckdb_to_sql_server_stream", timeout=timeout, *args, **kwargs
+        )
+
+    @defaults_from_attrs(
+        "sep",
+        "batch_size",
+        "rows_per_file",
+        "max_concurrent_loads",
+        "chunksize",
+        "on_error",
+        "error_log_file_path",
+        "if_empty",
+        "bcp_path",
+        "duckdb_credentials",
+        "sql_server_credentials",
+    )
+    def run(
+        self,
+        query: str,
+        path: str,
+        table: str,
+        schema: str = None,
+        sep: str = None,
+        batch_size: int = None,
+        rows_per_file: int = None,
+        max_concurrent_loads: int = None,
+        chunksize: int = None,
+        on_error: Literal["skip", "fail"] = None,
+        error_log_file_path: str = None,
+        if_empty: Literal["warn", "skip", "fail"] = None,
+        bcp_path: str = None,
+        duckdb_credentials: dict = None,
+        sql_server_credentials: dict = None,
+    ) -> Dict[str, Any]:
+        """
+        Stream the result of a DuckDB query into an existing SQL Server table.
+
+        Args:
+            query (str, required): The SELECT query to execute on DuckDB.
+            path (str, required): The base path of the intermediate CSV files.
+            table (str, required): The destination table.
+            schema (str, optional): The destination schema. Defaults to None.
+            sep (str, optional): The separator to use in the CSV files.
+            batch_size (int, optional): The number of rows fetched from DuckDB at a time.
+            rows_per_file (int, optional): The maximum number of rows in a single CSV file.
+            max_concurrent_loads (int, optional): The maximum number of concurrent bcp processes.
+            chunksize (int, optional): The bcp batch size.
+            on_error (Literal["skip", "fail"], optional): What to do if a bcp error occurs.
+            error_log_file_path (str, optional): Full path of the bcp error file.
+            if_empty (Literal["warn", "skip", "fail"], optional): What to do if the query returns no data.
+            bcp_path (str, optional): The path to the bcp executable.
+            duckdb_credentials (dict, optional): The config to use for connecting with DuckDB.
+            sql_server_credentials (dict, optional): The credentials to use for connecting with SQL Server.
+
+        Raises:
+            signals.FAIL: If any of the bcp processes fails.
+
+        Returns:
+            Dict[str, Any]: The number of files and rows loaded, and the total time in seconds.
+        """
+        duckdb = DuckDB(credentials=duckdb_credentials)
+        sql_server_credentials = get_bcp_credentials(credentials=sql_server_credentials)
+        fqn = f"{schema}.{table}" if schema else table
+
+        files = duckdb.to_csv_files(
+            query=query,
+            path=path,
+            sep=sep,
+            batch_size=batch_size,
+            rows_per_file=rows_per_file,
+        )
+        result = bcp_load_files(
+            files,
+            fqn=fqn,
+            credentials=sql_server_credentials,
+            max_concurrent_loads=max_concurrent_loads,
+            chunksize=chunksize,
+            error_log_file_path=error_log_file_path,
+            on_error=on_error,
+            bcp_path=bcp_path,
+            logger=self.logger,
+        )
+
+        if result["files"] == 0:
+            duckdb._handle_if_empty(if_empty)
+
+        return result
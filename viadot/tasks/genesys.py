@@ -1,5 +1,5 @@
 import os
-import time
+from copy import deepcopy
 from typing import Any, Dict, List
 
 import numpy as np
@@ -18,6 +18,47 @@ from viadot.task_utils import *
 
 logger = logging.get_logger()
 
+LEVEL_3_KEYS = ["metrics", "segments", "mediaEndpointStats"]
+
+
+def _flatten_record(record: Dict[str, Any], sep: str = ".") -> Dict[str, Any]:
+    """Flatten a JSON record the same way as `pd.json_normalize()`.
+
+    The values of the record come first, followed by the values of its nested dictionaries,
+    named after their path (eg. `flow.flowId`).
+
+    Args:
+        record (Dict[str, Any]): The record to flatten.
+        sep (str, optional): The separator of the nested keys. Defaults to ".".
+
+    Returns:
+        Dict[str, Any]: The flattened record.
+    """
+    flat_record = {
+        key: value for key, value in record.items() if not isinstance(value, dict)
+    }
+
+    def _flatten(nested: Dict[str, Any], prefix: str) -> None:
+        for key, value in nested.items():
+            name = f"{prefix}{sep}{key}"
+            if isinstance(value, dict):
+                _flatten(value, name)
+            else:
+                flat_record[name] = value
+
+    for key, value in record.items():
+        if isinstance(value, dict):
+            _flatten(value, str(key))
+    return flat_record
+
+
+def _get_records(record: Dict[str, Any], key: str) -> List[Dict[str, Any]]:
+    """Get the nested records of a JSON record, treating missing ones as an empty list."""
+    records = record.get(key)
+    if records is None or (not isinstance(records, list) and pd.isnull(records)):
+        return []
+    return records
+
 
 class GenesysToCSV(Task):
     def __init__(
@@ -183,36 +224,74 @@ class GenesysToCSV(Task):
         Returns:
             DataFrame: A single data frame with all the content.
         """
+        # The levels are flattened like `pd.json_normalize()` does (nested dictionaries
+        # are expanded into columns, and the columns of the parent records are added as
+        # object columns), but in a single traversal of the conversations.
+        records_0, records_1, records_2 = [], [], []
+        conversation_ids, external_contact_ids, participant_ids = [], [], []
+        dfs_3 = []
+
+        for conversation in data_to_merge:
+            records_0.append(_flatten_record(conversation, sep="."))
+            conversation_id = conversation["conversationId"]
+
+            records_3 = {key: [] for key in LEVEL_3_KEYS}
+            columns_3 = {key: {} for key in LEVEL_3_KEYS}
+            has_sessions = False
+            for participant in conversation["participants"]:
+                records_1.append(_flatten_record(participant, sep="."))
+                conversation_ids.append(conversation_id)
+
+                for session in _get_records(participant, "sessions"):
+                    has_sessions = True
+                    records_2.append(_flatten_record(session, sep="_"))
+                    external_contact_ids.append(
+                        participant.get("externalContactId", np.nan)
+                    )
+                    participant_ids.append(participant.get("participantId", np.nan))
+
+                    for key in LEVEL_3_KEYS:
+                        for record in _get_records(session, key):
+                            record_3 = {
+                                f"{key}_{name}": value
+                                for name, value in _flatten_record(
+                                    record, sep="_"
+                                ).items()
+                            }
+                            columns_3[key].update(dict.fromkeys(record_3))
+                            record_3["sessionId"] = session.get("sessionId", np.nan)
+                            records_3[key].append(record_3)
+
+            # One data frame per conversation and level 3 key, concatenated at the end,
+            # so that the columns are ordered and typed as when the conversations were
+            # normalized one by one: a conversation without any session has no
+            # `sessionId` column, and a column missing from any data frame, even an
+            # empty one, is made nullable (eg. integers become floats).
+            for key in LEVEL_3_KEYS:
+                if not has_sessions:
+                    dfs_3.append(pd.DataFrame())
+                    continue
+                df3 = pd.DataFrame(
+                    records_3[key], columns=[*columns_3[key], "sessionId"]
+                )
+                # Like the other columns of the parent records.
+                if df3["sessionId"].dtype != object:
+                    df3["sessionId"] = df3["sessionId"].astype(object)
+                dfs_3.append(df3)
+
         # LEVEL 0
-        df0 = pd.json_normalize(data_to_merge)
+        df0 = pd.DataFrame(records_0)
         df0.drop(["participants"], axis=1, inplace=True)
 
         # LEVEL 1
-        df1 = pd.json_normalize(
-            data_to_merge,
-            record_path=["participants"],
-            meta=["conversationId"],
-        )
+        df1 = pd.DataFrame(records_1)
+        df1["conversationId"] = np.array(conversation_ids, dtype=object)
         df1.drop(["sessions"], axis=1, inplace=True)
 
         # LEVEL 2
-        df2 = pd.json_normalize(
-            data_to_merge,
-            record_path=["participants", "sessions"],
-            meta=[
-                ["participants", "externalContactId"],
-                ["participants", "participantId"],
-            ],
-            errors="ignore",
-            sep="_",
-        )
-        df2.rename(
-            columns={
-                "participants_externalContactId": "externalContactId",
-                "participants_participantId": "participantId",
-            },
-            inplace=True,
-        )
+        df2 = pd.DataFrame(records_2)
+        df2["externalContactId"] = np.array(external_contact_ids, dtype=object)
+        df2["participantId"] = np.array(participant_ids, dtype=object)
         for key in ["metrics", "segments", "mediaEndpointStats"]:
             try:
                 df2.drop([key], axis=1, inplace=True)
@@ -220,79 +299,9 @@ class GenesysToCSV(Task):
                 logger.info(f"Key {e} not appearing in the response.")
 
         # LEVEL 3
-        # not all levels 3 have the same data, and that creates problems of standardization
-        # so I add empty data where it is not available to avoid future errors
-        conversations_df = {}
-        for i, conversation in enumerate(data_to_merge):
-            for j, entry_0 in enumerate(conversation["participants"]):
-                for key in list(entry_0.keys()):
-                    if key == "sessions":
-                        for k, entry_1 in enumerate(entry_0[key]):
-                            if "metrics" not in list(entry_1.keys()):
-                                conversation["participants"][j][key][k]["metrics"] = []
-                            if "segments" not in list(entry_1.keys()):
-                                conversation["participants"][j][key][k]["segments"] = []
-                            if "mediaEndpointStats" not in list(entry_1.keys()):
-                                conversation["participants"][j][key][k][
-                                    "mediaEndpointStats"
-                                ] = []
-            # LEVEL 3 metrics
-            df3_1 = pd.json_normalize(
-                conversation,
-                record_path=["participants", "sessions", "metrics"],
-                meta=[
-                    ["participants", "sessions", "sessionId"],
-                ],
-                errors="ignore",
-                record_prefix="metrics_",
-                sep="_",
-            )
-            df3_1.rename(
-                columns={"participants_sessions_sessionId": "sessionId"}, inplace=True
-            )
-            # LEVEL 3 segments
-            df3_2 = pd.json_normalize(
-                conversation,
-                record_path=["participants", "sessions", "segments"],
-                meta=[
-                    ["participants", "sessions", "sessionId"],
-                ],
-                errors="ignore",
-                record_prefix="segments_",
-                sep="_",
-            )
-            df3_2.rename(
-                columns={"participants_sessions_sessionId": "sessionId"}, inplace=True
-            )
-            # LEVEL 3 mediaEndpointStats
-            df3_3 = pd.json_normalize(
-                conversation,
-                record_path=["participants", "sessions", "mediaEndpointStats"],
-                meta=[
-                    ["participants", "sessions", "sessionId"],
-                ],
-                errors="ignore",
-                record_prefix="mediaEndpointStats_",
-                sep="_",
-            )
-            df3_3.rename(
-                columns={"participants_sessions_sessionId": "sessionId"}, inplace=True
-            )
-
-            # merging all LEVELs 3 from the same conversation
-            dff3_tmp = pd.concat([df3_1, df3_2])
-            dff3 = pd.concat([dff3_tmp, df3_3])
-
-            conversations_df.update({i: dff3})
+        dff3_f = pd.concat(dfs_3)
 
         # NERGING ALL LEVELS
-        # LEVELS 3
-        for l, key in enumerate(list(conversations_df.keys())):
-            if l == 0:
-                dff3_f = conversations_df[key]
-            else:
-                dff3_f = pd.concat([dff3_f, conversations_df[key]])
-
         # LEVEL 3 with LEVEL 2
         dff2 = pd.merge(dff3_f, df2, how="outer", on=["sessionId"])
 
@@ -326,7 +335,7 @@ class GenesysToCSV(Task):
         self,
         report_name: str = None,
         view_type: str = None,
-        view_type_time_sleep: int = 80,
+        view_type_time_sleep: int = 600,
         environment: str = None,
         report_url: str = None,
         post_data_list: List[str] = None,
@@ -347,7 +356,8 @@ class GenesysToCSV(Task):
         Args:
             report_name (str, optional): The name of this task. Defaults to a general name 'genesys_to_csv'.
             view_type (str, optional): The type of view export job to be created. Defaults to None.
-            view_type_time_sleep (int, optional): Waiting time to retrieve data from Genesys API. Defaults to 80.
+            view_type_time_sleep (int, optional): Maximum time, in seconds, to wait for the reports to be generated
+                in Genesys API. The reports are polled and downloaded as soon as they're completed. Defaults to 600.
             post_data_list (List[str], optional): List of string templates to generate json body. Defaults to None.
             end_point (str, optional): Final end point for Genesys connection. Defaults to "analytics/reporting/exports".
             credentials_genesys (Dict[str, Any], optional): Credentials to connect with Genesys API containing CLIENT_ID. Defaults to None.
@@ -391,75 +401,27 @@ class GenesysToCSV(Task):
             report_columns=report_columns,
         )
 
-        if view_type == "queue_performance_detail_view":
-            genesys.genesys_api_connection(
-                post_data_list=post_data_list, end_point=end_point
-            )
-
-            logger.info(
-                f"Waiting {view_type_time_sleep} seconds for caching data in Genesys database."
-            )
-            # sleep time to allow Genesys generate all exports
-            time.sleep(view_type_time_sleep)
-            # in order to wait for API POST request add it
-            timeout_start = time.time()
-            # 30 seconds timeout is minimal but for safety added 60.
-            timeout = timeout_start + 60
-            # while loop with timeout
-            while time.time() < timeout:
-                try:
-                    genesys.get_reporting_exports_data()
-                    urls = [col for col in np.array(genesys.report_data).T][1]
-                    if None in urls:
-                        logger.warning("Found None object in list of urls.")
-                    else:
-                        break
-                except TypeError:
-                    pass
-
-                # There is a need to clear a list before repeating try statement.
-                genesys.report_data.clear()
-
-        elif view_type in [
-            "agent_performance_summary_view",
-            "agent_status_summary_view",
-            "agent_status_detail_view",
-            "agent_interaction_detail_view",
-            "agent_timeline_summary_view",
-        ]:
+        if view_type is not None and end_point == "analytics/reporting/exports":
             genesys.genesys_api_connection(
                 post_data_list=post_data_list, end_point=end_point
             )
-            logger.info(
-                f"Waiting for getting data in Genesys database ({view_type_time_sleep} seconds)."
+            logger.info("Waiting for the reports to be generated in Genesys database.")
+            # Each report is downloaded and deleted as soon as it's completed.
+            file_names = genesys.process_reporting_exports(
+                expected_count=len(post_data_list),
+                path=self.local_file_path,
+                timeout=view_type_time_sleep,
             )
-            time.sleep(view_type_time_sleep)
-
-            genesys.get_reporting_exports_data()
-
-        if view_type is not None and end_point == "analytics/reporting/exports":
-            failed = [col for col in np.array(genesys.report_data).T][-1]
 
+            failed = [single_report[-1] for single_report in genesys.report_data]
             if "FAILED" in failed and "COMPLETED" in failed:
                 logger.warning("Some reports failed.")
 
-            if len(genesys.report_data) == 0 or np.unique(failed)[0] == "FAILED":
-                genesys.delete_all_reporting_exports()
+            if len(genesys.report_data) == 0 or set(failed) == {"FAILED"}:
                 logger.warning(f"All existing reports were deleted.")
                 raise APIError("No exporting reports were generated.")
-            elif not None in [col for col in np.array(genesys.report_data).T][1]:
-                logger.info("Downloaded the data from the Genesys into the CSV.")
-            else:
-                logger.info("Succesfully loaded all exports.")
 
-            file_names = genesys.download_all_reporting_exports(
-                path=self.local_file_path
-            )
             logger.info("Downloaded the data from the Genesys into the CSV.")
-            # in order to wait for API GET request call it
-            logger.info("Waiting for caching data in Genesys database.")
-            time.sleep(20)
-            genesys.delete_all_reporting_exports()
             logger.info(f"All existing reports were deleted.")
 
             return file_names
@@ -469,34 +431,28 @@ class GenesysToCSV(Task):
                 logger.error("Not available more than one body for this end-point.")
                 raise signals.FAIL(message="Stopping the flow.")
 
-            stop_loop = False
-            page_counter = post_data_list[0]["paging"]["pageNumber"]
-            merged_data = {}
-            while not stop_loop:
-                report = genesys.genesys_api_connection(
-                    post_data_list=post_data_list, end_point=end_point
-                )
-                merged_data_frame = self.merge_conversations_dfs(
-                    report["conversations"]
-                )
-
-                merged_data.update(
-                    {post_data_list[0]["paging"]["pageNumber"]: merged_data_frame}
+            # The first page gives the number of pages, the next ones are requested concurrently.
+            first_page = post_data_list[0]["paging"]["pageNumber"]
+            reports = genesys.genesys_api_connection(
+                post_data_list=post_data_list, end_point=end_point
+            )
+            max_calls = int(np.ceil(reports[0]["totalHits"] / 100))
+            next_pages = []
+            for page_number in range(first_page + 1, max_calls + 1):
+                next_page = deepcopy(post_data_list[0])
+                next_page["paging"]["pageNumber"] = page_number
+                next_pages.append(next_page)
+            if next_pages:
+                reports += genesys.genesys_api_connection(
+                    post_data_list=next_pages, end_point=end_point
                 )
 
-                if page_counter == 1:
-                    max_calls = int(np.ceil(report["totalHits"] / 100))
-                if page_counter == max_calls:
-                    stop_loop = True
-
-                post_data_list[0]["paging"]["pageNumber"] += 1
-                page_counter += 1
-
-            for i, key in enumerate(list(merged_data.keys())):
-                if i == 0:
-                    final_df = merged_data[key]
-                else:
-                    final_df = pd.concat([final_df, merged_data[key]])
+            final_df = pd.concat(
+                [
+                    self.merge_conversations_dfs(report["conversations"])
+                    for report in reports
+                ]
+            )
 
             date = start_date.replace("-", "")
             file_name = f"conversations_detail_{date}".upper() + ".csv"
@@ -528,7 +484,7 @@ class GenesysToCSV(Task):
                     post_data_list=post_data_list,
                     end_point=f"{end_point}/{id}",
                     method="GET",
-                )
+                )[-1]
                 logger.info(f"Generated webmsg_response for {id}")
 
                 attributes = json_file["participants"][0]["attributes"]
@@ -572,7 +528,7 @@ class GenesysToCSV(Task):
                 post_data_list=post_data_list,
                 end_point=f"{end_point}/?pageSize=500&pageNumber=1&expand=presence,dateLastLogin,groups,employerInfo,lasttokenissued&state=any",
                 method="GET",
-            )
+            )[-1]
             last_page = temp_json["pageCount"] + 1
 
             data_list = []
@@ -583,7 +539,7 @@ class GenesysToCSV(Task):
                     post_data_list=post_data_list,
                     end_point=f"{end_point}/?pageSize=500&pageNumber={n}&expand=presence,dateLastLogin,groups,employerInfo,lasttokenissued&state=any",
                     method="GET",
-                )
+                )[-1]
                 logger.info(f"Downloaded: {n} page")
 
                 num_ids = len(json_file["entities"])
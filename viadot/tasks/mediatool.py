@@ -7,6 +7,7 @@ from prefect.utilities.tasks import defaults_from_attrs
 
 from viadot.task_utils import *
 
+from ..cache import ExtractCache
 from ..sources import Mediatool
 
 logger = logging.get_logger()
@@ -24,6 +25,7 @@ class MediatoolToDF(Task):
         media_entries_columns: List[str] = None,
         mediatool_credentials: dict = None,
         mediatool_credentials_key: str = None,
+        cache_ttl: int = None,
         *args: List[Any],
         **kwargs: Dict[str, Any],
     ):
@@ -35,8 +37,11 @@ class MediatoolToDF(Task):
             media_entries_columns (List[str], optional): List of media entries fields to download. Defaults to None.
             mediatool_credentials (dict, optional): Dictionary containing Mediatool credentials. Defaults to None.
             mediatool_credentials_key (str, optional): Key for Mediatool credentials. Defaults to None.
+            cache_ttl (int, optional): For how many seconds the list of organizations is cached locally and
+                reused by subsequent runs. By default, the cache is not used.
         """
 
+        self.cache_ttl = cache_ttl
         self.media_entries_columns = media_entries_columns
         self.organization_ids = organization_ids
 
@@ -113,7 +118,14 @@ class MediatoolToDF(Task):
             pd.DataFrame: Data frame containing all of the information for organization or list of organizations.
         """
         mediatool = Mediatool(credentials=self.mediatool_credentials)
-        df_orgs = mediatool.get_organizations(self.mediatool_credentials["USER_ID"])
+        if self.cache_ttl:
+            df_orgs = ExtractCache(ttl=self.cache_ttl).get_or_extract(
+                mediatool,
+                "get_organizations",
+                self.mediatool_credentials["USER_ID"],
+            )
+        else:
+            df_orgs = mediatool.get_organizations(self.mediatool_credentials["USER_ID"])
 
         list_of_dfs = []
         for organization_id in organization_ids:
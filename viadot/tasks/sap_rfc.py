@@ -5,6 +5,7 @@ import pandas as pd
 import json
 from prefect import Task
 from prefect.utilities.tasks import defaults_from_attrs
+from viadot.cache import ExtractCache
 from viadot.tasks import AzureKeyVaultSecret
 
 try:
@@ -27,6 +28,7 @@ class SAPRFCToDF(Task):
         credentials: dict = None,
         sap_credentials_key: str = "SAP",
         env: str = "DEV",
+        cache_ttl: int = None,
         max_retries: int = 3,
         retry_delay: timedelta = timedelta(seconds=10),
         timeout: int = 3600,
@@ -62,6 +64,9 @@ class SAPRFCToDF(Task):
             sap_credentials_key (str, optional): The key for sap credentials located in the local config or Azure Key Vault. Defaults to "SAP".
             env (str, optional): The key for sap_credentials_key pointing to the SAP environment. Defaults to "DEV".
             By default, they're taken from the local viadot config.
+            cache_ttl (int, optional): For how many seconds the extracted data is cached locally and reused
+            by subsequent runs of the same query, eg. for slowly-changing master tables. By default, the
+            cache is not used.
         """
         self.query = query
         self.sep = sep
@@ -71,6 +76,7 @@ class SAPRFCToDF(Task):
         self.env = env
         self.func = func
         self.rfc_total_col_width_character_limit = rfc_total_col_width_character_limit
+        self.cache_ttl = cache_ttl
 
         super().__init__(
             name="sap_rfc_to_df",
@@ -88,6 +94,7 @@ class SAPRFCToDF(Task):
         "func",
         "rfc_total_col_width_character_limit",
         "credentials",
+        "cache_ttl",
     )
     def run(
         self,
@@ -101,6 +108,7 @@ class SAPRFCToDF(Task):
         rfc_total_col_width_character_limit: int = None,
         rfc_unique_id: List[str] = None,
         alternative_version: bool = False,
+        cache_ttl: int = None,
     ) -> pd.DataFrame:
         """Task run method.
 
@@ -128,6 +136,8 @@ class SAPRFCToDF(Task):
                     ...
                     )
             alternative_version (bool, optional): Enable the use version 2 in source. Defaults to False.
+            cache_ttl (int, optional): For how many seconds the extracted data is cached locally and reused
+                by subsequent runs of the same query. Defaults to None (no caching).
 
         Returns:
             pd.DataFrame: DataFrame with SAP data.
@@ -172,7 +182,20 @@ class SAPRFCToDF(Task):
         self.logger.info(f"Downloading data from SAP to a DataFrame...")
         self.logger.debug(f"Running query: \n{query}.")
 
-        df = sap.to_df()
+        if cache_ttl:
+            df = sap.to_df_cached(
+                cache=ExtractCache(ttl=cache_ttl),
+                key_params=dict(
+                    query=query,
+                    sep=sep,
+                    replacement=replacement,
+                    func=func,
+                    rfc_unique_id=rfc_unique_id,
+                    alternative_version=alternative_version,
+                ),
+            )
+        else:
+            df = sap.to_df()
 
         self.logger.info(f"Data has been downloaded successfully.")
         return df
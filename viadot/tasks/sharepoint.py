@@ -1,10 +1,14 @@
-import copy
 import json
 import os
 import re
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Iterator, List, Tuple, Union
 
+import numpy as np
+import openpyxl
 import pandas as pd
+from pandas.io.parsers import TextParser
 from prefect import Task
 from prefect.tasks.secrets import PrefectSecret
 from prefect.utilities import logging
@@ -13,11 +17,120 @@ from prefect.utilities.tasks import defaults_from_attrs
 from ..exceptions import ValidationError
 from ..sources import Sharepoint, SharepointList
 from ..utils import add_viadot_metadata_columns
+from ..watermarks import WatermarkStore, get_watermark_store
 from .azure_key_vault import AzureKeyVaultSecret
 
 logger = logging.get_logger()
 
 
+def _convert_excel_cell(cell) -> Any:
+    """Convert an openpyxl cell the same way as `pd.read_excel()`."""
+    if cell.value is None:
+        return ""
+    if cell.data_type == "e":
+        return np.nan
+    if cell.data_type == "n":
+        value = int(cell.value)
+        if value == cell.value:
+            return value
+    return cell.value
+
+
+def iter_excel_rows(worksheet) -> Iterator[List[Any]]:
+    """Iterate over the rows of a worksheet in a single pass, without loading it
+    into memory when the workbook is opened in read-only mode.
+
+    Args:
+        worksheet (openpyxl.worksheet.worksheet.Worksheet): The worksheet.
+
+    Yields:
+        List[Any]: The values of the row, without the trailing empty cells.
+    """
+    if getattr(worksheet, "reset_dimensions", None):
+        # the dimensions stored in the file can be wrong, see openpyxl docs
+        worksheet.reset_dimensions()
+    for row in worksheet.rows:
+        values = [_convert_excel_cell(cell) for cell in row]
+        while values and values[-1] == "":
+            values.pop()
+        yield values
+
+
+def excel_rows_to_df(rows: List[List[Any]], header: bool = False) -> pd.DataFrame:
+    """Build a DataFrame from rows read with `iter_excel_rows()`, parsing the values
+    in the same way as `pd.read_excel()`.
+
+    Args:
+        rows (List[List[Any]]): The rows.
+        header (bool, optional): Whether the first row is the header. Defaults to False.
+
+    Returns:
+        pd.DataFrame: The DataFrame. If `header` is False, the columns are numbered from 0.
+    """
+    while rows and not rows[-1]:
+        rows = rows[:-1]
+    if not rows:
+        return pd.DataFrame()
+    width = max(len(row) for row in rows)
+    rows = [row + [""] * (width - len(row)) for row in rows]
+    return TextParser(rows, header=0 if header else None).read()
+
+
+def iter_excel_chunks(worksheet, sheetname: str, nrows: int) -> Iterator[pd.DataFrame]:
+    """Read the data rows of a worksheet (all rows but the header) in chunks, in a single pass.
+
+    Args:
+        worksheet (openpyxl.worksheet.worksheet.Worksheet): The worksheet.
+        sheetname (str): The name of the sheet, added in the `sheet_name` column.
+        nrows (int): Number of rows to read at a time.
+
+    Yields:
+        pd.DataFrame: The chunks, with columns numbered from 0.
+    """
+    rows = islice(iter_excel_rows(worksheet), 1, None)
+    i_chunk = 0
+    while True:
+        rows_chunk = list(islice(rows, nrows))
+        # When there are no more rows, we know we can break out of the loop.
+        if not rows_chunk:
+            break
+        df_chunk = excel_rows_to_df(rows_chunk)
+        if df_chunk.empty:
+            continue
+        logger.debug(f" - chunk {i_chunk+1} ({df_chunk.shape[0]} rows)")
+        df_chunk["sheet_name"] = sheetname
+        yield df_chunk
+        i_chunk += 1
+
+
+def read_excel_sheet(
+    path: str, sheetname: str, nrows: int
+) -> Tuple[pd.DataFrame, List[pd.DataFrame]]:
+    """Read the header and the data of a sheet. Used to parse sheets in separate processes.
+
+    Args:
+        path (str): Path to the Excel file.
+        sheetname (str): The sheet to read.
+        nrows (int): Number of rows to read at a time.
+
+    Returns:
+        Tuple[pd.DataFrame, List[pd.DataFrame]]: The header (an empty DataFrame with the
+            sheet's columns) and the chunks of data.
+    """
+    logger.info(f"Worksheet: {sheetname}")
+    workbook = openpyxl.load_workbook(
+        path, read_only=True, data_only=True, keep_links=False
+    )
+    try:
+        worksheet = workbook[sheetname]
+        header = next(iter_excel_rows(worksheet), [])
+        df_header = excel_rows_to_df([header], header=True)
+        chunks = list(iter_excel_chunks(worksheet, sheetname, nrows))
+    finally:
+        workbook.close()
+    return df_header, chunks
+
+
 class SharepointToDF(Task):
     """
     Task for converting data from Sharepoint excel file to a pandas DataFrame.
@@ -29,6 +142,8 @@ class SharepointToDF(Task):
         nrows (int, optional): Number of rows to read at a time. Defaults to 50000.
         sheet_number (int): Sheet number to be extracted from file. Counting from 0, if None all sheets are axtracted. Defaults to None.
         validate_excel_file (bool, optional): Check if columns in separate sheets are the same. Defaults to False.
+        max_workers (int, optional): The number of processes parsing the sheets concurrently. Defaults to 1
+            (the sheets are parsed one by one).
         if_empty (str, optional): What to do if query returns no data. Defaults to "warn".
         timeout(int, optional): The amount of time (in seconds) to wait while running this task before
             a timeout occurs. Defaults to 3600.
@@ -44,6 +159,7 @@ class SharepointToDF(Task):
         nrows: int = 50000,
         sheet_number: int = None,
         validate_excel_file: bool = False,
+        max_workers: int = 1,
         if_empty: str = "warn",
         timeout: int = 3600,
         *args,
@@ -55,6 +171,7 @@ class SharepointToDF(Task):
         self.nrows = nrows
         self.sheet_number = sheet_number
         self.validate_excel_file = validate_excel_file
+        self.max_workers = max_workers
 
         super().__init__(
             name="sharepoint_to_df",
@@ -105,41 +222,36 @@ class SharepointToDF(Task):
         sheetname: str = None,
         nrows: int = None,
         chunks: List[pd.DataFrame] = None,
+        worksheet=None,
         **kwargs,
     ) -> List[pd.DataFrame]:
         """
-        Split sheet by chunks.
+        Split sheet by chunks. The sheet is read in a single pass.
 
         Args:
             sheetname (str): The sheet on which we iterate.
             nrows (int): Number of rows to read at a time.
             chunks(List[pd.DataFrame]): List of data in chunks.
+            worksheet (openpyxl.worksheet.worksheet.Worksheet, optional): The sheet, if the workbook is
+                already open. Defaults to None.
 
         Returns:
             List[pd.DataFrame]: List of data frames
         """
-        skiprows = 1
         logger.info(f"Worksheet: {sheetname}")
-        temp_chunks = copy.deepcopy(chunks)
-        i_chunk = 0
-        while True:
-            df_chunk = pd.read_excel(
-                self.path_to_file,
-                sheet_name=sheetname,
-                nrows=nrows,
-                skiprows=skiprows,
-                header=None,
-                **kwargs,
+        temp_chunks = list(chunks or [])
+        workbook = None
+        if worksheet is None:
+            workbook = openpyxl.load_workbook(
+                self.path_to_file, read_only=True, data_only=True, keep_links=False
             )
-            skiprows += nrows
-            # When there is no data, we know we can break out of the loop.
-            if df_chunk.empty:
-                break
-            else:
-                logger.debug(f" - chunk {i_chunk+1} ({df_chunk.shape[0]} rows)")
-                df_chunk["sheet_name"] = sheetname
-                temp_chunks.append(df_chunk)
-            i_chunk += 1
+            worksheet = workbook[sheetname]
+
+        try:
+            temp_chunks.extend(iter_excel_chunks(worksheet, sheetname, nrows))
+        finally:
+            if workbook is not None:
+                workbook.close()
         return temp_chunks
 
     @defaults_from_attrs(
@@ -148,6 +260,7 @@ class SharepointToDF(Task):
         "nrows",
         "sheet_number",
         "validate_excel_file",
+        "max_workers",
     )
     @add_viadot_metadata_columns(source_name="Sharepoint")
     def run(
@@ -159,6 +272,7 @@ class SharepointToDF(Task):
         sheet_number: int = None,
         credentials_secret: str = None,
         vault_name: str = None,
+        max_workers: int = None,
         **kwargs,
     ) -> None:
         """
@@ -173,6 +287,7 @@ class SharepointToDF(Task):
             credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary with
             ACCOUNT_NAME and Service Principal credentials (TENANT_ID, CLIENT_ID, CLIENT_SECRET). Defaults to None.
             vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
+            max_workers (int, optional): The number of processes parsing the sheets concurrently. Defaults to None.
 
         Returns:
             pd.DataFrame: Pandas data frame
@@ -199,34 +314,63 @@ class SharepointToDF(Task):
         s.download_file(download_to_path=path_to_file)
 
         self.nrows = nrows
-        excel = pd.ExcelFile(self.path_to_file)
-
-        if self.sheet_number is not None:
-            sheet_names_list = [excel.sheet_names[self.sheet_number]]
-        else:
-            sheet_names_list = excel.sheet_names
+        # Open the workbook once, in read-only mode, so that the sheets are streamed
+        # instead of being loaded into memory.
+        workbook = openpyxl.load_workbook(
+            self.path_to_file, read_only=True, data_only=True, keep_links=False
+        )
 
-        header_to_compare = None
-        chunks = []
+        try:
+            if self.sheet_number is not None:
+                sheet_names_list = [workbook.sheetnames[self.sheet_number]]
+            else:
+                sheet_names_list = workbook.sheetnames
+
+            header_to_compare = None
+            chunks = []
+
+            if max_workers and max_workers > 1 and len(sheet_names_list) > 1:
+                # Parsing is CPU-bound, so the sheets are parsed in separate processes.
+                # The results are returned in the workbook order.
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    sheets = executor.map(
+                        read_excel_sheet,
+                        [self.path_to_file] * len(sheet_names_list),
+                        sheet_names_list,
+                        [self.nrows] * len(sheet_names_list),
+                    )
+                    for df_header, sheet_chunks in sheets:
+                        if validate_excel_file:
+                            header_to_compare = self.check_column_names(
+                                df_header, header_to_compare
+                            )
+                        chunks.extend(sheet_chunks)
+            else:
+                for sheetname in sheet_names_list:
+                    worksheet = workbook[sheetname]
+                    header = next(iter_excel_rows(worksheet), [])
+                    df_header = excel_rows_to_df([header], header=True)
 
-        for sheetname in sheet_names_list:
-            df_header = pd.read_excel(self.path_to_file, sheet_name=sheetname, nrows=0)
+                    if validate_excel_file:
+                        header_to_compare = self.check_column_names(
+                            df_header, header_to_compare
+                        )
 
-            if validate_excel_file:
-                header_to_compare = self.check_column_names(
-                    df_header, header_to_compare
-                )
+                    chunks = self.split_sheet(
+                        sheetname, self.nrows, chunks, worksheet=worksheet
+                    )
+        finally:
+            workbook.close()
 
-            chunks = self.split_sheet(sheetname, self.nrows, chunks)
-            df_chunks = pd.concat(chunks)
+        df_chunks = pd.concat(chunks)
 
-            # Rename the columns to concatenate the chunks with the header.
-            columns = {i: col for i, col in enumerate(df_header.columns.tolist())}
-            last_column = len(columns)
-            columns[last_column] = "sheet_name"
+        # Rename the columns to concatenate the chunks with the header.
+        columns = {i: col for i, col in enumerate(df_header.columns.tolist())}
+        last_column = len(columns)
+        columns[last_column] = "sheet_name"
 
-            df_chunks.rename(columns=columns, inplace=True)
-            df = pd.concat([df_header, df_chunks])
+        df_chunks.rename(columns=columns, inplace=True)
+        df = pd.concat([df_header, df_chunks])
 
         df = self.df_replace_special_chars(df)
         self.logger.info(f"Successfully converted data to a DataFrame.")
@@ -270,6 +414,15 @@ class SharepointListToDF(Task):
                                 },
                         }
         row_count (int): Number of downloaded rows in single request. Default to 5000.
+        max_workers (int): The maximum number of requests sent concurrently when downloading all the list
+            items. Default to 4.
+        incremental (bool): Whether to only extract the items modified since the watermark stored under
+            `watermark_key` (the highest `Modified` value extracted so far). The `ID` and `Modified` columns are
+            always extracted in this mode. The watermark is not updated by this task
+            (see `viadot.task_utils.set_watermark`). Default to False.
+        watermark_key (str): The key of the watermark, unique per list. Default to None.
+        watermark_store (Union[str, WatermarkStore]): The store holding the watermark: "local", "duckdb",
+            "prefect" (the Prefect KV Store) or a `WatermarkStore`. Default to "local".
 
     Returns:
     pandas DataFrame
@@ -284,6 +437,10 @@ class SharepointListToDF(Task):
         field_property: str = "Title",
         filters: dict = None,
         row_count: int = 5000,
+        max_workers: int = 4,
+        incremental: bool = False,
+        watermark_key: str = None,
+        watermark_store: Union[str, WatermarkStore] = "local",
         credentials_secret: str = None,
         vault_name: str = None,
         *args,
@@ -296,6 +453,10 @@ class SharepointListToDF(Task):
         self.field_property = field_property
         self.filters = filters
         self.row_count = row_count
+        self.max_workers = max_workers
+        self.incremental = incremental
+        self.watermark_key = watermark_key
+        self.watermark_store = watermark_store
         self.vault_name = vault_name
         self.credentials_secret = credentials_secret
 
@@ -441,16 +602,35 @@ class SharepointListToDF(Task):
             pd.DataFrame
         """
 
+        required_fields = self.required_fields
+        modified_since = None
+        if self.incremental:
+            if not self.watermark_key:
+                raise ValueError("'watermark_key' is required in incremental mode.")
+            modified_since = get_watermark_store(self.watermark_store).get(
+                self.watermark_key
+            )
+            if modified_since is None:
+                self.logger.info("No watermark found. Extracting all the items.")
+            if required_fields is not None:
+                required_fields = required_fields + [
+                    field
+                    for field in ["ID", "Modified"]
+                    if field not in required_fields
+                ]
+
         s = SharepointList(
             credentials=self.credentials,
         )
         df_raw = s.list_item_to_df(
             list_title=self.list_title,
             site_url=self.site_url,
-            required_fields=self.required_fields,
+            required_fields=required_fields,
             field_property=self.field_property,
             filters=self.filters,
             row_count=self.row_count,
+            max_workers=self.max_workers,
+            modified_since=modified_since,
         )
 
         df_col_changed = self.change_column_name(df=df_raw)
@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import Any, Dict, Literal
+from typing import Any, Dict, Literal, Union
 
 from prefect import Task
 from prefect.utilities.tasks import defaults_from_attrs
@@ -8,6 +8,7 @@ from viadot.sources import sql_server
 
 from ..config import local_config
 from ..sources import SQLServer
+from ..watermarks import WatermarkStore, apply_watermark
 
 
 class SQLServerCreateTable(Task):
@@ -93,6 +94,14 @@ class SQLServerToDF(Task):
     def __init__(
         self,
         config_key: str = None,
+        utc_datetimeoffset: bool = False,
+        partition_column: str = None,
+        partitions: int = 4,
+        partition_method: Literal["range", "ntile"] = "range",
+        max_workers: int = None,
+        incremental_column: str = None,
+        watermark_key: str = None,
+        watermark_store: Union[str, WatermarkStore] = "local",
         timeout: int = 3600,
         *args,
         **kwargs,
@@ -102,19 +111,62 @@ class SQLServerToDF(Task):
 
         Args:
             config_key (str, optional): The key inside local config containing the credentials. Defaults to None.
+            utc_datetimeoffset (bool, optional): Whether to decode DATETIMEOFFSET columns in bulk into UTC
+                timestamps. Much faster for large results. Defaults to False.
+            partition_column (str, optional): The column by which to partition the query. If provided, the key
+                ranges of the result are read concurrently, on separate connections. Defaults to None.
+            partitions (int, optional): The number of partitions. Defaults to 4.
+            partition_method (Literal["range", "ntile"], optional): How to split the range of `partition_column`:
+                into equal ranges between its minimum and maximum, or into parts with the same number of rows
+                with NTILE. Defaults to "range".
+            max_workers (int, optional): The maximum number of partitions read concurrently. Defaults to None
+                (all of them).
+            incremental_column (str, optional): The column tracking changes, a `rowversion` column, whose values are
+                unique and increasing (timestamp columns such as `modified_at` are not supported). If provided, only
+                the rows changed since the watermark stored under `watermark_key` are downloaded. The watermark is
+                not updated by this task (see `viadot.task_utils.set_watermark`). Defaults to None.
+            watermark_key (str, optional): The key of the watermark, unique per flow and table. Defaults to None.
+            watermark_store (Union[str, WatermarkStore], optional): The store holding the watermark: "local",
+                "duckdb", "prefect" (the Prefect KV Store) or a `WatermarkStore`. Defaults to "local".
             timeout(int, optional): The amount of time (in seconds) to wait while running this task before
                 a timeout occurs. Defaults to 3600.
 
         """
         self.config_key = config_key
+        self.utc_datetimeoffset = utc_datetimeoffset
+        self.partition_column = partition_column
+        self.partitions = partitions
+        self.partition_method = partition_method
+        self.max_workers = max_workers
+        self.incremental_column = incremental_column
+        self.watermark_key = watermark_key
+        self.watermark_store = watermark_store
 
         super().__init__(name="sql_server_to_df", timeout=timeout, *args, **kwargs)
 
-    @defaults_from_attrs("config_key")
+    @defaults_from_attrs(
+        "config_key",
+        "utc_datetimeoffset",
+        "partition_column",
+        "partitions",
+        "partition_method",
+        "max_workers",
+        "incremental_column",
+        "watermark_key",
+        "watermark_store",
+    )
     def run(
         self,
         query: str,
         config_key: str = None,
+        utc_datetimeoffset: bool = None,
+        partition_column: str = None,
+        partitions: int = None,
+        partition_method: Literal["range", "ntile"] = None,
+        max_workers: int = None,
+        incremental_column: str = None,
+        watermark_key: str = None,
+        watermark_store: Union[str, WatermarkStore] = None,
     ):
         """
         Load the result of a SQL Server Database query into a pandas DataFrame.
@@ -123,12 +175,40 @@ class SQLServerToDF(Task):
             query (str, required): The query to execute on the SQL Server database. If the qery doesn't start
                 with "SELECT" returns an empty DataFrame.
             config_key (str, optional): The key inside local config containing the credentials. Defaults to None.
+            utc_datetimeoffset (bool, optional): Whether to decode DATETIMEOFFSET columns in bulk into UTC
+                timestamps. Defaults to None.
+            partition_column (str, optional): The column by which to partition the query. Defaults to None.
+            partitions (int, optional): The number of partitions. Defaults to None.
+            partition_method (Literal["range", "ntile"], optional): How to split the range of `partition_column`.
+                Defaults to None.
+            max_workers (int, optional): The maximum number of partitions read concurrently. Defaults to None.
+            incremental_column (str, optional): The column tracking changes. Defaults to None.
+            watermark_key (str, optional): The key of the watermark. Defaults to None.
+            watermark_store (Union[str, WatermarkStore], optional): The store holding the watermark.
+                Defaults to None.
 
         """
         if config_key is None:
             config_key = "SQL_SERVER"
+        if incremental_column:
+            query = apply_watermark(
+                query,
+                column=incremental_column,
+                key=watermark_key,
+                store=watermark_store,
+            )
         sql_server = SQLServer(config_key=config_key)
-        df = sql_server.to_df(query=query)
+        if partition_column:
+            df = sql_server.to_df_partitioned(
+                query=query,
+                partition_column=partition_column,
+                partitions=partitions,
+                partition_method=partition_method,
+                max_workers=max_workers,
+                utc_datetimeoffset=utc_datetimeoffset,
+            )
+        else:
+            df = sql_server.to_df(query=query, utc_datetimeoffset=utc_datetimeoffset)
         nrows = df.shape[0]
         ncols = df.shape[1]
 
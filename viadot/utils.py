@@ -2,7 +2,7 @@ import functools
 import os
 import re
 from itertools import chain
-from typing import Any, Callable, Dict, List, Literal, Union
+from typing import Any, Callable, Dict, Generator, Iterable, List, Literal, Union
 
 import pandas as pd
 import prefect
@@ -16,7 +16,8 @@ from requests.exceptions import ConnectionError, HTTPError, ReadTimeout, Timeout
 from requests.packages.urllib3.util.retry import Retry
 from urllib3.exceptions import ProtocolError
 
-from .exceptions import APIError
+from .cache import table_metadata_cache
+from .exceptions import APIError, ValidationError
 from .signals import SKIP
 
 logger = logging.get_logger(__name__)
@@ -144,6 +145,65 @@ def get_flow_last_run_date(flow_name: str) -> str:
     return last_run_date
 
 
+def get_sql_server_table_columns(
+    table: str, con: pyodbc.Connection, schema: str = None, use_cache: bool = True
+) -> List[Dict[str, Any]]:
+    """Get the columns of a SQL Server database table, with their types, lengths
+    and whether they're part of the primary key.
+
+    The result is stored in the shared `table_metadata_cache`, so that the SQL
+    helpers which need the columns of the same table don't query the catalog again.
+
+    Args:
+        table (str): The table for which to fetch the columns.
+        con (pyodbc.Connection): The connection to the database where the table is located.
+        schema (str, optional): The schema where the table is located. Defaults to None.
+        use_cache (bool, optional): Whether to use the cached columns. Defaults to True.
+
+    Returns:
+        List[Dict[str, Any]]: The columns, in column order, each with the `name`, `type`,
+        `max_length` and `is_key` fields. Empty if the table doesn't exist.
+    """
+
+    def _fetch() -> List[Dict[str, Any]]:
+        query = f"""
+        SELECT 
+            col.name,
+            t.name,
+            col.max_length,
+            CASE WHEN EXISTS (
+                SELECT 1
+                FROM sys.indexes AS i
+                    INNER JOIN sys.index_columns AS ic
+                        ON i.object_id = ic.object_id AND i.index_id = ic.index_id
+                WHERE i.is_primary_key = 1
+                AND ic.object_id = col.object_id
+                AND ic.column_id = col.column_id
+            ) THEN 1 ELSE 0 END
+        FROM sys.tables AS tab
+            INNER JOIN sys.columns AS col
+                ON tab.object_id = col.object_id
+            LEFT JOIN sys.types AS t
+                ON col.user_type_id = t.user_type_id
+        WHERE tab.name = '{table}'
+        AND schema_name(tab.schema_id) = '{schema}'
+        ORDER BY column_id;
+        """
+        cursor = con.cursor()
+        query_result = cursor.execute(query).fetchall()
+        cursor.close()
+
+        return [
+            dict(name=row[0], type=row[1], max_length=row[2], is_key=bool(row[3]))
+            for row in query_result
+        ]
+
+    if not use_cache:
+        return _fetch()
+    key = table_metadata_cache.make_key(con, table=table, schema=schema)
+    return table_metadata_cache.get_or_fetch(key, _fetch)
+
+
 def get_sql_server_table_dtypes(
     table: str, con: pyodbc.Connection, schema: str = None
 ) -> dict:
@@ -157,34 +217,12 @@ def get_sql_server_table_dtypes(
     Returns:
         dict: A dictionary of the form {column_name: dtype, column_name2: dtype2, ...}.
     """
-
-    query = f"""
-    SELECT 
-        col.name,
-        t.name,
-        col.max_length
-    FROM sys.tables AS tab
-        INNER JOIN sys.columns AS col
-            ON tab.object_id = col.object_id
-        LEFT JOIN sys.types AS t
-            ON col.user_type_id = t.user_type_id
-    WHERE tab.name = '{table}'
-    AND schema_name(tab.schema_id) = '{schema}'
-    ORDER BY column_id;
-    """
-    cursor = con.cursor()
-    query_result = cursor.execute(query).fetchall()
-    cursor.close()
-
     dtypes = {}
-    for row in query_result:
-        column_name = row[0]
-        dtype = row[1]
-        length = row[2]
-        if dtype == "varchar":
-            dtypes[column_name] = dtype + f"({length})"
+    for column in get_sql_server_table_columns(table=table, con=con, schema=schema):
+        if column["type"] == "varchar":
+            dtypes[column["name"]] = column["type"] + f"({column['max_length']})"
         else:
-            dtypes[column_name] = dtype
+            dtypes[column["name"]] = column["type"]
 
     return dtypes
 
@@ -213,50 +251,46 @@ def build_merge_query(
     stg_table: str,
     schema: str,
     table: str,
-    primary_key: str,
+    primary_key: Union[str, List[str]],
     con: pyodbc.Connection,
 ) -> str:
     """
     Build a merge query for the simplest possible upsert scenario:
     - updating and inserting all fields
-    - merging on a single column, which has the same name in both tables
+    - merging on one or more columns, which have the same names in both tables
 
     Args:
         stg_schema (str): The schema where the staging table is located.
         stg_table (str): The table with new/updated data.
         schema (str): The schema where the table is located.
         table (str): The table to merge into.
-        primary_key (str): The column on which to merge.
+        primary_key (Union[str, List[str]]): The column or columns on which to merge.
         con (pyodbc.Connection) The connection to the database on which the
         query will be executed.
     """
+    keys = [primary_key] if isinstance(primary_key, str) else list(primary_key)
 
-    # Get column names
-    columns_query = f"""
-    SELECT 
-        col.name
-    FROM sys.tables AS tab
-        INNER JOIN sys.columns AS col
-            ON tab.object_id = col.object_id
-    WHERE tab.name = '{table}'
-    AND schema_name(tab.schema_id) = '{schema}'
-    ORDER BY column_id;
-    """
-    cursor = con.cursor()
-    columns_query_result = cursor.execute(columns_query).fetchall()
-    cursor.close()
-
-    columns = [tup[0] for tup in columns_query_result]
+    columns = [
+        column["name"]
+        for column in get_sql_server_table_columns(table=table, con=con, schema=schema)
+    ]
     columns_stg_fqn = [f"stg.{col}" for col in columns]
 
     # Build merge query
-    update_pairs = [f"existing.{col} = stg.{col}" for col in columns]
+    on_conditions = [f"stg.{key} = existing.{key}" for key in keys]
+    update_pairs = [f"existing.{col} = stg.{col}" for col in columns if col not in keys]
+    # If all the columns are keys, there is nothing to update.
+    matched_clause = (
+        f"""
+        WHEN MATCHED
+            THEN UPDATE SET {", ".join(update_pairs)}"""
+        if update_pairs
+        else ""
+    )
     merge_query = f"""
     MERGE INTO {schema}.{table} existing
         USING {stg_schema}.{stg_table} stg
-        ON stg.{primary_key} = existing.{primary_key}
-        WHEN MATCHED
-            THEN UPDATE SET {", ".join(update_pairs)}
+        ON {" AND ".join(on_conditions)}{matched_clause}
         WHEN NOT MATCHED
             THEN INSERT({", ".join(columns)})
             VALUES({", ".join(columns_stg_fqn)});
@@ -504,3 +538,238 @@ def get_nested_value(
     except (TypeError, AttributeError) as e:
         logger.error(f"The 'nested_dict' must be a dictionary. {e}")
         return None
+
+
+def merge_df_with_snapshot(
+    snapshot: pd.DataFrame, delta: pd.DataFrame, key_columns: List[str]
+) -> pd.DataFrame:
+    """
+    Merge the changed rows of a table into its previous snapshot. The rows of the snapshot
+    with the same key as a changed row are replaced, and new rows are appended.
+
+    Args:
+        snapshot (pd.DataFrame): The previous snapshot of the table.
+        delta (pd.DataFrame): The changed rows.
+        key_columns (List[str]): The columns identifying a row, eg. `["ID"]`.
+
+    Returns:
+        pd.DataFrame: The new snapshot.
+    """
+    missing = [col for col in key_columns if col not in delta or col not in snapshot]
+    if missing:
+        raise ValueError(f"Key columns {missing} are missing from the data.")
+
+    # The last version of a row wins, also when it's repeated within the delta.
+    delta = delta.drop_duplicates(subset=key_columns, keep="last")
+    changed = pd.MultiIndex.from_frame(delta[key_columns].astype(str))
+    snapshot_keys = pd.MultiIndex.from_frame(snapshot[key_columns].astype(str))
+    unchanged = snapshot[~snapshot_keys.isin(changed)]
+    return pd.concat([unchanged, delta], ignore_index=True)
+
+
+def write_csv_files(
+    dfs: Iterable[pd.DataFrame],
+    path: str,
+    sep: str = "\t",
+    rows_per_file: int = 1_000_000,
+) -> Generator[str, None, None]:
+    """Write a stream of DataFrames into rotating CSV files.
+
+    A new file is started every `rows_per_file` rows, and each file's path is yielded
+    as soon as the file is complete, so that it can be processed (eg. loaded with bcp)
+    while the next one is being written.
+
+    Args:
+        dfs (Iterable[pd.DataFrame]): The DataFrames to write, eg. batches of a larger dataset.
+        path (str): The base path of the CSV files. A file number is appended to
+        the file name, eg. `data.csv` produces `data_0.csv`, `data_1.csv`, etc.
+        sep (str, optional): The separator to use in the CSV. Defaults to "\t".
+        rows_per_file (int, optional): The maximum number of rows in a single file.
+        Defaults to 1 000 000.
+
+    Yields:
+        Generator[str, None, None]: The paths of the completed CSV files.
+    """
+    base_path, extension = os.path.splitext(path)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    file_number = 0
+    file = None
+    file_path = None
+    rows_in_file = 0
+    try:
+        for df in dfs:
+            offset = 0
+            while offset < len(df):
+                if file is None:
+                    file_path = f"{base_path}_{file_number}{extension}"
+                    file = open(file_path, "w", newline="")
+                    rows_in_file = 0
+                length = min(len(df) - offset, rows_per_file - rows_in_file)
+                df.iloc[offset : offset + length].to_csv(
+                    file, sep=sep, index=False, header=rows_in_file == 0
+                )
+                offset += length
+                rows_in_file += length
+                if rows_in_file == rows_per_file:
+                    file.close()
+                    file = None
+                    file_number += 1
+                    yield file_path
+        if file is not None:
+            file.close()
+            file = None
+            yield file_path
+    finally:
+        if file is not None:
+            file.close()
+
+
+class DFStreamValidator:
+    """Run the tests of `validate_df()` on data which can be processed in batches.
+
+    Each batch is passed to `update()`, which only keeps the statistics needed by the
+    tests (eg. the running sum of a column), and `validate()` then evaluates the tests
+    on the whole dataset. `validate_df()` runs its tests with a single batch.
+
+    Args:
+        tests (dict): The tests to apply, in the same format as in `validate_df()`.
+    """
+
+    def __init__(self, tests: dict):
+        self.tests = tests
+        self.columns = None
+        self.row_count = 0
+        self.max_lengths = {}
+        self.seen_values = {
+            column: set() for column in tests.get("column_unique_values", [])
+        }
+        self.duplicated = set()
+        self.regex_errors = {}
+        self.regex_failures = set()
+        self.sums = {column: 0 for column in tests.get("column_sum", {})}
+
+    def update(self, df: pd.DataFrame) -> None:
+        """Update the statistics with a batch of the data.
+
+        Args:
+            df (pd.DataFrame): The batch.
+        """
+        if self.columns is None:
+            self.columns = list(df.columns)
+        self.row_count += len(df)
+
+        if "column_size" in self.tests:
+            lengths = df.astype(str).apply(lambda s: s.str.len()).max().to_dict()
+            for column, length in lengths.items():
+                self.max_lengths[column] = max(self.max_lengths.get(column, 0), length)
+
+        for column, seen in self.seen_values.items():
+            values = df[column]
+            # Missing values are not counted as unique values, as in `Series.nunique()`.
+            if (
+                values.isna().any()
+                or values.duplicated().any()
+                or values.isin(seen).any()
+            ):
+                self.duplicated.add(column)
+            seen.update(values)
+
+        for column, regex in self.tests.get("column_match_regex", {}).items():
+            if column in self.regex_errors:
+                continue
+            try:
+                matches = df[column].apply(lambda x: bool(re.match(regex, str(x))))
+                if not all(matches):
+                    self.regex_failures.add(column)
+            except Exception as e:
+                self.regex_errors[column] = e
+
+        for column in self.sums:
+            values = df[column]
+            if values.dtype == object:
+                # Batches read as text, eg. with `AzureDataLake.iter_batches()`.
+                values = pd.to_numeric(values.mask(values == ""))
+            self.sums[column] += values.sum()
+
+    def validate(self) -> None:
+        """Evaluate the tests on the statistics of all the batches.
+
+        Raises:
+            ValidationError: If validation failed for at least one test.
+        """
+        tests = self.tests
+        failed_tests_list = []
+
+        for column, size in tests.get("column_size", {}).items():
+            if column not in self.max_lengths:
+                logger.error(f"[column_size] Column {column} not found.")
+            elif self.max_lengths[column] == size:
+                logger.info(f"[column_size] for {column} passed.")
+            else:
+                logger.error(
+                    f"[column_size] test for {column} failed. field lenght is different than {size}"
+                )
+                failed_tests_list.append("column_size error")
+
+        for column in self.seen_values:
+            if column in self.duplicated:
+                failed_tests_list.append("column_unique_values error")
+                logger.error(
+                    f"[column_unique_values] Values for {column} are not unique."
+                )
+            else:
+                logger.info(
+                    f"[column_unique_values] Values are unique for {column} column."
+                )
+
+        if "column_list_to_match" in tests:
+            if set(tests["column_list_to_match"]) == set(self.columns or []):
+                logger.info(f"[column_list_to_match] passed.")
+            else:
+                failed_tests_list.append("column_list_to_match error")
+                logger.error(
+                    "[column_list_to_match] failed. Columns are different than expected."
+                )
+
+        if "dataset_row_count" in tests:
+            max_value = tests["dataset_row_count"]["max"] or 100_000_000
+            min_value = tests["dataset_row_count"]["min"] or 0
+            if min_value < self.row_count < max_value:
+                logger.info("[dataset_row_count] passed.")
+            else:
+                failed_tests_list.append("dataset_row_count error")
+                logger.error(
+                    f"[dataset_row_count] Row count ({self.row_count}) is not between {min_value} and {max_value}."
+                )
+
+        for column in tests.get("column_match_regex", {}):
+            if column in self.regex_errors:
+                failed_tests_list.append("column_match_regex error")
+                logger.error(
+                    f"[column_match_regex] Error in {column} column: {self.regex_errors[column]}"
+                )
+            elif column in self.regex_failures:
+                failed_tests_list.append("column_match_regex error")
+                logger.error(f"[column_match_regex] on {column} column failed!")
+            else:
+                logger.info(f"[column_match_regex] on {column} column passed.")
+
+        for column, bounds in tests.get("column_sum", {}).items():
+            col_sum = self.sums[column]
+            if bounds["min"] <= col_sum <= bounds["max"]:
+                logger.info(
+                    f"[column_sum] Sum of {col_sum} for {column} is within the expected range."
+                )
+            else:
+                failed_tests_list.append("column_sum error")
+                logger.error(
+                    f"[column_sum] Sum of {col_sum} for {column} is out of the expected range - <{bounds['min']}:{bounds['max']}>"
+                )
+
+        if failed_tests_list:
+            raise ValidationError(
+                f"Validation failed for {len(failed_tests_list)} test/tests: {', '.join(failed_tests_list)}"
+            )
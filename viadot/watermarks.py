@@ -0,0 +1,307 @@
+import json
+import numbers
+import os
+import threading
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Union
+
+import pandas as pd
+from prefect.utilities import logging
+
+from .config import USER_HOME
+
+logger = logging.get_logger(__name__)
+
+
+def encode_watermark(value: Any) -> str:
+    """Serialize a watermark, keeping its type, so that it can be stored as a string.
+
+    Args:
+        value (Any): The watermark, eg. the maximum `rowversion` (bytes) or datetime value
+            extracted so far.
+
+    Returns:
+        str: The JSON-encoded watermark.
+    """
+    if isinstance(value, (bytes, bytearray)):
+        encoded = {"type": "bytes", "value": bytes(value).hex()}
+    elif isinstance(value, datetime):
+        encoded = {"type": "datetime", "value": pd.Timestamp(value).isoformat()}
+    elif isinstance(value, date):
+        encoded = {"type": "date", "value": value.isoformat()}
+    elif isinstance(value, (bool, str)):
+        encoded = {"type": "str", "value": str(value)}
+    elif isinstance(value, numbers.Integral):
+        encoded = {"type": "int", "value": str(int(value))}
+    elif isinstance(value, (Decimal, numbers.Real)):
+        encoded = {"type": "decimal", "value": str(value)}
+    else:
+        raise TypeError(f"Unsupported watermark type: {type(value).__name__}.")
+    return json.dumps(encoded)
+
+
+def decode_watermark(encoded: str) -> Any:
+    """Deserialize a watermark encoded with `encode_watermark()`.
+
+    Args:
+        encoded (str): The JSON-encoded watermark.
+
+    Returns:
+        Any: The watermark.
+    """
+    data = json.loads(encoded)
+    value_type, value = data["type"], data["value"]
+    if value_type == "bytes":
+        return bytes.fromhex(value)
+    if value_type == "datetime":
+        return pd.Timestamp(value)
+    if value_type == "date":
+        return date.fromisoformat(value)
+    if value_type == "int":
+        return int(value)
+    if value_type == "decimal":
+        return Decimal(value)
+    return value
+
+
+def watermark_to_sql(value: Any) -> str:
+    """Render a watermark as a SQL Server literal.
+
+    Args:
+        value (Any): The watermark.
+
+    Returns:
+        str: The literal, eg. `0x00000000000007D1` for a `rowversion`.
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + bytes(value).hex().upper()
+    if isinstance(value, datetime):
+        value = pd.Timestamp(value)
+        # DATETIME2 and DATETIMEOFFSET are precise to 100 nanoseconds
+        fraction = (value.microsecond * 1000 + value.nanosecond) // 100
+        literal = value.strftime("%Y-%m-%d %H:%M:%S") + f".{fraction:07d}"
+        if value.tzinfo is None:
+            return f"CAST('{literal}' AS DATETIME2)"
+        offset = value.strftime("%z")
+        return f"CAST('{literal} {offset[:3]}:{offset[3:]}' AS DATETIMEOFFSET)"
+    if isinstance(value, date):
+        return f"CAST('{value.isoformat()}' AS DATE)"
+    if isinstance(value, numbers.Number) and not isinstance(value, bool):
+        return str(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def build_incremental_query(query: str, column: str, watermark: Any = None) -> str:
+    """Restrict a query to the rows changed since the last extraction.
+
+    The query is wrapped in a subquery, so it must not contain an `ORDER BY` clause
+    (without `TOP`).
+
+    Only the rows with a value of `column` strictly greater than the watermark are read,
+    so the values of `column` must be unique and increasing, as with a `rowversion`
+    column. With eg. a `modified_at` column, the rows written after an extraction with
+    the same timestamp as the watermark would never be read.
+
+    Args:
+        query (str): The query to restrict.
+        column (str): The column tracking changes, eg. a `rowversion` column.
+        watermark (Any, optional): The highest value of `column` extracted so far.
+            Defaults to None (the first extraction, which reads all the rows).
+
+    Returns:
+        str: The query with the delta predicate.
+    """
+    if watermark is None:
+        return query
+    query = query.strip().rstrip(";")
+    return (
+        f"SELECT * FROM ({query}) AS incremental_query "
+        f"WHERE [{column}] > {watermark_to_sql(watermark)}"
+    )
+
+
+def make_watermark_key(flow_name: str, table: str) -> str:
+    """Build the key under which the watermark of a table is stored.
+
+    Args:
+        flow_name (str): The name of the flow extracting the table.
+        table (str): The name of the extracted table.
+
+    Returns:
+        str: The key.
+    """
+    flow_name = flow_name.replace(" ", "_").replace("-", "_").lower()
+    return f"{flow_name}.{table.lower()}"
+
+
+class WatermarkStore(ABC):
+    """Stores the watermarks of incremental extractions, keyed per flow and table."""
+
+    def get(self, key: str) -> Any:
+        """Return the watermark stored under `key`, or None if there isn't one."""
+        encoded = self._get(key)
+        return decode_watermark(encoded) if encoded is not None else None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store the watermark `value` under `key`."""
+        self._set(key, encode_watermark(value))
+        logger.info(f"Watermark '{key}' set to {value}.")
+
+    @abstractmethod
+    def _get(self, key: str) -> Union[str, None]:
+        pass
+
+    @abstractmethod
+    def _set(self, key: str, encoded: str) -> None:
+        pass
+
+
+_local_store_lock = threading.Lock()
+
+
+class LocalWatermarkStore(WatermarkStore):
+    """Stores watermarks in a local JSON file."""
+
+    DEFAULT_PATH = os.path.join(USER_HOME, ".cache", "viadot", "watermarks.json")
+
+    def __init__(self, path: str = None):
+        self.path = path or self.DEFAULT_PATH
+
+    def _read(self) -> Dict[str, str]:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path) as f:
+            return json.load(f)
+
+    def _get(self, key: str) -> Union[str, None]:
+        with _local_store_lock:
+            return self._read().get(key)
+
+    def _set(self, key: str, encoded: str) -> None:
+        with _local_store_lock:
+            watermarks = self._read()
+            watermarks[key] = encoded
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(watermarks, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+class DuckDBWatermarkStore(WatermarkStore):
+    """Stores watermarks in a DuckDB table."""
+
+    def __init__(
+        self, credentials: Dict[str, Any] = None, table: str = "viadot_watermarks"
+    ):
+        self.credentials = credentials
+        self.table = table
+
+    @property
+    def con(self):
+        from .sources import DuckDB
+
+        con = DuckDB(credentials=self.credentials).con
+        con.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} "
+            "(key VARCHAR PRIMARY KEY, value VARCHAR, updated_at TIMESTAMP)"
+        )
+        return con
+
+    def _get(self, key: str) -> Union[str, None]:
+        con = self.con
+        try:
+            row = con.execute(
+                f"SELECT value FROM {self.table} WHERE key = ?", [key]
+            ).fetchone()
+        finally:
+            con.close()
+        return row[0] if row else None
+
+    def _set(self, key: str, encoded: str) -> None:
+        con = self.con
+        try:
+            con.execute(f"DELETE FROM {self.table} WHERE key = ?", [key])
+            con.execute(
+                f"INSERT INTO {self.table} VALUES (?, ?, current_timestamp)",
+                [key, encoded],
+            )
+        finally:
+            con.close()
+
+
+class PrefectWatermarkStore(WatermarkStore):
+    """Stores watermarks in the Prefect KV Store."""
+
+    def _get(self, key: str) -> Union[str, None]:
+        from prefect.backend import get_key_value
+
+        try:
+            return get_key_value(key=key)
+        except ValueError:
+            return None
+
+    def _set(self, key: str, encoded: str) -> None:
+        from prefect.backend import set_key_value
+
+        set_key_value(key=key, value=encoded)
+
+
+WATERMARK_STORES = {
+    "local": LocalWatermarkStore,
+    "duckdb": DuckDBWatermarkStore,
+    "prefect": PrefectWatermarkStore,
+}
+
+
+def get_watermark_store(store: Union[str, WatermarkStore] = "local") -> WatermarkStore:
+    """Return a watermark store.
+
+    Args:
+        store (Union[str, WatermarkStore], optional): Either a store or the name of the store to
+            create with default settings: "local", "duckdb" or "prefect". Defaults to "local".
+
+    Returns:
+        WatermarkStore: The store.
+    """
+    if isinstance(store, WatermarkStore):
+        return store
+    if store not in WATERMARK_STORES:
+        raise ValueError(
+            f"'store' must be one of {list(WATERMARK_STORES)} or a WatermarkStore."
+        )
+    return WATERMARK_STORES[store]()
+
+
+def apply_watermark(
+    query: str,
+    column: str,
+    key: str,
+    store: Union[str, WatermarkStore] = "local",
+) -> str:
+    """Restrict a query to the rows changed since the watermark stored under `key`.
+
+    The watermark is only read here. It should be updated with the new data (see
+    `viadot.task_utils.set_watermark`) once the data has been loaded to its destination,
+    so that a failed load is retried with the same delta on the next run.
+
+    Args:
+        query (str): The query to restrict.
+        column (str): The column tracking changes, eg. a `rowversion` column.
+        key (str): The key of the watermark.
+        store (Union[str, WatermarkStore], optional): The store holding the watermark.
+            Defaults to "local".
+
+    Returns:
+        str: The query with the delta predicate.
+    """
+    if not key:
+        raise ValueError("'watermark_key' is required for incremental extraction.")
+    watermark = get_watermark_store(store).get(key)
+    if watermark is None:
+        logger.info(f"No watermark found for '{key}'. Extracting all the rows.")
+    else:
+        logger.info(f"Extracting the rows with {column} > {watermark}.")
+    return build_incremental_query(query, column=column, watermark=watermark)